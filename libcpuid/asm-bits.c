@@ -203,6 +203,43 @@ void cpu_rdtsc(uint64_t* result)
 }
 #endif /* INLINE_ASM_SUPPORTED */
 
+#ifdef INLINE_ASM_SUPPORTED
+void cpu_rdtsc_ordered(uint64_t* result)
+{
+	uint32_t low_part, hi_part;
+#if defined(COMPILER_GCC) || defined(COMPILER_CLANG)
+#  if defined(PLATFORM_X86) || defined(PLATFORM_X64)
+	/* The first LFENCE waits for the preceding loads, the second one
+	   keeps the following instructions (e.g. stores) from starting early */
+	__asm __volatile (
+		"	lfence\n"
+		"	rdtsc\n"
+		"	lfence\n"
+		"	mov	%%eax,	%0\n"
+		"	mov	%%edx,	%1\n"
+		:"=m"(low_part), "=m"(hi_part)::"memory", "eax", "edx"
+	);
+#  else
+  low_part = 0;
+  hi_part = 0;
+#  endif
+#else
+#  ifdef COMPILER_MICROSOFT
+	__asm {
+		lfence
+		rdtsc
+		lfence
+		mov	low_part,	eax
+		mov	hi_part,	edx
+	};
+#  else
+#    error "Unsupported compiler"
+#  endif /* COMPILER_MICROSOFT */
+#endif /* COMPILER_GCC */
+	*result = (uint64_t)low_part + (((uint64_t) hi_part) << 32);
+}
+#endif /* INLINE_ASM_SUPPORTED */
+
 #ifdef INLINE_ASM_SUPPORTED
 void busy_sse_loop(int cycles)
 {
@@ -81,6 +81,8 @@
 
 int cpuid_exists_by_eflags(void);
 void exec_cpuid(uint32_t *regs);
+/* Like cpu_rdtsc(), but not reordered with the surrounding loads and stores */
+void cpu_rdtsc_ordered(uint64_t* result);
 void busy_sse_loop(int cycles);
 
 #endif /* __ASM_BITS_H__ */
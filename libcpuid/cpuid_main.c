@@ -31,10 +31,9 @@
 #include "recog_intel.h"
 #include "asm-bits.h"
 #include "libcpuid_util.h"
-#if defined(PLATFORM_ARM) || defined(PLATFORM_AARCH64)
-# include "libcpuid_arm_driver.h"
-# include "rdcpuid.h"
-#endif /* ARM */
+#include "libcpuid_arm_driver.h"
+#include "rdcpuid.h"
+#include "rdtsc.h"
 #ifdef HAVE_CONFIG_H
 # include "config.h"
 #endif /* HAVE_CONFIG_H */
@@ -43,6 +42,7 @@
 #include <stdlib.h>
 #include <stdbool.h>
 #include <inttypes.h>
+#include <time.h>
 #ifdef HAVE_GETAUXVAL
 # include <sys/auxv.h>
 #endif /* HAVE_GETAUXVAL */
@@ -52,15 +52,9 @@
 
 /* Implementation: */
 
-#if defined(__STDC_VERSION__) && __STDC_VERSION__ == 201112L
-#define INTERNAL_SCOPE _Thread_local
-#elif defined(__GNUC__) // Also works for clang
-#define INTERNAL_SCOPE __thread
-#else
-#define INTERNAL_SCOPE static
-#endif
-
 INTERNAL_SCOPE int _libcpuid_errno = ERR_OK;
+INTERNAL_SCOPE bool _libcpuid_stats_enabled = false;
+INTERNAL_SCOPE struct cpuid_stats_t _libcpuid_stats;
 
 /* get_total_cpus() system specific code: uses OS routines to determine total number of CPUs */
 #ifdef __APPLE__
@@ -470,6 +464,74 @@ int cpuid_get_error(void)
 	return _libcpuid_errno;
 }
 
+#if defined(_WIN32)
+static uint64_t stats_clock_ns(void)
+{
+	LARGE_INTEGER freq, counter;
+	QueryPerformanceCounter(&counter);
+	QueryPerformanceFrequency(&freq);
+	return (uint64_t) (counter.QuadPart / freq.QuadPart) * 1000000000ULL +
+	       (uint64_t) (counter.QuadPart % freq.QuadPart) * 1000000000ULL / (uint64_t) freq.QuadPart;
+}
+#elif defined(CLOCK_MONOTONIC)
+static uint64_t stats_clock_ns(void)
+{
+	struct timespec ts;
+	clock_gettime(CLOCK_MONOTONIC, &ts);
+	return (uint64_t) ts.tv_sec * 1000000000ULL + (uint64_t) ts.tv_nsec;
+}
+#else
+static uint64_t stats_clock_ns(void)
+{
+	uint64_t us;
+	sys_precise_clock(&us);
+	return us * 1000ULL;
+}
+#endif /* _WIN32 */
+
+uint64_t cpuid_stats_start(void)
+{
+	return _libcpuid_stats_enabled ? stats_clock_ns() : 0;
+}
+
+void cpuid_stats_extend(cpuid_stats_phase_t phase, uint64_t start)
+{
+	if (!_libcpuid_stats_enabled || start == 0)
+		return;
+	_libcpuid_stats.phases[phase].duration_ns += stats_clock_ns() - start;
+}
+
+void cpuid_stats_stop(cpuid_stats_phase_t phase, uint64_t start)
+{
+	if (!_libcpuid_stats_enabled || start == 0)
+		return;
+	_libcpuid_stats.phases[phase].count++;
+	cpuid_stats_extend(phase, start);
+}
+
+void cpuid_enable_stats(int enabled)
+{
+	_libcpuid_stats_enabled = (enabled != 0);
+}
+
+int cpuid_stats_enabled(void)
+{
+	return _libcpuid_stats_enabled;
+}
+
+int cpuid_get_stats(struct cpuid_stats_t* stats)
+{
+	if (stats == NULL)
+		return cpuid_set_error(ERR_HANDLE);
+	memcpy(stats, &_libcpuid_stats, sizeof(struct cpuid_stats_t));
+	return cpuid_set_error(ERR_OK);
+}
+
+void cpuid_reset_stats(void)
+{
+	memset(&_libcpuid_stats, 0, sizeof(struct cpuid_stats_t));
+}
+
 static void raw_data_t_constructor(struct cpu_raw_data_t* raw)
 {
 	memset(raw, 0, sizeof(struct cpu_raw_data_t));
@@ -1314,14 +1376,77 @@ void cpu_exec_cpuid(uint32_t eax, uint32_t* regs)
 {
 	regs[0] = eax;
 	regs[1] = regs[2] = regs[3] = 0;
-	exec_cpuid(regs);
+	cpu_exec_cpuid_ext(regs);
 }
 
 void cpu_exec_cpuid_ext(uint32_t* regs)
 {
+	if (_libcpuid_stats_enabled)
+		_libcpuid_stats.num_cpuid++;
 	exec_cpuid(regs);
 }
 
+#if defined(PLATFORM_X86) || defined(PLATFORM_X64)
+/* Executes CPUID for the given leaf and subleaf, directly or through the cpuid kernel driver if handle is not NULL */
+static int exec_cpuid_leaf(struct cpuid_driver_t* handle, uint32_t leaf, uint32_t subleaf, uint32_t* regs)
+{
+	memset(regs, 0, NUM_REGS * sizeof(uint32_t));
+	regs[EAX] = leaf;
+	regs[ECX] = subleaf;
+	if (handle == NULL) {
+		cpu_exec_cpuid_ext(regs);
+		return ERR_OK;
+	}
+	if (_libcpuid_stats_enabled)
+		_libcpuid_stats.num_cpuid++;
+	return cpu_read_x86_cpuid(handle, regs);
+}
+
+static int get_raw_data_x86(struct cpu_raw_data_t* data, struct cpuid_driver_t* handle, uint32_t leaves)
+{
+	/* Leaves with subleaves, in the same order as in struct cpu_raw_data_t */
+	const struct { cpu_raw_leaves_t family; uint32_t leaf; uint32_t (*regs)[NUM_REGS]; unsigned count; } subleaves[] = {
+		{ RAW_LEAVES_INTEL_FN4,       4,          data->intel_fn4,       MAX_INTELFN4_LEVEL       },
+		{ RAW_LEAVES_INTEL_FN11,      11,         data->intel_fn11,      MAX_INTELFN11_LEVEL      },
+		{ RAW_LEAVES_INTEL_FN12H,     0x12,       data->intel_fn12h,     MAX_INTELFN12H_LEVEL     },
+		{ RAW_LEAVES_INTEL_FN14H,     0x14,       data->intel_fn14h,     MAX_INTELFN14H_LEVEL     },
+		{ RAW_LEAVES_AMD_FN8000001DH, 0x8000001d, data->amd_fn8000001dh, MAX_AMDFN8000001DH_LEVEL },
+		{ RAW_LEAVES_AMD_FN80000026H, 0x80000026, data->amd_fn80000026h, MAX_AMDFN80000026H_LEVEL },
+	};
+	/* When collecting all leaves, the dump is kept complete (e.g. Intel CPUs repeat the highest basic leaf
+	   past the maximum); otherwise, leaves past the maximum reported by leaf 0 / 0x80000000 are skipped */
+	const bool partial = (leaves & RAW_LEAVES_ALL) != RAW_LEAVES_ALL;
+	/* Maximum leaves reported by the CPU, only known (and used) for partial collections */
+	uint32_t reported_basic = 0xffffffff;
+	uint32_t reported_ext   = 0xffffffff;
+	unsigned i, j;
+	int r = ERR_OK;
+
+	if (leaves & RAW_LEAVES_BASIC) {
+		r = exec_cpuid_leaf(handle, 0, 0, data->basic_cpuid[0]);
+		if (partial)
+			reported_basic = data->basic_cpuid[0][EAX];
+		for (i = 1; (r == ERR_OK) && (i < MAX_CPUID_LEVEL) && (i <= reported_basic); i++)
+			r = exec_cpuid_leaf(handle, i, 0, data->basic_cpuid[i]);
+	}
+	if ((r == ERR_OK) && (leaves & RAW_LEAVES_EXT)) {
+		r = exec_cpuid_leaf(handle, ADDRESS_EXT_CPUID_START, 0, data->ext_cpuid[0]);
+		if (partial)
+			reported_ext = data->ext_cpuid[0][EAX];
+		for (i = 1; (r == ERR_OK) && (i < MAX_EXT_CPUID_LEVEL) && (ADDRESS_EXT_CPUID_START + i <= reported_ext); i++)
+			r = exec_cpuid_leaf(handle, ADDRESS_EXT_CPUID_START + i, 0, data->ext_cpuid[i]);
+	}
+	for (i = 0; i < COUNT_OF(subleaves); i++) {
+		if (!(leaves & subleaves[i].family) || (subleaves[i].leaf > (subleaves[i].leaf < ADDRESS_EXT_CPUID_START ? reported_basic : reported_ext)))
+			continue;
+		for (j = 0; (r == ERR_OK) && (j < subleaves[i].count); j++)
+			r = exec_cpuid_leaf(handle, subleaves[i].leaf, j, subleaves[i].regs[j]);
+	}
+
+	return r;
+}
+#endif /* defined(PLATFORM_X86) || defined(PLATFORM_X64) */
+
 int cpuid_get_raw_data(struct cpu_raw_data_t* data)
 {
 	return(cpuid_get_raw_data_core(data, -1));
@@ -1329,68 +1454,39 @@ int cpuid_get_raw_data(struct cpu_raw_data_t* data)
 
 int cpuid_get_raw_data_core(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu)
 {
+	return cpuid_get_raw_data_core_leaves(data, logical_cpu, RAW_LEAVES_ALL);
+}
+
+int cpuid_get_raw_data_core_leaves(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu, uint32_t leaves)
+{
+	bool affinity_set = false;
 	bool affinity_saved = false;
+	uint64_t stats_start;
 
 	if (logical_cpu != (logical_cpu_t) -1) {
 		debugf(2, "Getting raw dump for logical CPU %u\n", logical_cpu);
-		if (set_cpu_affinity(logical_cpu))
-			affinity_saved = save_cpu_affinity();
-		else
-			/* Never return ERR_INVCNB for logical CPU 0 (in case set_cpu_affinity() is not supported) */
-			if (logical_cpu > 0)
-				return cpuid_set_error(ERR_INVCNB);
+		stats_start = cpuid_stats_start();
+		/* Save the affinity of the calling thread before pinning it, so that it is restored afterwards */
+		affinity_saved = save_cpu_affinity();
+		affinity_set = set_cpu_affinity(logical_cpu);
+		cpuid_stats_stop(STATS_PHASE_SET_AFFINITY, stats_start);
+		/* Never return ERR_INVCNB for logical CPU 0 (in case set_cpu_affinity() is not supported) */
+		if (!affinity_set && (logical_cpu > 0))
+			return cpuid_set_error(ERR_INVCNB);
 	}
 
 #if defined(PLATFORM_X86) || defined(PLATFORM_X64)
-	unsigned i;
-
 	if (!cpuid_present())
 		return cpuid_set_error(ERR_NO_CPUID);
 
-	for (i = 0; i < 32; i++)
-		cpu_exec_cpuid(i, data->basic_cpuid[i]);
-	for (i = 0; i < 32; i++)
-		cpu_exec_cpuid(0x80000000 + i, data->ext_cpuid[i]);
-	for (i = 0; i < MAX_INTELFN4_LEVEL; i++) {
-		memset(data->intel_fn4[i], 0, sizeof(data->intel_fn4[i]));
-		data->intel_fn4[i][EAX] = 4;
-		data->intel_fn4[i][ECX] = i;
-		cpu_exec_cpuid_ext(data->intel_fn4[i]);
-	}
-	for (i = 0; i < MAX_INTELFN11_LEVEL; i++) {
-		memset(data->intel_fn11[i], 0, sizeof(data->intel_fn11[i]));
-		data->intel_fn11[i][EAX] = 11;
-		data->intel_fn11[i][ECX] = i;
-		cpu_exec_cpuid_ext(data->intel_fn11[i]);
-	}
-	for (i = 0; i < MAX_INTELFN12H_LEVEL; i++) {
-		memset(data->intel_fn12h[i], 0, sizeof(data->intel_fn12h[i]));
-		data->intel_fn12h[i][EAX] = 0x12;
-		data->intel_fn12h[i][ECX] = i;
-		cpu_exec_cpuid_ext(data->intel_fn12h[i]);
-	}
-	for (i = 0; i < MAX_INTELFN14H_LEVEL; i++) {
-		memset(data->intel_fn14h[i], 0, sizeof(data->intel_fn14h[i]));
-		data->intel_fn14h[i][EAX] = 0x14;
-		data->intel_fn14h[i][ECX] = i;
-		cpu_exec_cpuid_ext(data->intel_fn14h[i]);
-	}
-	for (i = 0; i < MAX_AMDFN8000001DH_LEVEL; i++) {
-		memset(data->amd_fn8000001dh[i], 0, sizeof(data->amd_fn8000001dh[i]));
-		data->amd_fn8000001dh[i][EAX] = 0x8000001d;
-		data->amd_fn8000001dh[i][ECX] = i;
-		cpu_exec_cpuid_ext(data->amd_fn8000001dh[i]);
-	}
-	for (i = 0; i < MAX_AMDFN80000026H_LEVEL; i++) {
-		memset(data->amd_fn80000026h[i], 0, sizeof(data->amd_fn80000026h[i]));
-		data->amd_fn80000026h[i][EAX] = 0x80000026;
-		data->amd_fn80000026h[i][ECX] = i;
-		cpu_exec_cpuid_ext(data->amd_fn80000026h[i]);
-	}
+	get_raw_data_x86(data, NULL, leaves);
 #elif defined(PLATFORM_ARM) || defined(PLATFORM_AARCH64)
 	unsigned i;
 	struct cpuid_driver_t *handle;
 
+	/* Leaf families only apply to x86, all registers are always read */
+	UNUSED(leaves);
+
 	/* Try to use cpuid kernel driver on AArch32/AArch64 states */
 	if ((handle = cpu_cpuid_driver_open_core(logical_cpu)) != NULL) {
 		debugf(2, "Using kernel driver to read register on logical CPU %u\n", logical_cpu);
@@ -1459,23 +1555,57 @@ int cpuid_get_raw_data_core(struct cpu_raw_data_t* data, logical_cpu_t logical_c
 #else
 # warning This CPU architecture is not supported by libcpuid
 	UNUSED(data);
+	UNUSED(leaves);
 #endif
 
-	if (affinity_saved)
+	if (affinity_set && affinity_saved) {
+		stats_start = cpuid_stats_start();
 		restore_cpu_affinity();
+		cpuid_stats_stop(STATS_PHASE_SET_AFFINITY, stats_start);
+	}
 
 	return cpuid_set_error(ERR_OK);
 }
 
+int cpuid_get_raw_data_core_driver(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu)
+{
+	return cpuid_get_raw_data_core_driver_leaves(data, logical_cpu, RAW_LEAVES_ALL);
+}
+
+int cpuid_get_raw_data_core_driver_leaves(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu, uint32_t leaves)
+{
+#if defined(PLATFORM_X86) || defined(PLATFORM_X64)
+	int r;
+	struct cpuid_driver_t *handle;
+
+	if (data == NULL)
+		return cpuid_set_error(ERR_HANDLE);
+
+	debugf(2, "Getting raw dump for logical CPU %u through the kernel driver\n", logical_cpu);
+	if ((handle = cpu_cpuid_driver_open_core(logical_cpu)) == NULL)
+		return cpuid_get_error();
+	r = get_raw_data_x86(data, handle, leaves);
+	cpu_cpuid_driver_close(handle);
+	return cpuid_set_error(r);
+#else
+	UNUSED(data);
+	UNUSED(logical_cpu);
+	UNUSED(leaves);
+	return cpuid_set_error(ERR_NOT_IMP);
+#endif
+}
+
 int cpuid_get_all_raw_data(struct cpu_raw_data_array_t* data)
 {
 	int r = ERR_OK;
 	logical_cpu_t logical_cpu = 0;
 	struct cpu_raw_data_t raw_tmp;
+	uint64_t stats_start;
 
 	if (data == NULL)
 		return cpuid_set_error(ERR_HANDLE);
 
+	stats_start = cpuid_stats_start();
 	cpu_raw_data_array_t_constructor(data, true);
 	do {
 		memset(&raw_tmp, 0, sizeof(struct cpu_raw_data_t));
@@ -1489,6 +1619,7 @@ int cpuid_get_all_raw_data(struct cpu_raw_data_array_t* data)
 	/* On ERR_INVCNB, it means that logical_cpu value is out of bounds and we must break the loop, but it is a normal behavior. */
 	if (r == ERR_INVCNB)
 		r = ERR_OK;
+	cpuid_stats_stop(STATS_PHASE_GET_ALL_RAW_DATA, stats_start);
 	return cpuid_set_error(r);
 }
 
@@ -1513,7 +1644,7 @@ int cpuid_deserialize_all_raw_data(struct cpu_raw_data_array_t* data, const char
 	return cpuid_deserialize_raw_data_internal(NULL, data, filename);
 }
 
-int cpu_ident_internal(struct cpu_raw_data_t* raw, struct cpu_id_t* data, struct internal_id_info_t* internal)
+static int cpu_ident_internal_impl(struct cpu_raw_data_t* raw, struct cpu_id_t* data, struct internal_id_info_t* internal)
 {
 	int r;
 	struct cpu_raw_data_t myraw;
@@ -1576,6 +1707,15 @@ int cpu_ident_internal(struct cpu_raw_data_t* raw, struct cpu_id_t* data, struct
 	return cpuid_set_error(r);
 }
 
+int cpu_ident_internal(struct cpu_raw_data_t* raw, struct cpu_id_t* data, struct internal_id_info_t* internal)
+{
+	int r;
+	const uint64_t stats_start = cpuid_stats_start();
+	r = cpu_ident_internal_impl(raw, data, internal);
+	cpuid_stats_stop(STATS_PHASE_IDENT_INTERNAL, stats_start);
+	return r;
+}
+
 static cpu_purpose_t cpu_ident_purpose(struct cpu_raw_data_t* raw)
 {
 	cpu_vendor_t vendor = VENDOR_UNKNOWN;
@@ -1683,6 +1823,8 @@ int cpu_identify_all(struct cpu_raw_data_array_t* raw_array, struct system_id_t*
 	struct internal_topology_t topology;
 	struct internal_type_info_array_t type_info;
 	struct internal_cache_instances_t caches_all;
+	bool free_raw_array = false;
+	uint64_t stats_start;
 
 	/* Init variables */
 	if (system == NULL)
@@ -1691,6 +1833,7 @@ int cpu_identify_all(struct cpu_raw_data_array_t* raw_array, struct system_id_t*
 		if ((r = cpuid_get_all_raw_data(&my_raw_array)) < 0)
 			return r;
 		raw_array = &my_raw_array;
+		free_raw_array = true;
 	}
 	system_id_t_constructor(system);
 	type_info_array_t_constructor(&type_info);
@@ -1706,11 +1849,13 @@ int cpu_identify_all(struct cpu_raw_data_array_t* raw_array, struct system_id_t*
 		   APIC ID are unique for each logical CPU cores.
 		*/
 		purpose = cpu_ident_purpose(&raw_array->raw[logical_cpu]);
+		stats_start = cpuid_stats_start();
 		if (raw_array->with_affinity && is_topology_supported) {
 			is_topology_supported = cpu_ident_id(logical_cpu, &raw_array->raw[logical_cpu], &topology);
 			if (is_topology_supported)
 				cur_package_id = topology.package_id;
 		}
+		cpuid_stats_stop(STATS_PHASE_TOPOLOGY, stats_start);
 
 		/* Put data to system->cpu_types on the first iteration or when purpose is new.
 		   For motherboards with multiple CPUs, we grow the array when package ID is different. */
@@ -1720,7 +1865,7 @@ int cpu_identify_all(struct cpu_raw_data_array_t* raw_array, struct system_id_t*
 			cpuid_grow_system_id(system, system->num_cpu_types + 1);
 			cpuid_grow_type_info(&type_info, type_info.num + 1);
 			if ((r = cpu_ident_internal(&raw_array->raw[logical_cpu], &system->cpu_types[cpu_type_index], &type_info.data[cpu_type_index].id_info)) != ERR_OK)
-				return r;
+				break;
 			type_info.data[cpu_type_index].purpose = purpose;
 			if (is_topology_supported)
 				type_info.data[cpu_type_index].package_id = cur_package_id;
@@ -1729,6 +1874,7 @@ int cpu_identify_all(struct cpu_raw_data_array_t* raw_array, struct system_id_t*
 		}
 
 		/* Increment counters */
+		stats_start = cpuid_stats_start();
 		if (raw_array->with_affinity) {
 			set_affinity_mask_bit(logical_cpu, &system->cpu_types[cpu_type_index].affinity_mask);
 			system->cpu_types[cpu_type_index].num_logical_cpus++;
@@ -1738,9 +1884,17 @@ int cpu_identify_all(struct cpu_raw_data_array_t* raw_array, struct system_id_t*
 				update_cache_instances(&caches_all,  &topology, &type_info.data[cpu_type_index].id_info, false);
 			}
 		}
+		cpuid_stats_extend(STATS_PHASE_TOPOLOGY, stats_start);
+	}
+	if (free_raw_array)
+		cpuid_free_raw_data_array(&my_raw_array);
+	if (r != ERR_OK) {
+		cpuid_free_type_info(&type_info);
+		return r;
 	}
 
 	/* Update counters for all CPU types */
+	stats_start = cpuid_stats_start();
 	for (cpu_type_index = 0; cpu_type_index < system->num_cpu_types; cpu_type_index++) {
 		/* Overwrite core and cache counters when information is available per core */
 		if (raw_array->with_affinity) {
@@ -1773,31 +1927,38 @@ int cpu_identify_all(struct cpu_raw_data_array_t* raw_array, struct system_id_t*
 		system->l3_total_instances             = caches_all.instances[L3];
 		system->l4_total_instances             = caches_all.instances[L4];
 	}
+	cpuid_stats_extend(STATS_PHASE_TOPOLOGY, stats_start);
 
 	return cpuid_set_error(ERR_OK);
 }
 
 int cpu_request_core_type(cpu_purpose_t purpose, struct cpu_raw_data_array_t* raw_array, struct cpu_id_t* data)
 {
-	int r;
+	int r = ERR_NOT_FOUND;
 	logical_cpu_t logical_cpu = 0;
 	struct cpu_raw_data_array_t my_raw_array;
 	struct internal_id_info_t throwaway;
+	bool free_raw_array = false;
 
 	if (!raw_array) {
 		if ((r = cpuid_get_all_raw_data(&my_raw_array)) < 0)
 			return r;
 		raw_array = &my_raw_array;
+		free_raw_array = true;
+		r = ERR_NOT_FOUND;
 	}
 
 	for (logical_cpu = 0; logical_cpu < raw_array->num_raw; logical_cpu++) {
 		if (cpu_ident_purpose(&raw_array->raw[logical_cpu]) == purpose) {
 			cpu_ident_internal(&raw_array->raw[logical_cpu], data, &throwaway);
-			return cpuid_set_error(ERR_OK);
+			r = ERR_OK;
+			break;
 		}
 	}
 
-	return cpuid_set_error(ERR_NOT_FOUND);
+	if (free_raw_array)
+		cpuid_free_raw_data_array(&my_raw_array);
+	return cpuid_set_error(r);
 }
 
 const char* cpu_architecture_str(cpu_architecture_t architecture)
@@ -1921,7 +2082,7 @@ char* affinity_mask_str_r(cpu_affinity_mask_t* affinity_mask, char* buffer, uint
 
 char* affinity_mask_str(cpu_affinity_mask_t* affinity_mask)
 {
-	static char buffer[__MASK_SETSIZE + 1] = "";
+	INTERNAL_SCOPE char buffer[__MASK_SETSIZE + 1] = "";
 	return affinity_mask_str_r(affinity_mask, buffer, __MASK_SETSIZE + 1);
 }
 
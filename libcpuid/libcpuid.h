@@ -277,6 +277,25 @@ typedef enum {
 } hypervisor_vendor_t;
 #define NUM_HYPERVISOR_VENDORS NUM_HYPERVISOR_VENDORS
 
+/**
+ * @brief Families of x86 CPUID leaves stored in cpu_raw_data_t,
+ *        combined as a bit mask to collect only some of them.
+ *
+ * @see cpuid_get_raw_data_core_leaves
+ */
+typedef enum {
+	RAW_LEAVES_BASIC           = 0x01, /*!< basic_cpuid: vendor, family/model, most features */
+	RAW_LEAVES_EXT             = 0x02, /*!< ext_cpuid: brand string, extended features, AMD caches and cores */
+	RAW_LEAVES_INTEL_FN4       = 0x04, /*!< intel_fn4: Intel deterministic cache parameters, Intel purpose */
+	RAW_LEAVES_INTEL_FN11      = 0x08, /*!< intel_fn11: Intel extended topology (core counts, topology) */
+	RAW_LEAVES_INTEL_FN12H     = 0x10, /*!< intel_fn12h: SGX */
+	RAW_LEAVES_INTEL_FN14H     = 0x20, /*!< intel_fn14h: Intel Processor Trace (not used by the identification) */
+	RAW_LEAVES_AMD_FN8000001DH = 0x40, /*!< amd_fn8000001dh: AMD cache topology */
+	RAW_LEAVES_AMD_FN80000026H = 0x80, /*!< amd_fn80000026h: AMD extended topology, AMD purpose */
+	RAW_LEAVES_QUICK           = 0x03, /*!< the leaves needed for vendor, family/model, brand string and features */
+	RAW_LEAVES_ALL             = 0xff, /*!< all leaves, as collected by cpuid_get_raw_data_core() */
+} cpu_raw_leaves_t;
+
 /**
  * @brief Contains just the raw CPUID data.
  *
@@ -1278,6 +1297,58 @@ int cpuid_get_raw_data(struct cpu_raw_data_t* data);
  */
 int cpuid_get_raw_data_core(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu);
 
+/**
+ * @brief Obtains the raw CPUID data from the specified CPU through the cpuid kernel driver
+ * @param data - a pointer to cpu_raw_data_t structure
+ * @param logical_cpu specify the core number.
+ *          The first core number is 0.
+ *          The last core number is \ref cpuid_get_total_cpus - 1.
+ * @note Unlike \ref cpuid_get_raw_data_core, the calling thread is not migrated
+ *       to the specified CPU: every leaf is read from the per-CPU cpuid device
+ *       (/dev/cpu/N/cpuid on Linux), so raw data of several CPUs can be
+ *       collected concurrently from different threads.
+ *       This is only supported for x86 CPUs on Linux, and the cpuid module must
+ *       be loaded (if not, it is loaded automatically when running as root).
+ * @returns zero if successful, and some negative number on error
+ *          (\ref ERR_NO_DRIVER if the device is missing or not readable,
+ *          \ref ERR_INVCNB if logical_cpu is out of range,
+ *          \ref ERR_NOT_IMP on unsupported platforms).
+ *          The error message can be obtained by calling \ref cpuid_error.
+ *          @see cpu_error_t
+ */
+int cpuid_get_raw_data_core_driver(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu);
+
+/**
+ * @brief Obtains some of the raw CPUID data from the specified CPU
+ * @param data - a pointer to cpu_raw_data_t structure
+ * @param logical_cpu specify the core number (see \ref cpuid_get_raw_data_core).
+ * @param leaves - the families of leaves to collect, a bit mask of \ref cpu_raw_leaves_t.
+ * @note Every CPUID instruction costs a hypervisor exit in virtual machines,
+ *       so callers which only need a few fields can save most of them,
+ *       e.g. with \ref RAW_LEAVES_QUICK. Unless all leaves are requested,
+ *       the leaves above the maximum reported by leaf 0 (resp. 0x80000000)
+ *       are skipped too. Skipped leaves are not written, so data should be
+ *       zero-initialized; the fields decoded from them are then reported as
+ *       unknown by \ref cpu_identify.
+ *       Leaf families only apply to x86: all registers are always read on ARM.
+ * @returns zero if successful, and some negative number on error.
+ *          The error message can be obtained by calling \ref cpuid_error.
+ *          @see cpu_error_t
+ */
+int cpuid_get_raw_data_core_leaves(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu, uint32_t leaves);
+
+/**
+ * @brief Obtains some of the raw CPUID data from the specified CPU through the cpuid kernel driver
+ * @param data - a pointer to cpu_raw_data_t structure
+ * @param logical_cpu specify the core number (see \ref cpuid_get_raw_data_core_driver).
+ * @param leaves - the families of leaves to collect, a bit mask of \ref cpu_raw_leaves_t.
+ * @note See \ref cpuid_get_raw_data_core_leaves and \ref cpuid_get_raw_data_core_driver.
+ * @returns zero if successful, and some negative number on error.
+ *          The error message can be obtained by calling \ref cpuid_error.
+ *          @see cpu_error_t
+ */
+int cpuid_get_raw_data_core_driver_leaves(struct cpu_raw_data_t* data, logical_cpu_t logical_cpu, uint32_t leaves);
+
 /**
  * @brief Obtains the raw CPUID data from all CPUs
  * @param data - a pointer to cpu_raw_data_array_t structure
@@ -1445,7 +1516,8 @@ char* affinity_mask_str_r(cpu_affinity_mask_t* affinity_mask, char* buffer, uint
 /**
  * @brief Returns textual representation of a CPU affinity mask
  * @param affinity_mask - the affinity mask (in hexadecimal), whose textual representation is wanted.
- * @note This function is not thread-safe
+ * @note The returned buffer is overwritten by the next call from the same thread
+ *       (or from any thread, if the compiler lacks thread-local storage)
  * @returns a string like "0000FFFF", "00FF0000", etc.
  */
 char* affinity_mask_str(cpu_affinity_mask_t *affinity_mask);
@@ -1464,7 +1536,10 @@ const char* cpu_feature_str(cpu_feature_t feature);
  *
  * libcpuid stores an `errno'-style error status, whose description
  * can be obtained with this function.
- * @note This function is not thread-safe
+ * @note The error status is kept per thread, like the rest of the library
+ *       state (e.g., the saved CPU affinity), so several threads may call
+ *       libcpuid at once. This requires a compiler supporting thread-local
+ *       storage (C11, GCC/Clang or MSVC); otherwise the library is not thread-safe.
  * @see cpu_error_t
  */
 const char* cpuid_error(void);
@@ -1686,6 +1761,71 @@ int cpu_clock_by_tsc(struct cpu_raw_data_t* raw);
  */
 int cpu_clock(void);
 
+/**
+ * @brief Measure the latency of dependent loads over a working set
+ *
+ * @param working_set - the size of the working set, in bytes (at least 128
+ *                      bytes and at most 1 GiB)
+ * @param millis - how much time to spend measuring, in milliseconds
+ *
+ * The function chases pointers through a random cyclic permutation of the
+ * 64-byte lines of a freshly allocated buffer of the given size, so that each
+ * load depends on the previous one and the hardware prefetchers are defeated.
+ * After a warm-up pass, the average time of a single load reflects the
+ * innermost level of the memory hierarchy the whole working set fits in.
+ * Sweeping the working set size thus reveals the effective cache sizes.
+ *
+ * The result is affected by task scheduling and by migrations to other
+ * logical CPUs, so pin the calling thread to a single logical CPU first.
+ *
+ * @returns the average latency of a load in picoseconds, or a negative error
+ * code (\ref ERR_INVRANGE if the parameters are out of range, \ref ERR_NO_MEM
+ * if the buffer cannot be allocated).
+ */
+int cpu_mem_latency(uint64_t working_set, int millis);
+
+/**
+ * @brief Measure the streaming read bandwidth over a working set
+ *
+ * @param working_set - the size of the working set, in bytes (at least 32
+ *                      bytes and at most 1 GiB)
+ * @param millis - how much time to spend measuring, in milliseconds
+ *
+ * The function reads sequentially a freshly allocated buffer of the given
+ * size over and over, using independent accumulators. As with
+ * cpu_mem_latency(), pin the calling thread to a single logical CPU first.
+ *
+ * @returns the bandwidth in MB/s, or a negative error code (\ref ERR_INVRANGE
+ * if the parameters are out of range, \ref ERR_NO_MEM if the buffer cannot be
+ * allocated).
+ */
+int cpu_mem_bandwidth(uint64_t working_set, int millis);
+
+/**
+ * @brief Run one side of a TSC ping-pong between two threads
+ *
+ * @param shared - a zero-initialized array of 16 uint64_t, shared by both sides
+ * @param role - 0 for the side sending the requests, 1 for the side replying
+ * @param rounds - the number of round trips
+ * @param samples - for role 0, an array of 3 * rounds uint64_t, receiving for
+ *                  each round the TSC of the sender before its request, the TSC
+ *                  of the replying side and the TSC of the sender after the
+ *                  reply. Ignored for role 1.
+ * @param timeout_ms - how long to wait for the other side in each round
+ *
+ * Both sides must run concurrently, each pinned to one of the two logical CPUs
+ * to compare. If the TSCs of both CPUs are synchronized, the TSC of the
+ * replying side lies between the two TSCs of the sender in every round.
+ * The offset between the two TSCs is bounded by the tightest round trip.
+ *
+ * NOTE: only x86 CPUs are supported.
+ *
+ * @returns zero if successful, and some negative number on error
+ * (\ref ERR_REQUEST if the other side did not respond in time,
+ * \ref ERR_NOT_IMP on other architectures).
+ */
+int cpu_tsc_ping_pong(uint64_t* shared, int role, int rounds, uint64_t* samples, int timeout_ms);
+
 
 /**
  * @brief The return value of cpuid_get_epc().
@@ -1835,6 +1975,79 @@ void cpuid_free_raw_data_array(struct cpu_raw_data_array_t* raw_array);
  */
 void cpuid_free_system_id(struct system_id_t* system);
 
+/**
+ * @brief Phases of the library measured by the instrumentation
+ * @see cpuid_enable_stats
+ */
+typedef enum {
+	STATS_PHASE_GET_ALL_RAW_DATA = 0, /*!< cpuid_get_all_raw_data(), including the affinity switching */
+	STATS_PHASE_SET_AFFINITY,         /*!< switching to, saving and restoring the CPU affinity while collecting raw data */
+	STATS_PHASE_IDENT_INTERNAL,       /*!< decoding the raw data of a single logical CPU */
+	STATS_PHASE_MATCH_CODENAME,       /*!< scoring the CPU against the codename table of its vendor */
+	STATS_PHASE_TOPOLOGY,             /*!< decoding the topology and counting the core and cache instances in cpu_identify_all() */
+	NUM_STATS_PHASES,                 /*!< Valid stats phase ids: 0..NUM_STATS_PHASES - 1 */
+} cpuid_stats_phase_t;
+
+/**
+ * @brief Counters of a single instrumented phase
+ */
+struct cpuid_phase_stats_t {
+	/** number of times the phase was entered */
+	uint64_t count;
+
+	/** total time spent in the phase, in nanoseconds */
+	uint64_t duration_ns;
+};
+
+/**
+ * @brief Instrumentation counters
+ * @see cpuid_get_stats
+ */
+struct cpuid_stats_t {
+	/** counters of each phase, indexed by cpuid_stats_phase_t */
+	struct cpuid_phase_stats_t phases[NUM_STATS_PHASES];
+
+	/** number of executed cpuid instructions */
+	uint64_t num_cpuid;
+};
+
+/**
+ * @brief Enables or disables the instrumentation
+ *
+ * When enabled, libcpuid measures the time spent in the phases listed in
+ * \ref cpuid_stats_phase_t and counts the executed cpuid instructions.
+ * The instrumentation is disabled by default; when disabled, its overhead
+ * is a single check per phase. The counters are kept per thread.
+ *
+ * @param enabled - non-zero to enable the instrumentation, zero to disable it.
+ *                  Disabling it keeps the collected counters.
+ */
+void cpuid_enable_stats(int enabled);
+
+/**
+ * @brief Checks whether the instrumentation is enabled in the calling thread
+ *
+ * @returns non-zero if the instrumentation is enabled, zero otherwise.
+ * @see cpuid_enable_stats
+ */
+int cpuid_stats_enabled(void);
+
+/**
+ * @brief Gets the instrumentation counters of the calling thread
+ *
+ * @param stats - the counters collected since the last cpuid_reset_stats()
+ *                call are written here.
+ * @returns zero if successful, and some negative number on error.
+ *          The error message can be obtained by calling \ref cpuid_error.
+ *          @see cpu_error_t
+ */
+int cpuid_get_stats(struct cpuid_stats_t* stats);
+
+/**
+ * @brief Resets the instrumentation counters of the calling thread to zero
+ */
+void cpuid_reset_stats(void);
+
 struct msr_driver_t;
 /**
  * @brief Starts/opens a driver, needed to read MSRs (Model Specific Registers)
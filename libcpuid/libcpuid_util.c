@@ -130,6 +130,7 @@ int match_cpu_codename(const struct match_entry_t* matchtable, int count,
 	int bestscore = -1;
 	int bestindex = 0;
 	int i, t;
+	const uint64_t stats_start = cpuid_stats_start();
 
 	debugf(3, "Matching cpu f:%d, m:%d, s:%d, xf:%d, xm:%d, ncore:%d, l2:%d, bcode:%d, bits:%llu, code:%d\n",
 		data->x86.family, data->x86.model, data->x86.stepping, data->x86.ext_family,
@@ -145,6 +146,7 @@ int match_cpu_codename(const struct match_entry_t* matchtable, int count,
 		}
 	}
 	strncpy(data->cpu_codename, matchtable[bestindex].name, CODENAME_STR_MAX);
+	cpuid_stats_stop(STATS_PHASE_MATCH_CODENAME, stats_start);
 	return bestscore;
 }
 
@@ -226,8 +228,8 @@ int match_pattern(const char* s, const char* p)
 
 struct cpu_id_t* get_cached_cpuid(void)
 {
-	static int initialized = 0;
-	static struct cpu_id_t id;
+	INTERNAL_SCOPE int initialized = 0;
+	INTERNAL_SCOPE struct cpu_id_t id;
 	if (initialized) return &id;
 	if (cpu_identify(NULL, &id) != ERR_OK) {
 		memset(&id, 0, sizeof(id));
@@ -31,6 +31,22 @@
 #define COUNT_OF(array) (sizeof(array) / sizeof(array[0]))
 #define UNUSED(x) (void)(x)
 
+/*
+ * Storage class of the library state which must not be shared between threads
+ * (the last error, the saved CPU affinity, cached identification data...),
+ * so that the library can be used from several threads at once.
+ */
+#if defined(_MSC_VER)
+# define INTERNAL_SCOPE static __declspec(thread)
+#elif defined(__STDC_VERSION__) && __STDC_VERSION__ >= 201112L
+# define INTERNAL_SCOPE static _Thread_local
+#elif defined(__GNUC__) // Also works for clang
+# define INTERNAL_SCOPE static __thread
+#else
+/* No thread-local storage: the library is not thread-safe */
+# define INTERNAL_SCOPE static
+#endif
+
 struct feature_map_t {
 	unsigned bit;
 	cpu_feature_t feature;
@@ -100,6 +116,16 @@ int cpuid_set_error(cpu_error_t err);
  */
 int cpuid_get_error(void);
 
+/*
+ * Instrumentation, see cpuid_enable_stats(). cpuid_stats_start() returns the
+ * start timestamp of a phase (zero if the instrumentation is disabled),
+ * cpuid_stats_stop() counts an entry of the phase and adds the elapsed time,
+ * cpuid_stats_extend() only adds the elapsed time to the last entry.
+ */
+uint64_t cpuid_stats_start(void);
+void cpuid_stats_stop(cpuid_stats_phase_t phase, uint64_t start);
+void cpuid_stats_extend(cpuid_stats_phase_t phase, uint64_t start);
+
 extern libcpuid_warn_fn_t _warn_fun;
 extern int _current_verboselevel;
 
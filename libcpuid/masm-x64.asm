@@ -39,6 +39,19 @@ cpu_rdtsc Proc
 	ret
 cpu_rdtsc endp
 
+; procedure cpu_rdtsc_ordered
+; Signature: void cpu_rdtsc_ordered(uint64_t *result)
+cpu_rdtsc_ordered Proc
+	push	rdx
+	lfence
+	rdtsc
+	lfence
+	mov	[rcx],	eax
+	mov	[rcx+4],	edx
+	pop	rdx
+	ret
+cpu_rdtsc_ordered endp
+
 ; procedure busy_sse_loop
 ; Signature: void busy_sse_loop(int cycles)
 busy_sse_loop Proc
@@ -27,6 +27,8 @@
 /* freebsd requires _XOPEN_SOURCE 600 for snprintf()
  * for linux it is enough 500 */
 #define _XOPEN_SOURCE 600
+/* The Linux cpuid driver takes the subleaf in the high 32 bits of the file offset */
+#define _FILE_OFFSET_BITS 64
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -138,6 +140,26 @@ int cpu_read_arm_register_64b(struct cpuid_driver_t* driver, reg_request_t reque
 	return 0;
 }
 
+int cpu_read_x86_cpuid(struct cpuid_driver_t* driver, uint32_t* regs)
+{
+# if defined (__linux__) || defined (__gnu_linux__)
+	/* The leaf is taken from the low 32 bits of the offset, and the subleaf from the high 32 bits */
+	const off_t offset = ((off_t) regs[ECX] << 32) | regs[EAX];
+
+	if (!driver || driver->fd < 0)
+		return cpuid_set_error(ERR_HANDLE);
+
+	if (pread(driver->fd, regs, NUM_REGS * sizeof(uint32_t), offset) != NUM_REGS * sizeof(uint32_t))
+		return cpuid_set_error(ERR_HANDLE_R);
+
+	return 0;
+# else
+	UNUSED(driver);
+	UNUSED(regs);
+	return cpuid_set_error(ERR_NOT_IMP);
+# endif
+}
+
 int cpu_cpuid_driver_close(struct cpuid_driver_t* drv)
 {
 	if (drv && drv->fd >= 0) {
@@ -176,6 +198,13 @@ int cpu_read_arm_register_64b(struct cpuid_driver_t* driver, reg_request_t reque
 	return cpuid_set_error(ERR_NOT_IMP);
 }
 
+int cpu_read_x86_cpuid(struct cpuid_driver_t* driver, uint32_t* regs)
+{
+	UNUSED(driver);
+	UNUSED(regs);
+	return cpuid_set_error(ERR_NOT_IMP);
+}
+
 int cpu_cpuid_driver_close(struct cpuid_driver_t* driver)
 {
 	UNUSED(driver);
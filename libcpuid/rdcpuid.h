@@ -29,6 +29,8 @@
 struct cpuid_driver_t* cpu_cpuid_driver_open_core(unsigned core_num);
 int cpu_read_arm_register_32b(struct cpuid_driver_t* driver, reg_request_t request, uint32_t* result);
 int cpu_read_arm_register_64b(struct cpuid_driver_t* driver, reg_request_t request, uint64_t* result);
+/* Executes CPUID (leaf in regs[EAX], subleaf in regs[ECX]) on the driver's CPU, see cpu_exec_cpuid_ext() */
+int cpu_read_x86_cpuid(struct cpuid_driver_t* driver, uint32_t* regs);
 int cpu_cpuid_driver_close(struct cpuid_driver_t* drv);
 
 #endif /* __RDCPUID_H__ */
@@ -977,6 +977,7 @@ static int get_amd_multipliers(struct msr_info_t *info, uint32_t pstate, double
 static uint32_t get_amd_last_pstate_addr(struct msr_info_t *info)
 {
 	static uint32_t last_addr = 0x0;
+	uint32_t addr;
 	uint64_t reg = 0x0;
 
 	/* The result is cached, need to be computed once */
@@ -985,12 +986,14 @@ static uint32_t get_amd_last_pstate_addr(struct msr_info_t *info)
 
 	/* Refer links above
 	MSRC001_00[6B:64][63] is PstateEn
-	PstateEn indicates if the rest of the P-state information in the register is valid after a reset */
-	last_addr = MSR_PSTATE_7 + 1;
-	while((reg == 0x0) && (last_addr > MSR_PSTATE_0)) {
-		last_addr--;
-		cpu_rdmsr_range(info->handle, last_addr, 63, 63, &reg);
+	PstateEn indicates if the rest of the P-state information in the register is valid after a reset
+	The address is only published once found, as other threads may read the cached value meanwhile */
+	addr = MSR_PSTATE_7 + 1;
+	while((reg == 0x0) && (addr > MSR_PSTATE_0)) {
+		addr--;
+		cpu_rdmsr_range(info->handle, addr, 63, 63, &reg);
 	}
+	last_addr = addr;
 	return last_addr;
 }
 
@@ -1212,11 +1215,11 @@ int cpu_rdmsr_range(struct msr_driver_t* handle, uint32_t msr_index, uint8_t hig
 
 int cpu_msrinfo(struct msr_driver_t* handle, cpu_msrinfo_request_t which)
 {
-	static int err = 0, init = 0;
+	INTERNAL_SCOPE int err = 0, init = 0;
 	struct cpu_raw_data_t raw;
-	static struct cpu_id_t id;
-	static struct internal_id_info_t internal;
-	static struct msr_info_t info;
+	INTERNAL_SCOPE struct cpu_id_t id;
+	INTERNAL_SCOPE struct internal_id_info_t internal;
+	INTERNAL_SCOPE struct msr_info_t info;
 
 	if (handle == NULL) {
 		cpuid_set_error(ERR_HANDLE);
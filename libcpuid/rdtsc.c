@@ -24,6 +24,7 @@
  * THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
  */
 #include <stdio.h>
+#include <stdlib.h>
 #include <string.h>
 #include "libcpuid.h"
 #include "libcpuid_util.h"
@@ -403,6 +404,196 @@ int cpu_clock_by_tsc(struct cpu_raw_data_t* raw)
 	return (nominal_freq_khz * numerator) / denominator / 1000;
 }
 
+#define MEM_BENCH_LINE 64
+#define MEM_BENCH_CHUNK 1024
+
+static uint32_t xorshift32(uint32_t* state)
+{
+	uint32_t x = *state;
+	x ^= x << 13;
+	x ^= x >> 17;
+	x ^= x << 5;
+	return *state = x;
+}
+
+/* Returns the random index in [0, n) (n is well below 2^32) */
+static size_t random_index(uint32_t* state, size_t n)
+{
+	return (size_t) (((uint64_t) xorshift32(state) * n) >> 32);
+}
+
+static int check_mem_bench_params(uint64_t working_set, int millis, uint64_t min_size)
+{
+	if (millis < 1 || working_set < min_size || working_set > 0x40000000)
+		return cpuid_set_error(ERR_INVRANGE);
+	return ERR_OK;
+}
+
+int cpu_mem_latency(uint64_t working_set, int millis)
+{
+	void *block, **lines, **p;
+	void* volatile sink;
+	size_t *order, n, i, j, tmp;
+	uint32_t seed = 0x2545f491;
+	uint64_t t0, t1, steps = 0, elapsed;
+	int r;
+
+	if ((r = check_mem_bench_params(working_set, millis, 2 * MEM_BENCH_LINE)) < 0)
+		return r;
+	n = (size_t) (working_set / MEM_BENCH_LINE);
+	block = malloc(n * MEM_BENCH_LINE + MEM_BENCH_LINE);
+	order = (size_t*) malloc(n * sizeof(size_t));
+	if (!block || !order) {
+		free(block);
+		free(order);
+		return cpuid_set_error(ERR_NO_MEM);
+	}
+	lines = (void**) (((size_t) block + MEM_BENCH_LINE - 1) & ~(size_t) (MEM_BENCH_LINE - 1));
+	/* Sattolo's algorithm: a random cyclic permutation visiting every line
+	   once, so that neither the hardware prefetchers nor the out-of-order
+	   execution can guess the next address */
+	for (i = 0; i < n; i++)
+		order[i] = i;
+	for (i = n - 1; i > 0; i--) {
+		j = random_index(&seed, i);
+		tmp = order[i];
+		order[i] = order[j];
+		order[j] = tmp;
+	}
+	for (i = 0; i < n; i++)
+		lines[order[i] * (MEM_BENCH_LINE / sizeof(void*))] = &lines[order[(i + 1) % n] * (MEM_BENCH_LINE / sizeof(void*))];
+	free(order);
+
+	/* Warm up: bring the working set into the caches (and the TLBs) */
+	p = lines;
+	for (i = 0; i < n; i++)
+		p = (void**) *p;
+	sys_precise_clock(&t0);
+	do {
+		for (i = 0; i < MEM_BENCH_CHUNK; i += 8) {
+			p = (void**) *p; p = (void**) *p; p = (void**) *p; p = (void**) *p;
+			p = (void**) *p; p = (void**) *p; p = (void**) *p; p = (void**) *p;
+		}
+		steps += MEM_BENCH_CHUNK;
+		sys_precise_clock(&t1);
+		elapsed = t1 - t0;
+	} while (elapsed < millis * (uint64_t) 1000);
+	/* Make the chased pointer observable, so the loop cannot be optimized out */
+	sink = p;
+	UNUSED(sink);
+	free(block);
+	debugf(2, "cpu_mem_latency(%llu): %llu steps in %llu us\n", (unsigned long long) working_set, (unsigned long long) steps, (unsigned long long) elapsed);
+	/* Average latency of a dependent load, in picoseconds */
+	return (int) (elapsed * 1000000 / steps);
+}
+
+int cpu_mem_bandwidth(uint64_t working_set, int millis)
+{
+	uint64_t *data, s0 = 0, s1 = 0, s2 = 0, s3 = 0, t0, t1, bytes = 0, elapsed;
+	volatile uint64_t sink;
+	size_t n, i, k, passes;
+	int r;
+
+	if ((r = check_mem_bench_params(working_set, millis, 4 * sizeof(uint64_t))) < 0)
+		return r;
+	n = (size_t) (working_set / (4 * sizeof(uint64_t)) * 4);
+	data = (uint64_t*) malloc(n * sizeof(uint64_t));
+	if (!data)
+		return cpuid_set_error(ERR_NO_MEM);
+	for (i = 0; i < n; i++)
+		data[i] = i;
+	/* Read at least 64 KiB between clock readings */
+	passes = n * sizeof(uint64_t) < 65536 ? 65536 / (n * sizeof(uint64_t)) : 1;
+
+	/* Warm up with a first pass, then read the whole working set repeatedly */
+	for (i = 0; i < n; i++)
+		s0 += data[i];
+	sys_precise_clock(&t0);
+	do {
+		for (k = 0; k < passes; k++)
+			for (i = 0; i < n; i += 4) {
+				s0 += data[i];
+				s1 += data[i + 1];
+				s2 += data[i + 2];
+				s3 += data[i + 3];
+			}
+		bytes += passes * n * sizeof(uint64_t);
+		sys_precise_clock(&t1);
+		elapsed = t1 - t0;
+	} while (elapsed < millis * (uint64_t) 1000);
+	sink = s0 + s1 + s2 + s3;
+	UNUSED(sink);
+	free(data);
+	debugf(2, "cpu_mem_bandwidth(%llu): %llu bytes in %llu us\n", (unsigned long long) working_set, (unsigned long long) bytes, (unsigned long long) elapsed);
+	/* Bytes per microsecond are megabytes per second */
+	return (int) (bytes / elapsed);
+}
+
+#define TSC_SYNC_SEQ 0
+#define TSC_SYNC_REPLY 8
+#define TSC_SYNC_SPINS 4096
+
+/* Spins until shared[TSC_SYNC_SEQ] == seq, or the timeout expires */
+static int tsc_sync_wait(volatile uint64_t* shared, uint64_t seq, uint64_t deadline)
+{
+	uint64_t now;
+	int spins = 0;
+	while (shared[TSC_SYNC_SEQ] != seq) {
+		if (++spins == TSC_SYNC_SPINS) {
+			spins = 0;
+			sys_precise_clock(&now);
+			if (now > deadline)
+				return cpuid_set_error(ERR_REQUEST);
+		}
+	}
+	return ERR_OK;
+}
+
+int cpu_tsc_ping_pong(uint64_t* shared, int role, int rounds, uint64_t* samples, int timeout_ms)
+{
+#if defined(PLATFORM_X86) || defined(PLATFORM_X64)
+	volatile uint64_t* sync = shared;
+	uint64_t deadline, t0, t1;
+	int i, r;
+
+	if (shared == NULL || (role == 0 && samples == NULL))
+		return cpuid_set_error(ERR_HANDLE);
+	if ((role != 0 && role != 1) || rounds < 1 || timeout_ms < 1)
+		return cpuid_set_error(ERR_INVRANGE);
+	for (i = 0; i < rounds; i++) {
+		sys_precise_clock(&deadline);
+		deadline += timeout_ms * (uint64_t) 1000;
+		if (role == 0) {
+			/* Ping: read the TSC, then publish the request (ordered reads keep the TSC
+			   readings from moving past the store of the request or the load of the reply) */
+			cpu_rdtsc_ordered(&t0);
+			sync[TSC_SYNC_SEQ] = 2 * (uint64_t) i + 1;
+			if ((r = tsc_sync_wait(sync, 2 * (uint64_t) i + 2, deadline)) < 0)
+				return r;
+			cpu_rdtsc_ordered(&t1);
+			samples[3 * i]     = t0;
+			samples[3 * i + 1] = sync[TSC_SYNC_REPLY];
+			samples[3 * i + 2] = t1;
+		} else {
+			/* Pong: read the TSC as soon as the request is seen, then reply */
+			if ((r = tsc_sync_wait(sync, 2 * (uint64_t) i + 1, deadline)) < 0)
+				return r;
+			cpu_rdtsc_ordered(&t0);
+			sync[TSC_SYNC_REPLY] = t0;
+			sync[TSC_SYNC_SEQ] = 2 * (uint64_t) i + 2;
+		}
+	}
+	return cpuid_set_error(ERR_OK);
+#else
+	UNUSED(shared);
+	UNUSED(role);
+	UNUSED(rounds);
+	UNUSED(samples);
+	UNUSED(timeout_ms);
+	return cpuid_set_error(ERR_NOT_IMP);
+#endif /* defined(PLATFORM_X86) || defined(PLATFORM_X64) */
+}
+
 int cpu_clock(void)
 {
 	int result;
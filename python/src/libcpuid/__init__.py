@@ -3,6 +3,8 @@ The libcpuid package defines Python bindings to the
 libcpuid C library, which provides CPU identification.
 """
 
+from functools import cache
+from typing import Iterable
 from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
     ffi,
     lib,
@@ -35,19 +37,28 @@ def get_vendor() -> enums.CPUVendor:
         return enums.CPUVendor.UNKNOWN
 
 
-def get_cpu_list(vendor: enums.CPUVendor) -> list[str]:
-    """Gets a list of CPU :meth:`codenames <info.CPUInfo.cpu_codename>` for a specific vendor."""
+@cache
+def _get_cpu_list(vendor: enums.CPUVendor) -> tuple[str, ...]:
     c_cpu_list = ffi.new("struct cpu_list_t *")
     lib.cpuid_get_cpu_list(vendor, c_cpu_list)
     if c_cpu_list.num_entries == 0:
         raise CLibraryError
-    cpu_list = [
+    cpu_list = tuple(
         c_string_to_str(name) for name in c_cpu_list.names[0 : c_cpu_list.num_entries]
-    ]
+    )
     lib.cpuid_free_cpu_list(c_cpu_list)
     return cpu_list
 
 
+def get_cpu_list(vendor: enums.CPUVendor) -> list[str]:
+    """
+    Gets a list of CPU :meth:`codenames <info.CPUInfo.cpu_codename>` for a specific vendor.
+    The list is built once per vendor. See :mod:`libcpuid.codenames`
+    for the matching data of the codenames.
+    """
+    return list(_get_cpu_list(vendor))
+
+
 def exec_cpuid(
     eax: bytes,
     ebx: bytes = 4 * b"\x00",
@@ -66,3 +77,23 @@ def exec_cpuid(
     )
     lib.cpu_exec_cpuid_ext(regs)
     return tuple(reg.to_bytes(4) for reg in regs)
+
+
+def has_feature(feature: enums.CPUFeature) -> bool:
+    """
+    Checks whether the current CPU has the given feature
+    (see :func:`libcpuid.probe.has_feature`).
+    """
+    from libcpuid import probe  # pylint: disable=import-outside-toplevel
+
+    return probe.has_feature(feature)
+
+
+def has_features(features: Iterable[enums.CPUFeature]) -> bool:
+    """
+    Checks whether the current CPU has all of the given features
+    (see :func:`libcpuid.probe.has_features`).
+    """
+    from libcpuid import probe  # pylint: disable=import-outside-toplevel
+
+    return probe.has_features(features)
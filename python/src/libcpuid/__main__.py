@@ -0,0 +1,264 @@
+"""
+Command-line interface of the libcpuid package, run as ``python -m libcpuid``.
+
+It accepts the field selectors of the C `cpuid_tool` utility (e.g., ``--family``
+or ``--l2-cache``) and prints the selected fields of every identified CPU type,
+one value per line, or all fields if none are selected. With ``--json`` or
+``--jsonl``, the results are printed in a machine-readable format
+(see :mod:`libcpuid.export`). Modules are imported only when needed.
+"""
+
+import argparse
+import sys
+from typing import Optional
+
+FIELD_SELECTORS = {
+    "--architecture": "architecture",
+    "--feature-level": "feature_level",
+    "--purpose": "purpose",
+    "--vendorstr": "vendor_str",
+    "--vendorid": "vendor",
+    "--brandstr": "brand_str",
+    "--family": "family",
+    "--model": "model",
+    "--stepping": "stepping",
+    "--extfamily": "ext_family",
+    "--extmodel": "ext_model",
+    "--implementer": "implementer",
+    "--variant": "variant",
+    "--part-num": "part_num",
+    "--revision": "revision",
+    "--cores": "num_cores",
+    "--logical": "num_logical_cpus",
+    "--total-cpus": "total_logical_cpus",
+    "--affi-mask": "affinity_mask",
+    "--l1d-cache": "l1_data_cache",
+    "--l1i-cache": "l1_instruction_cache",
+    "--cache": "l2_cache",
+    "--l2-cache": "l2_cache",
+    "--l3-cache": "l3_cache",
+    "--l4-cache": "l4_cache",
+    "--l1d-assoc": "l1_data_assoc",
+    "--l1i-assoc": "l1_instruction_assoc",
+    "--l2-assoc": "l2_assoc",
+    "--l3-assoc": "l3_assoc",
+    "--l4-assoc": "l4_assoc",
+    "--l1d-cacheline": "l1_data_cacheline",
+    "--l1i-cacheline": "l1_instruction_cacheline",
+    "--l2-cacheline": "l2_cacheline",
+    "--l3-cacheline": "l3_cacheline",
+    "--l4-cacheline": "l4_cacheline",
+    "--l1d-instances": "l1_data_instances",
+    "--l1i-instances": "l1_instruction_instances",
+    "--l2-instances": "l2_instances",
+    "--l3-instances": "l3_instances",
+    "--l4-instances": "l4_instances",
+    "--codename": "cpu_codename",
+    "--flags": "features",
+    "--sse-size": "sse_size",
+}
+"""Field selectors of `cpuid_tool`, mapped to the keys of exported rows."""
+
+LIVE_SELECTORS = {
+    "--cpuid": "cpuid_present",
+    "--clock": "clock",
+    "--clock-os": "clock_os",
+    "--clock-rdtsc": "clock_rdtsc",
+    "--clock-ic": "clock_ic",
+}
+"""Selectors of values measured on the current machine, not read from raw data."""
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="libcpuid",
+        description="Identifies the CPU types of the current machine or of saved raw dumps.",
+    )
+    selectors = parser.add_argument_group("field selectors")
+    for option, field in FIELD_SELECTORS.items():
+        selectors.add_argument(
+            option, dest="fields", action="append_const", const=field
+        )
+    for option, field in LIVE_SELECTORS.items():
+        selectors.add_argument(
+            option, dest="live_fields", action="append_const", const=field
+        )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--json", action="store_true", help="print the results as JSON documents"
+    )
+    output.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="print one JSON object per CPU type (JSON Lines)",
+    )
+    parser.add_argument(
+        "--load",
+        metavar="FILE",
+        nargs="+",
+        default=[],
+        help="identify saved raw dumps instead of the current machine ('-' is stdin)",
+    )
+    parser.add_argument(
+        "--save", metavar="FILE", help="save the raw data of the current machine"
+    )
+    parser.add_argument(
+        "--cached",
+        metavar="DIR",
+        nargs="?",
+        const="",
+        help="reuse the identification cached in DIR (or the default cache directory)"
+        " until the machine reboots, its online CPUs or its microcode change",
+    )
+    parser.add_argument(
+        "--method",
+        choices=("auto", "affinity", "driver"),
+        default="affinity",
+        help="how to collect the raw data of each CPU: by switching the affinity,"
+        " through the cpuid kernel driver, or through the driver if available"
+        " (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    if args.load and (args.live_fields or args.save or args.cached is not None):
+        parser.error(
+            "--load cannot be combined with live selectors, --save or --cached"
+        )
+    return args
+
+
+def _live_values(live_fields: list[str]) -> dict:
+    values = {}
+    if "cpuid_present" in live_fields:
+        import libcpuid  # pylint: disable=import-outside-toplevel
+
+        values["cpuid_present"] = libcpuid.cpuid_present()
+    clock_functions = {
+        "clock": "frequency",
+        "clock_os": "frequency_by_os",
+        "clock_rdtsc": "frequency_by_tsc",
+        "clock_ic": "frequency_by_ic",
+    }
+    if any(field in clock_functions for field in live_fields):
+        from libcpuid import clock  # pylint: disable=import-outside-toplevel
+
+        for field, function in clock_functions.items():
+            if field in live_fields:
+                values[field] = getattr(clock, function)()
+    return values
+
+
+def _identify(args: argparse.Namespace):
+    """Yields (source, :class:`SystemInfo` or exception) pairs."""
+    # pylint: disable=import-outside-toplevel
+    from libcpuid.errors import LibcpuidError
+    from libcpuid.info import SystemInfo
+    from libcpuid.raw import CPURawDataArray
+
+    for filename in args.load:
+        try:
+            raw_data = CPURawDataArray.from_file("" if filename == "-" else filename)
+            yield filename, SystemInfo.from_raw_array(raw_data)
+        except LibcpuidError as err:
+            yield filename, err
+    if args.load:
+        return
+    try:
+        if args.cached is not None:
+            from libcpuid.cache import IdentificationCache
+
+            raw_data, system_info = IdentificationCache(args.cached or None).get()
+        else:
+            raw_data = CPURawDataArray.from_all_cpus(args.method)
+            system_info = SystemInfo.from_raw_array(raw_data)
+        if args.save:
+            raw_data.serialize(args.save)
+        yield None, system_info
+    except LibcpuidError as err:
+        yield None, err
+
+
+def _select(row: dict, fields: Optional[list[str]]) -> dict:
+    if not fields:
+        return row
+    return {field: row.get(field) for field in fields}
+
+
+def _format_value(value) -> str:
+    if value is None:
+        return "-1"
+    if isinstance(value, list):
+        return " ".join(value)
+    return str(value)
+
+
+def _print_text(source, system_info, fields, live_values):
+    # pylint: disable=import-outside-toplevel
+    from libcpuid.export import cpu_info_to_dict
+
+    if source is not None:
+        print(f"{source}:")
+    for value in live_values.values():
+        print(_format_value(value))
+    for index, cpu_info in enumerate(system_info):
+        row = cpu_info_to_dict(cpu_info)
+        if len(system_info) > 1:
+            print(f"CPU type #{index} ({row['purpose']}):")
+        if fields:
+            for field in fields:
+                print(_format_value(row.get(field)))
+        else:
+            for field, value in row.items():
+                if field != "sgx":
+                    print(f"{field}: {_format_value(value)}")
+
+
+def _print_jsonl(source, system_info, fields, live_values):
+    # pylint: disable=import-outside-toplevel
+    import json
+    from libcpuid.export import iter_rows
+
+    for row in iter_rows([system_info]):
+        row = {**_select(row, fields), **live_values}
+        if source is not None:
+            row = {"key": source, **row}
+        sys.stdout.write(json.dumps(row) + "\n")
+
+
+def _json_document(source, system_info, fields, live_values) -> dict:
+    # pylint: disable=import-outside-toplevel
+    from libcpuid.export import system_info_to_dict
+
+    document = system_info_to_dict(system_info)
+    document["cpu_types"] = [_select(row, fields) for row in document["cpu_types"]]
+    document.update(live_values)
+    if source is not None:
+        document = {"source": source, **document}
+    return document
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Runs the command-line interface, returning the exit status."""
+    args = _parse_args(argv)
+    fields = args.fields or []
+    live_values = _live_values(args.live_fields or [])
+    status = 0
+    documents = []
+    for source, result in _identify(args):
+        if isinstance(result, Exception):
+            print(f"libcpuid: {source or 'current CPU'}: {result}", file=sys.stderr)
+            status = 1
+        elif args.jsonl:
+            _print_jsonl(source, result, fields, live_values)
+        elif args.json:
+            documents.append(_json_document(source, result, fields, live_values))
+        else:
+            _print_text(source, result, fields, live_values)
+    if args.json and (args.load or documents):
+        import json  # pylint: disable=import-outside-toplevel
+
+        print(json.dumps(documents if args.load else documents[0], indent=2))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
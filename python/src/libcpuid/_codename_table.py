@@ -0,0 +1,919 @@
+"""
+Codename recognition tables of the C library.
+
+X86_ENTRIES are the rows of the x86 match tables, as (vendors, family, model,
+stepping, ext_family, ext_model, num_cores, l2_cache, l3_cache, brand_code,
+model_bits, model_code, technology, codename) tuples, where -1 means any value,
+a brand or model code of None is the "no code" one (NC or 0), and the
+technology node is taken from the comments of the table.
+ARM_PARTS are the known ARM parts, as (vendor, implementer, part_num, part_name,
+codename) tuples. FIXED_CODENAMES are the codenames of the other vendors.
+
+Generated by utils/generate_codename_table.py from the C library, do not edit.
+"""
+
+# pylint: disable=line-too-long
+# fmt: off
+
+X86_ENTRIES = (
+    (("INTEL",), -1, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Intel CPU"),
+    (("INTEL",), 4, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown i486"),
+    (("INTEL",), 4, 0, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 DX-25/33"),
+    (("INTEL",), 4, 1, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 DX-50"),
+    (("INTEL",), 4, 2, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 SX"),
+    (("INTEL",), 4, 3, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 DX2"),
+    (("INTEL",), 4, 4, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 SL"),
+    (("INTEL",), 4, 5, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 SX2"),
+    (("INTEL",), 4, 7, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 DX2 WriteBack"),
+    (("INTEL",), 4, 8, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 DX4"),
+    (("INTEL",), 4, 9, -1, -1, -1, 1, -1, -1, None, (), None, None, "i486 DX4 WriteBack"),
+    (("INTEL",), 5, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Pentium"),
+    (("INTEL",), 5, 0, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium A-Step"),
+    (("INTEL",), 5, 1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium 1 (0.8u)"),
+    (("INTEL",), 5, 2, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium 1 (0.35u)"),
+    (("INTEL",), 5, 3, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium OverDrive"),
+    (("INTEL",), 5, 4, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium 1 (0.35u)"),
+    (("INTEL",), 5, 7, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium 1 (0.35u)"),
+    (("INTEL",), 5, 8, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium MMX (0.25u)"),
+    (("INTEL",), 6, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown P6"),
+    (("INTEL",), 6, 0, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium Pro"),
+    (("INTEL",), 6, 1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium Pro"),
+    (("INTEL",), 6, 3, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium II (Klamath)"),
+    (("INTEL",), 6, 5, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium II (Deschutes)"),
+    (("INTEL",), 6, 5, -1, -1, -1, 1, -1, -1, None, ("MOBILE_", "PENTIUM_"), None, None, "Mobile Pentium II (Tonga)"),
+    (("INTEL",), 6, 6, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium II (Dixon)"),
+    (("INTEL",), 6, 3, -1, -1, -1, 1, -1, -1, None, ("XEON_",), None, None, "P-II Xeon (Klamath)"),
+    (("INTEL",), 6, 5, -1, -1, -1, 1, -1, -1, None, ("XEON_",), None, None, "P-II Xeon (Drake)"),
+    (("INTEL",), 6, 6, -1, -1, -1, 1, -1, -1, None, ("XEON_",), None, None, "P-II Xeon (Dixon)"),
+    (("INTEL",), 6, 5, -1, -1, -1, 1, -1, -1, None, ("CELERON_",), None, None, "P-II Celeron (Covington)"),
+    (("INTEL",), 6, 6, -1, -1, -1, 1, -1, -1, None, ("CELERON_",), None, None, "P-II Celeron (Mendocino)"),
+    (("INTEL",), 6, 7, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium III (Katmai)"),
+    (("INTEL",), 6, 8, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium III (Coppermine)"),
+    (("INTEL",), 6, 10, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium III (Coppermine)"),
+    (("INTEL",), 6, 11, -1, -1, -1, 1, -1, -1, None, (), None, None, "Pentium III (Tualatin)"),
+    (("INTEL",), 6, 11, -1, -1, -1, 1, 512, -1, None, (), None, None, "Pentium III (Tualatin)"),
+    (("INTEL",), 6, 7, -1, -1, -1, 1, -1, -1, None, ("XEON_",), None, None, "P-III Xeon (Tanner)"),
+    (("INTEL",), 6, 8, -1, -1, -1, 1, -1, -1, None, ("XEON_",), None, None, "P-III Xeon (Cascades)"),
+    (("INTEL",), 6, 10, -1, -1, -1, 1, -1, -1, None, ("XEON_",), None, None, "P-III Xeon (Cascades)"),
+    (("INTEL",), 6, 11, -1, -1, -1, 1, -1, -1, None, ("XEON_",), None, None, "P-III Xeon (Tualatin)"),
+    (("INTEL",), 6, 7, -1, -1, -1, 1, 128, -1, None, ("CELERON_",), None, None, "P-III Celeron (Katmai)"),
+    (("INTEL",), 6, 8, -1, -1, -1, 1, 128, -1, None, ("CELERON_",), None, None, "P-III Celeron (Coppermine)"),
+    (("INTEL",), 6, 10, -1, -1, -1, 1, 128, -1, None, ("CELERON_",), None, None, "P-III Celeron (Coppermine)"),
+    (("INTEL",), 6, 11, -1, -1, -1, 1, 256, -1, None, ("CELERON_",), None, None, "P-III Celeron (Tualatin)"),
+    (("INTEL",), 15, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Pentium 4"),
+    (("INTEL",), 15, -1, -1, 15, -1, 1, -1, -1, None, ("CELERON_",), None, None, "Unknown P-4 Celeron"),
+    (("INTEL",), 15, -1, -1, 15, -1, 1, -1, -1, None, ("XEON_",), None, None, "Unknown Xeon"),
+    (("INTEL",), 15, 0, -1, 15, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium 4 (Willamette)"),
+    (("INTEL",), 15, 1, -1, 15, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium 4 (Willamette)"),
+    (("INTEL",), 15, 2, -1, 15, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium 4 (Northwood)"),
+    (("INTEL",), 15, 3, -1, 15, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium 4 (Prescott)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium 4 (Prescott)"),
+    (("INTEL",), 15, 6, -1, 15, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium 4 (Cedar Mill)"),
+    (("INTEL",), 15, 0, -1, 15, -1, 1, -1, -1, None, ("MOBILE_", "PENTIUM_"), None, None, "Mobile P-4 (Willamette)"),
+    (("INTEL",), 15, 1, -1, 15, -1, 1, -1, -1, None, ("MOBILE_", "PENTIUM_"), None, None, "Mobile P-4 (Willamette)"),
+    (("INTEL",), 15, 2, -1, 15, -1, 1, -1, -1, None, ("MOBILE_", "PENTIUM_"), None, None, "Mobile P-4 (Northwood)"),
+    (("INTEL",), 15, 3, -1, 15, -1, 1, -1, -1, None, ("MOBILE_", "PENTIUM_"), None, None, "Mobile P-4 (Prescott)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, None, ("MOBILE_", "PENTIUM_"), None, None, "Mobile P-4 (Prescott)"),
+    (("INTEL",), 15, 6, -1, 15, -1, 1, -1, -1, None, ("MOBILE_", "PENTIUM_"), None, None, "Mobile P-4 (Cedar Mill)"),
+    (("INTEL",), 15, 0, -1, 15, -1, 1, -1, -1, None, ("XEON_",), None, None, "Xeon (Foster)"),
+    (("INTEL",), 15, 1, -1, 15, -1, 1, -1, -1, None, ("XEON_",), None, None, "Xeon (Foster)"),
+    (("INTEL",), 15, 2, -1, 15, -1, 1, -1, -1, None, ("XEON_",), None, None, "Xeon (Prestonia)"),
+    (("INTEL",), 15, 2, -1, 15, -1, 1, -1, -1, None, ("XEON_", "_MP_"), None, None, "Xeon (Gallatin)"),
+    (("INTEL",), 15, 3, -1, 15, -1, 1, -1, -1, None, ("XEON_",), None, None, "Xeon (Nocona)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, None, ("XEON_",), None, None, "Xeon (Nocona)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, "IRWIN", ("XEON_",), None, None, "Xeon (Irwindale)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, None, ("XEON_", "_MP_"), None, None, "Xeon (Cranford)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, "POTOMAC", ("XEON_",), None, None, "Xeon (Potomac)"),
+    (("INTEL",), 15, 6, -1, 15, -1, 1, -1, -1, None, ("XEON_",), None, None, "Xeon (Dempsey)"),
+    (("INTEL",), 15, 4, 4, 15, -1, 1, -1, -1, None, (), None, None, "Pentium D (SmithField)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, "PENTIUM_D", (), None, None, "Pentium D (SmithField)"),
+    (("INTEL",), 15, 4, 7, 15, -1, 1, -1, -1, None, (), None, None, "Pentium D (SmithField)"),
+    (("INTEL",), 15, 6, -1, 15, -1, 1, -1, -1, "PENTIUM_D", (), None, None, "Pentium D (Presler)"),
+    (("INTEL",), 15, 1, -1, 15, -1, 1, -1, -1, None, ("CELERON_",), None, None, "P-4 Celeron (Willamette)"),
+    (("INTEL",), 15, 2, -1, 15, -1, 1, -1, -1, None, ("CELERON_",), None, None, "P-4 Celeron (Northwood)"),
+    (("INTEL",), 15, 3, -1, 15, -1, 1, -1, -1, None, ("CELERON_",), None, None, "P-4 Celeron D (Prescott)"),
+    (("INTEL",), 15, 4, -1, 15, -1, 1, -1, -1, None, ("CELERON_",), None, None, "P-4 Celeron D (Prescott)"),
+    (("INTEL",), 15, 6, -1, 15, -1, 1, -1, -1, None, ("CELERON_",), None, None, "P-4 Celeron D (Cedar Mill)"),
+    (("INTEL",), 6, 9, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Pentium M"),
+    (("INTEL",), 6, 9, -1, -1, -1, 1, -1, -1, "PENTIUM_M", (), None, None, "Unknown Pentium M"),
+    (("INTEL",), 6, 9, -1, -1, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium M (Banias)"),
+    (("INTEL",), 6, 9, -1, -1, -1, 1, -1, -1, "PENTIUM_M", (), None, None, "Pentium M (Banias)"),
+    (("INTEL",), 6, 9, -1, -1, -1, 1, -1, -1, None, ("CELERON_",), None, None, "Celeron M"),
+    (("INTEL",), 6, 13, -1, -1, -1, 1, -1, -1, None, ("PENTIUM_",), None, None, "Pentium M (Dothan)"),
+    (("INTEL",), 6, 13, -1, -1, -1, 1, -1, -1, "PENTIUM_M", (), None, None, "Pentium M (Dothan)"),
+    (("INTEL",), 6, 13, -1, -1, -1, 1, -1, -1, None, ("CELERON_",), None, None, "Celeron M"),
+    (("INTEL",), 6, 12, -1, -1, -1, -1, -1, -1, None, ("ATOM_",), None, None, "Unknown Atom"),
+    (("INTEL",), 6, 12, -1, -1, -1, -1, -1, -1, "DIAMONDVILLE", ("ATOM_",), None, None, "Atom (Diamondville)"),
+    (("INTEL",), 6, 12, -1, -1, -1, -1, -1, -1, "SILVERTHORNE", ("ATOM_",), None, None, "Atom (Silverthorne)"),
+    (("INTEL",), 6, 12, -1, -1, -1, -1, -1, -1, "CEDARVIEW", ("ATOM_",), None, None, "Atom (Cedarview)"),
+    (("INTEL",), 6, 6, -1, -1, -1, -1, -1, -1, "CEDARVIEW", ("ATOM_",), None, None, "Atom (Cedarview)"),
+    (("INTEL",), 6, 12, -1, -1, -1, -1, -1, -1, "PINEVIEW", ("ATOM_",), None, None, "Atom (Pineview)"),
+    (("INTEL",), 6, 14, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Yonah"),
+    (("INTEL",), 6, 14, -1, -1, -1, 1, -1, -1, "CORE_SOLO", (), None, None, "Yonah (Core Solo)"),
+    (("INTEL",), 6, 14, -1, -1, -1, 2, -1, -1, "CORE_DUO", (), None, None, "Yonah (Core Duo)"),
+    (("INTEL",), 6, 14, -1, -1, -1, 1, -1, -1, "CORE_SOLO", ("MOBILE_",), None, None, "Yonah (Core Solo)"),
+    (("INTEL",), 6, 14, -1, -1, -1, 2, -1, -1, "CORE_DUO", ("MOBILE_",), None, None, "Yonah (Core Duo)"),
+    (("INTEL",), 6, 14, -1, -1, -1, 1, -1, -1, "CORE_SOLO", (), None, None, "Yonah (Core Solo)"),
+    (("INTEL",), 6, 15, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Core 2"),
+    (("INTEL",), 6, 15, -1, -1, -1, 2, 4096, -1, "CORE_DUO", (), None, None, "Conroe (Core 2 Duo)"),
+    (("INTEL",), 6, 15, -1, -1, -1, 2, 1024, -1, "CORE_DUO", (), None, None, "Conroe (Core 2 Duo) 1024K"),
+    (("INTEL",), 6, 15, -1, -1, -1, 2, 512, -1, "CORE_DUO", (), None, None, "Conroe (Core 2 Duo) 512K"),
+    (("INTEL",), 6, 15, -1, -1, -1, 4, -1, -1, "QUAD_CORE", (), None, None, "Kentsfield (Core 2 Quad)"),
+    (("INTEL",), 6, 15, -1, -1, -1, 4, 4096, -1, "QUAD_CORE", (), None, None, "Kentsfield (Core 2 Quad)"),
+    (("INTEL",), 6, 15, -1, -1, -1, 400, -1, -1, "MORE_THAN_QUADCORE", (), None, None, "More than quad-core"),
+    (("INTEL",), 6, 15, -1, -1, -1, 2, 2048, -1, "CORE_DUO", (), None, None, "Allendale (Core 2 Duo)"),
+    (("INTEL",), 6, 15, -1, -1, -1, 2, -1, -1, "MOBILE_CORE_DUO", (), None, None, "Merom (Core 2 Duo)"),
+    (("INTEL",), 6, 15, -1, -1, -1, 2, 2048, -1, "MEROM", (), None, None, "Merom (Core 2 Duo) 2048K"),
+    (("INTEL",), 6, 15, -1, -1, -1, 2, 4096, -1, "MEROM", (), None, None, "Merom (Core 2 Duo) 4096K"),
+    (("INTEL",), 6, 15, -1, -1, 15, 2, -1, -1, None, ("PENTIUM_",), None, None, "Allendale (Pentium)"),
+    (("INTEL",), 6, 15, -1, -1, 15, 2, -1, -1, None, ("CELERON_",), None, None, "Allendale (Celeron)"),
+    (("INTEL",), 6, 6, -1, -1, 22, 1, -1, -1, None, ("CELERON_",), None, None, "Conroe-L (Celeron)"),
+    (("INTEL",), 6, 6, -1, -1, 22, 1, -1, -1, None, (), None, None, "Unknown Core ?"),
+    (("INTEL",), 6, 7, -1, -1, 23, 1, -1, -1, None, (), None, None, "Unknown Core ?"),
+    (("INTEL",), 6, 6, -1, -1, 22, 400, -1, -1, "MORE_THAN_QUADCORE", (), None, None, "More than quad-core"),
+    (("INTEL",), 6, 7, -1, -1, 23, 400, -1, -1, "MORE_THAN_QUADCORE", (), None, None, "More than quad-core"),
+    (("INTEL",), 6, 7, -1, -1, 23, 1, -1, -1, "CORE_SOLO", (), None, None, "Unknown Core 45nm"),
+    (("INTEL",), 6, 7, -1, -1, 23, 1, -1, -1, "CORE_DUO", (), None, None, "Unknown Core 45nm"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 1024, -1, "WOLFDALE", (), None, None, "Celeron Wolfdale 1M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 2048, -1, "WOLFDALE", (), None, None, "Wolfdale (Core 2 Duo) 2M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 3072, -1, "WOLFDALE", (), None, None, "Wolfdale (Core 2 Duo) 3M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 6144, -1, "WOLFDALE", (), None, None, "Wolfdale (Core 2 Duo) 6M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 1, 1024, -1, "PENRYN", ("CELERON_",), None, None, "Celeron Penryn L"),
+    (("INTEL",), 6, 7, -1, -1, 23, 1, -1, -1, "MOBILE_CORE_DUO", (), None, None, "Penryn (Core 2 Duo)"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 1024, -1, "PENRYN", (), None, None, "Penryn (Core 2 Duo)"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 3072, -1, "PENRYN", (), None, None, "Penryn (Core 2 Duo) 3M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 6144, -1, "PENRYN", (), None, None, "Penryn (Core 2 Duo) 6M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 4, 2048, -1, None, (), None, None, "Yorkfield (Core 2 Quad) 2M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 4, 3072, -1, None, (), None, None, "Yorkfield (Core 2 Quad) 3M"),
+    (("INTEL",), 6, 7, -1, -1, 23, 4, 6144, -1, None, (), None, None, "Yorkfield (Core 2 Quad) 6M"),
+    (("INTEL",), 6, 14, -1, -1, 14, 1, -1, -1, None, ("XEON_",), None, None, "Xeon LV"),
+    (("INTEL",), 6, 15, -1, -1, 15, 2, 4096, -1, None, ("XEON_",), "_5100", None, "Xeon (Woodcrest)"),
+    (("INTEL",), 6, 15, -1, -1, 15, 2, 2048, -1, None, ("XEON_",), "_3000", None, "Xeon (Conroe/2M)"),
+    (("INTEL",), 6, 15, -1, -1, 15, 2, 4096, -1, None, ("XEON_",), "_3000", None, "Xeon (Conroe/4M)"),
+    (("INTEL",), 6, 15, -1, -1, 15, 4, 4096, -1, None, ("XEON_",), "X3200", None, "Xeon (Kentsfield)"),
+    (("INTEL",), 6, 15, -1, -1, 15, 4, 4096, -1, None, ("XEON_",), "_5300", None, "Xeon (Clovertown)"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 6144, -1, None, ("XEON_",), "_3100", None, "Xeon (Wolfdale)"),
+    (("INTEL",), 6, 7, -1, -1, 23, 2, 6144, -1, None, ("XEON_",), "_5200", None, "Xeon (Wolfdale DP)"),
+    (("INTEL",), 6, 7, -1, -1, 23, 4, 6144, -1, None, ("XEON_",), "_5400", None, "Xeon (Harpertown)"),
+    (("INTEL",), 6, 7, -1, -1, 23, 4, 3072, -1, None, ("XEON_",), "X3300", None, "Xeon (Yorkfield/3M)"),
+    (("INTEL",), 6, 7, -1, -1, 23, 4, 6144, -1, None, ("XEON_",), "X3300", None, "Xeon (Yorkfield/6M)"),
+    (("INTEL",), 6, 10, -1, -1, 26, 4, -1, -1, "GAINESTOWN", ("XEON_",), None, "45nm", "Gainestown (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 26, 4, -1, 4096, "GAINESTOWN", ("XEON_",), None, "45nm", "Gainestown 4M (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 26, 4, -1, 8192, "GAINESTOWN", ("XEON_",), None, "45nm", "Gainestown 8M (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 26, 4, -1, -1, None, ("XEON_", "_7"), None, "45nm", "Bloomfield (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 26, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "45nm", "Bloomfield (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 30, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "45nm", "Lynnfield (Core i7)"),
+    (("INTEL",), 6, 5, -1, -1, 30, 4, -1, 8192, None, ("CORE_", "_I_", "_5"), None, "45nm", "Lynnfield (Core i5)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, -1, None, (), None, "32nm", "Unknown Core i3/i5"),
+    (("INTEL",), 6, 12, -1, -1, 44, -1, -1, -1, "WESTMERE", ("XEON_",), None, "32nm", "Westmere (Xeon)"),
+    (("INTEL",), 6, 12, -1, -1, 44, -1, -1, 12288, "WESTMERE", ("XEON_",), None, "32nm", "Gulftown (Xeon)"),
+    (("INTEL",), 6, 12, -1, -1, 44, 4, -1, 12288, None, ("CORE_", "_I_", "_7"), None, "32nm", "Gulftown (Core i7)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, 4096, None, ("CORE_", "_I_", "_5"), None, "32nm", "Clarkdale (Core i5)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, 4096, None, ("CORE_", "_I_", "_3"), None, "32nm", "Clarkdale (Core i3)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, 4096, None, ("CORE_", "_I_", "_7"), None, "32nm", "Arrandale (Core i7)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, 3072, None, ("CORE_", "_I_", "_5"), None, "32nm", "Arrandale (Core i5)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, 3072, None, ("CORE_", "_I_", "_3"), None, "32nm", "Arrandale (Core i3)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, -1, None, ("PENTIUM_",), None, "32nm", "Arrandale (Pentium)"),
+    (("INTEL",), 6, 5, -1, -1, 37, 2, -1, -1, None, ("CELERON_",), None, "32nm", "Arrandale (Celeron)"),
+    (("INTEL",), 6, 10, -1, -1, 42, -1, -1, -1, None, (), None, "32nm", "Unknown Sandy Bridge"),
+    (("INTEL",), 6, 10, -1, -1, 42, -1, -1, -1, None, ("XEON_",), None, "32nm", "Sandy Bridge (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 42, 4, -1, -1, None, ("XEON_",), None, "32nm", "Sandy Bridge (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 42, -1, -1, -1, None, ("CORE_", "_I_", "_7"), None, "32nm", "Sandy Bridge (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 42, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "32nm", "Sandy Bridge (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 42, 4, -1, -1, None, ("CORE_", "_I_", "_5"), None, "32nm", "Sandy Bridge (Core i5)"),
+    (("INTEL",), 6, 10, -1, -1, 42, 2, -1, -1, None, ("CORE_", "_I_", "_3"), None, "32nm", "Sandy Bridge (Core i3)"),
+    (("INTEL",), 6, 10, -1, -1, 42, 2, -1, -1, None, ("PENTIUM_",), None, "32nm", "Sandy Bridge (Pentium)"),
+    (("INTEL",), 6, 10, -1, -1, 42, 1, -1, -1, None, ("CELERON_",), None, "32nm", "Sandy Bridge (Celeron)"),
+    (("INTEL",), 6, 10, -1, -1, 42, 2, -1, -1, None, ("CELERON_",), None, "32nm", "Sandy Bridge (Celeron)"),
+    (("INTEL",), 6, 13, -1, -1, 45, -1, -1, -1, None, ("CORE_", "_I_", "_7"), None, "32nm", "Sandy Bridge-E (Core i7)"),
+    (("INTEL",), 6, 13, -1, -1, 45, -1, -1, -1, None, ("XEON_",), None, "32nm", "Sandy Bridge-E (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 58, -1, -1, -1, None, ("XEON_",), None, "22nm", "Ivy Bridge (Xeon)"),
+    (("INTEL",), 6, 10, -1, -1, 58, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "22nm", "Ivy Bridge (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 58, 4, -1, -1, None, ("CORE_", "_I_", "_5"), None, "22nm", "Ivy Bridge (Core i5)"),
+    (("INTEL",), 6, 10, -1, -1, 58, 2, -1, -1, None, ("CORE_", "_I_", "_3"), None, "22nm", "Ivy Bridge (Core i3)"),
+    (("INTEL",), 6, 10, -1, -1, 58, 2, -1, -1, None, ("PENTIUM_",), None, "22nm", "Ivy Bridge (Pentium)"),
+    (("INTEL",), 6, 10, -1, -1, 58, 1, -1, -1, None, ("CELERON_",), None, "22nm", "Ivy Bridge (Celeron)"),
+    (("INTEL",), 6, 10, -1, -1, 58, 2, -1, -1, None, ("CELERON_",), None, "22nm", "Ivy Bridge (Celeron)"),
+    (("INTEL",), 6, 14, -1, -1, 62, -1, -1, -1, None, ("XEON_",), None, "22nm", "Ivy Bridge-E (Xeon)"),
+    (("INTEL",), 6, 14, -1, -1, 62, -1, -1, -1, None, (), None, "22nm", "Ivy Bridge-E"),
+    (("INTEL",), 6, 12, -1, -1, 60, -1, -1, -1, None, ("XEON_",), None, "22nm", "Haswell (Xeon)"),
+    (("INTEL",), 6, 12, -1, -1, 60, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "22nm", "Haswell (Core i7)"),
+    (("INTEL",), 6, 5, -1, -1, 69, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "22nm", "Haswell (Core i7)"),
+    (("INTEL",), 6, 6, -1, -1, 70, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "22nm", "Haswell (Core i7)"),
+    (("INTEL",), 6, 12, -1, -1, 60, 4, -1, -1, None, ("CORE_", "_I_", "_5"), None, "22nm", "Haswell (Core i5)"),
+    (("INTEL",), 6, 5, -1, -1, 69, 4, -1, -1, None, ("CORE_", "_I_", "_5"), None, "22nm", "Haswell (Core i5)"),
+    (("INTEL",), 6, 12, -1, -1, 60, 2, -1, -1, None, ("CORE_", "_I_", "_5"), None, "22nm", "Haswell (Core i5)"),
+    (("INTEL",), 6, 5, -1, -1, 69, 2, -1, -1, None, ("CORE_", "_I_", "_5"), None, "22nm", "Haswell (Core i5)"),
+    (("INTEL",), 6, 12, -1, -1, 60, 2, -1, -1, None, ("CORE_", "_I_", "_3"), None, "22nm", "Haswell (Core i3)"),
+    (("INTEL",), 6, 5, -1, -1, 69, 2, -1, -1, None, ("CORE_", "_I_", "_3"), None, "22nm", "Haswell (Core i3)"),
+    (("INTEL",), 6, 12, -1, -1, 60, 2, -1, -1, None, ("PENTIUM_",), None, "22nm", "Haswell (Pentium)"),
+    (("INTEL",), 6, 12, -1, -1, 60, 2, -1, -1, None, ("CELERON_",), None, "22nm", "Haswell (Celeron)"),
+    (("INTEL",), 6, 12, -1, -1, 60, 1, -1, -1, None, ("CELERON_",), None, "22nm", "Haswell (Celeron)"),
+    (("INTEL",), 6, 15, -1, -1, 63, -1, -1, -1, None, (), None, "22nm", "Haswell-E"),
+    (("INTEL",), 6, 7, -1, -1, 55, -1, -1, -1, None, ("PENTIUM_", "_J_"), None, "22nm", "Bay Trail-D (Pentium)"),
+    (("INTEL",), 6, 7, -1, -1, 55, -1, -1, -1, None, ("CELERON_", "_J_"), None, "22nm", "Bay Trail-D (Celeron)"),
+    (("INTEL",), 6, 7, -1, -1, 55, -1, -1, -1, None, ("PENTIUM_", "_N_"), None, "22nm", "Bay Trail-M (Pentium)"),
+    (("INTEL",), 6, 7, -1, -1, 55, -1, -1, -1, None, ("CELERON_", "_N_"), None, "22nm", "Bay Trail-M (Celeron)"),
+    (("INTEL",), 6, 7, -1, -1, 55, -1, -1, -1, None, ("ATOM_",), None, "22nm", "Bay Trail-T (Atom)"),
+    (("INTEL",), 6, 7, -1, -1, 71, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "14nm", "Broadwell (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 71, 4, -1, -1, None, ("CORE_", "_I_", "_5"), None, "14nm", "Broadwell (Core i5)"),
+    (("INTEL",), 6, 13, -1, -1, 61, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "14nm", "Broadwell-U (Core i7)"),
+    (("INTEL",), 6, 13, -1, -1, 61, 2, -1, -1, None, ("CORE_", "_I_", "_7"), None, "14nm", "Broadwell-U (Core i7)"),
+    (("INTEL",), 6, 13, -1, -1, 61, 2, -1, -1, None, ("CORE_", "_I_", "_5"), None, "14nm", "Broadwell-U (Core i5)"),
+    (("INTEL",), 6, 13, -1, -1, 61, 2, -1, -1, None, ("CORE_", "_I_", "_3"), None, "14nm", "Broadwell-U (Core i3)"),
+    (("INTEL",), 6, 13, -1, -1, 61, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Broadwell-U (Pentium)"),
+    (("INTEL",), 6, 13, -1, -1, 61, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Broadwell-U (Celeron)"),
+    (("INTEL",), 6, 13, -1, -1, 61, 2, -1, -1, "NA", (), None, "14nm", "Broadwell-U (Core M)"),
+    (("INTEL",), 6, 15, -1, -1, 79, -1, -1, -1, None, ("XEON_",), None, "14nm", "Broadwell-E (Xeon)"),
+    (("INTEL",), 6, 15, -1, -1, 79, 2, -1, -1, None, ("CORE_", "_I_", "_3"), None, "14nm", "Broadwell-E (Core i3)"),
+    (("INTEL",), 6, 15, -1, -1, 79, 2, -1, -1, None, ("CORE_", "_I_", "_5"), None, "14nm", "Broadwell-E (Core i5)"),
+    (("INTEL",), 6, 15, -1, -1, 79, 4, -1, -1, None, ("CORE_", "_I_", "_5"), None, "14nm", "Broadwell-E (Core i5)"),
+    (("INTEL",), 6, 15, -1, -1, 79, 2, -1, -1, None, ("CORE_", "_I_", "_7"), None, "14nm", "Broadwell-E (Core i7)"),
+    (("INTEL",), 6, 15, -1, -1, 79, 4, -1, -1, None, ("CORE_", "_I_", "_7"), None, "14nm", "Broadwell-E (Core i7)"),
+    (("INTEL",), 6, 14, -1, -1, 94, -1, -1, -1, None, ("XEON_",), None, "14nm", "Skylake (Xeon)"),
+    (("INTEL",), 6, 14, -1, -1, 94, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_6xxx", "14nm", "Skylake (Core i7)"),
+    (("INTEL",), 6, 14, -1, -1, 94, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_6xxx", "14nm", "Skylake (Core i5)"),
+    (("INTEL",), 6, 14, -1, -1, 94, 2, -1, -1, None, ("CORE_", "_I_", "_3"), "_6xxx", "14nm", "Skylake (Core i3)"),
+    (("INTEL",), 6, 14, -1, -1, 94, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Skylake (Pentium)"),
+    (("INTEL",), 6, 14, -1, -1, 78, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Skylake (Pentium)"),
+    (("INTEL",), 6, 14, -1, -1, 94, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Skylake (Celeron)"),
+    (("INTEL",), 6, 14, -1, -1, 78, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Skylake (Celeron)"),
+    (("INTEL",), 6, 14, -1, -1, 78, 2, -1, -1, None, ("CORE_", "_M_", "_7"), "_6xxx", "14nm", "Skylake (Core m7)"),
+    (("INTEL",), 6, 14, -1, -1, 78, 2, -1, -1, None, ("CORE_", "_M_", "_5"), "_6xxx", "14nm", "Skylake (Core m5)"),
+    (("INTEL",), 6, 14, -1, -1, 78, 2, -1, -1, None, ("CORE_", "_M_", "_3"), "_6xxx", "14nm", "Skylake (Core m3)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("CORE_", "_I_", "_9"), "_6xxx", "14nm", "Skylake-X (Core i9)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("CORE_", "_I_", "_7"), "_6xxx", "14nm", "Skylake-X (Core i7)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_W_"), "_x1xx", "14nm", "Skylake-W (Xeon W)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_D_"), "_x1xx", "14nm", "Skylake-DE (Xeon D)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_PLATINIUM_"), "_x1xx", "14nm", "Skylake-SP (Xeon Platinum)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_GOLD_"), "_x1xx", "14nm", "Skylake-SP (Xeon Gold)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_SILVER_"), "_x1xx", "14nm", "Skylake-SP (Xeon Silver)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_BRONZE_"), "_x1xx", "14nm", "Skylake-SP (Xeon Bronze)"),
+    (("INTEL",), 6, 14, -1, -1, 158, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_7xxx", "14nm", "Kaby Lake (Core i7)"),
+    (("INTEL",), 6, 14, -1, -1, 158, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_7xxx", "14nm", "Kaby Lake (Core i5)"),
+    (("INTEL",), 6, 14, -1, -1, 158, 2, -1, -1, None, ("CORE_", "_I_", "_3"), "_7xxx", "14nm", "Kaby Lake (Core i3)"),
+    (("INTEL",), 6, 14, -1, -1, 158, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Kaby Lake (Pentium)"),
+    (("INTEL",), 6, 14, -1, -1, 158, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Kaby Lake (Celeron)"),
+    (("INTEL",), 6, 14, 9, -1, 142, 2, -1, -1, None, ("CORE_", "_I_", "_7"), "_7xxx", "14nm", "Kaby Lake-U (Core i7)"),
+    (("INTEL",), 6, 14, 9, -1, 142, 2, -1, -1, None, ("CORE_", "_I_", "_5"), "_7xxx", "14nm", "Kaby Lake-U (Core i5)"),
+    (("INTEL",), 6, 14, 9, -1, 142, 2, -1, -1, None, ("CORE_", "_I_", "_3"), "_7xxx", "14nm", "Kaby Lake-U (Core i3)"),
+    (("INTEL",), 6, 14, 9, -1, 142, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Kaby Lake-U (Pentium)"),
+    (("INTEL",), 6, 14, 9, -1, 142, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Kaby Lake-U (Celeron)"),
+    (("INTEL",), 6, 14, 9, -1, 142, 2, -1, -1, None, ("CORE_", "_M_", "_3"), "_7xxx", "14nm", "Kaby Lake-U (Core m3)"),
+    (("INTEL",), 6, 14, 9, -1, 158, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_8xxx", "14nm", "Kaby Lake-G (Core i7)"),
+    (("INTEL",), 6, 14, 9, -1, 158, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_8xxx", "14nm", "Kaby Lake-G (Core i5)"),
+    (("INTEL",), 6, 14, 10, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_8xxx", "14nm", "Kaby Lake-R (Core i7)"),
+    (("INTEL",), 6, 14, 10, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_8xxx", "14nm", "Kaby Lake-R (Core i5)"),
+    (("INTEL",), 6, 14, 10, -1, 158, 8, -1, -1, None, ("CORE_", "_I_", "_9"), "_8xxx", "14nm", "Coffee Lake (Core i9)"),
+    (("INTEL",), 6, 14, 10, -1, 158, 8, -1, -1, None, ("CORE_", "_I_", "_7"), "_8xxx", "14nm", "Coffee Lake (Core i7)"),
+    (("INTEL",), 6, 14, 10, -1, 158, 6, -1, -1, None, ("CORE_", "_I_", "_7"), "_8xxx", "14nm", "Coffee Lake (Core i7)"),
+    (("INTEL",), 6, 14, 10, -1, 158, 6, -1, -1, None, ("CORE_", "_I_", "_5"), "_8xxx", "14nm", "Coffee Lake (Core i5)"),
+    (("INTEL",), 6, 14, 10, -1, 158, 4, -1, -1, None, ("CORE_", "_I_", "_3"), "_8xxx", "14nm", "Coffee Lake (Core i3)"),
+    (("INTEL",), 6, 14, 10, -1, 158, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Coffee Lake (Pentium)"),
+    (("INTEL",), 6, 14, 10, -1, 158, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Coffee Lake (Celeron)"),
+    (("INTEL",), 6, 14, 10, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_8xxx", "14nm", "Coffee Lake-U (Core i7)"),
+    (("INTEL",), 6, 14, 10, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_8xxx", "14nm", "Coffee Lake-U (Core i5)"),
+    (("INTEL",), 6, 14, 10, -1, 142, 2, -1, -1, None, ("CORE_", "_I_", "_3"), "_8xxx", "14nm", "Coffee Lake-U (Core i3)"),
+    (("INTEL",), 6, 6, -1, -1, 102, 2, -1, -1, None, ("CORE_", "_I_", "_3"), "_8xxx", "14nm", "Cannon Lake (Core i3)"),
+    (("INTEL",), 6, 6, -1, -1, 102, 2, -1, -1, None, ("CORE_", "_M_", "_3"), "_8xxx", "14nm", "Cannon Lake (Core m3)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_8xxx", "14nm", "Whiskey Lake-U (Core i7)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_8xxx", "14nm", "Whiskey Lake-U (Core i5)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 2, -1, -1, None, ("CORE_", "_I_", "_3"), "_8xxx", "14nm", "Whiskey Lake-U (Core i3)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 2, -1, -1, None, ("PENTIUM_",), "_8xxx", "14nm", "Whiskey Lake-U (Pentium)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 2, -1, -1, None, ("CELERON_",), "_8xxx", "14nm", "Whiskey Lake-U (Celeron)"),
+    (("INTEL",), 6, 14, 13, -1, 158, 8, -1, -1, None, ("CORE_", "_I_", "_9"), "_9xxx", "14nm", "Coffee Lake-R (Core i9)"),
+    (("INTEL",), 6, 14, 12, -1, 158, 8, -1, -1, None, ("CORE_", "_I_", "_9"), "_9xxx", "14nm", "Coffee Lake-R (Core i9)"),
+    (("INTEL",), 6, 14, 13, -1, 158, 8, -1, -1, None, ("CORE_", "_I_", "_7"), "_9xxx", "14nm", "Coffee Lake-R (Core i7)"),
+    (("INTEL",), 6, 14, 12, -1, 158, 8, -1, -1, None, ("CORE_", "_I_", "_7"), "_9xxx", "14nm", "Coffee Lake-R (Core i7)"),
+    (("INTEL",), 6, 14, 13, -1, 158, 6, -1, -1, None, ("CORE_", "_I_", "_5"), "_9xxx", "14nm", "Coffee Lake-R (Core i5)"),
+    (("INTEL",), 6, 14, 11, -1, 158, 4, -1, -1, None, ("CORE_", "_I_", "_3"), "_9xxx", "14nm", "Coffee Lake-R (Core i3)"),
+    (("INTEL",), 6, 5, 7, -1, 85, -1, -1, -1, None, ("CORE_", "_I_", "_9"), "_10xxx", "14nm", "Cascade Lake-X (Core i9)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_W_"), "_x2xx", "14nm", "Cascade Lake-W (Xeon W)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_PLATINIUM_"), "_x2xx", "14nm", "Cascade Lake-SP (Xeon Platinum)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_GOLD_"), "_x2xx", "14nm", "Cascade Lake-SP (Xeon Gold)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_SILVER_"), "_x2xx", "14nm", "Cascade Lake-SP (Xeon Silver)"),
+    (("INTEL",), 6, 5, -1, -1, 85, -1, -1, -1, None, ("XEON_", "_BRONZE_"), "_x2xx", "14nm", "Cascade Lake-SP (Xeon Bronze)"),
+    (("INTEL",), 6, 5, -1, -1, 165, 10, -1, -1, None, ("CORE_", "_I_", "_9"), "_10xxx", "14nm", "Comet Lake (Core i9)"),
+    (("INTEL",), 6, 5, -1, -1, 165, 8, -1, -1, None, ("CORE_", "_I_", "_7"), "_10xxx", "14nm", "Comet Lake (Core i7)"),
+    (("INTEL",), 6, 5, -1, -1, 165, 6, -1, -1, None, ("CORE_", "_I_", "_5"), "_10xxx", "14nm", "Comet Lake (Core i5)"),
+    (("INTEL",), 6, 5, -1, -1, 165, 4, -1, -1, None, ("CORE_", "_I_", "_3"), "_10xxx", "14nm", "Comet Lake (Core i3)"),
+    (("INTEL",), 6, 5, -1, -1, 165, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Comet Lake (Pentium)"),
+    (("INTEL",), 6, 5, -1, -1, 165, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Comet Lake (Celeron)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 6, -1, -1, None, ("CORE_", "_I_", "_7"), "_10xxx", "14nm", "Comet Lake-U (Core i7)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_10xxx", "14nm", "Comet Lake-U (Core i7)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_10xxx", "14nm", "Comet Lake-U (Core i5)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 2, -1, -1, None, ("PENTIUM_",), None, "14nm", "Comet Lake-U (Pentium)"),
+    (("INTEL",), 6, 14, 12, -1, 142, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Comet Lake-U (Celeron)"),
+    (("INTEL",), 6, 14, -1, -1, 126, 4, -1, -1, None, ("CORE_", "_I_", "_7"), "_10xxx", "10nm", "Ice Lake (Core i7)"),
+    (("INTEL",), 6, 14, -1, -1, 126, 4, -1, -1, None, ("CORE_", "_I_", "_5"), "_10xxx", "10nm", "Ice Lake (Core i5)"),
+    (("INTEL",), 6, 14, -1, -1, 126, 2, -1, -1, None, ("CORE_", "_I_", "_3"), "_10xxx", "10nm", "Ice Lake (Core i3)"),
+    (("INTEL",), 6, 12, -1, -1, 108, 4, -1, -1, None, ("XEON_",), None, "10nm", "Ice Lake-D (Xeon-D)"),
+    (("INTEL",), 6, 10, -1, -1, 106, -1, -1, -1, None, ("XEON_", "_W_"), "_x3xx", "10nm", "Ice Lake-W (Xeon W)"),
+    (("INTEL",), 6, 10, -1, -1, 106, -1, -1, -1, None, ("XEON_", "_PLATINIUM_"), "_x3xx", "10nm", "Ice Lake-SP (Xeon Platinum)"),
+    (("INTEL",), 6, 10, -1, -1, 106, -1, -1, -1, None, ("XEON_", "_GOLD_"), "_x3xx", "10nm", "Ice Lake-SP (Xeon Gold)"),
+    (("INTEL",), 6, 10, -1, -1, 106, -1, -1, -1, None, ("XEON_", "_SILVER_"), "_x3xx", "10nm", "Ice Lake-SP (Xeon Silver)"),
+    (("INTEL",), 6, 10, -1, -1, 106, -1, -1, -1, None, ("XEON_", "_BRONZE_"), "_x3xx", "10nm", "Ice Lake-SP (Xeon Bronze)"),
+    (("INTEL",), 6, 7, -1, -1, 167, -1, -1, -1, None, ("CORE_", "_I_", "_9"), "_11xxx", "14nm", "Rocket Lake (Core i9)"),
+    (("INTEL",), 6, 7, -1, -1, 167, -1, -1, -1, None, ("CORE_", "_I_", "_7"), "_11xxx", "14nm", "Rocket Lake (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 167, -1, -1, -1, None, ("CORE_", "_I_", "_5"), "_11xxx", "14nm", "Rocket Lake (Core i5)"),
+    (("INTEL",), 6, 7, -1, -1, 167, -1, -1, -1, None, ("CORE_", "_I_", "_3"), "_11xxx", "14nm", "Rocket Lake (Core i3)"),
+    (("INTEL",), 6, 7, -1, -1, 167, -1, -1, -1, None, ("XEON_",), None, "14nm", "Rocket Lake (Xeon-E)"),
+    (("INTEL",), 6, 10, -1, -1, 122, 4, -1, -1, None, ("PENTIUM_",), None, "14nm", "Gemini Lake (Pentium)"),
+    (("INTEL",), 6, 10, -1, -1, 122, 4, -1, -1, None, ("CELERON_",), None, "14nm", "Gemini Lake (Celeron)"),
+    (("INTEL",), 6, 10, -1, -1, 122, 2, -1, -1, None, ("CELERON_",), None, "14nm", "Gemini Lake (Celeron)"),
+    (("INTEL",), 6, 12, -1, -1, 92, -1, -1, -1, None, ("ATOM_",), None, "14nm", "Apollo Lake (Atom)"),
+    (("INTEL",), 6, 6, -1, -1, 150, -1, -1, -1, None, ("PENTIUM_",), None, "10nm", "Elkhart Lake (Pentium)"),
+    (("INTEL",), 6, 6, -1, -1, 150, -1, -1, -1, None, ("CELERON_",), None, "10nm", "Elkhart Lake (Celeron)"),
+    (("INTEL",), 6, 6, -1, -1, 150, -1, -1, -1, None, ("ATOM_",), None, "10nm", "Elkhart Lake (Atom)"),
+    (("INTEL",), 6, 10, -1, -1, 138, -1, -1, -1, None, ("CORE_", "_I_", "_5"), None, "10nm", "Lakefield (Core i5)"),
+    (("INTEL",), 6, 10, -1, -1, 138, -1, -1, -1, None, ("CORE_", "_I_", "_3"), None, "10nm", "Lakefield (Core i3)"),
+    (("INTEL",), 6, 12, -1, -1, 156, -1, -1, -1, None, ("PENTIUM_",), None, "10nm", "Jasper Lake (Pentium)"),
+    (("INTEL",), 6, 12, -1, -1, 156, -1, -1, -1, None, ("CELERON_",), None, "10nm", "Jasper Lake (Celeron)"),
+    (("INTEL",), 6, 12, -1, -1, 140, -1, -1, -1, None, ("CORE_", "_I_", "_9"), "_11xxx", "10nm", "Tiger Lake (Core i9)"),
+    (("INTEL",), 6, 12, -1, -1, 140, -1, -1, -1, None, ("CORE_", "_I_", "_7"), "_11xxx", "10nm", "Tiger Lake (Core i7)"),
+    (("INTEL",), 6, 12, -1, -1, 140, -1, -1, -1, None, ("CORE_", "_I_", "_5"), "_11xxx", "10nm", "Tiger Lake (Core i5)"),
+    (("INTEL",), 6, 12, -1, -1, 140, -1, -1, -1, None, ("CORE_", "_I_", "_3"), "_11xxx", "10nm", "Tiger Lake (Core i3)"),
+    (("INTEL",), 6, 12, -1, -1, 140, 2, -1, -1, None, ("PENTIUM_",), None, "10nm", "Tiger Lake (Pentium)"),
+    (("INTEL",), 6, 12, -1, -1, 140, 2, -1, -1, None, ("CELERON_",), None, "10nm", "Tiger Lake (Celeron)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CORE_", "_I_", "_9"), "_12xxx", "10nm", "Alder Lake-S (Core i9)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CORE_", "_I_", "_7"), "_12xxx", "10nm", "Alder Lake-S (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CORE_", "_I_", "_5"), "_12xxx", "10nm", "Alder Lake-S (Core i5)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CORE_", "_I_", "_3"), "_12xxx", "10nm", "Alder Lake-S (Core i3)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("PENTIUM_",), None, "10nm", "Alder Lake-S (Pentium)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CELERON_",), None, "10nm", "Alder Lake-S (Celeron)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CORE_", "_I_", "_9", "_H", "_X"), "_12xxx", "10nm", "Alder Lake-HX (Core i9)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_H", "_X"), "_12xxx", "10nm", "Alder Lake-HX (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 151, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_H", "_X"), "_12xxx", "10nm", "Alder Lake-HX (Core i5)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_P"), None, "10nm", "Alder Lake-P (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_P"), None, "10nm", "Alder Lake-P (Core i5)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_3", "_P"), None, "10nm", "Alder Lake-P (Core i3)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_U"), None, "10nm", "Alder Lake-U (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_U"), None, "10nm", "Alder Lake-U (Core i5)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_3", "_U"), None, "10nm", "Alder Lake-U (Core i3)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("PENTIUM_",), None, "10nm", "Alder Lake-U (Pentium)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CELERON_",), None, "10nm", "Alder Lake-U (Celeron)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_9", "_H"), "_12xxx", "10nm", "Alder Lake-H (Core i9)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_H"), "_12xxx", "10nm", "Alder Lake-H (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 154, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_H"), "_12xxx", "10nm", "Alder Lake-H (Core i5)"),
+    (("INTEL",), 6, 14, -1, -1, 190, -1, -1, -1, None, ("CORE_", "_I_", "_3", "_N"), None, "10nm", "Alder Lake-N (Core i3)"),
+    (("INTEL",), 6, 14, -1, -1, 190, -1, -1, -1, None, ("ATOM_",), None, "10nm", "Alder Lake-N (Atom)"),
+    (("INTEL",), 6, 14, -1, -1, 190, 4, -1, -1, None, ("_N",), None, "10nm", "Alder Lake-N"),
+    (("INTEL",), 6, 14, -1, -1, 190, 2, -1, -1, None, ("_N",), None, "10nm", "Alder Lake-N"),
+    (("INTEL",), 6, 15, -1, -1, 191, -1, -1, -1, None, ("CORE_", "_I_", "_5"), "_13xxx", "Intel 7", "Raptor Lake-S (Core i5)"),
+    (("INTEL",), 6, 15, -1, -1, 191, -1, -1, -1, None, ("CORE_", "_I_", "_3"), "_13xxx", "Intel 7", "Raptor Lake-S (Core i3)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_9"), "_13xxx", "Intel 7", "Raptor Lake-S (Core i9)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_7"), "_13xxx", "Intel 7", "Raptor Lake-S (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_5"), "_13xxx", "Intel 7", "Raptor Lake-S (Core i5)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_3"), "_13xxx", "Intel 7", "Raptor Lake-S (Core i3)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_9", "_H", "_X"), "_13xxx", "Intel 7", "Raptor Lake-HX (Core i9)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_H", "_X"), "_13xxx", "Intel 7", "Raptor Lake-HX (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_H", "_X"), "_13xxx", "Intel 7", "Raptor Lake-HX (Core i5)"),
+    (("INTEL",), 6, 10, 2, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_P"), None, "Intel 7", "Raptor Lake-P (Core i7)"),
+    (("INTEL",), 6, 10, 2, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_P"), None, "Intel 7", "Raptor Lake-P (Core i5)"),
+    (("INTEL",), 6, 10, 3, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_U"), None, "Intel 7", "Raptor Lake-U (Core i7)"),
+    (("INTEL",), 6, 10, 3, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_U"), None, "Intel 7", "Raptor Lake-U (Core i5)"),
+    (("INTEL",), 6, 10, 3, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_3", "_U"), None, "Intel 7", "Raptor Lake-U (Core i3)"),
+    (("INTEL",), 6, 10, -1, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_9", "_H"), "_13xxx", "Intel 7", "Raptor Lake-H (Core i9)"),
+    (("INTEL",), 6, 10, -1, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_H"), "_13xxx", "Intel 7", "Raptor Lake-H (Core i7)"),
+    (("INTEL",), 6, 10, -1, -1, 186, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_H"), "_13xxx", "Intel 7", "Raptor Lake-H (Core i5)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_9"), "_14xxx", "Intel 7", "Raptor Lake-S (Core i9)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_7"), "_14xxx", "Intel 7", "Raptor Lake-S (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_5"), "_14xxx", "Intel 7", "Raptor Lake-S (Core i5)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_3"), "_14xxx", "Intel 7", "Raptor Lake-S (Core i3)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_9", "_H", "_X"), "_14xxx", "Intel 7", "Raptor Lake-HX (Core i9)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_7", "_H", "_X"), "_14xxx", "Intel 7", "Raptor Lake-HX (Core i7)"),
+    (("INTEL",), 6, 7, -1, -1, 183, -1, -1, -1, None, ("CORE_", "_I_", "_5", "_H", "_X"), "_14xxx", "Intel 7", "Raptor Lake-HX (Core i5)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_W_", "_9"), "_x4xx", "Intel 7", "Sapphire Rapids-WS (Xeon w9)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_W_", "_7"), "_x4xx", "Intel 7", "Sapphire Rapids-WS (Xeon w7)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_W_", "_5"), "_x4xx", "Intel 7", "Sapphire Rapids-WS (Xeon w5)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_W_", "_3"), "_x4xx", "Intel 7", "Sapphire Rapids-WS (Xeon w3)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_MAX_"), "_x4xx", "Intel 7", "Sapphire Rapids-HBM (Xeon Max)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_PLATINIUM_"), "_x4xx", "Intel 7", "Sapphire Rapids-SP (Xeon Platinum)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_GOLD_"), "_x4xx", "Intel 7", "Sapphire Rapids-SP (Xeon Gold)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_SILVER_"), "_x4xx", "Intel 7", "Sapphire Rapids-SP (Xeon Silver)"),
+    (("INTEL",), 6, 15, -1, -1, 143, -1, -1, -1, None, ("XEON_", "_BRONZE_"), "_x4xx", "Intel 7", "Sapphire Rapids-SP (Xeon Bronze)"),
+    (("INTEL",), 6, 15, -1, -1, 207, -1, -1, -1, None, ("XEON_", "_PLATINIUM_"), "_x5xx", "Intel 7", "Emerald Rapids-SP (Xeon Platinum)"),
+    (("INTEL",), 6, 15, -1, -1, 207, -1, -1, -1, None, ("XEON_", "_GOLD_"), "_x5xx", "Intel 7", "Emerald Rapids-SP (Xeon Gold)"),
+    (("INTEL",), 6, 15, -1, -1, 207, -1, -1, -1, None, ("XEON_", "_SILVER_"), "_x5xx", "Intel 7", "Emerald Rapids-SP (Xeon Silver)"),
+    (("INTEL",), 6, 15, -1, -1, 207, -1, -1, -1, None, ("XEON_", "_BRONZE_"), "_x5xx", "Intel 7", "Emerald Rapids-SP (Xeon Bronze)"),
+    (("INTEL",), 6, 10, -1, -1, 170, -1, -1, -1, None, ("CORE_", "_ULTRA_", "_9", "_H"), "_x1xx", "Intel 4", "Meteor Lake-H (Core Ultra 9)"),
+    (("INTEL",), 6, 10, -1, -1, 170, -1, -1, -1, None, ("CORE_", "_ULTRA_", "_7", "_H"), "_x1xx", "Intel 4", "Meteor Lake-H (Core Ultra 7)"),
+    (("INTEL",), 6, 10, -1, -1, 170, -1, -1, -1, None, ("CORE_", "_ULTRA_", "_5", "_H"), "_x1xx", "Intel 4", "Meteor Lake-H (Core Ultra 5)"),
+    (("INTEL",), 6, 10, -1, -1, 170, -1, -1, -1, None, ("CORE_", "_ULTRA_", "_7", "_U"), "_x1xx", "Intel 4", "Meteor Lake-U (Core Ultra 7)"),
+    (("INTEL",), 6, 10, -1, -1, 170, -1, -1, -1, None, ("CORE_", "_ULTRA_", "_5", "_U"), "_x1xx", "Intel 4", "Meteor Lake-U (Core Ultra 5)"),
+    (("INTEL",), 7, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Itanium"),
+    (("INTEL",), 15, -1, -1, 16, -1, 1, -1, -1, None, (), None, None, "Itanium 2"),
+    (("AMD", "HYGON"), -1, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown AMD CPU"),
+    (("AMD", "HYGON"), 4, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown AMD 486"),
+    (("AMD", "HYGON"), 4, 3, -1, -1, -1, 1, -1, -1, None, (), None, None, "AMD 486DX2"),
+    (("AMD", "HYGON"), 4, 7, -1, -1, -1, 1, -1, -1, None, (), None, None, "AMD 486DX2WB"),
+    (("AMD", "HYGON"), 4, 8, -1, -1, -1, 1, -1, -1, None, (), None, None, "AMD 486DX4"),
+    (("AMD", "HYGON"), 4, 9, -1, -1, -1, 1, -1, -1, None, (), None, None, "AMD 486DX4WB"),
+    (("AMD", "HYGON"), 5, -1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown AMD 586"),
+    (("AMD", "HYGON"), 5, 0, -1, -1, -1, 1, -1, -1, None, (), None, None, "K5"),
+    (("AMD", "HYGON"), 5, 1, -1, -1, -1, 1, -1, -1, None, (), None, None, "K5"),
+    (("AMD", "HYGON"), 5, 2, -1, -1, -1, 1, -1, -1, None, (), None, None, "K5"),
+    (("AMD", "HYGON"), 5, 3, -1, -1, -1, 1, -1, -1, None, (), None, None, "K5"),
+    (("AMD", "HYGON"), 5, 6, -1, -1, -1, 1, -1, -1, None, (), None, None, "K6"),
+    (("AMD", "HYGON"), 5, 7, -1, -1, -1, 1, -1, -1, None, (), None, None, "K6"),
+    (("AMD", "HYGON"), 5, 8, -1, -1, -1, 1, -1, -1, None, (), None, None, "K6-2"),
+    (("AMD", "HYGON"), 5, 9, -1, -1, -1, 1, -1, -1, None, (), None, None, "K6-III"),
+    (("AMD", "HYGON"), 5, 10, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown K6"),
+    (("AMD", "HYGON"), 5, 11, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown K6"),
+    (("AMD", "HYGON"), 5, 12, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown K6"),
+    (("AMD", "HYGON"), 5, 13, -1, -1, -1, 1, -1, -1, None, (), None, None, "K6-2+"),
+    (("AMD", "HYGON"), 6, 1, -1, -1, -1, 1, -1, -1, None, (), None, None, "Athlon (Slot-A)"),
+    (("AMD", "HYGON"), 6, 2, -1, -1, -1, 1, -1, -1, None, (), None, None, "Athlon (Slot-A)"),
+    (("AMD", "HYGON"), 6, 3, -1, -1, -1, 1, -1, -1, None, (), None, None, "Duron (Spitfire)"),
+    (("AMD", "HYGON"), 6, 4, -1, -1, -1, 1, -1, -1, None, (), None, None, "Athlon (ThunderBird)"),
+    (("AMD", "HYGON"), 6, 6, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Athlon"),
+    (("AMD", "HYGON"), 6, 6, -1, -1, -1, 1, -1, -1, None, ("ATHLON_",), None, None, "Athlon (Palomino)"),
+    (("AMD", "HYGON"), 6, 6, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_MP_"), None, None, "Athlon MP (Palomino)"),
+    (("AMD", "HYGON"), 6, 6, -1, -1, -1, 1, -1, -1, None, ("DURON_",), None, None, "Duron (Palomino)"),
+    (("AMD", "HYGON"), 6, 6, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_XP_"), None, None, "Athlon XP"),
+    (("AMD", "HYGON"), 6, 7, -1, -1, -1, 1, -1, -1, None, (), None, None, "Unknown Athlon XP"),
+    (("AMD", "HYGON"), 6, 7, -1, -1, -1, 1, -1, -1, None, ("DURON_",), None, None, "Duron (Morgan)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, (), None, None, "Athlon XP"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, ("ATHLON_",), None, None, "Athlon XP (Thoroughbred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_XP_"), None, None, "Athlon XP (Thoroughbred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, ("DURON_",), None, None, "Duron (Applebred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, ("SEMPRON_",), None, None, "Sempron (Thoroughbred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, 128, -1, None, ("SEMPRON_",), None, None, "Sempron (Thoroughbred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron (Thoroughbred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_MP_"), None, None, "Athlon MP (Thoroughbred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_XP_", "_M_"), None, None, "Mobile Athlon (T-Bred)"),
+    (("AMD", "HYGON"), 6, 8, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_XP_", "_M_", "_LV_"), None, None, "Mobile Athlon (T-Bred)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, -1, -1, None, (), None, None, "Athlon XP (Barton)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, 512, -1, None, ("ATHLON_", "_XP_"), None, None, "Athlon XP (Barton)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, 512, -1, None, ("SEMPRON_",), None, None, "Sempron (Barton)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron (Thorton)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, 256, -1, None, ("ATHLON_", "_XP_"), None, None, "Athlon XP (Thorton)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_MP_"), None, None, "Athlon MP (Barton)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_XP_", "_M_"), None, None, "Mobile Athlon (Barton)"),
+    (("AMD", "HYGON"), 6, 10, -1, -1, -1, 1, -1, -1, None, ("ATHLON_", "_XP_", "_M_", "_LV_"), None, None, "Mobile Athlon (Barton)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, -1, -1, None, (), None, None, "Unknown K8"),
+    (("AMD", "HYGON"), 15, -1, -1, 16, -1, 1, -1, -1, None, (), None, None, "Unknown K9"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, -1, -1, None, (), None, None, "Unknown A64"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, -1, -1, None, ("OPTERON_",), None, None, "Opteron"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 2, -1, -1, None, ("OPTERON_", "_X2"), None, None, "Opteron (Dual Core)"),
+    (("AMD", "HYGON"), 15, 3, -1, 15, -1, 1, -1, -1, None, ("OPTERON_",), None, None, "Opteron"),
+    (("AMD", "HYGON"), 15, 3, -1, 15, -1, 2, -1, -1, None, ("OPTERON_", "_X2"), None, None, "Opteron (Dual Core)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, 1024, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, -1, -1, None, ("ATHLON_", "_FX"), None, None, "Athlon FX"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, -1, -1, None, ("ATHLON_", "_64_", "_FX"), None, None, "Athlon 64 FX"),
+    (("AMD", "HYGON"), 15, 3, -1, 15, 35, 2, -1, -1, None, ("ATHLON_", "_64_", "_FX"), None, None, "Athlon 64 FX X2 (Toledo)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 2, 1024, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, 512, -1, None, ("TURION_", "_64_"), None, None, "Turion 64 (512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, 1024, -1, None, ("TURION_", "_64_"), None, None, "Turion 64 (1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 2, 512, -1, None, ("TURION_", "_X2"), None, None, "Turion 64 X2 (512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 2, 1024, -1, None, ("TURION_", "_X2"), None, None, "Turion 64 X2 (1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, 128, -1, None, ("SEMPRON_",), None, None, "A64 Sempron (128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, 256, -1, None, ("SEMPRON_",), None, None, "A64 Sempron (256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 1, 512, -1, None, ("SEMPRON_",), None, None, "A64 Sempron (512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 79, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (Orleans/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 95, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (Orleans/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 47, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (Venice/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 44, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (Venice/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 31, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (Winchester/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 12, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (Newcastle/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 39, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (San Diego/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 55, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (San Diego/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 4, 1, 512, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (ClawHammer/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 95, 1, 1024, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (Orleans/1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 39, 1, 1024, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (San Diego/1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 4, 1, 1024, -1, None, ("ATHLON_", "_64_"), None, None, "Athlon 64 (ClawHammer/1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 75, 2, 256, -1, None, ("SEMPRON_",), None, None, "Athlon 64 X2 (Windsor/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 35, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (Toledo/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 75, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (Windsor/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 67, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (Windsor/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 107, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (Brisbane/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 43, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (Manchester/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 35, 2, 1024, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (Toledo/1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 67, 2, 1024, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon 64 X2 (Windsor/1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 8, 1, 128, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Dublin/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 8, 1, 256, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Dublin/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 12, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Paris)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 28, 1, 128, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Palermo/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 28, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Palermo/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 28, 1, 128, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Sonora/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 28, 1, 256, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Sonora/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 44, 1, 128, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Palermo/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 44, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Palermo/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 44, 1, 128, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Albany/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 44, 1, 256, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Albany/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 47, 1, 128, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Palermo/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 47, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Palermo/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 79, 1, 128, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Manila/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 79, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Manila/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 95, 1, 128, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Manila/128K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 95, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Manila/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 107, 2, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 Dual (Sherman/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 107, 2, 512, -1, None, ("SEMPRON_",), None, None, "Sempron 64 Dual (Sherman/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 124, 1, 512, -1, None, ("ATHLON_",), None, None, "Athlon 64 (Sherman/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 127, 1, 256, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Sparta/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 127, 1, 512, -1, None, ("SEMPRON_",), None, None, "Sempron 64 (Sparta/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 76, 1, 256, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Keene/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 76, 1, 512, -1, None, ("MOBILE_", "SEMPRON_"), None, None, "Mobile Sempron 64 (Keene/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, -1, 2, -1, -1, None, ("SEMPRON_",), None, None, "Sempron Dual Core"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 36, 1, 512, -1, None, ("TURION_", "_64_"), None, None, "Turion 64 (Lancaster/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 36, 1, 1024, -1, None, ("TURION_", "_64_"), None, None, "Turion 64 (Lancaster/1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 72, 2, 256, -1, None, ("TURION_", "_X2"), None, None, "Turion X2 (Taylor)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 72, 2, 512, -1, None, ("TURION_", "_X2"), None, None, "Turion X2 (Trinidad)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 76, 1, 512, -1, None, ("TURION_", "_64_"), None, None, "Turion 64 (Richmond)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 104, 2, 256, -1, None, ("TURION_", "_X2"), None, None, "Turion X2 (Tyler/256K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 15, 104, 2, 512, -1, None, ("TURION_", "_X2"), None, None, "Turion X2 (Tyler/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 17, 3, 2, 512, -1, None, ("TURION_", "_X2"), None, None, "Turion X2 (Griffin/512K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 17, 3, 2, 1024, -1, None, ("TURION_", "_X2"), None, None, "Turion X2 (Griffin/1024K)"),
+    (("AMD", "HYGON"), 15, -1, -1, 16, -1, 1, -1, -1, "PHENOM", (), None, None, "Unknown AMD Phenom"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 1, -1, -1, "PHENOM", (), None, None, "Phenom"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 3, -1, -1, "PHENOM", (), None, None, "Phenom X3 (Toliman)"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 4, -1, -1, "PHENOM", (), None, None, "Phenom X4 (Agena)"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 3, 512, -1, "PHENOM", (), None, None, "Phenom X3 (Toliman/256K)"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 3, 512, -1, "PHENOM", (), None, None, "Phenom X3 (Toliman/512K)"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 4, 128, -1, "PHENOM", (), None, None, "Phenom X4 (Agena/128K)"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 4, 256, -1, "PHENOM", (), None, None, "Phenom X4 (Agena/256K)"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 4, 512, -1, "PHENOM", (), None, None, "Phenom X4 (Agena/512K)"),
+    (("AMD", "HYGON"), 15, 2, -1, 16, -1, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon X2 (Kuma)"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, -1, 4, -1, -1, None, (), None, None, "Phenom (Deneb-based)"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, -1, 1, 1024, -1, None, ("SEMPRON_",), None, None, "Sempron (Sargas)"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, -1, 2, 512, -1, "PHENOM2", (), None, None, "Phenom II X2 (Callisto)"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, -1, 3, 512, -1, "PHENOM2", (), None, None, "Phenom II X3 (Heka)"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, -1, 4, 512, -1, "PHENOM2", (), None, None, "Phenom II X4"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, 4, 4, 512, -1, "PHENOM2", (), None, None, "Phenom II X4 (Deneb)"),
+    (("AMD", "HYGON"), 15, 5, -1, 16, 5, 4, 512, -1, "PHENOM2", (), None, None, "Phenom II X4 (Deneb)"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, 10, 4, 512, -1, "PHENOM2", (), None, None, "Phenom II X4 (Zosma)"),
+    (("AMD", "HYGON"), 15, 4, -1, 16, 10, 6, 512, -1, "PHENOM2", (), None, None, "Phenom II X6 (Thuban)"),
+    (("AMD", "HYGON"), 15, 6, -1, 16, 6, 2, 512, -1, None, ("ATHLON_", "_X2"), None, None, "Athlon II (Champlain)"),
+    (("AMD", "HYGON"), 15, 6, -1, 16, 6, 2, 512, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon II X2 (Regor)"),
+    (("AMD", "HYGON"), 15, 6, -1, 16, 6, 2, 1024, -1, None, ("ATHLON_", "_64_", "_X2"), None, None, "Athlon II X2 (Regor)"),
+    (("AMD", "HYGON"), 15, 5, -1, 16, 5, 3, 512, -1, None, ("ATHLON_", "_64_", "_X3"), None, None, "Athlon II X3 (Rana)"),
+    (("AMD", "HYGON"), 15, 5, -1, 16, 5, 4, 512, -1, None, ("ATHLON_", "_64_", "_X4"), None, None, "Athlon II X4 (Propus)"),
+    (("AMD", "HYGON"), 15, 9, -1, 22, 9, 8, -1, -1, None, ("OPTERON_",), None, None, "Magny-Cours Opteron"),
+    (("AMD", "HYGON"), 15, 1, -1, 18, 1, 2, -1, -1, "FUSION_EA", (), None, None, "Llano X2"),
+    (("AMD", "HYGON"), 15, 1, -1, 18, 1, 3, -1, -1, "FUSION_EA", (), None, None, "Llano X3"),
+    (("AMD", "HYGON"), 15, 1, -1, 18, 1, 4, -1, -1, "FUSION_EA", (), None, None, "Llano X4"),
+    (("AMD", "HYGON"), 15, 2, -1, 20, -1, 1, -1, -1, "FUSION_C", (), None, None, "Brazos Ontario"),
+    (("AMD", "HYGON"), 15, 2, -1, 20, -1, 2, -1, -1, "FUSION_C", (), None, None, "Brazos Ontario (Dual-core)"),
+    (("AMD", "HYGON"), 15, 1, -1, 20, -1, 1, -1, -1, "FUSION_E", (), None, None, "Brazos Zacate"),
+    (("AMD", "HYGON"), 15, 1, -1, 20, -1, 2, -1, -1, "FUSION_E", (), None, None, "Brazos Zacate (Dual-core)"),
+    (("AMD", "HYGON"), 15, 2, -1, 20, -1, 2, -1, -1, "FUSION_Z", (), None, None, "Brazos Desna (Dual-core)"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 0, 4, -1, -1, None, (), None, None, "Zambezi X2"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 1, 4, -1, -1, None, (), None, None, "Zambezi X2"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 1, 6, -1, -1, None, (), None, None, "Zambezi X3"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 1, 8, -1, -1, None, (), None, None, "Zambezi X4"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 1, -1, -1, -1, None, ("OPTERON_",), None, None, "Interlagos"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 2, 4, -1, -1, None, (), None, None, "Vishera X2"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 2, 6, -1, -1, None, (), None, None, "Vishera X3"),
+    (("AMD", "HYGON"), 15, -1, -1, 21, 2, 8, -1, -1, None, (), None, None, "Vishera X4"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 16, 2, -1, -1, "FUSION_A", (), None, None, "Trinity X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 16, 4, -1, -1, "FUSION_A", (), None, None, "Trinity X4"),
+    (("AMD", "HYGON"), 15, 3, -1, 21, 19, 2, -1, -1, "FUSION_A", (), None, None, "Richland X2"),
+    (("AMD", "HYGON"), 15, 3, -1, 21, 19, 4, -1, -1, "FUSION_A", (), None, None, "Richland X4"),
+    (("AMD", "HYGON"), 15, 2, -1, 21, 2, -1, -1, -1, None, ("OPTERON_",), None, None, "Abu Dhabi"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 48, 2, -1, -1, "FUSION_A", (), None, None, "Kaveri X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 48, 4, -1, -1, "FUSION_A", (), None, None, "Kaveri X4"),
+    (("AMD", "HYGON"), 15, 8, -1, 21, 56, 2, -1, -1, "FUSION_A", (), None, None, "Godavari X2"),
+    (("AMD", "HYGON"), 15, 8, -1, 21, 56, 4, -1, -1, "FUSION_A", (), None, None, "Godavari X4"),
+    (("AMD", "HYGON"), 15, 8, -1, 21, 56, 4, -1, -1, None, ("ATHLON_", "_X4"), None, None, "Godavari X4"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 48, 2, -1, -1, "FUSION_RX", (), None, None, "Bald Eagle X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 48, 4, -1, -1, "FUSION_RX", (), None, None, "Bald Eagle X4"),
+    (("AMD", "HYGON"), 15, 1, -1, 21, 96, 2, -1, -1, "FUSION_A", (), None, None, "Carrizo X2"),
+    (("AMD", "HYGON"), 15, 1, -1, 21, 96, 4, -1, -1, "FUSION_A", (), None, None, "Carrizo X4"),
+    (("AMD", "HYGON"), 15, 5, -1, 21, 101, 2, -1, -1, "FUSION_A", (), None, None, "Bristol Ridge X2"),
+    (("AMD", "HYGON"), 15, 5, -1, 21, 101, 4, -1, -1, "FUSION_A", (), None, None, "Bristol Ridge X4"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 112, 2, -1, -1, "FUSION_A", (), None, None, "Stoney Ridge X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 21, 112, 2, -1, -1, "FUSION_E", (), None, None, "Stoney Ridge X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 22, 0, 2, -1, -1, "FUSION_A", (), None, None, "Kabini X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 22, 0, 4, -1, -1, "FUSION_A", (), None, None, "Kabini X4"),
+    (("AMD", "HYGON"), 15, 0, -1, 22, 0, 2, -1, -1, None, ("SEMPRON_", "_X2"), None, None, "Kabini X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 22, 0, 4, -1, -1, None, ("SEMPRON_", "_X4"), None, None, "Kabini X4"),
+    (("AMD", "HYGON"), 15, 0, -1, 22, 0, 4, -1, -1, None, ("ATHLON_", "_X4"), None, None, "Kabini X4"),
+    (("AMD", "HYGON"), 15, 0, -1, 22, 48, 2, -1, -1, "FUSION_E", (), None, None, "Mullins X2"),
+    (("AMD", "HYGON"), 15, 0, -1, 22, 48, 4, -1, -1, "FUSION_A", (), None, None, "Mullins X4"),
+    (("AMD", "HYGON"), 15, 0, 1, 22, 48, 2, -1, -1, "FUSION_A", (), None, None, "Beema X2"),
+    (("AMD", "HYGON"), 15, 0, 1, 22, 48, 4, -1, -1, "FUSION_A", (), None, None, "Beema X4"),
+    (("AMD", "HYGON"), 15, 0, 1, 22, 48, 2, -1, -1, "FUSION_GX", (), None, None, "Steppe Eagle X2"),
+    (("AMD", "HYGON"), 15, 0, 1, 22, 48, 4, -1, -1, "FUSION_GX", (), None, None, "Steppe Eagle X4"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 1, -1, -1, -1, None, ("EPYC_",), None, None, "EPYC (Naples)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 1, -1, -1, -1, None, ("RYZEN_TR_",), None, None, "Threadripper (Whitehaven)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 1, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Summit Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 1, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Summit Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 1, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Summit Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 17, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Raven Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 17, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Raven Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 17, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Raven Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 17, -1, -1, -1, None, ("ATHLON_",), None, None, "Athlon (Raven Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 32, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Dali)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 32, -1, -1, -1, None, ("ATHLON_",), None, None, "Athlon (Dali)"),
+    (("AMD", "HYGON"), 15, -1, 1, 23, 32, -1, -1, -1, None, (), None, None, "Dali"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 8, -1, -1, -1, None, ("RYZEN_TR_",), None, None, "Threadripper (Colfax)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 8, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Pinnacle Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 8, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Pinnacle Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 8, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Pinnacle Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 24, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Picasso)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 24, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Picasso)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 24, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Picasso)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 24, -1, -1, -1, None, ("ATHLON_",), None, None, "Athlon (Picasso)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 49, -1, -1, -1, None, ("EPYC_",), None, None, "EPYC (Rome)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 49, -1, -1, -1, None, ("RYZEN_TR_",), None, None, "Threadripper (Castle Peak)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 113, -1, -1, -1, None, ("RYZEN_", "_9"), None, None, "Ryzen 9 (Matisse)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 113, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Matisse)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 113, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Matisse)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 113, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Matisse)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 96, -1, -1, -1, None, ("RYZEN_", "_9"), None, None, "Ryzen 9 (Renoir)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 96, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Renoir)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 96, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Renoir)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 96, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Renoir)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 104, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Lucienne)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 104, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Lucienne)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 104, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Lucienne)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 71, -1, -1, -1, None, (), None, None, "Desktop Kit (Zen 2)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 132, -1, -1, -1, None, (), None, None, "Desktop Kit (Zen 2)"),
+    (("AMD", "HYGON"), 15, -1, 2, 23, 144, -1, -1, -1, None, (), None, None, "Van Gogh"),
+    (("AMD", "HYGON"), 15, -1, 0, 23, 145, -1, -1, -1, None, (), None, None, "Van Gogh"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 160, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Mendocino)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 160, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Mendocino)"),
+    (("AMD", "HYGON"), 15, -1, -1, 23, 160, -1, -1, -1, None, ("ATHLON_",), None, None, "Athlon (Mendocino)"),
+    (("AMD", "HYGON"), 15, -1, -1, 24, 0, -1, -1, -1, None, ("C86_", "_7"), None, None, "C86 7 (Dhyana)"),
+    (("AMD", "HYGON"), 15, -1, -1, 24, 0, -1, -1, -1, None, ("C86_", "_5"), None, None, "C86 5 (Dhyana)"),
+    (("AMD", "HYGON"), 15, -1, -1, 24, 0, -1, -1, -1, None, ("C86_", "_3"), None, None, "C86 3 (Dhyana)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 1, -1, -1, -1, None, ("EPYC_",), None, None, "EPYC (Milan)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 8, -1, -1, -1, None, ("RYZEN_TR_",), None, None, "Threadripper (Chagall)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 33, -1, -1, -1, None, ("RYZEN_", "_9"), None, None, "Ryzen 9 (Vermeer)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 33, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Vermeer)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 33, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Vermeer)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 33, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Vermeer)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 80, -1, -1, -1, None, ("RYZEN_", "_9"), None, None, "Ryzen 9 (Cezanne)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 80, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Cezanne)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 80, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Cezanne)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 80, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Cezanne)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 68, -1, -1, -1, None, ("RYZEN_", "_9"), None, None, "Ryzen 9 (Rembrandt)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 68, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Rembrandt)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 68, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Rembrandt)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 68, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Rembrandt)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 17, -1, -1, -1, None, ("EPYC_",), None, None, "EPYC (Genoa)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 24, -1, -1, -1, None, ("RYZEN_TR_",), None, None, "Threadripper (Storm Peak)"),
+    (("AMD", "HYGON"), 15, -1, 2, 25, 97, -1, -1, -1, None, ("RYZEN_", "_9"), None, None, "Ryzen 9 (Raphael)"),
+    (("AMD", "HYGON"), 15, -1, 2, 25, 97, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Raphael)"),
+    (("AMD", "HYGON"), 15, -1, 2, 25, 97, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Raphael)"),
+    (("AMD", "HYGON"), 15, -1, 2, 25, 97, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Raphael)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 97, -1, -1, -1, None, ("RYZEN_", "_9", "_H"), None, None, "Ryzen 9 (Dragon Range)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 97, -1, -1, -1, None, ("RYZEN_", "_7", "_H"), None, None, "Ryzen 7 (Dragon Range)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 97, -1, -1, -1, None, ("RYZEN_", "_5", "_H"), None, None, "Ryzen 5 (Dragon Range)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 116, -1, -1, -1, None, ("RYZEN_", "_9", "_H"), None, None, "Ryzen 9 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 116, -1, -1, -1, None, ("RYZEN_", "_7", "_H"), None, None, "Ryzen 7 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 116, -1, -1, -1, None, ("RYZEN_", "_7", "_U"), None, None, "Ryzen 7 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 116, -1, -1, -1, None, ("RYZEN_", "_5", "_H"), None, None, "Ryzen 5 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 116, -1, -1, -1, None, ("RYZEN_", "_5", "_U"), None, None, "Ryzen 5 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 116, -1, -1, -1, None, ("RYZEN_", "_3", "_U"), None, None, "Ryzen 3 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 116, -1, -1, -1, None, ("RYZEN_", "_Z"), None, None, "Ryzen Z1 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_7", "_F"), None, None, "Ryzen 7 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_5", "_F"), None, None, "Ryzen 5 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_9", "_G"), None, None, "Ryzen 9 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_7", "_G"), None, None, "Ryzen 7 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_5", "_G"), None, None, "Ryzen 5 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_3", "_G"), None, None, "Ryzen 3 (Phoenix)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_9", "_H"), None, None, "Ryzen 9 (Hawk Point)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_7", "_H"), None, None, "Ryzen 7 (Hawk Point)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_7", "_U"), None, None, "Ryzen 7 (Hawk Point)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_5", "_H"), None, None, "Ryzen 5 (Hawk Point)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_5", "_U"), None, None, "Ryzen 5 (Hawk Point)"),
+    (("AMD", "HYGON"), 15, -1, -1, 25, 117, -1, -1, -1, None, ("RYZEN_", "_3", "_U"), None, None, "Ryzen 3 (Hawk Point)"),
+    (("AMD", "HYGON"), 15, -1, -1, 26, 68, -1, -1, -1, None, ("RYZEN_", "_9"), None, None, "Ryzen 9 (Granite Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 26, 68, -1, -1, -1, None, ("RYZEN_", "_7"), None, None, "Ryzen 7 (Granite Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 26, 68, -1, -1, -1, None, ("RYZEN_", "_5"), None, None, "Ryzen 5 (Granite Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 26, 68, -1, -1, -1, None, ("RYZEN_", "_3"), None, None, "Ryzen 3 (Granite Ridge)"),
+    (("AMD", "HYGON"), 15, -1, -1, 26, 36, -1, -1, -1, None, ("RYZEN_", "_AI_", "_9"), None, None, "Ryzen AI 9 (Strix Point)"),
+    (("AMD", "HYGON"), 15, -1, -1, 26, 36, -1, -1, -1, None, ("RYZEN_", "_AI_", "_7"), None, None, "Ryzen AI 7 (Strix Point)"),
+    (("CENTAUR",), -1, -1, -1, -1, -1, -1, -1, -1, None, (), None, None, "Unknown Centaur CPU"),
+    (("CENTAUR",), 6, -1, -1, -1, -1, -1, -1, -1, "VIA", (), None, None, "Unknown VIA CPU"),
+    (("CENTAUR",), 6, 6, -1, -1, -1, -1, -1, -1, "VIA", ("SAMUEL_",), None, "180nm", "VIA Cyrix III (Samuel)"),
+    (("CENTAUR",), 6, 7, -1, -1, -1, -1, -1, -1, "VIA", ("SAMUEL_",), None, "150nm", "VIA C3 (Samuel 2)"),
+    (("CENTAUR",), 6, 7, -1, -1, -1, -1, -1, -1, "VIA", ("EZRA_",), None, "130nm", "VIA C3 (Ezra)"),
+    (("CENTAUR",), 6, 8, -1, -1, -1, -1, -1, -1, "VIA", ("EZRA_",), None, "130nm", "VIA C3 (Ezra-T)"),
+    (("CENTAUR",), 6, 9, -1, -1, -1, -1, -1, -1, "VIA", ("NEHEMIAH_",), None, "130nm", "VIA C3 (Nehemiah)"),
+    (("CENTAUR",), 6, 10, -1, -1, -1, -1, -1, -1, "VIA", ("ESTHER_",), None, "90nm", "VIA C7 (Esther)"),
+    (("CENTAUR",), 6, 13, -1, -1, -1, -1, -1, -1, "VIA", ("ESTHER_",), None, "90nm", "VIA C7-M (Esther)"),
+    (("CENTAUR",), 6, 15, -1, -1, -1, -1, -1, -1, "VIA", ("CNA_",), None, "65nm", "VIA Nano (Isaiah)"),
+    (("CENTAUR",), 6, 15, -1, -1, -1, 1, -1, -1, "VIA", ("NANO_",), None, "65nm", "VIA Nano (Isaiah)"),
+    (("CENTAUR",), 6, 15, -1, -1, -1, 2, -1, -1, "VIA", ("NANO_",), None, "65nm", "VIA Nano X2 (Isaiah)"),
+    (("CENTAUR",), 6, 15, -1, -1, -1, -1, -1, -1, "VIA", ("QUADCORE_",), None, "65nm", "VIA Nano X4 (Isaiah)"),
+    (("CENTAUR",), 6, 15, -1, -1, -1, 4, -1, -1, "VIA", ("EDEN_",), None, "65nm", "VIA Eden X4 (Isaiah)"),
+    (("CENTAUR",), 7, -1, -1, -1, -1, -1, -1, -1, "ZHAOXIN", (), None, None, "Unknown Zhaoxin CPU"),
+    (("CENTAUR",), 7, -1, -1, -1, 15, -1, -1, -1, "ZHAOXIN", ("KAISHENG_", "_KH_", "_C"), None, "28nm", "Zhaoxin KaisHeng (ZhangJiang)"),
+    (("CENTAUR",), 7, -1, -1, -1, 15, -1, -1, -1, "ZHAOXIN", ("KAIXIAN_", "_ZX_", "_C"), None, "28nm", "Zhaoxin KaiXian (ZhangJiang)"),
+    (("CENTAUR",), 7, -1, -1, -1, 27, -1, -1, -1, "ZHAOXIN", ("KAISHENG_", "_KH_"), "_20000", "28nm", "Zhaoxin KaisHeng (WuDaoKou)"),
+    (("CENTAUR",), 7, -1, -1, -1, 27, -1, -1, -1, "ZHAOXIN", ("KAIXIAN_", "_KX_"), "_5000", "28nm", "Zhaoxin KaiXian (WuDaoKou)"),
+    (("CENTAUR",), 7, -1, -1, -1, 59, -1, -1, -1, "ZHAOXIN", ("KAISHENG_", "_KH_"), "_30000", "16nm", "Zhaoxin KaisHeng (LuJiaZui)"),
+    (("CENTAUR",), 7, -1, -1, -1, 59, -1, -1, -1, "ZHAOXIN", ("KAIXIAN_", "_KX_"), "_6000", "16nm", "Zhaoxin KaiXian (LuJiaZui)"),
+    (("CENTAUR",), 7, -1, -1, -1, 91, -1, -1, -1, "ZHAOXIN", ("KAISHENG_", "_KH_"), "_40000", "16nm", "Zhaoxin KaisHeng (Yongfeng)"),
+    (("CENTAUR",), 7, -1, -1, -1, 91, -1, -1, -1, "ZHAOXIN", ("KAIXIAN_", "_KX_"), "_7000", "16nm", "Zhaoxin KaiXian (Yongfeng)"),
+)
+
+ARM_PARTS = (
+    ("ARM", 0x41, 0x810, "ARM810", ""),
+    ("ARM", 0x41, 0x920, "ARM920", ""),
+    ("ARM", 0x41, 0x922, "ARM922", ""),
+    ("ARM", 0x41, 0x926, "ARM926", ""),
+    ("ARM", 0x41, 0x940, "ARM940", ""),
+    ("ARM", 0x41, 0x946, "ARM946", ""),
+    ("ARM", 0x41, 0x966, "ARM966", ""),
+    ("ARM", 0x41, 0xa20, "ARM1020", ""),
+    ("ARM", 0x41, 0xa22, "ARM1022", ""),
+    ("ARM", 0x41, 0xa26, "ARM1026", ""),
+    ("ARM", 0x41, 0xb02, "ARM11 MPCore", ""),
+    ("ARM", 0x41, 0xb36, "ARM1136", ""),
+    ("ARM", 0x41, 0xb56, "ARM1156", ""),
+    ("ARM", 0x41, 0xb76, "ARM1176", ""),
+    ("ARM", 0x41, 0xc05, "Cortex-A5", "Sparrow"),
+    ("ARM", 0x41, 0xc07, "Cortex-A7", "Kingfisher"),
+    ("ARM", 0x41, 0xc08, "Cortex-A8", "Tiger"),
+    ("ARM", 0x41, 0xc09, "Cortex-A9", "Falcon"),
+    ("ARM", 0x41, 0xc0d, "Cortex-A17", "Owl"),
+    ("ARM", 0x41, 0xc0f, "Cortex-A15", "Eagle"),
+    ("ARM", 0x41, 0xc0e, "Cortex-A17", "Owl"),
+    ("ARM", 0x41, 0xc14, "Cortex-R4", ""),
+    ("ARM", 0x41, 0xc15, "Cortex-R5", ""),
+    ("ARM", 0x41, 0xc17, "Cortex-R7", ""),
+    ("ARM", 0x41, 0xc18, "Cortex-R8", ""),
+    ("ARM", 0x41, 0xc20, "Cortex-M0", "Swift"),
+    ("ARM", 0x41, 0xc21, "Cortex-M1", "Proteus"),
+    ("ARM", 0x41, 0xc23, "Cortex-M3", "Sandcat"),
+    ("ARM", 0x41, 0xc24, "Cortex-M4", "Merlin"),
+    ("ARM", 0x41, 0xc27, "Cortex-M7", "Pelican"),
+    ("ARM", 0x41, 0xc60, "Cortex-M0+", "Flycatcher"),
+    ("ARM", 0x41, 0xd01, "Cortex-A32", "Minerva"),
+    ("ARM", 0x41, 0xd02, "Cortex-A34", "Metis"),
+    ("ARM", 0x41, 0xd03, "Cortex-A53", "Apollo"),
+    ("ARM", 0x41, 0xd04, "Cortex-A35", "Mercury"),
+    ("ARM", 0x41, 0xd05, "Cortex-A55", "Ananke"),
+    ("ARM", 0x41, 0xd06, "Cortex-A65", "Helios"),
+    ("ARM", 0x41, 0xd07, "Cortex-A57", "Atlas"),
+    ("ARM", 0x41, 0xd08, "Cortex-A72", "Maia"),
+    ("ARM", 0x41, 0xd09, "Cortex-A73", "Artemis"),
+    ("ARM", 0x41, 0xd0a, "Cortex-A75", "Prometheus"),
+    ("ARM", 0x41, 0xd0b, "Cortex-A76", "Enyo"),
+    ("ARM", 0x41, 0xd0c, "Neoverse-N1", "Ares"),
+    ("ARM", 0x41, 0xd0d, "Cortex-A77", "Deimos"),
+    ("ARM", 0x41, 0xd0e, "Cortex-A76AE", "Enyo-AE"),
+    ("ARM", 0x41, 0xd13, "Cortex-R52", ""),
+    ("ARM", 0x41, 0xd15, "Cortex-R82", ""),
+    ("ARM", 0x41, 0xd16, "Cortex-R52+", ""),
+    ("ARM", 0x41, 0xd20, "Cortex-M23", "Grebe"),
+    ("ARM", 0x41, 0xd21, "Cortex-M33", "Teal"),
+    ("ARM", 0x41, 0xd22, "Cortex-M55", "Yamin"),
+    ("ARM", 0x41, 0xd23, "Cortex-M85", ""),
+    ("ARM", 0x41, 0xd40, "Neoverse-V1", "Zeus"),
+    ("ARM", 0x41, 0xd41, "Cortex-A78", "Hercules"),
+    ("ARM", 0x41, 0xd42, "Cortex-A78AE", "Hercules-AE"),
+    ("ARM", 0x41, 0xd43, "Cortex-A65AE", "Helios-AE"),
+    ("ARM", 0x41, 0xd44, "Cortex-X1", "Hera"),
+    ("ARM", 0x41, 0xd46, "Cortex-A510", "Klein"),
+    ("ARM", 0x41, 0xd47, "Cortex-A710", "Matterhorn"),
+    ("ARM", 0x41, 0xd48, "Cortex-X2", "Matterhorn ELP"),
+    ("ARM", 0x41, 0xd49, "Neoverse-N2", "Perseus"),
+    ("ARM", 0x41, 0xd4a, "Neoverse-E1", "Helios"),
+    ("ARM", 0x41, 0xd4b, "Cortex-A78C", "Hercules-C"),
+    ("ARM", 0x41, 0xd4c, "Cortex-X1C", "Hera-C"),
+    ("ARM", 0x41, 0xd4d, "Cortex-A715", "Makalu"),
+    ("ARM", 0x41, 0xd4e, "Cortex-X3", "Makalu ELP"),
+    ("ARM", 0x41, 0xd4f, "Neoverse-V2", "Demeter"),
+    ("ARM", 0x41, 0xd80, "Cortex-A520", "Hayes"),
+    ("ARM", 0x41, 0xd81, "Cortex-A720", "Hunter"),
+    ("ARM", 0x41, 0xd82, "Cortex-X4", "Hunter ELP"),
+    ("ARM", 0x41, 0xd84, "Neoverse-V3", "Poseidon"),
+    ("ARM", 0x41, 0xd8e, "Neoverse-N3", "Hermes"),
+    ("BROADCOM", 0x42, 0x00f, "Brahma-B15", ""),
+    ("BROADCOM", 0x42, 0x100, "Brahma-B53", ""),
+    ("BROADCOM", 0x42, 0x516, "ThunderX2", ""),
+    ("CAVIUM", 0x43, 0x0a0, "ThunderX", ""),
+    ("CAVIUM", 0x43, 0x0a1, "ThunderX-88XX", ""),
+    ("CAVIUM", 0x43, 0x0a2, "ThunderX-81XX", ""),
+    ("CAVIUM", 0x43, 0x0a3, "ThunderX-83XX", ""),
+    ("CAVIUM", 0x43, 0x0af, "ThunderX2-99xx", ""),
+    ("CAVIUM", 0x43, 0x0b0, "OcteonTX2", ""),
+    ("CAVIUM", 0x43, 0x0b1, "OcteonTX2-98XX", ""),
+    ("CAVIUM", 0x43, 0x0b2, "OcteonTX2-96XX", ""),
+    ("CAVIUM", 0x43, 0x0b3, "OcteonTX2-95XX", ""),
+    ("CAVIUM", 0x43, 0x0b4, "OcteonTX2-95XXN", ""),
+    ("CAVIUM", 0x43, 0x0b5, "OcteonTX2-95XXMM", ""),
+    ("CAVIUM", 0x43, 0x0b6, "OcteonTX2-95XXO", ""),
+    ("CAVIUM", 0x43, 0x0b8, "ThunderX3-T110", ""),
+    ("DEC", 0x44, 0xa10, "SA110", ""),
+    ("DEC", 0x44, 0xa11, "SA1100", ""),
+    ("FUJITSU", 0x46, 0x001, "A64FX", ""),
+    ("HISILICON", 0x48, 0xd01, "TaiShan-v110", ""),
+    ("HISILICON", 0x48, 0xd02, "TaiShan-v120", ""),
+    ("HISILICON", 0x48, 0xd40, "Cortex-A76", ""),
+    ("HISILICON", 0x48, 0xd41, "Cortex-A77", ""),
+    ("NVIDIA", 0x4e, 0x000, "Denver", ""),
+    ("NVIDIA", 0x4e, 0x003, "Denver 2", ""),
+    ("NVIDIA", 0x4e, 0x004, "Carmel", ""),
+    ("APM", 0x50, 0x000, "X-Gene", ""),
+    ("QUALCOMM", 0x51, 0x001, "Oryon", ""),
+    ("QUALCOMM", 0x51, 0x00f, "Scorpion", ""),
+    ("QUALCOMM", 0x51, 0x02d, "Scorpion", ""),
+    ("QUALCOMM", 0x51, 0x04d, "Krait", ""),
+    ("QUALCOMM", 0x51, 0x06f, "Krait", ""),
+    ("QUALCOMM", 0x51, 0x201, "Kryo", ""),
+    ("QUALCOMM", 0x51, 0x205, "Kryo", ""),
+    ("QUALCOMM", 0x51, 0x211, "Kryo", ""),
+    ("QUALCOMM", 0x51, 0x800, "Falkor-V1/Kryo", ""),
+    ("QUALCOMM", 0x51, 0x801, "Kryo-V2", ""),
+    ("QUALCOMM", 0x51, 0x802, "Kryo-3XX-Gold", ""),
+    ("QUALCOMM", 0x51, 0x803, "Kryo-3XX-Silver", ""),
+    ("QUALCOMM", 0x51, 0x804, "Kryo-4XX-Gold", ""),
+    ("QUALCOMM", 0x51, 0x805, "Kryo-4XX-Silver", ""),
+    ("QUALCOMM", 0x51, 0xc00, "Falkor", ""),
+    ("QUALCOMM", 0x51, 0xc01, "Saphira", ""),
+    ("SAMSUNG", 0x53, 0x001, "Exynos M1", ""),
+    ("SAMSUNG", 0x53, 0x002, "Exynos M3", ""),
+    ("SAMSUNG", 0x53, 0x003, "Exynos M4", ""),
+    ("SAMSUNG", 0x53, 0x004, "Exynos M5", ""),
+    ("MARVELL", 0x56, 0x131, "Feroceon-88FR131", ""),
+    ("MARVELL", 0x56, 0x581, "PJ4/PJ4b", ""),
+    ("MARVELL", 0x56, 0x584, "PJ4B-MP", ""),
+    ("APPLE", 0x61, 0x000, "A6", "Swift"),
+    ("APPLE", 0x61, 0x001, "A7", "Cyclone"),
+    ("APPLE", 0x61, 0x002, "A8", "Typhoon"),
+    ("APPLE", 0x61, 0x003, "A8X", "Typhoon"),
+    ("APPLE", 0x61, 0x004, "A9", "Twister"),
+    ("APPLE", 0x61, 0x005, "A9X", "Twister"),
+    ("APPLE", 0x61, 0x006, "A10 Fusion", "Zephyr"),
+    ("APPLE", 0x61, 0x007, "A10 Fusion", "Hurricane"),
+    ("APPLE", 0x61, 0x008, "A11 Bionic", "Monsoon"),
+    ("APPLE", 0x61, 0x009, "A11 Bionic", "Mistral"),
+    ("APPLE", 0x61, 0x00b, "A12", "Vortex"),
+    ("APPLE", 0x61, 0x00c, "A12", "Tempest"),
+    ("APPLE", 0x61, 0x00f, "M9", "Tempest"),
+    ("APPLE", 0x61, 0x010, "A12X Bionic", "Vortex"),
+    ("APPLE", 0x61, 0x011, "A12X Bionic", "Tempest"),
+    ("APPLE", 0x61, 0x012, "A13 Bionic", "Lightning"),
+    ("APPLE", 0x61, 0x013, "A13 Bionic", "Thunder"),
+    ("APPLE", 0x61, 0x020, "A14", "Icestorm"),
+    ("APPLE", 0x61, 0x021, "A14", "Firestorm"),
+    ("APPLE", 0x61, 0x022, "M1", "Icestorm"),
+    ("APPLE", 0x61, 0x023, "M1", "Firestorm"),
+    ("APPLE", 0x61, 0x024, "M1 Pro", "Icestorm"),
+    ("APPLE", 0x61, 0x025, "M1 Pro", "Firestorm"),
+    ("APPLE", 0x61, 0x026, "M10", "Thunder"),
+    ("APPLE", 0x61, 0x028, "M1 Max", "Icestorm"),
+    ("APPLE", 0x61, 0x029, "M1 Max", "Firestorm"),
+    ("APPLE", 0x61, 0x030, "A15", "Blizzard"),
+    ("APPLE", 0x61, 0x031, "A15", "Avalanche"),
+    ("APPLE", 0x61, 0x032, "M2", "Blizzard"),
+    ("APPLE", 0x61, 0x033, "M2", "Avalanche"),
+    ("APPLE", 0x61, 0x034, "M2 Pro", "Blizzard"),
+    ("APPLE", 0x61, 0x035, "M2 Pro", "Avalanche"),
+    ("APPLE", 0x61, 0x036, "A16", "Sawtooth"),
+    ("APPLE", 0x61, 0x037, "A16", "Everest"),
+    ("APPLE", 0x61, 0x038, "M2 Max", "Blizzard"),
+    ("APPLE", 0x61, 0x039, "M2 Max", "Avalanche"),
+    ("FARADAY", 0x66, 0x526, "FA526", ""),
+    ("FARADAY", 0x66, 0x626, "FA626", ""),
+    ("INTEL", 0x69, 0x200, "i80200", ""),
+    ("INTEL", 0x69, 0x210, "PXA250A", ""),
+    ("INTEL", 0x69, 0x212, "PXA210A", ""),
+    ("INTEL", 0x69, 0x242, "i80321-400", ""),
+    ("INTEL", 0x69, 0x243, "i80321-600", ""),
+    ("INTEL", 0x69, 0x290, "PXA250B/PXA26x", ""),
+    ("INTEL", 0x69, 0x292, "PXA210B", ""),
+    ("INTEL", 0x69, 0x2c2, "i80321-400-B0", ""),
+    ("INTEL", 0x69, 0x2c3, "i80321-600-B0", ""),
+    ("INTEL", 0x69, 0x2d0, "PXA250C/PXA255/PXA26x", ""),
+    ("INTEL", 0x69, 0x2d2, "PXA210C", ""),
+    ("INTEL", 0x69, 0x411, "PXA27x", ""),
+    ("INTEL", 0x69, 0x41c, "IPX425-533", ""),
+    ("INTEL", 0x69, 0x41d, "IPX425-400", ""),
+    ("INTEL", 0x69, 0x41f, "IPX425-266", ""),
+    ("INTEL", 0x69, 0x682, "PXA32x", ""),
+    ("INTEL", 0x69, 0x683, "PXA930/PXA935", ""),
+    ("INTEL", 0x69, 0x688, "PXA30x", ""),
+    ("INTEL", 0x69, 0x689, "PXA31x", ""),
+    ("INTEL", 0x69, 0xb11, "SA1110", ""),
+    ("INTEL", 0x69, 0xc12, "IPX1200", ""),
+    ("MICROSOFT", 0x6d, 0xd49, "Azure-Cobalt-100", ""),
+    ("PHYTIUM", 0x70, 0x303, "FTC310", ""),
+    ("PHYTIUM", 0x70, 0x660, "FTC660", ""),
+    ("PHYTIUM", 0x70, 0x661, "FTC661", ""),
+    ("PHYTIUM", 0x70, 0x662, "FTC662", ""),
+    ("PHYTIUM", 0x70, 0x663, "FTC663", ""),
+    ("PHYTIUM", 0x70, 0x664, "FTC664", ""),
+    ("PHYTIUM", 0x70, 0x862, "FTC862", ""),
+    ("AMPERE", 0xc0, 0xac3, "Ampere-1", ""),
+    ("AMPERE", 0xc0, 0xac4, "Ampere-1a", ""),
+)
+
+FIXED_CODENAMES = {
+    "CYRIX": ("Cx486", "Cx5x86", "6x86", "6x86MX", "M II", "MediaGX", "MediaGXi", "MediaGXm"),
+    "NEXGEN": ("Nx586",),
+    "TRANSMETA": ("Crusoe", "Efficeon"),
+    "UMC": ("UMC x86 CPU",),
+    "RISE": ("Rise mP6",),
+    "SIS": ("SiS mP6",),
+    "NSC": ("Geode GXm", "Geode GXLV", "Geode GX1", "Geode GX2"),
+}
+
+# fmt: on
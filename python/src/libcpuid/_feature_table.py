@@ -0,0 +1,123 @@
+"""
+Locations of the x86 CPU features directly encoded in a single `cpuid` bit,
+as (leaf, subleaf, register index, bit, vendors) tuples, where an empty tuple
+of vendors means all x86 vendors.
+
+Generated by utils/generate_feature_table.py from the feature match tables
+of the C library, do not edit.
+"""
+
+FEATURE_BITS = {
+    "PNI": (0x00000001, 0, 2, 0, ()),
+    "PCLMUL": (0x00000001, 0, 2, 1, ()),
+    "DTS64": (0x00000001, 0, 2, 2, ("INTEL",)),
+    "MONITOR": (0x00000001, 0, 2, 3, ()),
+    "DS_CPL": (0x00000001, 0, 2, 4, ("INTEL",)),
+    "VMX": (0x00000001, 0, 2, 5, ("INTEL",)),
+    "SMX": (0x00000001, 0, 2, 6, ("INTEL",)),
+    "EST": (0x00000001, 0, 2, 7, ("INTEL",)),
+    "TM2": (0x00000001, 0, 2, 8, ("INTEL",)),
+    "SSSE3": (0x00000001, 0, 2, 9, ()),
+    "CID": (0x00000001, 0, 2, 10, ("INTEL",)),
+    "FMA3": (0x00000001, 0, 2, 12, ()),
+    "CX16": (0x00000001, 0, 2, 13, ()),
+    "XTPR": (0x00000001, 0, 2, 14, ("INTEL",)),
+    "PDCM": (0x00000001, 0, 2, 15, ("INTEL",)),
+    "DCA": (0x00000001, 0, 2, 18, ("INTEL",)),
+    "SSE4_1": (0x00000001, 0, 2, 19, ()),
+    "SSE4_2": (0x00000001, 0, 2, 20, ()),
+    "X2APIC": (0x00000001, 0, 2, 21, ()),
+    "MOVBE": (0x00000001, 0, 2, 22, ()),
+    "POPCNT": (0x00000001, 0, 2, 23, ()),
+    "AES": (0x00000001, 0, 2, 25, ()),
+    "XSAVE": (0x00000001, 0, 2, 26, ()),
+    "OSXSAVE": (0x00000001, 0, 2, 27, ()),
+    "AVX": (0x00000001, 0, 2, 28, ()),
+    "F16C": (0x00000001, 0, 2, 29, ()),
+    "RDRAND": (0x00000001, 0, 2, 30, ()),
+    "HYPERVISOR": (0x00000001, 0, 2, 31, ()),
+    "FPU": (0x00000001, 0, 3, 0, ()),
+    "VME": (0x00000001, 0, 3, 1, ()),
+    "DE": (0x00000001, 0, 3, 2, ()),
+    "PSE": (0x00000001, 0, 3, 3, ()),
+    "TSC": (0x00000001, 0, 3, 4, ()),
+    "MSR": (0x00000001, 0, 3, 5, ()),
+    "PAE": (0x00000001, 0, 3, 6, ()),
+    "MCE": (0x00000001, 0, 3, 7, ()),
+    "CX8": (0x00000001, 0, 3, 8, ()),
+    "APIC": (0x00000001, 0, 3, 9, ()),
+    "SEP": (0x00000001, 0, 3, 11, ()),
+    "MTRR": (0x00000001, 0, 3, 12, ()),
+    "PGE": (0x00000001, 0, 3, 13, ()),
+    "MCA": (0x00000001, 0, 3, 14, ()),
+    "CMOV": (0x00000001, 0, 3, 15, ()),
+    "PAT": (0x00000001, 0, 3, 16, ()),
+    "PSE36": (0x00000001, 0, 3, 17, ()),
+    "PN": (0x00000001, 0, 3, 18, ("INTEL",)),
+    "CLFLUSH": (0x00000001, 0, 3, 19, ()),
+    "DTS": (0x00000001, 0, 3, 21, ("INTEL",)),
+    "ACPI": (0x00000001, 0, 3, 22, ("INTEL",)),
+    "MMX": (0x00000001, 0, 3, 23, ()),
+    "FXSR": (0x00000001, 0, 3, 24, ()),
+    "SSE": (0x00000001, 0, 3, 25, ()),
+    "SSE2": (0x00000001, 0, 3, 26, ()),
+    "SS": (0x00000001, 0, 3, 27, ("INTEL",)),
+    "TM": (0x00000001, 0, 3, 29, ("INTEL",)),
+    "IA64": (0x00000001, 0, 3, 30, ("INTEL",)),
+    "PBE": (0x00000001, 0, 3, 31, ("INTEL",)),
+    "SGX": (0x00000007, 0, 1, 2, ("INTEL",)),
+    "BMI1": (0x00000007, 0, 1, 3, ()),
+    "HLE": (0x00000007, 0, 1, 4, ("INTEL",)),
+    "AVX2": (0x00000007, 0, 1, 5, ()),
+    "BMI2": (0x00000007, 0, 1, 8, ()),
+    "RTM": (0x00000007, 0, 1, 11, ("INTEL",)),
+    "AVX512F": (0x00000007, 0, 1, 16, ()),
+    "AVX512DQ": (0x00000007, 0, 1, 17, ()),
+    "RDSEED": (0x00000007, 0, 1, 18, ()),
+    "ADX": (0x00000007, 0, 1, 19, ()),
+    "AVX512PF": (0x00000007, 0, 1, 26, ("INTEL",)),
+    "AVX512ER": (0x00000007, 0, 1, 27, ("INTEL",)),
+    "AVX512CD": (0x00000007, 0, 1, 28, ()),
+    "SHA_NI": (0x00000007, 0, 1, 29, ()),
+    "AVX512BW": (0x00000007, 0, 1, 30, ()),
+    "AVX512VL": (0x00000007, 0, 1, 31, ()),
+    "AVX512VBMI": (0x00000007, 0, 2, 1, ()),
+    "AVX512VBMI2": (0x00000007, 0, 2, 6, ()),
+    "AVX512VNNI": (0x00000007, 0, 2, 11, ()),
+    "LAHF_LM": (0x80000001, 0, 2, 0, ()),
+    "CMP_LEGACY": (0x80000001, 0, 2, 1, ("AMD", "HYGON")),
+    "SVM": (0x80000001, 0, 2, 2, ("AMD", "HYGON")),
+    "ABM": (0x80000001, 0, 2, 5, ()),
+    "SSE4A": (0x80000001, 0, 2, 6, ("AMD", "HYGON")),
+    "MISALIGNSSE": (0x80000001, 0, 2, 7, ("AMD", "HYGON")),
+    "3DNOWPREFETCH": (0x80000001, 0, 2, 8, ("AMD", "HYGON")),
+    "OSVW": (0x80000001, 0, 2, 9, ("AMD", "HYGON")),
+    "IBS": (0x80000001, 0, 2, 10, ("AMD", "HYGON")),
+    "XOP": (0x80000001, 0, 2, 11, ("AMD", "HYGON")),
+    "SKINIT": (0x80000001, 0, 2, 12, ("AMD", "HYGON")),
+    "WDT": (0x80000001, 0, 2, 13, ("AMD", "HYGON")),
+    "FMA4": (0x80000001, 0, 2, 16, ("AMD", "HYGON")),
+    "TBM": (0x80000001, 0, 2, 21, ("AMD", "HYGON")),
+    "SYSCALL": (0x80000001, 0, 3, 11, ()),
+    "XD": (0x80000001, 0, 3, 20, ("INTEL",)),
+    "NX": (0x80000001, 0, 3, 20, ("AMD", "HYGON")),
+    "MMXEXT": (0x80000001, 0, 3, 22, ("AMD", "HYGON")),
+    "FXSR_OPT": (0x80000001, 0, 3, 25, ("AMD", "HYGON")),
+    "RDTSCP": (0x80000001, 0, 3, 27, ()),
+    "LM": (0x80000001, 0, 3, 29, ()),
+    "3DNOWEXT": (0x80000001, 0, 3, 30, ("AMD", "HYGON")),
+    "3DNOW": (0x80000001, 0, 3, 31, ("AMD", "HYGON")),
+    "TS": (0x80000007, 0, 3, 0, ("AMD", "HYGON")),
+    "FID": (0x80000007, 0, 3, 1, ("AMD", "HYGON")),
+    "VID": (0x80000007, 0, 3, 2, ("AMD", "HYGON")),
+    "TTP": (0x80000007, 0, 3, 3, ("AMD", "HYGON")),
+    "TM_AMD": (0x80000007, 0, 3, 4, ("AMD", "HYGON")),
+    "STC": (0x80000007, 0, 3, 5, ("AMD", "HYGON")),
+    "100MHZSTEPS": (0x80000007, 0, 3, 6, ("AMD", "HYGON")),
+    "HWPSTATE": (0x80000007, 0, 3, 7, ("AMD", "HYGON")),
+    "CONSTANT_TSC": (0x80000007, 0, 3, 8, ()),
+    "CPB": (0x80000007, 0, 3, 9, ("AMD", "HYGON")),
+    "APERFMPERF": (0x80000007, 0, 3, 10, ("AMD", "HYGON")),
+    "PFI": (0x80000007, 0, 3, 11, ("AMD", "HYGON")),
+    "PA": (0x80000007, 0, 3, 12, ("AMD", "HYGON")),
+}
@@ -2,7 +2,9 @@
 Internal module containing utility functions.
 """
 
-from typing import Optional
+import os
+from functools import cache
+from typing import Callable, NamedTuple, Optional, TypeVar
 from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
     ffi,
     lib,
@@ -29,3 +31,134 @@ def get_enum_options(  # pylint: disable=dangerous-default-value
         for x in enum_options
         if x[len(prefix) :] not in ignore
     }
+
+
+def check_index(index: int, length: int) -> int:
+    """
+    Checks that the given (possibly negative) index is valid for
+    a sequence of the given length, returning the equivalent non-negative index.
+    """
+    if not -length <= index < length:
+        raise IndexError(f"Index {index} out of range for length {length}.")
+    return index % length if length else index
+
+
+_FLAG_TO_BINARY_DIGIT = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def bytes_to_bits(flags: bytes) -> int:
+    """
+    Packs a sequence of 0/1 bytes into an integer,
+    where bit `i` is set if byte `i` is 1.
+    """
+    digits = flags[::-1].translate(_FLAG_TO_BINARY_DIGIT)
+    return int(digits, 2) if digits else 0
+
+
+def flags_to_bits(c_flags) -> int:
+    """
+    Packs an FFI array of 0/1 flags (e.g., :const:`cpu_id_t.flags`)
+    into an integer, where bit `i` is set if flag `i` is set.
+    """
+    return bytes_to_bits(bytes(ffi.buffer(c_flags)))
+
+
+def iter_bits(mask: int):
+    """Yields the indices of the set bits of a non-negative integer, lowest first."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def parse_cpu_list(cpu_list: str) -> list[int]:
+    """
+    Parses a Linux CPU list, e.g., :const:`'0-3,8,10-11'`
+    (the format of :const:`/sys/devices/system/cpu/online`).
+    """
+    cpus = []
+    for part in cpu_list.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def read_sysfs(path: str) -> bytes:
+    """
+    Reads a small file (e.g., of sysfs) without buffering,
+    returning an empty string if it cannot be read.
+    """
+    try:
+        file_descriptor = os.open(path, os.O_RDONLY)
+    except OSError:
+        return b""
+    try:
+        return os.read(file_descriptor, 256)
+    except OSError:
+        return b""
+    finally:
+        os.close(file_descriptor)
+
+
+_T = TypeVar("_T")
+
+
+def run_on_cpu(logical_cpu: int, function: Callable[[], _T]) -> _T:
+    """
+    Runs a function with the calling thread pinned to a logical CPU,
+    restoring its affinity afterwards.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        # pylint: disable-next=import-outside-toplevel, cyclic-import
+        from libcpuid.errors import LibcpuidError
+
+        raise LibcpuidError("Running on a specific CPU is not supported.")
+    previous_affinity = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {logical_cpu})
+    try:
+        return function()
+    finally:
+        os.sched_setaffinity(0, previous_affinity)
+
+
+def check_collection_method(method: str):
+    """Checks that the given raw data collection method is valid."""
+    if method not in ("auto", "affinity", "driver"):
+        raise ValueError(f"Invalid collection method {method!r}.")
+
+
+class RawField(NamedTuple):
+    """Description of a single field of :const:`struct cpu_raw_data_t`."""
+
+    name: str
+    offset: int
+    row_size: int
+    num_rows: int
+
+
+@cache
+def raw_data_layout() -> tuple[RawField, ...]:
+    """
+    Returns the memory layout of :const:`struct cpu_raw_data_t`. Each field
+    is split into rows, which are either register quadruples (x86 leaves)
+    or single registers (ARM).
+    """
+    layout = []
+    for name, field in ffi.typeof("struct cpu_raw_data_t").fields:
+        if field.type.kind == "array":
+            layout.append(
+                RawField(
+                    name, field.offset, ffi.sizeof(field.type.item), field.type.length
+                )
+            )
+        else:
+            layout.append(RawField(name, field.offset, ffi.sizeof(field.type), 1))
+    return tuple(layout)
+
+
+@cache
+def raw_data_fields() -> dict[str, RawField]:
+    """Returns the fields of :const:`struct cpu_raw_data_t` by name."""
+    return {field.name: field for field in raw_data_layout()}
@@ -0,0 +1,242 @@
+"""
+Module deriving tuning parameters (working-set budgets, blocking factors,
+chunk sizes and false-sharing padding) from the cache geometry reported
+by :class:`~libcpuid.info.CPUInfo` and :class:`~libcpuid.info.SystemInfo`.
+
+.. code-block:: python
+
+   from libcpuid.advisor import advise_system
+   from libcpuid.info import SystemInfo
+
+   for purpose, advice in advise_system(SystemInfo.from_all_cpus()).items():
+       print(purpose, advice.tile_edge(element_size=8), advice.false_sharing_padding)
+
+The values are heuristics meant as defaults to be refined by benchmarks:
+one way of each set-associative cache is left for other data (e.g., stack,
+streamed inputs), and a cache is assumed to be shared evenly by the logical
+CPUs using it.
+"""
+
+from math import ceil, isqrt
+from typing import NamedTuple, Optional
+from libcpuid import enums
+from libcpuid.info import CPUInfo, SystemInfo
+
+DATA_CACHES = ("l1_data", "l2", "l3", "l4")
+"""Prefixes of the :class:`CPUInfo` properties of the data (or unified) caches."""
+
+_LAST_LEVEL_CACHES = ("l3", "l4")
+
+
+class CacheBudget(NamedTuple):
+    """Working-set budgets derived from the geometry of a single cache level."""
+
+    cache: str
+    """Prefix of the :class:`CPUInfo` properties of the cache, e.g., :const:`'l2'`."""
+    size: int
+    """Size of one instance of the cache, in bytes."""
+    assoc: Optional[int]
+    line_size: Optional[int]
+    """Cache line size, in bytes."""
+    threads_sharing: int
+    """Number of logical CPUs sharing one instance of the cache."""
+    domain_budget: int
+    """Bytes usable by all the logical CPUs sharing one instance of the cache."""
+    thread_budget: int
+    """Bytes usable by each of the logical CPUs sharing one instance of the cache."""
+
+
+def _num_type_cpus(cpu_info: CPUInfo) -> Optional[int]:
+    """Number of logical CPUs of the given type (hybrid CPUs report several types)."""
+    num_cpus = int.from_bytes(cpu_info.affinity_mask, "big").bit_count()
+    return num_cpus or cpu_info.num_logical_cpus
+
+
+def _threads_sharing(
+    cpu_info: CPUInfo, cache: str, total_instances: Optional[int] = None
+) -> int:
+    """
+    Estimates the number of logical CPUs sharing one instance of a cache.
+    Last-level caches are shared by all CPU types of a hybrid CPU, so they
+    are counted system-wide if the total number of instances is known.
+    Without instance counts, the private caches are assumed to be shared
+    by the SMT threads of a core, and the last-level ones by a whole package.
+    """
+    if cache in _LAST_LEVEL_CACHES:
+        if total_instances and cpu_info.total_logical_cpus:
+            return max(1, ceil(cpu_info.total_logical_cpus / total_instances))
+        instances = getattr(cpu_info, f"{cache}_instances")
+        if instances and cpu_info.total_logical_cpus:
+            return max(1, ceil(cpu_info.total_logical_cpus / instances))
+        return max(1, cpu_info.num_logical_cpus or 1)
+    instances = getattr(cpu_info, f"{cache}_instances")
+    num_cpus = _num_type_cpus(cpu_info)
+    if instances and num_cpus:
+        return max(1, ceil(num_cpus / instances))
+    if cpu_info.num_cores and cpu_info.num_logical_cpus:
+        return max(1, cpu_info.num_logical_cpus // cpu_info.num_cores)
+    return 1
+
+
+def cache_budget(
+    cpu_info: CPUInfo, cache: str, total_instances: Optional[int] = None
+) -> Optional[CacheBudget]:
+    """
+    Returns the budgets of the given cache (one of :const:`DATA_CACHES`),
+    :const:`None` if its size is not determined. `total_instances` is
+    the number of instances in the whole system, if known
+    (e.g., :attr:`SystemInfo.l3_total_instances`).
+    """
+    size_kb = getattr(cpu_info, f"{cache}_cache")
+    if not size_kb:
+        return None
+    size = size_kb * 1024
+    assoc = getattr(cpu_info, f"{cache}_assoc")
+    threads_sharing = _threads_sharing(cpu_info, cache, total_instances)
+    domain_budget = size * (assoc - 1) // assoc if assoc and assoc > 1 else size
+    return CacheBudget(
+        cache,
+        size,
+        assoc,
+        getattr(cpu_info, f"{cache}_cacheline"),
+        threads_sharing,
+        domain_budget,
+        domain_budget // threads_sharing,
+    )
+
+
+def _line_size(caches: dict[str, CacheBudget]) -> int:
+    for budget in caches.values():
+        if budget.line_size:
+            return budget.line_size
+    return 64
+
+
+class TuningAdvice:
+    """Tuning parameters for the logical CPUs of a single CPU type."""
+
+    def __init__(
+        self,
+        cpu_info: CPUInfo,
+        caches: dict[str, CacheBudget],
+        false_sharing_padding: int,
+    ):
+        self._cpu_info = cpu_info
+        self._caches = caches
+        self._false_sharing_padding = false_sharing_padding
+
+    def __repr__(self) -> str:
+        budgets = ", ".join(
+            f"{cache}={budget.thread_budget}" for cache, budget in self._caches.items()
+        )
+        return f"TuningAdvice({self.purpose}, {budgets})"
+
+    @property
+    def cpu_info(self) -> CPUInfo:
+        """The CPU type the advice is for."""
+        return self._cpu_info
+
+    @property
+    def purpose(self) -> Optional[enums.CPUPurpose]:
+        """The purpose of the CPU type."""
+        return self._cpu_info.purpose
+
+    @property
+    def caches(self) -> dict[str, CacheBudget]:
+        """The budgets of the data caches of known size, from the innermost one."""
+        return self._caches
+
+    @property
+    def line_size(self) -> int:
+        """The cache line size of the innermost data cache, in bytes (64 if unknown)."""
+        return _line_size(self._caches)
+
+    @property
+    def false_sharing_padding(self) -> int:
+        """
+        Alignment and padding, in bytes, keeping data written by different
+        threads apart. On x86, it covers two cache lines, as the spatial prefetcher
+        of the L2 cache fetches lines in pairs.
+        """
+        return self._false_sharing_padding
+
+    def thread_budget(self, cache: str) -> Optional[int]:
+        """Bytes usable by each thread in the given cache, :const:`None` if unknown."""
+        budget = self._caches.get(cache)
+        return None if budget is None else budget.thread_budget
+
+    def domain_budget(self, cache: str) -> Optional[int]:
+        """
+        Bytes usable by all the threads sharing one instance of the given cache,
+        :const:`None` if unknown.
+        """
+        budget = self._caches.get(cache)
+        return None if budget is None else budget.domain_budget
+
+    def _budget_for(self, cache: Optional[str]) -> int:
+        if cache is None:
+            cache = next(iter(self._caches), None)
+        budget = self._caches.get(cache)
+        if budget is None:
+            raise ValueError(f"The size of the {cache!r} cache is not known.")
+        return budget.thread_budget
+
+    def chunk_elements(self, element_size: int, cache: Optional[str] = "l2") -> int:
+        """
+        Returns the number of elements of `element_size` bytes of a chunk
+        processed by one thread which fits in its budget of the given cache,
+        rounded down to whole cache lines. Raises :class:`ValueError` if the size
+        of the cache is not known; `cache=None` selects the innermost data cache.
+        """
+        per_line = max(1, self.line_size // element_size)
+        elements = self._budget_for(cache) // element_size
+        return max(per_line, elements // per_line * per_line)
+
+    def tile_edge(
+        self, element_size: int, cache: Optional[str] = "l1_data", operands: int = 3
+    ) -> int:
+        """
+        Returns the edge length (in elements) of square tiles such that
+        `operands` tiles of `element_size`-byte elements (e.g., the blocks of
+        A, B and C in a matrix product) fit in the per-thread budget of
+        the given cache. The edge is rounded down to whole cache lines when
+        possible. Raises :class:`ValueError` if the size of the cache is not known.
+        """
+        per_line = max(1, self.line_size // element_size)
+        edge = isqrt(self._budget_for(cache) // (operands * element_size))
+        if edge >= per_line:
+            edge = edge // per_line * per_line
+        return max(1, edge)
+
+
+def _advise(cpu_info: CPUInfo, system_info: Optional[SystemInfo]) -> TuningAdvice:
+    caches = {}
+    for cache in DATA_CACHES:
+        total_instances = (
+            getattr(system_info, f"{cache}_total_instances") if system_info else None
+        )
+        budget = cache_budget(cpu_info, cache, total_instances)
+        if budget is not None:
+            caches[cache] = budget
+    line_size = _line_size(caches)
+    is_x86 = cpu_info.architecture == enums.CPUArchitecture.X86
+    return TuningAdvice(cpu_info, caches, 2 * line_size if is_x86 else line_size)
+
+
+def advise(cpu_info: CPUInfo) -> TuningAdvice:
+    """Returns the tuning advice for a single CPU type."""
+    return _advise(cpu_info, None)
+
+
+def advise_system(
+    system_info: SystemInfo,
+) -> dict[Optional[enums.CPUPurpose], TuningAdvice]:
+    """
+    Returns the tuning advice for each CPU type of a system, by purpose
+    (e.g., performance and efficiency cores of hybrid CPUs). System-wide
+    instance counts refine the sharing of the last-level caches.
+    """
+    advice = {}
+    for cpu_info in system_info:
+        advice.setdefault(cpu_info.purpose, _advise(cpu_info, system_info))
+    return advice
@@ -0,0 +1,311 @@
+"""
+Module providing a persistent on-disk cache of the raw CPU data
+and the identification results of the current machine.
+
+The identity of the CPUs can only change with a reboot, a change of the set
+of online CPUs or a microcode update, so the cache is keyed by the kernel
+boot ID, the online CPU list and the microcode revision (see :func:`cache_key`).
+The cache file holds the C structures verbatim and is memory-mapped when
+loaded, so loading does not copy the data. A stale file is replaced atomically,
+so readers never see a partially written file and instances loaded from
+the old file stay valid.
+
+As the cache file controls the identification, it is only trusted if it and
+its directory belong to the effective user and are not accessible to other
+users (e.g., if another user created the directory in the temporary directory
+first), otherwise nothing is cached.
+"""
+
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+from typing import Callable, NamedTuple, Optional
+import libcpuid
+from libcpuid.info import TOTAL_INSTANCES_FIELDS, SystemInfo
+from libcpuid.raw import CPURawDataArray
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    ffi,
+)
+
+CACHE_DIR_ENV = "LIBCPUID_CACHE_DIR"
+"""Name of the environment variable overriding :func:`default_directory`."""
+
+_MAGIC = b"LIBCPUID-CACHE\x00\x01"
+_ALIGNMENT = 64
+
+
+class CacheEntry(NamedTuple):
+    """Raw data and identification results loaded from or stored into the cache."""
+
+    raw_data_array: CPURawDataArray
+    system_info: SystemInfo
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="ascii") as text_file:
+            return text_file.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _microcode_revision(procfs_root: str, sysfs_root: str) -> str:
+    revision = _read_text(
+        os.path.join(sysfs_root, "devices/system/cpu/cpu0/microcode/version")
+    )
+    if revision is not None:
+        return revision
+    try:
+        with open(os.path.join(procfs_root, "cpuinfo"), encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("microcode"):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return ""
+
+
+def cache_key(procfs_root: str = "/proc", sysfs_root: str = "/sys") -> Optional[dict]:
+    """
+    Returns the key identifying the current boot, the online CPUs and
+    the microcode revision, or :const:`None` if the boot ID is not available
+    (e.g., outside of Linux), in which case nothing is cached.
+    """
+    boot_id = _read_text(os.path.join(procfs_root, "sys/kernel/random/boot_id"))
+    if not boot_id:
+        return None
+    return {
+        "boot_id": boot_id,
+        "online_cpus": _read_text(
+            os.path.join(sysfs_root, "devices/system/cpu/online")
+        ),
+        "microcode": _microcode_revision(procfs_root, sysfs_root),
+    }
+
+
+def default_directory() -> str:
+    """
+    Returns the directory of the cache file. It is the value of the
+    :const:`LIBCPUID_CACHE_DIR` environment variable if set, otherwise
+    :const:`/run/libcpuid` for root, ``$XDG_RUNTIME_DIR/libcpuid``
+    for other users, or a per-user directory in the temporary directory.
+    """
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    if os.geteuid() == 0:
+        return "/run/libcpuid"
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "libcpuid")
+    return os.path.join(tempfile.gettempdir(), f"libcpuid-{os.geteuid()}")
+
+
+def _is_private(status: os.stat_result, is_type: Callable[[int], bool]) -> bool:
+    """
+    Whether a file has the given type, belongs to the effective user
+    and is not accessible to the group and the other users.
+    """
+    return (
+        is_type(status.st_mode)
+        and status.st_uid == os.geteuid()
+        and not status.st_mode & 0o077
+    )
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _parse_header(mapping) -> tuple[dict, int]:
+    """Returns the header of a cache file and the offset of the raw data."""
+    if mapping[: len(_MAGIC)] != _MAGIC:
+        raise ValueError("not a cache file")
+    offset = len(_MAGIC) + 8
+    (header_size,) = struct.unpack("<Q", mapping[len(_MAGIC) : offset])
+    header = json.loads(mapping[offset : offset + header_size])
+    return header, _align(offset + header_size)
+
+
+class IdentificationCache:
+    """
+    On-disk cache of a :class:`CPURawDataArray` and the :class:`SystemInfo`
+    identified from it. The cache is best-effort: failures to read or write
+    the cache file are not reported, the data is collected again instead.
+    The same applies when the directory or the cache file is not private
+    to the effective user.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        filename: str = "identification.cache",
+        procfs_root: str = "/proc",
+        sysfs_root: str = "/sys",
+    ):
+        self._directory = default_directory() if directory is None else directory
+        self._path = os.path.join(self._directory, filename)
+        self._procfs_root = procfs_root
+        self._sysfs_root = sysfs_root
+
+    @property
+    def path(self) -> str:
+        """The path of the cache file."""
+        return self._path
+
+    def key(self) -> Optional[dict]:
+        """Returns the current :func:`cache_key`."""
+        return cache_key(self._procfs_root, self._sysfs_root)
+
+    def _has_private_directory(self, create: bool = False) -> bool:
+        """
+        Whether the directory of the cache file is a real directory private
+        to the effective user (see :func:`_is_private`), creating it if asked.
+        """
+        try:
+            if create:
+                os.makedirs(self._directory, mode=0o700, exist_ok=True)
+            status = os.lstat(self._directory)
+        except OSError:
+            return False
+        return _is_private(status, stat.S_ISDIR)
+
+    def _header(self, key: dict, raw_data_array, system_info) -> dict:
+        c_system_id = system_info.c_system_id
+        header = {
+            "key": key,
+            "version": libcpuid.version(),
+            "raw_size": ffi.sizeof("struct cpu_raw_data_t"),
+            "cpu_id_size": ffi.sizeof("struct cpu_id_t"),
+            "num_raw": len(raw_data_array),
+            "with_affinity": bool(raw_data_array.c_cpu_raw_data_array.with_affinity),
+            "num_cpu_types": len(system_info),
+        }
+        for name in TOTAL_INSTANCES_FIELDS:
+            header[name] = getattr(c_system_id, name)
+        return header
+
+    def _is_current(self, header: dict, key: dict) -> bool:
+        return (
+            header.get("key") == key
+            and header.get("version") == libcpuid.version()
+            and header.get("raw_size") == ffi.sizeof("struct cpu_raw_data_t")
+            and header.get("cpu_id_size") == ffi.sizeof("struct cpu_id_t")
+        )
+
+    def load(self) -> Optional[CacheEntry]:
+        """
+        Loads the cached data if the cache file exists and is current,
+        otherwise returns :const:`None`. The returned instances are views
+        into the memory-mapped file and must not be modified.
+        """
+        key = self.key()
+        if key is None or not self._has_private_directory():
+            return None
+        try:
+            with open(self._path, "rb") as cache_file:
+                if not _is_private(os.fstat(cache_file.fileno()), stat.S_ISREG):
+                    return None
+                mapping = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            header, raw_offset = _parse_header(mapping)
+            cpu_types_offset = raw_offset + header["num_raw"] * header["raw_size"]
+            cpu_types_size = header["num_cpu_types"] * header["cpu_id_size"]
+            if (
+                not self._is_current(header, key)
+                or len(mapping) != cpu_types_offset + cpu_types_size
+            ):
+                raise ValueError("stale cache file")
+        except (ValueError, KeyError, TypeError):
+            mapping.close()
+            return None
+        view = memoryview(mapping)
+        c_raw = ffi.from_buffer(
+            "struct cpu_raw_data_t[]", view[raw_offset:cpu_types_offset]
+        )
+        c_cpu_types = ffi.from_buffer("struct cpu_id_t[]", view[cpu_types_offset:])
+        c_cpu_raw_data_array = ffi.new("struct cpu_raw_data_array_t *")
+        c_cpu_raw_data_array.with_affinity = header["with_affinity"]
+        c_cpu_raw_data_array.num_raw = header["num_raw"]
+        c_cpu_raw_data_array.raw = c_raw
+        c_system_id = ffi.new("struct system_id_t *")
+        c_system_id.num_cpu_types = header["num_cpu_types"]
+        c_system_id.cpu_types = c_cpu_types
+        for name in TOTAL_INSTANCES_FIELDS:
+            setattr(c_system_id, name, header[name])
+        raw_data_array = CPURawDataArray(
+            c_cpu_raw_data_array, owner=c_raw, is_local=True
+        )
+        return CacheEntry(
+            raw_data_array,
+            SystemInfo.from_c(
+                c_system_id,
+                owner=c_cpu_types,
+                raw_data=raw_data_array[0] if len(raw_data_array) else None,
+            ),
+        )
+
+    def store(self, raw_data_array: CPURawDataArray, system_info: SystemInfo) -> bool:
+        """
+        Atomically replaces the cache file with the given data,
+        returning whether the file was written.
+        """
+        key = self.key()
+        if key is None:
+            return False
+        header = json.dumps(self._header(key, raw_data_array, system_info)).encode()
+        prefix = _MAGIC + struct.pack("<Q", len(header)) + header
+        c_cpu_raw_data_array = raw_data_array.c_cpu_raw_data_array
+        if not self._has_private_directory(create=True):
+            return False
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self._directory, prefix=".identification."
+            )
+        except OSError:
+            return False
+        try:
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                cache_file.write(prefix)
+                cache_file.write(bytes(_align(len(prefix)) - len(prefix)))
+                cache_file.write(
+                    ffi.buffer(
+                        c_cpu_raw_data_array.raw,
+                        len(raw_data_array) * ffi.sizeof("struct cpu_raw_data_t"),
+                    )
+                )
+                cache_file.write(
+                    ffi.buffer(
+                        system_info.c_system_id.cpu_types,
+                        len(system_info) * ffi.sizeof("struct cpu_id_t"),
+                    )
+                )
+            os.replace(temporary_path, self._path)
+        except OSError:
+            os.unlink(temporary_path)
+            return False
+        return True
+
+    def invalidate(self):
+        """Removes the cache file if it exists."""
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    def get(self) -> CacheEntry:
+        """
+        Returns the cached data if it is current, otherwise collects and
+        identifies the raw data of all CPUs and stores it into the cache.
+        """
+        entry = self.load()
+        if entry is None:
+            raw_data_array = CPURawDataArray.from_all_cpus()
+            entry = CacheEntry(
+                raw_data_array, SystemInfo.from_raw_array(raw_data_array)
+            )
+            self.store(*entry)
+        return entry
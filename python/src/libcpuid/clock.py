@@ -2,8 +2,17 @@
 Module for CPU clock/frequency calculation.
 """
 
+import glob
+import math
+import os
+import re
+import statistics
+import time
+from array import array
 from enum import Enum, auto
+from typing import Callable, Iterable, NamedTuple, Optional
 from libcpuid.errors import LibcpuidError
+from libcpuid._utils import parse_cpu_list, read_sysfs, run_on_cpu
 from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
     lib,
     ffi,
@@ -121,3 +130,454 @@ def frequency() -> int:
     if result < 0:
         raise LibcpuidError("Could not get clock frequency.")
     return result
+
+
+def _read_os_after(millis: int) -> int:
+    time.sleep(millis / 1000)
+    return lib.cpu_clock_by_os()
+
+
+ADAPTIVE_METHODS: dict[str, Callable[[int], int]] = {
+    "tsc": lambda millis: lib.cpu_clock_measure(millis, 0),
+    "ic": lambda millis: lib.cpu_clock_by_ic(millis, 1),
+    "os": _read_os_after,
+}
+"""
+Single measurements usable by :func:`frequency_adaptive`, by name: a busy-wait
+interval timed with the TSC (:func:`frequency_measure`), an instruction counting
+run (:func:`frequency_by_ic`) and a reading of the OS (:func:`frequency_by_os`)
+at the end of the interval. Each takes the length of the interval
+in milliseconds and returns MHz.
+"""
+
+# Frequencies are integer MHz, so no estimate is more precise than that.
+_RESOLUTION_ERROR = 0.5
+
+# The OS readings are snapshots of the current frequency rather than
+# measurements over the interval, so reading more of them does not make
+# the estimate more precise: their error is their spread across the window,
+# and at least half of the 100 MHz steps most cpufreq drivers switch between.
+_READING_METHODS = frozenset({"os"})
+_OS_RESOLUTION_ERROR = 50.0
+
+
+class FrequencyEstimate(NamedTuple):
+    """A clock frequency estimated from several measurements."""
+
+    frequency: float
+    """The estimated frequency in MHz."""
+    low: float
+    """The lower bound of the confidence interval, in MHz."""
+    high: float
+    """The upper bound of the confidence interval, in MHz."""
+    std_error: float
+    """The standard error of the estimate, in MHz."""
+    confidence: float
+    """The confidence level of the interval, e.g., :const:`0.95`."""
+    samples: int
+    """The number of measurements."""
+    elapsed: float
+    """The time spent measuring, in seconds."""
+    converged: bool
+    """Whether the target relative error was reached before the time limit."""
+    method: str
+    """The name of the method, or the names of the combined methods joined by '+'."""
+
+    @property
+    def relative_error(self) -> float:
+        """The half-width of the confidence interval relative to the estimate."""
+        return (self.high - self.low) / 2 / self.frequency
+
+
+def _t_quantile(probability: float, degrees_of_freedom: int) -> float:
+    """
+    Quantile of the Student's t-distribution, using the Cornish-Fisher expansion
+    around the normal quantile (within 0.1% from 3 degrees of freedom,
+    which :func:`frequency_adaptive` always has).
+    """
+    z = statistics.NormalDist().inv_cdf(probability)
+    v = degrees_of_freedom
+    return (
+        z
+        + (z**3 + z) / (4 * v)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * v**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * v**3)
+        + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z)
+        / (92160 * v**4)
+    )
+
+
+def frequency_adaptive(  # pylint: disable=too-many-arguments
+    method: str = "tsc",
+    *,
+    interval: int = 10,
+    target_error: float = 0.001,
+    max_time: float = 1.0,
+    confidence: float = 0.95,
+    min_samples: int = 4,
+) -> FrequencyEstimate:
+    """
+    Measures the CPU clock frequency in short intervals of `interval`
+    milliseconds with one of the :data:`ADAPTIVE_METHODS`, until the
+    `confidence` interval of the mean is within `target_error` of it
+    (relatively) or `max_time` seconds have passed. At least `min_samples`
+    (and at least 4) measurements are made.
+
+    The readings of the OS (method :const:`'os'`) are not averaged: the
+    error of the estimate is their standard deviation, at least the
+    resolution of cpufreq, and they stop after `min_samples` readings.
+    """
+    if method not in ADAPTIVE_METHODS:
+        raise ValueError(f"Invalid frequency measurement method {method!r}.")
+    measure = ADAPTIVE_METHODS[method]
+    min_samples = max(4, min_samples)
+    samples: list[int] = []
+    start = time.monotonic()
+    while True:
+        result = measure(interval)
+        if result <= 0:
+            raise LibcpuidError(f"Could not measure clock frequency ({method}).")
+        samples.append(result)
+        elapsed = time.monotonic() - start
+        if len(samples) < min_samples:
+            continue
+        mean = statistics.fmean(samples)
+        if method in _READING_METHODS:
+            std_error = max(statistics.stdev(samples), _OS_RESOLUTION_ERROR)
+        else:
+            std_error = max(
+                statistics.stdev(samples) / math.sqrt(len(samples)), _RESOLUTION_ERROR
+            )
+        half_width = _t_quantile((1 + confidence) / 2, len(samples) - 1) * std_error
+        converged = half_width <= target_error * mean
+        if converged or elapsed >= max_time or method in _READING_METHODS:
+            return FrequencyEstimate(
+                mean,
+                mean - half_width,
+                mean + half_width,
+                std_error,
+                confidence,
+                len(samples),
+                elapsed,
+                converged,
+                method,
+            )
+
+
+def combine_estimates(estimates: Iterable[FrequencyEstimate]) -> FrequencyEstimate:
+    """
+    Combines estimates of the same clock (e.g., made with different methods)
+    into their inverse-variance weighted mean. If the estimates disagree more
+    than their errors allow (a reduced chi-squared above 1), the standard error
+    is scaled up accordingly, so that the interval covers the disagreement.
+    The weight of the readings of the OS is capped to the lowest weight
+    of the measurements, so that they never dominate them.
+    """
+    estimates = list(estimates)
+    if not estimates:
+        raise ValueError("No estimates to combine.")
+    weights = [1 / estimate.std_error**2 for estimate in estimates]
+    measured = [
+        weight
+        for weight, estimate in zip(weights, estimates)
+        if estimate.method not in _READING_METHODS
+    ]
+    if measured:
+        cap = min(measured)
+        weights = [
+            min(weight, cap) if e.method in _READING_METHODS else weight
+            for weight, e in zip(weights, estimates)
+        ]
+    total_weight = sum(weights)
+    mean = (
+        sum(weight * e.frequency for weight, e in zip(weights, estimates))
+        / total_weight
+    )
+    std_error = math.sqrt(1 / total_weight)
+    if len(estimates) > 1:
+        chi_squared = sum(
+            weight * (e.frequency - mean) ** 2 for weight, e in zip(weights, estimates)
+        )
+        std_error *= math.sqrt(max(1.0, chi_squared / (len(estimates) - 1)))
+    confidence = min(estimate.confidence for estimate in estimates)
+    half_width = statistics.NormalDist().inv_cdf((1 + confidence) / 2) * std_error
+    return FrequencyEstimate(
+        mean,
+        mean - half_width,
+        mean + half_width,
+        std_error,
+        confidence,
+        sum(estimate.samples for estimate in estimates),
+        sum(estimate.elapsed for estimate in estimates),
+        all(estimate.converged for estimate in estimates),
+        "+".join(estimate.method for estimate in estimates),
+    )
+
+
+def frequency_combined(
+    methods: Iterable[str] = ("tsc", "os", "ic"), **kwargs
+) -> FrequencyEstimate:
+    """
+    Measures the CPU clock frequency with each of the given
+    :data:`ADAPTIVE_METHODS` (see :func:`frequency_adaptive`, which receives
+    the keyword arguments) and combines the results (see :func:`combine_estimates`).
+    Methods which are not available are skipped, unless all of them are.
+    """
+    estimates = []
+    for method in methods:
+        try:
+            estimates.append(frequency_adaptive(method, **kwargs))
+        except LibcpuidError:
+            continue
+    if not estimates:
+        raise LibcpuidError("Could not measure clock frequency.")
+    return combine_estimates(estimates)
+
+
+CALIBRATION_METHODS = {
+    "frequency": frequency,
+    "frequency_measure": frequency_measure,
+    "frequency_by_os": frequency_by_os,
+    "frequency_by_ic": frequency_by_ic,
+    "frequency_by_tsc": frequency_by_tsc,
+}
+"""Functions of this module usable as calibration methods, by name."""
+
+_POLICY_FILES = (
+    "scaling_driver",
+    "scaling_governor",
+    "scaling_min_freq",
+    "scaling_max_freq",
+)
+
+
+class Calibration(NamedTuple):
+    """A cached clock frequency measurement."""
+
+    frequency: int
+    """The measured frequency in MHz."""
+    method: str
+    """The name of the calibration method, a key of :data:`CALIBRATION_METHODS`."""
+    logical_cpu: Optional[int]
+    """The logical CPU the measurement ran on, :const:`None` if not pinned."""
+    timestamp: float
+    """The :func:`time.monotonic` time of the measurement."""
+
+    @property
+    def age(self) -> float:
+        """The number of seconds since the measurement."""
+        return time.monotonic() - self.timestamp
+
+    def cycles_to_seconds(self, cycles: int) -> float:
+        """Converts a number of clock cycles to seconds using the measured frequency."""
+        return cycles / (self.frequency * 1_000_000)
+
+
+class CalibrationCache:
+    """
+    Cache of clock frequency measurements per method and logical CPU.
+    A cached value is measured again when it is older than `ttl` seconds,
+    or when the set of online CPUs or the cpufreq policy (driver, governor
+    or frequency limits) of the measured CPUs changes. The policy files are
+    checked at most once per `check_interval` seconds, so that cached values
+    are returned immediately in between.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        check_interval: float = 1.0,
+        sysfs_root: str = "/sys",
+    ):
+        self._ttl = ttl
+        self._check_interval = check_interval
+        self._cpu_root = os.path.join(sysfs_root, "devices/system/cpu")
+        self._entries: dict[tuple, tuple[Calibration, bytes, float]] = {}
+
+    def _fingerprint(self, logical_cpu: Optional[int]) -> bytes:
+        if logical_cpu is None:
+            policies = sorted(
+                glob.glob(os.path.join(self._cpu_root, "cpufreq/policy*"))
+            )
+        else:
+            policies = [os.path.join(self._cpu_root, f"cpu{logical_cpu}/cpufreq")]
+        parts = [read_sysfs(os.path.join(self._cpu_root, "online"))]
+        for policy in policies:
+            parts += [read_sysfs(os.path.join(policy, name)) for name in _POLICY_FILES]
+        return b"\0".join(parts)
+
+    def get(
+        self, method: str = "frequency", logical_cpu: Optional[int] = None, **kwargs
+    ) -> Calibration:
+        """
+        Returns the cached measurement of the given method (see
+        :data:`CALIBRATION_METHODS`), measuring it first if there is no valid one.
+        If `logical_cpu` is given, the measurement runs pinned to that CPU.
+        Additional keyword arguments are passed to the method.
+        """
+        key = (method, logical_cpu, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            calibration, fingerprint, checked = entry
+            if now - calibration.timestamp <= self._ttl:
+                if now - checked <= self._check_interval:
+                    return calibration
+                if self._fingerprint(logical_cpu) == fingerprint:
+                    self._entries[key] = (calibration, fingerprint, now)
+                    return calibration
+        function = CALIBRATION_METHODS[method]
+        fingerprint = self._fingerprint(logical_cpu)
+        if logical_cpu is None:
+            result = function(**kwargs)
+        else:
+            result = run_on_cpu(logical_cpu, lambda: function(**kwargs))
+        calibration = Calibration(result, method, logical_cpu, time.monotonic())
+        self._entries[key] = (calibration, fingerprint, calibration.timestamp)
+        return calibration
+
+    def invalidate(self):
+        """Drops all cached measurements."""
+        self._entries.clear()
+
+
+_DEFAULT_CACHE = CalibrationCache()
+
+
+def calibrated(
+    method: str = "frequency", logical_cpu: Optional[int] = None, **kwargs
+) -> Calibration:
+    """
+    Returns a cached measurement using a module-wide :class:`CalibrationCache`
+    with the default settings (see :meth:`CalibrationCache.get`).
+    """
+    return _DEFAULT_CACHE.get(method, logical_cpu, **kwargs)
+
+
+class OSFrequencies(NamedTuple):
+    """
+    Frequencies of all online CPUs in MHz as reported by the OS (cpufreq).
+    Items of the arrays correspond to each other, -1 means unavailable.
+    """
+
+    cpus: array
+    """Logical CPU numbers."""
+    current: array
+    """Current frequencies."""
+    minimum: array
+    """Minimum frequencies allowed by the cpufreq policy."""
+    maximum: array
+    """Maximum frequencies allowed by the cpufreq policy."""
+
+
+_FREQUENCY_FILES = (
+    ("scaling_cur_freq", "cpuinfo_cur_freq"),
+    ("scaling_min_freq",),
+    ("scaling_max_freq",),
+)
+
+
+def _open_first(directory: str, names: tuple[str, ...]) -> int:
+    for name in names:
+        try:
+            return os.open(os.path.join(directory, name), os.O_RDONLY)
+        except OSError:
+            pass
+    return -1
+
+
+def _pread_int(file_descriptor: int) -> int:
+    try:
+        return int(os.pread(file_descriptor, 32, 0))
+    except (OSError, ValueError):
+        return -1
+
+
+class OSFrequencyReader:
+    """
+    Reader of the cpufreq frequencies of all online CPUs, keeping the sysfs
+    files open between calls to :meth:`read` and reading them with `pread`.
+    The files are reopened when the set of online CPUs changes.
+    """
+
+    def __init__(self, sysfs_root: str = "/sys"):
+        self._cpu_root = os.path.join(sysfs_root, "devices/system/cpu")
+        self._online_fd = _open_first(self._cpu_root, ("online",))
+        self._online = None
+        self._cpus = array("i")
+        self._file_descriptors: list[tuple[int, int, int]] = []
+
+    def _online_cpus(self) -> bytes:
+        if self._online_fd < 0:
+            return " ".join(
+                sorted(
+                    name
+                    for name in os.listdir(self._cpu_root)
+                    if re.fullmatch(r"cpu[0-9]+", name)
+                )
+            ).encode()
+        try:
+            return os.pread(self._online_fd, 4096, 0)
+        except OSError:
+            return b""
+
+    def _reopen(self, online: bytes):
+        self._close_cpus()
+        if self._online_fd < 0:
+            cpus = sorted(int(name[3:]) for name in online.decode().split())
+        else:
+            cpus = parse_cpu_list(online.decode())
+        self._cpus = array("i", cpus)
+        for cpu in cpus:
+            directory = os.path.join(self._cpu_root, f"cpu{cpu}/cpufreq")
+            self._file_descriptors.append(
+                tuple(_open_first(directory, names) for names in _FREQUENCY_FILES)
+            )
+        self._online = online
+
+    def read(self) -> OSFrequencies:
+        """Reads the current, minimum and maximum frequencies of all online CPUs."""
+        online = self._online_cpus()
+        if online != self._online:
+            self._reopen(online)
+        columns = (array("i"), array("i"), array("i"))
+        for file_descriptors in self._file_descriptors:
+            for column, file_descriptor in zip(columns, file_descriptors):
+                value = _pread_int(file_descriptor) if file_descriptor >= 0 else -1
+                column.append(value // 1000 if value > 0 else -1)
+        return OSFrequencies(array("i", self._cpus), *columns)
+
+    def _close_cpus(self):
+        for file_descriptors in self._file_descriptors:
+            for file_descriptor in file_descriptors:
+                if file_descriptor >= 0:
+                    os.close(file_descriptor)
+        self._file_descriptors = []
+
+    def close(self):
+        """Closes all open files."""
+        self._close_cpus()
+        if self._online_fd >= 0:
+            os.close(self._online_fd)
+            self._online_fd = -1
+        self._online = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_OS_FREQUENCY_READERS: dict[str, OSFrequencyReader] = {}
+
+
+def frequency_by_os_all(sysfs_root: str = "/sys") -> OSFrequencies:
+    """
+    Returns the current, minimum and maximum frequencies of all online CPUs
+    as reported by the OS (cpufreq). The sysfs files stay open between calls
+    (see :class:`OSFrequencyReader`), so repeated calls are cheap.
+    """
+    if sysfs_root not in _OS_FREQUENCY_READERS:
+        _OS_FREQUENCY_READERS[sysfs_root] = OSFrequencyReader(sysfs_root)
+    return _OS_FREQUENCY_READERS[sysfs_root].read()
@@ -0,0 +1,290 @@
+"""
+Module providing the codename recognition tables of the libcpuid C library
+as an indexed database, so that CPU models can be resolved offline (e.g., from
+an inventory of family and model numbers) without collecting raw data.
+
+x86 CPUs are matched by family, model and stepping, and by the number of cores,
+the cache sizes and the codes decoded from the brand string. :func:`lookup`
+scores the entries of a vendor like the C library does when it identifies
+a CPU, skipping the entries of other models and the values which are not known.
+ARM CPUs are identified by their part number instead (see :func:`arm_part`).
+
+.. code-block:: python
+
+   from libcpuid import codenames
+   from libcpuid.enums import CPUVendor
+
+   print(codenames.lookup(CPUVendor.INTEL, family=6, model=183).codename)
+   print(codenames.codenames(CPUVendor.AMD))
+   for entry in codenames.entries_for("Sapphire Rapids-SP (Xeon Gold)"):
+       print(entry.ext_model, entry.model_bits, entry.technology)
+
+The tables are built once per process, on first use.
+"""
+
+from functools import cache
+from typing import Iterable, NamedTuple, Optional
+from libcpuid import enums
+from libcpuid._codename_table import ARM_PARTS, FIXED_CODENAMES, X86_ENTRIES
+
+
+class CodenameEntry(NamedTuple):
+    """
+    An entry of the recognition tables. For x86 CPUs, :const:`None` numbers
+    match any value. Fields which do not apply to the architecture
+    of the entry are :const:`None`.
+    """
+
+    vendors: tuple[enums.CPUVendor, ...]
+    """The vendors the entry applies to."""
+    codename: str
+    """
+    The codename, as reported by
+    :attr:`CPUInfo.cpu_codename <libcpuid.info.CPUInfo.cpu_codename>`.
+    """
+    family: Optional[int] = None
+    """The x86 family (without the extended family)."""
+    model: Optional[int] = None
+    """The x86 model (without the extended model)."""
+    stepping: Optional[int] = None
+    ext_family: Optional[int] = None
+    """The x86 display family."""
+    ext_model: Optional[int] = None
+    """The x86 display model."""
+    num_cores: Optional[int] = None
+    l2_cache: Optional[int] = None
+    """The L2 cache size, in KB."""
+    l3_cache: Optional[int] = None
+    """The L3 cache size, in KB."""
+    brand_code: Optional[str] = None
+    """The code decoded from the brand string (e.g., :const:`'WOLFDALE'`), if any."""
+    model_bits: tuple[str, ...] = ()
+    """The flags decoded from the brand string (e.g., :const:`'XEON_'`)."""
+    model_code: Optional[str] = None
+    """
+    The range of model numbers decoded from the brand string
+    (e.g., :const:`'_13xxx'`), if any.
+    """
+    technology: Optional[str] = None
+    """The technology node (e.g., :const:`'14nm'`), when the tables record it."""
+    implementer: Optional[int] = None
+    """The ARM implementer code."""
+    part_num: Optional[int] = None
+    """The ARM part number."""
+    part_name: Optional[str] = None
+    """The ARM part name (e.g., :const:`'Cortex-A53'`)."""
+
+    @property
+    def generic(self) -> bool:
+        """Whether the entry is a fallback for unknown CPUs (e.g., "Unknown P6")."""
+        return "Unknown" in self.codename
+
+
+class _Database(NamedTuple):
+    entries: tuple[CodenameEntry, ...]
+    by_vendor: dict[enums.CPUVendor, tuple[CodenameEntry, ...]]
+    x86_by_vendor: dict[enums.CPUVendor, tuple[CodenameEntry, ...]]
+    by_codename: dict[str, tuple[CodenameEntry, ...]]
+    by_part: dict[tuple[enums.CPUVendor, int], CodenameEntry]
+
+
+def _wildcard(value: int) -> Optional[int]:
+    return None if value == -1 else value
+
+
+def _x86_entry(row: tuple) -> CodenameEntry:
+    vendors, *numbers, brand_code, model_bits, model_code, technology, codename = row
+    return CodenameEntry(
+        tuple(enums.CPUVendor[vendor] for vendor in vendors),
+        codename,
+        *(_wildcard(number) for number in numbers),
+        brand_code,
+        model_bits,
+        model_code,
+        technology,
+    )
+
+
+def _arm_entry(row: tuple) -> CodenameEntry:
+    vendor, implementer, part_num, part_name, codename = row
+    return CodenameEntry(
+        (enums.CPUVendor[vendor],),
+        codename,
+        implementer=implementer,
+        part_num=part_num,
+        part_name=part_name,
+    )
+
+
+def _group(pairs: Iterable[tuple]) -> dict:
+    groups: dict = {}
+    for key, entry in pairs:
+        groups.setdefault(key, []).append(entry)
+    return {key: tuple(group) for key, group in groups.items()}
+
+
+@cache
+def _database() -> _Database:
+    x86_entries = [_x86_entry(row) for row in X86_ENTRIES]
+    arm_entries = [_arm_entry(row) for row in ARM_PARTS]
+    fixed_entries = [
+        CodenameEntry((enums.CPUVendor[vendor],), codename)
+        for vendor, names in FIXED_CODENAMES.items()
+        for codename in names
+    ]
+    all_entries = tuple(x86_entries + arm_entries + fixed_entries)
+    return _Database(
+        all_entries,
+        _group((vendor, entry) for entry in all_entries for vendor in entry.vendors),
+        _group((vendor, entry) for entry in x86_entries for vendor in entry.vendors),
+        _group((entry.codename, entry) for entry in all_entries if entry.codename),
+        {(entry.vendors[0], entry.part_num): entry for entry in reversed(arm_entries)},
+    )
+
+
+def entries(vendor: Optional[enums.CPUVendor] = None) -> tuple[CodenameEntry, ...]:
+    """Returns all the entries of the tables, or the ones of a single vendor."""
+    database = _database()
+    if vendor is None:
+        return database.entries
+    return database.by_vendor.get(vendor, ())
+
+
+def entries_for(codename: str) -> tuple[CodenameEntry, ...]:
+    """Returns all the entries reporting the given codename."""
+    return _database().by_codename.get(codename, ())
+
+
+def codenames(vendor: enums.CPUVendor) -> list[str]:
+    """
+    Returns the codenames known for a vendor, without duplicates and
+    fallbacks for unknown CPUs, in the order of the tables.
+    Unlike :func:`libcpuid.get_cpu_list`, which lists the part names
+    of ARM CPUs, this lists their codenames.
+    """
+    return list(
+        dict.fromkeys(
+            entry.codename
+            for entry in entries(vendor)
+            if entry.codename and not entry.generic
+        )
+    )
+
+
+def arm_part(vendor: enums.CPUVendor, part_num: int) -> Optional[CodenameEntry]:
+    """Returns the entry of an ARM part, :const:`None` if it is not known."""
+    return _database().by_part.get((vendor, part_num))
+
+
+def _contradicts(entry: CodenameEntry, cpu: tuple) -> bool:
+    """Whether the family, model or stepping of an entry differ from the known ones."""
+    identity = (entry.family, entry.model, entry.stepping)
+    identity += (entry.ext_family, entry.ext_model)
+    return any(
+        value is not None and known is not None and value != known
+        for value, known in zip(identity, cpu)
+    )
+
+
+def _score(
+    entry: CodenameEntry,
+    cpu: tuple,
+    *,
+    brand_code: Optional[str],
+    model_bits: frozenset[str],
+    model_code: Optional[str],
+) -> int:
+    """Scores an entry like score() in libcpuid_util.c."""
+    fields = (
+        (entry.family, 2),
+        (entry.model, 2),
+        (entry.stepping, 2),
+        (entry.ext_family, 2),
+        (entry.ext_model, 2),
+        (entry.num_cores, 2),
+        (entry.l2_cache, 1),
+        (entry.l3_cache, 1),
+    )
+    score = sum(
+        weight
+        for (value, weight), known in zip(fields, cpu)
+        if value is not None and value == known
+    )
+    if brand_code is not None and entry.brand_code == brand_code:
+        score += 2
+    if model_code is not None and entry.model_code == model_code:
+        score += 2
+    return score + 2 * len(model_bits.intersection(entry.model_bits))
+
+
+@cache
+def _lookup(
+    vendor: enums.CPUVendor,
+    cpu: tuple,
+    *,
+    brand_code: Optional[str],
+    model_bits: frozenset[str],
+    model_code: Optional[str],
+) -> Optional[CodenameEntry]:
+    best, best_score = None, -1
+    for entry in _database().x86_by_vendor.get(vendor, ()):
+        if _contradicts(entry, cpu):
+            continue
+        score = _score(
+            entry,
+            cpu,
+            brand_code=brand_code,
+            model_bits=model_bits,
+            model_code=model_code,
+        )
+        if score > best_score:
+            best, best_score = entry, score
+    return best
+
+
+def lookup(  # pylint: disable=too-many-arguments
+    vendor: enums.CPUVendor,
+    family: int,
+    model: int,
+    stepping: Optional[int] = None,
+    *,
+    num_cores: Optional[int] = None,
+    l2_cache: Optional[int] = None,
+    l3_cache: Optional[int] = None,
+    brand_code: Optional[str] = None,
+    model_bits: Iterable[str] = (),
+    model_code: Optional[str] = None,
+) -> Optional[CodenameEntry]:
+    """
+    Returns the best entry for an x86 CPU of the given display `family` and
+    `model` (see :attr:`CPUInfo.ext_family <libcpuid.info.CPUInfo.ext_family>`
+    and :attr:`CPUInfo.ext_model <libcpuid.info.CPUInfo.ext_model>`), which may be
+    a fallback for unknown CPUs (see :attr:`CodenameEntry.generic`).
+    :const:`None` is returned for vendors without x86 match tables.
+
+    The codes of the brand string, as named in :class:`CodenameEntry`, refine
+    the match. Unlike the C library, which scores all the entries, and scores
+    a brand string without code like the entries without code, entries
+    contradicting the family, model or stepping are skipped, and unknown values
+    (:const:`None`) are not scored, so that the family and model alone select
+    the entries of that display model. The flags of `model_bits` are compared
+    by name, so flags sharing a bit in the C library do not match each other.
+    """
+    base_family = family if family < 0xF else 0xF
+    cpu = (
+        base_family,
+        model & 0xF,
+        stepping,
+        family,
+        model,
+        num_cores,
+        l2_cache,
+        l3_cache,
+    )
+    return _lookup(
+        vendor,
+        cpu,
+        brand_code=brand_code,
+        model_bits=frozenset(model_bits),
+        model_code=model_code,
+    )
@@ -0,0 +1,194 @@
+"""
+Module for comparing raw CPU data and identified CPUs, e.g., when checking
+live-migration compatibility of two hosts.
+"""
+
+import sys
+from typing import NamedTuple, Optional
+from libcpuid import enums
+from libcpuid.info import CACHE_FIELDS, CPUInfo, X86Info, ARMInfo
+from libcpuid.raw import CPURawData
+from libcpuid._utils import iter_bits, raw_data_layout
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    ffi,
+)
+
+_X86_REGISTERS = ("eax", "ebx", "ecx", "edx")
+
+_COMMON_FIELDS = (
+    "architecture",
+    "feature_level",
+    "vendor",
+    "vendor_str",
+    "brand_str",
+    "cpu_codename",
+    "num_cores",
+    "num_logical_cpus",
+    "total_logical_cpus",
+    "purpose",
+)
+_X86_FIELDS = ("family", "model", "stepping", "ext_family", "ext_model", "sse_size")
+_ARM_FIELDS = ("implementer", "variant", "part_num", "revision")
+
+
+class RegisterChange(NamedTuple):
+    """A single register whose value differs between two raw dumps."""
+
+    field: str
+    """Name of the :const:`struct cpu_raw_data_t` field, e.g., :const:`'basic_cpuid'`."""
+    index: int
+    """Index within the field, e.g., the leaf number for :const:`'basic_cpuid'`."""
+    register: str
+    """Register name, e.g., :const:`'ecx'` for x86 or the field name for ARM."""
+    old: int
+    new: int
+
+    @property
+    def changed_bits(self) -> int:
+        """Mask of the bits that differ."""
+        return self.old ^ self.new
+
+    @property
+    def set_bits(self) -> int:
+        """Mask of the bits that are set only in the new value."""
+        return self.new & ~self.old
+
+    @property
+    def cleared_bits(self) -> int:
+        """Mask of the bits that are set only in the old value."""
+        return self.old & ~self.new
+
+
+class RawDiff:
+    """Differences between two :class:`CPURawData` instances."""
+
+    def __init__(self, changes: list[RegisterChange]):
+        self._changes = changes
+
+    def __bool__(self) -> bool:
+        return bool(self._changes)
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __iter__(self):
+        return iter(self._changes)
+
+    @property
+    def changes(self) -> list[RegisterChange]:
+        """The list of changed registers."""
+        return self._changes
+
+    @property
+    def changed_leaves(self) -> set[tuple[str, int]]:
+        """The set of changed (field, index) pairs."""
+        return {(change.field, change.index) for change in self._changes}
+
+
+class InfoDiff:  # pylint: disable=too-few-public-methods
+    """Differences between two :class:`CPUInfo` instances."""
+
+    def __init__(
+        self,
+        added_bits: int,
+        removed_bits: int,
+        cache_changes: dict[str, tuple[Optional[int], Optional[int]]],
+        field_changes: dict[str, tuple],
+    ):
+        self.added_bits = added_bits
+        """Feature bits (see :attr:`CPUInfo.feature_bits`) present only in the new CPU."""
+        self.removed_bits = removed_bits
+        """Feature bits present only in the old CPU."""
+        self.cache_changes = cache_changes
+        """Changed cache geometry properties, mapped to (old, new) value pairs."""
+        self.field_changes = field_changes
+        """Other changed properties, mapped to (old, new) value pairs."""
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added_bits
+            or self.removed_bits
+            or self.cache_changes
+            or self.field_changes
+        )
+
+    @property
+    def added_features(self) -> set[enums.CPUFeature]:
+        """Features supported only by the new CPU."""
+        return {enums.CPUFeature(bit) for bit in iter_bits(self.added_bits)}
+
+    @property
+    def removed_features(self) -> set[enums.CPUFeature]:
+        """Features supported only by the old CPU."""
+        return {enums.CPUFeature(bit) for bit in iter_bits(self.removed_bits)}
+
+    @property
+    def is_feature_superset(self) -> bool:
+        """Whether the new CPU supports every feature of the old CPU."""
+        return self.removed_bits == 0
+
+
+def diff_raw(old: CPURawData, new: CPURawData) -> RawDiff:
+    """Compares two raw dumps register by register."""
+    old_buffer = ffi.buffer(old.c_cpu_raw_data)
+    new_buffer = ffi.buffer(new.c_cpu_raw_data)
+    if old_buffer[:] == new_buffer[:]:
+        return RawDiff([])
+    changes = []
+    for field in raw_data_layout():
+        end = field.offset + field.row_size * field.num_rows
+        if old_buffer[field.offset : end] == new_buffer[field.offset : end]:
+            continue
+        register_size = 4 if field.row_size == 16 else field.row_size
+        for index in range(field.num_rows):
+            start = field.offset + index * field.row_size
+            for register in range(field.row_size // register_size):
+                position = start + register * register_size
+                old_value = int.from_bytes(
+                    old_buffer[position : position + register_size], sys.byteorder
+                )
+                new_value = int.from_bytes(
+                    new_buffer[position : position + register_size], sys.byteorder
+                )
+                if old_value != new_value:
+                    changes.append(
+                        RegisterChange(
+                            field.name,
+                            index,
+                            (
+                                _X86_REGISTERS[register]
+                                if field.row_size == 16
+                                else field.name
+                            ),
+                            old_value,
+                            new_value,
+                        )
+                    )
+    return RawDiff(changes)
+
+
+def diff_info(old: CPUInfo, new: CPUInfo) -> InfoDiff:
+    """
+    Compares two identified CPUs. Feature differences are computed
+    on :attr:`CPUInfo.feature_bits`, so the instances can be reused
+    cheaply when comparing many pairs.
+    """
+    old_bits, new_bits = old.feature_bits, new.feature_bits
+    cache_changes = {}
+    for name in CACHE_FIELDS:
+        old_value, new_value = getattr(old, name), getattr(new, name)
+        if old_value != new_value:
+            cache_changes[name] = (old_value, new_value)
+    fields = _COMMON_FIELDS
+    if isinstance(old, X86Info) and isinstance(new, X86Info):
+        fields += _X86_FIELDS
+    elif isinstance(old, ARMInfo) and isinstance(new, ARMInfo):
+        fields += _ARM_FIELDS
+    field_changes = {}
+    for name in fields:
+        old_value, new_value = getattr(old, name), getattr(new, name)
+        if old_value != new_value:
+            field_changes[name] = (old_value, new_value)
+    return InfoDiff(
+        new_bits & ~old_bits, old_bits & ~new_bits, cache_changes, field_changes
+    )
@@ -0,0 +1,346 @@
+"""
+Module providing a registry for runtime dispatch between implementations
+of a function built for different instruction set extensions.
+
+Implementations are registered under a function name together with the CPU
+features or the minimum :class:`~libcpuid.enums.CPUFeatureLevel` they
+require. The best supported implementation is resolved on first access using
+the identification of the current CPU, which is done once per process, and
+is then stored as an attribute of the registry, so further calls are plain
+attribute lookups:
+
+.. code-block:: python
+
+   from libcpuid.dispatch import DispatchRegistry
+   from libcpuid.enums import CPUFeature, CPUFeatureLevel
+
+   kernels = DispatchRegistry()
+
+   @kernels.register("dot", variant="generic")
+   def dot_generic(x, y): ...
+
+   @kernels.register("dot", min_level=CPUFeatureLevel.X86_64_V3)
+   def dot_v3(x, y): ...
+
+   @kernels.register("dot", features={CPUFeature.AVX512F})
+   def dot_avx512(x, y): ...
+
+   kernels.dot(x, y)
+
+The choice can be overridden through the :const:`LIBCPUID_DISPATCH`
+environment variable, e.g., for benchmarking. It contains a comma-separated
+list of ``function=variant`` items, forcing the variant of a single function,
+or ``variant`` items, forcing the variant of all functions having one of that
+name (e.g., ``LIBCPUID_DISPATCH=generic,dot=dot_v3``). A forced variant must
+still be supported by the CPU.
+"""
+
+import os
+from functools import cache
+from typing import Callable, Iterable, NamedTuple, Optional
+from libcpuid import enums
+from libcpuid.errors import DispatchError
+from libcpuid.info import CPUInfo
+
+DISPATCH_ENV = "LIBCPUID_DISPATCH"
+"""Name of the environment variable overriding the dispatch choices."""
+
+_PROFILES = ("A", "M", "R")
+
+# The features required by each x86-64 level on top of the previous one,
+# as checked by decode_architecture_version_x86() in the C library.
+_X86_64_LEVEL_FEATURES = {
+    enums.CPUFeatureLevel.X86_64_V1: (
+        "LM",
+        "CMOV",
+        "CX8",
+        "FPU",
+        "FXSR",
+        "MMX",
+        "SSE",
+        "SSE2",
+    ),
+    enums.CPUFeatureLevel.X86_64_V2: (
+        "CX16",
+        "LAHF_LM",
+        "POPCNT",
+        "PNI",
+        "SSE4_1",
+        "SSE4_2",
+        "SSSE3",
+    ),
+    enums.CPUFeatureLevel.X86_64_V3: (
+        "AVX",
+        "AVX2",
+        "BMI1",
+        "BMI2",
+        "F16C",
+        "FMA3",
+        "ABM",
+        "MOVBE",
+        "OSXSAVE",
+    ),
+    enums.CPUFeatureLevel.X86_64_V4: (
+        "AVX512F",
+        "AVX512BW",
+        "AVX512CD",
+        "AVX512DQ",
+        "AVX512VL",
+    ),
+}
+
+
+@cache
+def current_cpu_info() -> CPUInfo:
+    """Returns the identification of the current CPU, computed once per process."""
+    return CPUInfo.from_current_cpu()
+
+
+def _profile(level: enums.CPUFeatureLevel) -> Optional[str]:
+    profile = level.name.rpartition("_")[2]
+    return profile if profile in _PROFILES else None
+
+
+def level_features(level: enums.CPUFeatureLevel) -> frozenset[enums.CPUFeature]:
+    """
+    Returns the features required by an x86-64 feature level (including
+    the ones of the lower levels), or an empty set for other levels.
+    """
+    if level not in _X86_64_LEVEL_FEATURES:
+        return frozenset()
+    return frozenset(
+        enums.CPUFeature[name]
+        for x86_64_level, names in _X86_64_LEVEL_FEATURES.items()
+        if x86_64_level <= level
+        for name in names
+    )
+
+
+def implied_level(
+    features: Iterable[enums.CPUFeature],
+) -> Optional[enums.CPUFeatureLevel]:
+    """
+    Returns the lowest x86-64 feature level requiring all of the given
+    features, ignoring the features no level requires, :const:`None`
+    if there are no such features.
+    """
+    names = {feature.name for feature in features}
+    implied = None
+    for level, level_names in _X86_64_LEVEL_FEATURES.items():
+        if names.intersection(level_names):
+            implied = level
+    return implied
+
+
+def level_satisfies(
+    level: enums.CPUFeatureLevel, minimum: enums.CPUFeatureLevel
+) -> bool:
+    """
+    Returns whether a CPU with feature level `level` supports the code built
+    for `minimum`. Levels of different architectures never satisfy each other,
+    nor do the different profiles (A, M, R) of ARM architecture versions.
+    """
+    if enums.CPUFeatureLevel.UNKNOWN in (level, minimum):
+        return False
+    is_arm = level >= enums.CPUFeatureLevel.ARM_V1
+    if is_arm != (minimum >= enums.CPUFeatureLevel.ARM_V1):
+        return False
+    if is_arm and None not in (_profile(level), _profile(minimum)):
+        if _profile(level) != _profile(minimum):
+            return False
+    return level >= minimum
+
+
+class Implementation(NamedTuple):
+    """An implementation registered in a :class:`DispatchRegistry`."""
+
+    function: Callable
+    variant: str
+    """Name of the implementation, used to override the choice."""
+    features: frozenset[enums.CPUFeature]
+    """The CPU features required by the implementation."""
+    min_level: Optional[enums.CPUFeatureLevel]
+    """The minimum CPU feature level required by the implementation."""
+
+    @property
+    def feature_bits(self) -> int:
+        """The required features packed as in :attr:`CPUInfo.feature_bits`."""
+        bits = 0
+        for feature in self.features:
+            bits |= 1 << feature
+        return bits
+
+    def supported_by(self, cpu_info: CPUInfo) -> bool:
+        """Returns whether the implementation can run on the given CPU."""
+        feature_bits = self.feature_bits
+        if cpu_info.feature_bits & feature_bits != feature_bits:
+            return False
+        return self.min_level is None or level_satisfies(
+            cpu_info.feature_level, self.min_level
+        )
+
+    @property
+    def effective_level(self) -> Optional[enums.CPUFeatureLevel]:
+        """
+        The feature level the implementation requires, either explicitly
+        or through its features (see :func:`implied_level`).
+        """
+        levels = [
+            level
+            for level in (self.min_level, implied_level(self.features))
+            if level is not None
+        ]
+        return max(levels) if levels else None
+
+    @property
+    def rank(self) -> tuple[int, int]:
+        """
+        Sort key of the implementation, higher ranks are preferred: the
+        effective level, then the number of features required in total,
+        counting the ones of the effective level.
+        """
+        level = self.effective_level
+        if level is None:
+            return (-1, len(self.features))
+        return (level, len(self.features | level_features(level)))
+
+
+class DispatchRegistry:
+    """
+    Registry of implementations of one or more functions, each function
+    being available as an attribute named after it.
+
+    Among the implementations supported by the CPU, the one with the highest
+    effective feature level is chosen (the minimum level, or the x86-64 level
+    implied by the features, e.g., :const:`X86_64_V4` for :const:`AVX512F`),
+    then the one requiring the most features, then the one registered last.
+    `cpu_info` defaults to the identification of the current CPU
+    (see :func:`current_cpu_info`).
+    """
+
+    def __init__(
+        self, cpu_info: Optional[CPUInfo] = None, env_var: Optional[str] = DISPATCH_ENV
+    ):
+        self._cpu_info = cpu_info
+        self._env_var = env_var
+        self._implementations = {}
+        self._selected = {}
+
+    def __getattr__(self, name: str) -> Callable:
+        # Only called for functions which have not been resolved yet.
+        if name.startswith("_") or name not in self._implementations:
+            raise AttributeError(name)
+        return self.resolve(name)
+
+    def __dir__(self) -> Iterable[str]:
+        return [*super().__dir__(), *self._implementations]
+
+    @property
+    def cpu_info(self) -> CPUInfo:
+        """The CPU information the implementations are chosen for."""
+        if self._cpu_info is None:
+            self._cpu_info = current_cpu_info()
+        return self._cpu_info
+
+    def register(
+        self,
+        name: str,
+        features: Iterable[enums.CPUFeature] = (),
+        min_level: Optional[enums.CPUFeatureLevel] = None,
+        variant: Optional[str] = None,
+    ) -> Callable[[Callable], Callable]:
+        """
+        Returns a decorator registering an implementation of function `name`
+        requiring all of the given `features` and at least the feature level
+        `min_level`. `variant` defaults to the name of the decorated function.
+        """
+        if name.startswith("_") or hasattr(type(self), name):
+            raise ValueError(f"Invalid function name {name!r}.")
+        features = frozenset(features)
+
+        def decorator(function: Callable) -> Callable:
+            self._implementations.setdefault(name, []).append(
+                Implementation(
+                    function,
+                    function.__name__ if variant is None else variant,
+                    features,
+                    min_level,
+                )
+            )
+            # Registering a new implementation invalidates the previous choice.
+            self.__dict__.pop(name, None)
+            self._selected.pop(name, None)
+            return function
+
+        return decorator
+
+    def implementations(self, name: str) -> list[Implementation]:
+        """Returns the implementations of function `name`, in registration order."""
+        return list(self._implementations.get(name, ()))
+
+    def _forced_variant(self, name: str) -> Optional[str]:
+        """Returns the variant of function `name` forced through the environment."""
+        value = os.environ.get(self._env_var, "") if self._env_var else ""
+        variants = {
+            implementation.variant for implementation in self._implementations[name]
+        }
+        forced = None
+        for item in value.split(","):
+            function, separator, variant = item.strip().rpartition("=")
+            if separator and function.strip() == name:
+                return variant.strip()
+            if not separator and forced is None and variant in variants:
+                forced = variant
+        return forced
+
+    def select(self, name: str) -> Implementation:
+        """
+        Returns the implementation of function `name` chosen for the CPU,
+        raising :class:`DispatchError` if none is supported (or if
+        the variant forced through the environment is not).
+        """
+        if name in self._selected:
+            return self._selected[name]
+        if name not in self._implementations:
+            raise DispatchError(f"No implementations of {name!r} are registered.")
+        forced = self._forced_variant(name)
+        candidates = [
+            implementation
+            for implementation in self._implementations[name]
+            if forced is None or implementation.variant == forced
+        ]
+        if not candidates:
+            raise DispatchError(f"Variant {forced!r} of {name!r} is not registered.")
+        supported = [
+            implementation
+            for implementation in candidates
+            if implementation.supported_by(self.cpu_info)
+        ]
+        if not supported:
+            raise DispatchError(f"No implementation of {name!r} supports the CPU.")
+        # max() returns the first maximal item, so prefer later registrations.
+        selected = max(
+            reversed(supported), key=lambda implementation: implementation.rank
+        )
+        self._selected[name] = selected
+        return selected
+
+    def resolve(self, name: str) -> Callable:
+        """
+        Returns the implementation of function `name` chosen for the CPU
+        and stores it as an attribute of the registry.
+        """
+        function = self.select(name).function
+        setattr(self, name, function)
+        return function
+
+    def resolve_all(self) -> dict[str, str]:
+        """
+        Resolves all registered functions (e.g., at import time),
+        returning the chosen variant of each.
+        """
+        variants = {}
+        for name in self._implementations:
+            self.resolve(name)
+            variants[name] = self._selected[name].variant
+        return variants
@@ -8,13 +8,12 @@ or :func:`print` function on an enum member returns or prints
 its string representation.
 """
 
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 from libcpuid._utils import c_string_to_str, get_enum_options
 from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
     lib,
 )
 
-
 CPUArchitecture = IntEnum("CPUArchitecture", get_enum_options("ARCHITECTURE_"))
 CPUArchitecture.__str__ = lambda self: c_string_to_str(lib.cpu_architecture_str(self))
 CPUArchitecture.__doc__ = "CPU architectures."
@@ -52,3 +51,15 @@ CPUHint.__doc__ = "CPU detection hint identifiers."
 SGXFeature = IntEnum("SGXFeature", get_enum_options("INTEL_"))
 SGXFeature.__str__ = lambda self: self.name
 SGXFeature.__doc__ = "SGX feature flags."
+
+StatsPhase = IntEnum("StatsPhase", get_enum_options("STATS_PHASE_"))
+StatsPhase.__str__ = lambda self: self.name
+StatsPhase.__doc__ = (
+    "Phases measured by the instrumentation (see :mod:`libcpuid.stats`)."
+)
+
+RawLeaves = IntFlag("RawLeaves", get_enum_options("RAW_LEAVES_"))
+RawLeaves.__doc__ = """
+    Families of x86 CPUID leaves in the raw data, combined to collect only some of them
+    (see :meth:`libcpuid.raw.CPURawData.from_current_cpu`).
+"""
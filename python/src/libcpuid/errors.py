@@ -20,3 +20,10 @@ class CLibraryError(LibcpuidError):
 
     def __init__(self):
         super().__init__(c_string_to_str(lib.cpuid_error()))
+
+
+class DispatchError(LibcpuidError):
+    """
+    Raised when no registered implementation of a function
+    can be chosen for the CPU (see :mod:`libcpuid.dispatch`).
+    """
@@ -0,0 +1,201 @@
+"""
+Module for exporting identification results as dictionaries,
+JSON Lines streams or Arrow record batches.
+
+Enum values are exported using their string representation
+(see :mod:`libcpuid.enums`), undetermined values as :const:`None`.
+Exporting many results is done row by row, each row
+corresponding to a single :class:`CPUInfo` instance.
+"""
+
+import json
+from typing import IO, Iterable, Iterator, Union
+from libcpuid import enums
+from libcpuid.info import (
+    CACHE_FIELDS,
+    TOTAL_INSTANCES_FIELDS,
+    CPUInfo,
+    X86Info,
+    ARMInfo,
+    SystemInfo,
+)
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    ffi,
+)
+
+ExportItem = Union[CPUInfo, SystemInfo, tuple[str, Union[CPUInfo, SystemInfo]]]
+
+_ENUM_FIELDS = {
+    "architecture": enums.CPUArchitecture,
+    "feature_level": enums.CPUFeatureLevel,
+    "vendor": enums.CPUVendor,
+    "purpose": enums.CPUPurpose,
+}
+_STRING_FIELDS = ("vendor_str", "brand_str", "cpu_codename")
+_INT_FIELDS = ("num_cores", "num_logical_cpus", "total_logical_cpus", *CACHE_FIELDS)
+_X86_FIELDS = ("family", "model", "stepping", "ext_family", "ext_model", "sse_size")
+_ARM_FIELDS = ("implementer", "variant", "part_num", "revision")
+
+
+def _enum_strings(enum_class) -> dict[int, str]:
+    return {member.value: str(member) for member in enum_class if member >= 0}
+
+
+_ENUM_STRINGS = {name: _enum_strings(enum) for name, enum in _ENUM_FIELDS.items()}
+_FEATURE_STRINGS = _enum_strings(enums.CPUFeature)
+_HINT_STRINGS = _enum_strings(enums.CPUHint)
+_SGX_FEATURE_STRINGS = _enum_strings(enums.SGXFeature)
+
+
+def _set_flags(c_flags, strings: dict[int, str]) -> list[str]:
+    """Converts a C array of flags into a list of strings without creating enum members."""
+    return [
+        strings[index]
+        for index, flag in enumerate(bytes(ffi.buffer(c_flags)))
+        if flag and index in strings
+    ]
+
+
+def _sgx_to_dict(info: X86Info):
+    sgx = info.sgx
+    if sgx is None:
+        return None
+    return {
+        "max_enclave_32bit": sgx.max_enclave_32bit,
+        "max_enclave_64bit": sgx.max_enclave_64bit,
+        "features": _set_flags(info.c_cpu_id.sgx.flags, _SGX_FEATURE_STRINGS),
+        "num_epc_sections": sgx.num_epc_sections,
+        "misc_select": sgx.misc_select.hex(),
+        "secs_attributes": sgx.secs_attributes.hex(),
+        "secs_xfrm": sgx.secs_xfrm.hex(),
+    }
+
+
+def cpu_info_to_dict(info: CPUInfo) -> dict:
+    """
+    Converts a :class:`CPUInfo` instance into a dictionary of JSON-compatible values.
+    Fields specific to :class:`X86Info` or :class:`ARMInfo` are only included
+    for instances of the respective class.
+    """
+    c_cpu_id = info.c_cpu_id
+    row: dict = {}
+    for name, strings in _ENUM_STRINGS.items():
+        value = getattr(c_cpu_id, name)
+        row[name] = strings.get(value, str(value))
+    for name in _STRING_FIELDS:
+        row[name] = getattr(info, name)
+    for name in _INT_FIELDS:
+        row[name] = getattr(info, name)
+    row["features"] = _set_flags(c_cpu_id.flags, _FEATURE_STRINGS)
+    row["detection_hints"] = _set_flags(c_cpu_id.detection_hints, _HINT_STRINGS)
+    row["affinity_mask"] = info.affinity_mask.hex()
+    if isinstance(info, X86Info):
+        for name in _X86_FIELDS:
+            row[name] = getattr(info, name)
+        row["sgx"] = _sgx_to_dict(info)
+    elif isinstance(info, ARMInfo):
+        for name in _ARM_FIELDS:
+            row[name] = getattr(info, name)
+    for name in info.undetermined & row.keys():
+        row[name] = None
+    return row
+
+
+def system_info_to_dict(system_info: SystemInfo) -> dict:
+    """
+    Converts a :class:`SystemInfo` instance into a dictionary with the system-wide
+    fields and a :const:`'cpu_types'` list of :func:`cpu_info_to_dict` results.
+    """
+    return {
+        "cpu_types": [cpu_info_to_dict(info) for info in system_info],
+        **{name: getattr(system_info, name) for name in TOTAL_INSTANCES_FIELDS},
+    }
+
+
+def to_dict(info: Union[CPUInfo, SystemInfo]) -> dict:
+    """Converts a :class:`CPUInfo` or :class:`SystemInfo` instance into a dictionary."""
+    if isinstance(info, SystemInfo):
+        return system_info_to_dict(info)
+    return cpu_info_to_dict(info)
+
+
+def iter_rows(items: Iterable[ExportItem]) -> Iterator[dict]:
+    """
+    Yields one flat dictionary per CPU type. Items can be :class:`CPUInfo`
+    or :class:`SystemInfo` instances, or (key, info) pairs, in which case
+    the rows also contain a :const:`'key'` field. Rows of a :class:`SystemInfo`
+    instance also contain its system-wide fields. The items are consumed lazily.
+    """
+    for item in items:
+        key, info = item if isinstance(item, tuple) else (None, item)
+        if isinstance(info, SystemInfo):
+            system_fields = {
+                name: getattr(info, name) for name in TOTAL_INSTANCES_FIELDS
+            }
+            rows = (
+                {**cpu_info_to_dict(cpu_info), **system_fields} for cpu_info in info
+            )
+        else:
+            rows = (cpu_info_to_dict(info),)
+        for row in rows:
+            if key is not None:
+                row = {"key": key, **row}
+            yield row
+
+
+def write_jsonl(items: Iterable[ExportItem], stream: IO[str]) -> int:
+    """
+    Writes the rows produced by :func:`iter_rows` into a text stream
+    in the JSON Lines format, one row at a time. Returns the number of rows.
+    """
+    num_rows = 0
+    for row in iter_rows(items):
+        stream.write(json.dumps(row))
+        stream.write("\n")
+        num_rows += 1
+    return num_rows
+
+
+def arrow_schema():
+    """
+    Returns the :class:`pyarrow.Schema` of the record batches produced by
+    :func:`iter_arrow_batches`. Requires the optional `pyarrow` package.
+    """
+    import pyarrow  # pylint: disable=import-outside-toplevel,import-error
+
+    strings = pyarrow.list_(pyarrow.string())
+    fields = [("key", pyarrow.string())]
+    fields += [(name, pyarrow.string()) for name in _ENUM_FIELDS]
+    fields += [(name, pyarrow.string()) for name in _STRING_FIELDS]
+    fields += [(name, pyarrow.int32()) for name in _INT_FIELDS]
+    fields += [
+        ("features", strings),
+        ("detection_hints", strings),
+        ("affinity_mask", pyarrow.string()),
+    ]
+    fields += [(name, pyarrow.int32()) for name in _X86_FIELDS + _ARM_FIELDS]
+    fields += [(name, pyarrow.int32()) for name in TOTAL_INSTANCES_FIELDS]
+    return pyarrow.schema(fields)
+
+
+def iter_arrow_batches(items: Iterable[ExportItem], batch_size: int = 1024):
+    """
+    Yields :class:`pyarrow.RecordBatch` instances with up to `batch_size` rows
+    produced by :func:`iter_rows`, using the schema returned by :func:`arrow_schema`.
+    Nested SGX information is not included. Requires the optional `pyarrow` package.
+    """
+    import pyarrow  # pylint: disable=import-outside-toplevel,import-error
+
+    schema = arrow_schema()
+    columns: dict[str, list] = {name: [] for name in schema.names}
+    num_rows = 0
+    for row in iter_rows(items):
+        for name, column in columns.items():
+            column.append(row.get(name))
+        num_rows += 1
+        if num_rows == batch_size:
+            yield pyarrow.RecordBatch.from_pydict(columns, schema=schema)
+            columns = {name: [] for name in schema.names}
+            num_rows = 0
+    if num_rows > 0:
+        yield pyarrow.RecordBatch.from_pydict(columns, schema=schema)
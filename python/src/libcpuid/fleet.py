@@ -0,0 +1,308 @@
+"""
+Module providing a columnar index of identification results from many hosts.
+
+Feature flags of all rows are kept in a single byte matrix, from which
+per-feature bit columns (Python integers, where bit `i` corresponds to row `i`)
+are derived on demand. Numeric properties are kept in typed arrays, with
+a separate null mask of the rows where they are undetermined, and a bit column
+per distinct value is derived on demand as well. Queries combine these bit
+columns instead of visiting the rows, and return row masks in the same format,
+so they can be combined with the bitwise operators ``&``, ``|`` and ``~``.
+"""
+
+import json
+import operator
+import struct
+import sys
+from array import array
+from itertools import repeat
+from typing import Iterable, Optional, Union
+from libcpuid import enums
+from libcpuid.info import CACHE_FIELDS, CPUInfo, SystemInfo
+from libcpuid.errors import LibcpuidError
+from libcpuid._utils import bytes_to_bits, iter_bits
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    ffi,
+)
+
+NUMERIC_COLUMNS = (
+    "architecture",
+    "vendor",
+    "purpose",
+    "feature_level",
+    "family",
+    "model",
+    "stepping",
+    "ext_family",
+    "ext_model",
+    "num_cores",
+    "num_logical_cpus",
+    "total_logical_cpus",
+    *CACHE_FIELDS,
+)
+"""Names of the numeric columns, matching :class:`CPUInfo` property names."""
+
+_ENUM_COLUMNS = {
+    "architecture": enums.CPUArchitecture,
+    "vendor": enums.CPUVendor,
+    "purpose": enums.CPUPurpose,
+    "feature_level": enums.CPUFeatureLevel,
+}
+
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_NUM_FLAGS = ffi.sizeof(dict(ffi.typeof("struct cpu_id_t").fields)["flags"].type)
+_MAGIC = b"LIBCPUID-FLEET\x00\x02"
+
+
+class FleetIndex:
+    """
+    Columnar index of :class:`CPUInfo` results. Each row corresponds
+    to one CPU type of one host and is identified by a key (usually
+    the host name). Row masks returned by queries are integers,
+    where bit `i` is set if row `i` matches.
+    """
+
+    def __init__(self):
+        self._keys: list[str] = []
+        self._codenames: list[str] = []
+        self._flags = bytearray()
+        self._columns = {name: array("i") for name in NUMERIC_COLUMNS}
+        self._nulls = {name: bytearray() for name in NUMERIC_COLUMNS}
+        self._feature_columns: dict[int, int] = {}
+        self._value_columns: dict[str, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def all_rows(self) -> int:
+        """The mask selecting all rows."""
+        return (1 << len(self)) - 1
+
+    @property
+    def keys(self) -> list[str]:
+        """The keys of all rows."""
+        return self._keys
+
+    def add(self, key: str, cpu_info: CPUInfo):
+        """Adds a row with the identification result of a single CPU type."""
+        self._keys.append(key)
+        self._codenames.append(cpu_info.cpu_codename)
+        self._flags += ffi.buffer(cpu_info.c_cpu_id.flags)
+        for name, column in self._columns.items():
+            value = getattr(cpu_info, name, None)
+            column.append(0 if value is None else int(value))
+            self._nulls[name].append(value is None)
+        self._feature_columns.clear()
+        self._value_columns.clear()
+
+    def add_system(self, key: str, system_info: SystemInfo):
+        """Adds one row for each CPU type of a :class:`SystemInfo` instance."""
+        for cpu_info in system_info:
+            self.add(key, cpu_info)
+
+    def extend(self, items: Iterable[tuple[str, Union[CPUInfo, SystemInfo]]]):
+        """Adds many (key, :class:`CPUInfo` or :class:`SystemInfo`) pairs."""
+        for key, info in items:
+            if isinstance(info, SystemInfo):
+                self.add_system(key, info)
+            else:
+                self.add(key, info)
+
+    def column(self, name: str) -> array:
+        """
+        Returns the typed array of a numeric column. Rows where the value
+        is undetermined hold 0 (see :meth:`null_mask`).
+        """
+        return self._columns[name]
+
+    def null_mask(self, name: str) -> int:
+        """
+        Returns the mask of rows where a numeric column or the
+        :const:`'cpu_codename'` column is undetermined.
+        """
+        return self._value_index(name).get(None, 0)
+
+    def value_columns(self, name: str) -> dict:
+        """
+        Returns the mask of rows of each distinct value of a numeric column
+        or the :const:`'cpu_codename'` column. Rows where the value
+        is undetermined are mapped from :const:`None`.
+        """
+        return dict(self._value_index(name))
+
+    def _value_index(self, name: str) -> dict:
+        if name not in self._value_columns:
+            if name == "cpu_codename":
+                values = self._codenames
+                nulls = bytes_to_bits(bytes(map(operator.is_, values, repeat(None))))
+            else:
+                values = self._columns[name]
+                nulls = bytes_to_bits(self._nulls[name])
+            # One pass over the column per distinct value, without Python code per row.
+            value_columns = {}
+            for value in set(values) - {None}:
+                rows = bytes_to_bits(bytes(map(operator.eq, values, repeat(value))))
+                if rows & ~nulls:
+                    value_columns[value] = rows & ~nulls
+            if nulls:
+                value_columns[None] = nulls
+            self._value_columns[name] = value_columns
+        return self._value_columns[name]
+
+    def feature_column(self, feature: enums.CPUFeature) -> int:
+        """Returns the mask of rows supporting the given feature."""
+        if feature not in self._feature_columns:
+            self._feature_columns[feature] = bytes_to_bits(
+                bytes(self._flags[feature::_NUM_FLAGS])
+            )
+        return self._feature_columns[feature]
+
+    def with_features(self, *features: enums.CPUFeature) -> int:
+        """Returns the mask of rows supporting all of the given features."""
+        mask = self.all_rows
+        for feature in features:
+            mask &= self.feature_column(feature)
+        return mask
+
+    def where(self, name: str, op: str, value) -> int:
+        """
+        Returns the mask of rows whose numeric column `name` compares
+        to `value` using `op`, one of ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``.
+        Rows where the value is undetermined never match.
+        """
+        compare = _OPERATORS[op]
+        value = int(value)
+        mask = 0
+        for column_value, rows in self._value_index(name).items():
+            if column_value is not None and compare(column_value, value):
+                mask |= rows
+        return mask
+
+    def where_codename(self, codename: str) -> int:
+        """Returns the mask of rows with the given CPU codename."""
+        return self._value_index("cpu_codename").get(codename, 0)
+
+    def select(self, mask: int) -> list[str]:
+        """Returns the keys of the rows selected by a mask."""
+        return [self._keys[row] for row in iter_bits(mask)]
+
+    @staticmethod
+    def count(mask: int) -> int:
+        """Returns the number of rows selected by a mask."""
+        return mask.bit_count()
+
+    def group_by(self, name: str, mask: Optional[int] = None) -> dict:
+        """
+        Groups the rows (optionally only those selected by `mask`) by the value
+        of a numeric column or the :const:`'cpu_codename'` column, returning
+        a dictionary mapping each value to a row mask. Rows where the value
+        is undetermined are grouped under :const:`None`.
+        """
+        mask = self.all_rows if mask is None else mask
+        enum_class = _ENUM_COLUMNS.get(name)
+        groups = {}
+        for value, rows in self._value_index(name).items():
+            if rows & mask:
+                if enum_class is not None and value is not None:
+                    value = _to_enum(enum_class, value)
+                groups[value] = rows & mask
+        return groups
+
+    def baseline(self, mask: Optional[int] = None) -> set[enums.CPUFeature]:
+        """
+        Returns the set of features supported by all rows
+        (optionally only those selected by `mask`).
+        """
+        mask = self.all_rows if mask is None else mask
+        if mask == 0:
+            return set()
+        return {
+            feature
+            for feature in enums.CPUFeature
+            if feature >= 0 and self.feature_column(feature) & mask == mask
+        }
+
+    def union(self, mask: Optional[int] = None) -> set[enums.CPUFeature]:
+        """
+        Returns the set of features supported by at least one row
+        (optionally only those selected by `mask`).
+        """
+        mask = self.all_rows if mask is None else mask
+        return {
+            feature
+            for feature in enums.CPUFeature
+            if feature >= 0 and self.feature_column(feature) & mask
+        }
+
+    def save(self, filename: str):
+        """Writes the index into a file."""
+        header = json.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "num_flags": _NUM_FLAGS,
+                "columns": list(self._columns),
+                "keys": self._keys,
+                "codenames": self._codenames,
+            }
+        ).encode()
+        with open(filename, "wb") as index_file:
+            index_file.write(_MAGIC)
+            index_file.write(struct.pack("<Q", len(header)))
+            index_file.write(header)
+            index_file.write(self._flags)
+            for column in self._columns.values():
+                column.tofile(index_file)
+            for nulls in self._nulls.values():
+                index_file.write(nulls)
+
+    @classmethod
+    def load(cls, filename: str):
+        """Reads an index previously written by :meth:`save`."""
+        index = cls()
+        with open(filename, "rb") as index_file:
+            if index_file.read(len(_MAGIC)) != _MAGIC:
+                raise LibcpuidError(f"'{filename}' is not a fleet index file.")
+            (header_size,) = struct.unpack("<Q", index_file.read(8))
+            header = json.loads(index_file.read(header_size))
+            if header["num_flags"] != _NUM_FLAGS:
+                raise LibcpuidError(
+                    f"'{filename}' was written by an incompatible libcpuid version."
+                )
+            num_rows = len(header["keys"])
+            index._keys = header["keys"]
+            index._codenames = header["codenames"]
+            index._flags = bytearray(index_file.read(num_rows * _NUM_FLAGS))
+            columns = {}
+            for name in header["columns"]:
+                column = array("i")
+                column.fromfile(index_file, num_rows)
+                if header["byteorder"] != sys.byteorder:
+                    column.byteswap()
+                columns[name] = column
+            for name, column in columns.items():
+                if name in index._columns:
+                    index._columns[name] = column
+                    index._nulls[name] = bytearray(index_file.read(num_rows))
+                else:
+                    index_file.seek(num_rows, 1)
+        for name, column in index._columns.items():
+            if len(column) != num_rows:
+                index._columns[name] = array("i", bytes(4 * num_rows))
+                index._nulls[name] = bytearray(b"\x01" * num_rows)
+        return index
+
+
+def _to_enum(enum_class, value):
+    try:
+        return enum_class(value)
+    except ValueError:
+        return value
@@ -0,0 +1,214 @@
+"""
+Module keeping a :class:`~libcpuid.info.SystemInfo` up to date when logical CPUs
+are brought online or offline (e.g., vCPU hotplug in virtual machines) or when
+the CPUs the process may run on change (e.g., cgroup cpuset updates of
+containers).
+
+A :class:`HotplugWatcher` keeps the raw data of every logical CPU it has seen,
+so that only the added CPUs are probed when the set of CPUs changes, and the
+identification of the whole system is then recomputed from the cached raw data,
+without running `cpuid` again on the other CPUs.
+
+.. code-block:: python
+
+   from libcpuid.hotplug import HotplugWatcher
+
+   with HotplugWatcher(method="auto") as watcher:
+       watcher.subscribe(lambda event: print(event.added, event.removed))
+       watcher.start(interval=1.0)
+       ...
+"""
+
+import os
+import threading
+from typing import Callable, NamedTuple, Optional
+from libcpuid.errors import CLibraryError, LibcpuidError
+from libcpuid.info import SystemInfo
+from libcpuid.raw import CollectionMethod, CPURawData
+from libcpuid._utils import check_collection_method, parse_cpu_list, read_sysfs
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    lib,
+    ffi,
+)
+
+
+class HotplugEvent(NamedTuple):
+    """A change of the set of logical CPUs, passed to the subscribers."""
+
+    added: frozenset[int]
+    """The logical CPUs which were added (and probed)."""
+    removed: frozenset[int]
+    """The logical CPUs which were removed."""
+    system_info: SystemInfo
+    """The identification of the system after the change."""
+
+
+def _remap_affinity_masks(c_system_id, cpus: list[int]):
+    """
+    Replaces the indices of the raw data array in the affinity masks
+    of all CPU types by the logical CPU numbers they were collected on.
+    """
+    for index in range(c_system_id.num_cpu_types):
+        c_bits = getattr(c_system_id.cpu_types[index].affinity_mask, "__bits")
+        size = len(c_bits)
+        indices = int.from_bytes(bytes(c_bits), "little")
+        mask = 0
+        for position, cpu in enumerate(cpus):
+            if indices >> position & 1:
+                mask |= 1 << cpu
+        ffi.memmove(c_bits, mask.to_bytes(size, "little"), size)
+
+
+def system_info_from_raw_data(raw_data: dict[int, CPURawData]) -> SystemInfo:
+    """
+    Identifies a system from the raw data of its logical CPUs, by logical CPU
+    number. Unlike :meth:`SystemInfo.from_raw_array`, the logical CPUs do not
+    need to be contiguous (e.g., when some are offline), and the affinity masks
+    refer to the given logical CPU numbers.
+    """
+    if not raw_data:
+        raise LibcpuidError("No raw data to identify.")
+    cpus = sorted(raw_data)
+    c_raw = ffi.new("struct cpu_raw_data_t[]", len(cpus))
+    for index, cpu in enumerate(cpus):
+        ffi.memmove(
+            c_raw + index,
+            raw_data[cpu].c_cpu_raw_data,
+            ffi.sizeof("struct cpu_raw_data_t"),
+        )
+    c_cpu_raw_data_array = ffi.new("struct cpu_raw_data_array_t *")
+    c_cpu_raw_data_array.with_affinity = True
+    c_cpu_raw_data_array.num_raw = len(cpus)
+    c_cpu_raw_data_array.raw = c_raw
+    c_system_id = ffi.new("struct system_id_t *")
+    if lib.cpu_identify_all(c_cpu_raw_data_array, c_system_id) != 0:
+        raise CLibraryError
+    _remap_affinity_masks(c_system_id, cpus)
+    # The leaves used by the derived queries do not differ between the logical
+    # CPUs of a machine, so the raw data of the first one is kept.
+    return SystemInfo.from_c(c_system_id, raw_data=raw_data[cpus[0]])
+
+
+class HotplugWatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Watches the set of logical CPUs, which are the online ones
+    (:const:`/sys/devices/system/cpu/online`), restricted to the ones
+    the process may run on if `use_cpuset` is set. The raw data
+    of added CPUs is collected with the given `method` (see :mod:`libcpuid.raw`).
+
+    Changes are detected by :meth:`check`, called either explicitly or
+    periodically by a background thread (see :meth:`start`), and are notified
+    to the subscribers, in the thread calling :meth:`check`.
+    """
+
+    def __init__(
+        self,
+        method: CollectionMethod = "auto",
+        use_cpuset: bool = True,
+        sysfs_root: str = "/sys",
+    ):
+        check_collection_method(method)
+        self._method = method
+        self._use_cpuset = use_cpuset
+        self._online_path = os.path.join(sysfs_root, "devices/system/cpu/online")
+        self._raw_data: dict[int, CPURawData] = {}
+        self._subscribers: list[Callable[[HotplugEvent], None]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._collect(self._current_cpus())
+        if not self._raw_data:
+            raise LibcpuidError("No logical CPU could be probed.")
+        self._system_info = system_info_from_raw_data(self._raw_data)
+
+    @property
+    def system_info(self) -> SystemInfo:
+        """The identification of the system as of the last change."""
+        return self._system_info
+
+    @property
+    def cpus(self) -> list[int]:
+        """The logical CPUs of :attr:`system_info`."""
+        return sorted(self._raw_data)
+
+    def _current_cpus(self) -> set[int]:
+        online = read_sysfs(self._online_path)
+        if online:
+            cpus = set(parse_cpu_list(online.decode()))
+        else:
+            cpus = set(range(lib.cpuid_get_total_cpus()))
+        if self._use_cpuset and hasattr(os, "sched_getaffinity"):
+            cpus &= os.sched_getaffinity(0)
+        return cpus
+
+    def _collect(self, cpus: set[int]) -> set[int]:
+        """
+        Collects the raw data of the given CPUs, returning the ones which
+        could be probed (a CPU may go offline again in the meantime).
+        """
+        collected = set()
+        for cpu in sorted(cpus):
+            try:
+                self._raw_data[cpu] = CPURawData.from_cpu_core(cpu, self._method)
+            except CLibraryError:
+                continue
+            collected.add(cpu)
+        return collected
+
+    def subscribe(self, callback: Callable[[HotplugEvent], None]):
+        """Registers a function called with a :class:`HotplugEvent` on each change."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[HotplugEvent], None]):
+        """Unregisters a function registered with :meth:`subscribe`."""
+        self._subscribers.remove(callback)
+
+    def check(self) -> Optional[HotplugEvent]:
+        """
+        Checks whether the set of logical CPUs changed, updating
+        :attr:`system_info` and notifying the subscribers if it did.
+        Returns the change, or :const:`None` if there is none.
+        """
+        with self._lock:
+            cpus = self._current_cpus()
+            removed = set(self._raw_data) - cpus
+            for cpu in removed:
+                del self._raw_data[cpu]
+            added = self._collect(cpus - set(self._raw_data))
+            if not added and not removed:
+                return None
+            if self._raw_data:
+                self._system_info = system_info_from_raw_data(self._raw_data)
+            event = HotplugEvent(
+                frozenset(added), frozenset(removed), self._system_info
+            )
+        for callback in list(self._subscribers):
+            callback(event)
+        return event
+
+    def _run(self, interval: float):
+        while not self._stop_event.wait(interval):
+            self.check()
+
+    def start(self, interval: float = 1.0):
+        """Starts checking for changes every `interval` seconds in a daemon thread."""
+        if self._thread is not None:
+            raise LibcpuidError("The watcher is already started.")
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="libcpuid-hotplug", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops the thread started by :meth:`start`, if any."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
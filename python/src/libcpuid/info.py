@@ -2,54 +2,174 @@
 The main module, providing a class that holds CPU information.
 """
 
-from typing import Optional
+from typing import Iterable, Optional
 from libcpuid import enums
 from libcpuid.sgx import SGX
-from libcpuid.raw import CPURawData, CPURawDataArray
+from libcpuid.raw import CPURawData, CPURawDataArray, CollectionMethod
 from libcpuid.errors import CLibraryError
-from libcpuid._utils import c_string_to_str, optional_int
+from libcpuid._utils import (
+    c_string_to_str,
+    optional_int,
+    check_index,
+    flags_to_bits,
+)
 from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
     lib,
     ffi,
 )
 
+_CACHE_LEVELS = ("l1_data", "l1_instruction", "l2", "l3", "l4")
+CACHE_FIELDS = tuple(
+    f"{level}_{attribute}"
+    for level in _CACHE_LEVELS
+    for attribute in ("cache", "assoc", "cacheline", "instances")
+)
+"""Names of the :class:`CPUInfo` properties describing the cache geometry."""
+TOTAL_INSTANCES_FIELDS = tuple(f"{level}_total_instances" for level in _CACHE_LEVELS)
+"""Names of the :class:`SystemInfo` properties counting the cache instances."""
+
+_TOPOLOGY_FIELDS = ("num_cores", "num_logical_cpus", "total_logical_cpus")
+_CACHE_LEAVES = (
+    enums.RawLeaves.QUICK | enums.RawLeaves.INTEL_FN4 | enums.RawLeaves.AMD_FN8000001DH
+)
+_TOPOLOGY_LEAVES = (
+    enums.RawLeaves.QUICK | enums.RawLeaves.INTEL_FN4 | enums.RawLeaves.INTEL_FN11
+)
+# The leaves each field is decoded from, for all vendors. The codename
+# is scored against the cache sizes and core counts as well.
+_FIELD_LEAVES = {
+    **dict.fromkeys(CACHE_FIELDS, _CACHE_LEAVES),
+    **dict.fromkeys(_TOPOLOGY_FIELDS, _TOPOLOGY_LEAVES),
+    "cpu_codename": _CACHE_LEAVES | _TOPOLOGY_LEAVES,
+    "purpose": enums.RawLeaves.QUICK
+    | enums.RawLeaves.INTEL_FN4
+    | enums.RawLeaves.AMD_FN80000026H,
+    "sgx": enums.RawLeaves.BASIC | enums.RawLeaves.INTEL_FN12H,
+}
+
+
+def undetermined_fields(leaves: enums.RawLeaves) -> frozenset[str]:
+    """
+    Returns the names of the :class:`CPUInfo` fields which cannot be determined
+    from raw data containing only the given families of `leaves`.
+    """
+    return frozenset(
+        field for field, required in _FIELD_LEAVES.items() if required & ~leaves
+    )
+
+
+def _first_raw_data(raw_data_array: CPURawDataArray) -> Optional[CPURawData]:
+    """
+    Returns the raw data kept by CPUs identified from `raw_data_array`.
+    The leaves used by the derived queries (SGX and hypervisor) do not differ
+    between the logical CPUs of a machine, so the first one is used.
+    """
+    return raw_data_array[0] if len(raw_data_array) else None
+
 
 class CPUInfo:  # pylint: disable=too-many-public-methods
     """
     The main class, holding information about a CPU
     in human-friendly format.
+
+    Instances keep the :class:`CPURawData` the CPU was identified from (if known),
+    which is used to answer derived queries (e.g., :attr:`hypervisor`)
+    without running `cpuid` again. If only some of its leaves were collected
+    (see :attr:`CPURawData.leaves`), the fields decoded from the others are
+    :const:`None` (see :attr:`undetermined`).
     """
 
-    def __init__(self, c_cpu_id):
+    def __init__(self, c_cpu_id, owner=None, raw_data: Optional[CPURawData] = None):
         self._c_cpu_id = c_cpu_id
+        self._owner = owner
+        self._raw_data = raw_data
         self._features = None
+        self._feature_bits = None
         self._detection_hints = None
+        self._hypervisor = None
 
     @classmethod
-    def from_c(cls, c_cpu_id):
-        """Creates a :class:`CPUInfo` instance from the corresponding C structure."""
-        cpu_info = cls(c_cpu_id)
+    def from_c(cls, c_cpu_id, owner=None, raw_data: Optional[CPURawData] = None):
+        """
+        Creates a :class:`CPUInfo` instance from the corresponding C structure.
+        If the structure is borrowed from another allocation, `owner` must
+        be an object keeping that allocation alive. `raw_data` is the raw data
+        the CPU was identified from, if known.
+        """
+        cpu_info = cls(c_cpu_id, owner, raw_data)
         if cpu_info.architecture == enums.CPUArchitecture.X86:
-            return X86Info(c_cpu_id)
+            return X86Info(c_cpu_id, owner, raw_data)
         if cpu_info.architecture == enums.CPUArchitecture.ARM:
-            return ARMInfo(c_cpu_id)
+            return ARMInfo(c_cpu_id, owner, raw_data)
         return cpu_info
 
-    @classmethod
-    def from_current_cpu(cls):
-        """Creates a :class:`CPUInfo` instance by identifying the current CPU."""
+    @property
+    def c_cpu_id(self):
+        """Returns the underlying C structure."""
+        return self._c_cpu_id
+
+    @property
+    def raw_data(self) -> Optional[CPURawData]:
+        """The raw data the CPU was identified from, :const:`None` if not known."""
+        return self._raw_data
+
+    @property
+    def undetermined(self) -> frozenset[str]:
+        """
+        The names of the fields which are :const:`None` because the leaves
+        they are decoded from were not collected.
+        """
+        if self._raw_data is None or self.architecture != enums.CPUArchitecture.X86:
+            return frozenset()
+        return undetermined_fields(self._raw_data.leaves)
+
+    def copy(self):
+        """Returns a :class:`CPUInfo` instance owning a copy of the underlying C structure."""
         c_cpu_id = ffi.new("struct cpu_id_t *")
-        if lib.cpu_identify(ffi.NULL, c_cpu_id) != 0:
-            raise CLibraryError
-        return cls.from_c(c_cpu_id)
+        ffi.memmove(c_cpu_id, self._c_cpu_id, ffi.sizeof("struct cpu_id_t"))
+        return CPUInfo.from_c(c_cpu_id, raw_data=self._raw_data)
+
+    @classmethod
+    def from_current_cpu(cls, leaves: enums.RawLeaves = enums.RawLeaves.ALL):
+        """
+        Creates a :class:`CPUInfo` instance by identifying the current CPU,
+        collecting only the given families of `leaves` (e.g., :const:`RawLeaves.QUICK`
+        for the vendor, family/model, brand string and features).
+        """
+        return cls.from_raw(CPURawData.from_current_cpu(leaves))
 
     @classmethod
     def from_purpose(cls, purpose: enums.CPUPurpose):
         """Creates a :class:`CPUInfo` instance by identifying a CPU with the requested purpose."""
-        c_cpu_id = ffi.new("struct cpu_id_t *")
-        if lib.cpu_request_core_type(purpose, ffi.NULL, c_cpu_id) != 0:
-            raise CLibraryError
-        return CPUInfo.from_c(c_cpu_id)
+        return cls.from_raw_array_and_purpose(CPURawDataArray.from_all_cpus(), purpose)
+
+    @classmethod
+    def from_purposes(
+        cls,
+        purposes: Iterable[enums.CPUPurpose],
+        raw_data_array: Optional[CPURawDataArray] = None,
+    ) -> dict[enums.CPUPurpose, "CPUInfo"]:
+        """
+        Identifies CPUs with each of the requested purposes, collecting the raw data
+        of all CPUs only once (or using `raw_data_array` if given). Returns
+        a dictionary mapping the purposes present in the system to :class:`CPUInfo`
+        instances; purposes not present in the system are left out.
+        """
+        if raw_data_array is None:
+            raw_data_array = CPURawDataArray.from_all_cpus()
+        cpu_infos = {}
+        for purpose in purposes:
+            c_cpu_id = ffi.new("struct cpu_id_t *")
+            result = lib.cpu_request_core_type(
+                purpose, raw_data_array.c_cpu_raw_data_array, c_cpu_id
+            )
+            if result == 0:
+                cpu_infos[purpose] = cls.from_c(
+                    c_cpu_id, raw_data=_first_raw_data(raw_data_array)
+                )
+            elif result != lib.ERR_NOT_FOUND:
+                raise CLibraryError
+        return cpu_infos
 
     @classmethod
     def from_raw(cls, raw_data: CPURawData):
@@ -57,7 +177,11 @@ class CPUInfo:  # pylint: disable=too-many-public-methods
         c_cpu_id = ffi.new("struct cpu_id_t *")
         if lib.cpu_identify(raw_data.c_cpu_raw_data, c_cpu_id) != 0:
             raise CLibraryError
-        return CPUInfo.from_c(c_cpu_id)
+        cpu_info = CPUInfo.from_c(c_cpu_id, raw_data=raw_data)
+        for field in cpu_info.undetermined & {*CACHE_FIELDS, *_TOPOLOGY_FIELDS}:
+            # The library decodes these from other leaves on a best-effort basis.
+            setattr(c_cpu_id, field, -1)
+        return cpu_info
 
     @classmethod
     def from_raw_array_and_purpose(
@@ -72,7 +196,7 @@ class CPUInfo:  # pylint: disable=too-many-public-methods
             != 0
         ):
             raise CLibraryError
-        return CPUInfo.from_c(c_cpu_id)
+        return CPUInfo.from_c(c_cpu_id, raw_data=_first_raw_data(raw_data_array))
 
     @property
     def architecture(self) -> enums.CPUArchitecture:
@@ -120,19 +244,30 @@ class CPUInfo:  # pylint: disable=too-many-public-methods
         return self._features
 
     @property
-    def num_cores(self) -> int:
-        """The number of CPU cores."""
-        return self._c_cpu_id.num_cores
+    def feature_bits(self) -> int:
+        """
+        The supported CPU features packed into an integer, where bit `i` is set
+        if the feature with value `i` is supported. Suitable for fast set
+        operations using bitwise operators.
+        """
+        if self._feature_bits is None:
+            self._feature_bits = flags_to_bits(self._c_cpu_id.flags)
+        return self._feature_bits
 
     @property
-    def num_logical_cpus(self) -> int:
-        """The number of logical processors."""
-        return self._c_cpu_id.num_logical_cpus
+    def num_cores(self) -> Optional[int]:
+        """The number of CPU cores. :const:`None` if not determined."""
+        return optional_int(self._c_cpu_id.num_cores)
 
     @property
-    def total_logical_cpus(self) -> int:
-        """The total number of logical processors."""
-        return self._c_cpu_id.total_logical_cpus
+    def num_logical_cpus(self) -> Optional[int]:
+        """The number of logical processors. :const:`None` if not determined."""
+        return optional_int(self._c_cpu_id.num_logical_cpus)
+
+    @property
+    def total_logical_cpus(self) -> Optional[int]:
+        """The total number of logical processors. :const:`None` if not determined."""
+        return optional_int(self._c_cpu_id.total_logical_cpus)
 
     @property
     def l1_data_cache(self) -> Optional[int]:
@@ -235,8 +370,10 @@ class CPUInfo:  # pylint: disable=too-many-public-methods
         return optional_int(self._c_cpu_id.l4_instances)
 
     @property
-    def cpu_codename(self) -> str:
-        """A human-friendly CPU codename."""
+    def cpu_codename(self) -> Optional[str]:
+        """A human-friendly CPU codename. :const:`None` if not determined."""
+        if "cpu_codename" in self.undetermined:
+            return None
         return c_string_to_str(self._c_cpu_id.cpu_codename)
 
     @property
@@ -259,15 +396,43 @@ class CPUInfo:  # pylint: disable=too-many-public-methods
         )
 
     @property
-    def purpose(self) -> enums.CPUPurpose:
-        """The purpose of the CPU type, relevant for hybrid CPUs."""
+    def purpose(self) -> Optional[enums.CPUPurpose]:
+        """
+        The purpose of the CPU type, relevant for hybrid CPUs.
+        :const:`None` if not determined.
+        """
+        if "purpose" in self.undetermined:
+            return None
         return enums.CPUPurpose(self._c_cpu_id.purpose)
 
     @property
     def hypervisor(self) -> Optional[enums.HypervisorVendor]:
-        """The hypervisor vendor or :const:`None` if not detected."""
-        hypervisor = lib.cpuid_get_hypervisor(ffi.NULL, self._c_cpu_id)
-        return enums.HypervisorVendor(hypervisor) if hypervisor != 0 else None
+        """
+        The hypervisor vendor or :const:`None` if not detected. The vendor is
+        determined by running `cpuid` on the current CPU (the hypervisor leaves
+        are not part of the raw data), so it is :const:`HypervisorVendor.UNKNOWN`
+        for a hypervisor detected in the raw data of another machine.
+        """
+        if self._hypervisor is None:
+            if (
+                self._raw_data is not None
+                and not self._raw_data.is_local
+                and self._c_cpu_id.flags[enums.CPUFeature.HYPERVISOR]
+            ):
+                self._hypervisor = enums.HypervisorVendor.UNKNOWN
+            else:
+                # Returns without running `cpuid` if no hypervisor is present.
+                self._hypervisor = lib.cpuid_get_hypervisor(
+                    (
+                        ffi.NULL
+                        if self._raw_data is None
+                        else self._raw_data.c_cpu_raw_data
+                    ),
+                    self._c_cpu_id,
+                )
+        return (
+            enums.HypervisorVendor(self._hypervisor) if self._hypervisor != 0 else None
+        )
 
 
 class X86Info(CPUInfo):
@@ -275,9 +440,10 @@ class X86Info(CPUInfo):
     The :class:`CPUInfo` child class for x86 CPUs.
     """
 
-    def __init__(self, c_cpu_id):
-        super().__init__(c_cpu_id)
+    def __init__(self, c_cpu_id, owner=None, raw_data: Optional[CPURawData] = None):
+        super().__init__(c_cpu_id, owner, raw_data)
         self._c_cpu_id = c_cpu_id
+        self._sgx = None
 
     @property
     def family(self) -> int:
@@ -311,8 +477,12 @@ class X86Info(CPUInfo):
 
     @property
     def sgx(self) -> Optional[SGX]:
-        """SGX-related features if present, otherwise :const:`None`."""
-        return SGX(self._c_cpu_id.sgx) if self._c_cpu_id.sgx.present == 1 else None
+        """SGX-related features if present, otherwise (or if not determined) :const:`None`."""
+        if self._c_cpu_id.sgx.present != 1 or "sgx" in self.undetermined:
+            return None
+        if self._sgx is None:
+            self._sgx = SGX(self._c_cpu_id.sgx, self._raw_data)
+        return self._sgx
 
 
 class ARMInfo(CPUInfo):
@@ -320,8 +490,8 @@ class ARMInfo(CPUInfo):
     The :class:`CPUInfo` child class for ARM CPUs.
     """
 
-    def __init__(self, c_cpu_id):
-        super().__init__(c_cpu_id)
+    def __init__(self, c_cpu_id, owner=None, raw_data: Optional[CPURawData] = None):
+        super().__init__(c_cpu_id, owner, raw_data)
         self._c_cpu_id = c_cpu_id
 
     @property
@@ -349,41 +519,80 @@ class SystemInfo:
     """
     Class for holding structured :class:`CPUInfo` information about multiple CPUs.
     Instances of this class can be indexed like lists, each item (of type :class:`CPUInfo`)
-    corresponds to a different :class:`CPUPurpose`.
+    corresponds to a different :class:`CPUPurpose`. Items are created lazily and
+    borrow the memory of the underlying C structure.
     """
 
-    def __init__(self, c_system_id, cpu_info_list: list[CPUInfo]):
-        self._c_system_id = c_system_id
-        self._cpu_info_list = cpu_info_list
-
-    def __del__(self):
-        lib.cpuid_free_system_id(self._c_system_id)
+    def __init__(self, c_system_id, owner=None, raw_data: Optional[CPURawData] = None):
+        if owner is None:
+            self._c_system_id = ffi.gc(c_system_id, lib.cpuid_free_system_id)
+            self._item_owner = self._c_system_id
+        else:
+            # The CPU types were not allocated by the C library,
+            # so they must not be freed by it either.
+            self._c_system_id = c_system_id
+            self._item_owner = owner
+        self._raw_data = raw_data
+        self._cpu_info_list = [None] * c_system_id.num_cpu_types
+        self._purpose_indices = None
 
     def __getitem__(self, index: int) -> CPUInfo:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = check_index(index, len(self))
+        if self._cpu_info_list[index] is None:
+            self._cpu_info_list[index] = CPUInfo.from_c(
+                self._c_system_id.cpu_types + index, self._item_owner, self._raw_data
+            )
         return self._cpu_info_list[index]
 
     def __len__(self) -> int:
         return len(self._cpu_info_list)
 
+    def by_purpose(self, purpose: enums.CPUPurpose) -> Optional[CPUInfo]:
+        """
+        Returns the :class:`CPUInfo` of the CPU type with the given purpose,
+        or :const:`None` if the system has no such CPU type.
+        """
+        if self._purpose_indices is None:
+            self._purpose_indices = {}
+            for index in range(len(self)):
+                self._purpose_indices.setdefault(
+                    self._c_system_id.cpu_types[index].purpose, index
+                )
+        index = self._purpose_indices.get(purpose)
+        return None if index is None else self[index]
+
+    @property
+    def purposes(self) -> list[enums.CPUPurpose]:
+        """The purposes of the CPU types, in the order of indexing."""
+        return [
+            enums.CPUPurpose(self._c_system_id.cpu_types[index].purpose)
+            for index in range(len(self))
+        ]
+
+    @property
+    def c_system_id(self):
+        """Returns the underlying C structure."""
+        return self._c_system_id
+
     @classmethod
-    def from_c(cls, c_system_id):
-        """Create a :class:`SystemInfo` instance from the corresponding C structure."""
-        cpu_id_list = []
-        for c_cpu_id in c_system_id.cpu_types[0 : c_system_id.num_cpu_types]:
-            new_c_cpu_id = ffi.new("struct cpu_id_t *")
-            ffi.memmove(
-                new_c_cpu_id, ffi.addressof(c_cpu_id), ffi.sizeof("struct cpu_id_t")
-            )
-            cpu_id_list.append(CPUInfo.from_c(new_c_cpu_id))
-        return cls(c_system_id, cpu_id_list)
+    def from_c(cls, c_system_id, owner=None, raw_data: Optional[CPURawData] = None):
+        """
+        Create a :class:`SystemInfo` instance from the corresponding C structure.
+        If the CPU types are not allocated by the C library, `owner` must be
+        an object keeping their memory alive. `raw_data` is the raw data
+        kept by the items (see :attr:`CPUInfo.raw_data`), if known.
+        """
+        return cls(c_system_id, owner, raw_data)
 
     @classmethod
-    def from_all_cpus(cls):
-        """Create a :class:`SystemInfo` instance by indentifying all CPUs."""
-        c_system_id = ffi.new("struct system_id_t *")
-        if lib.cpu_identify_all(ffi.NULL, c_system_id) != 0:
-            raise CLibraryError
-        return cls.from_c(c_system_id)
+    def from_all_cpus(cls, method: CollectionMethod = "affinity"):
+        """
+        Create a :class:`SystemInfo` instance by indentifying all CPUs,
+        collecting their raw data with the given `method` (see :mod:`libcpuid.raw`).
+        """
+        return cls.from_raw_array(CPURawDataArray.from_all_cpus(method))
 
     @classmethod
     def from_raw_array(cls, raw_data_array: CPURawDataArray):
@@ -391,7 +600,7 @@ class SystemInfo:
         c_system_id = ffi.new("struct system_id_t *")
         if lib.cpu_identify_all(raw_data_array.c_cpu_raw_data_array, c_system_id) != 0:
             raise CLibraryError
-        return SystemInfo.from_c(c_system_id)
+        return SystemInfo.from_c(c_system_id, raw_data=_first_raw_data(raw_data_array))
 
     @property
     def l1_data_total_instances(self) -> Optional[int]:
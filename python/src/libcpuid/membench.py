@@ -0,0 +1,341 @@
+"""
+Module providing cache and memory microbenchmarks, which detect the effective
+cache levels of the running machine and check the cache geometry reported by
+:class:`~libcpuid.info.CPUInfo` against them.
+
+The cache sizes decoded from `cpuid` can be wrong or missing (e.g., virtual
+machines often report the caches of the host). The benchmarks sweep working
+sets of increasing sizes, measuring the latency of dependent loads
+(:func:`latency`, chasing pointers in a random cycle) and the streaming read
+bandwidth (:func:`bandwidth`). The latency stays on a plateau while the working
+set fits in a cache level and rises when it does not, so the plateaus give the
+effective levels (:func:`detect_levels`). The loops run in the C library,
+as the overhead of Python would hide the latency of the caches.
+
+.. code-block:: python
+
+   from libcpuid.info import SystemInfo
+   from libcpuid.membench import benchmark_system
+
+   for purpose, report in benchmark_system(SystemInfo.from_all_cpus()).items():
+       for check in report.disagreements:
+           print(purpose, check)
+
+Each CPU type is measured on one of its logical CPUs (taken from
+:attr:`CPUInfo.affinity_mask`), with the calling thread pinned to it.
+Large working sets also miss the TLBs, which adds to their latency,
+and the largest plateau of a sweep is assumed to be the main memory.
+"""
+
+import os
+import statistics
+from typing import Iterable, NamedTuple, Optional
+from libcpuid import enums
+from libcpuid.advisor import DATA_CACHES
+from libcpuid.errors import CLibraryError, LibcpuidError
+from libcpuid.info import CPUInfo, SystemInfo
+from libcpuid._utils import run_on_cpu
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    lib,
+)
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+"""Largest working set of the default sweep, in bytes."""
+
+SIZE_TOLERANCE = 2.0
+"""
+Factor by which a reported cache size may exceed the measured bounds of its
+level, as the latency already rises before a level is full (because of TLB
+misses and of the replacement policy).
+"""
+
+
+def latency(working_set: int, millis: int = 20) -> float:
+    """
+    Measures the average latency of dependent loads over a working set
+    of the given size in bytes, for about `millis` milliseconds.
+    Returns the latency in nanoseconds.
+    """
+    result = lib.cpu_mem_latency(working_set, millis)
+    if result < 0:
+        raise CLibraryError
+    return result / 1000
+
+
+def bandwidth(working_set: int, millis: int = 20) -> int:
+    """
+    Measures the streaming read bandwidth over a working set
+    of the given size in bytes, for about `millis` milliseconds.
+    Returns the bandwidth in MB/s.
+    """
+    result = lib.cpu_mem_bandwidth(working_set, millis)
+    if result < 0:
+        raise CLibraryError
+    return result
+
+
+def default_sizes(max_size: int = DEFAULT_MAX_SIZE) -> list[int]:
+    """
+    Returns the working set sizes of the default sweep: two sizes per
+    power of two (2^n and 3 * 2^(n-1) bytes), from 4 KiB to `max_size`.
+    """
+    sizes = []
+    size = 4096
+    while size <= max_size:
+        sizes.append(size)
+        if size * 3 // 2 <= max_size:
+            sizes.append(size * 3 // 2)
+        size *= 2
+    return sizes
+
+
+class SweepPoint(NamedTuple):
+    """A single measurement of a sweep."""
+
+    size: int
+    """Size of the working set, in bytes."""
+    latency: float
+    """Average latency of dependent loads, in nanoseconds."""
+    bandwidth: Optional[int]
+    """Streaming read bandwidth in MB/s, :const:`None` if not measured."""
+
+
+def sweep(
+    sizes: Optional[Iterable[int]] = None, millis: int = 20, with_bandwidth: bool = True
+) -> list[SweepPoint]:
+    """
+    Measures the latency (and the bandwidth if `with_bandwidth` is set)
+    of each working set size, :func:`default_sizes` by default,
+    spending about `millis` milliseconds on each measurement.
+    """
+    points = []
+    for size in sorted(default_sizes() if sizes is None else sizes):
+        points.append(
+            SweepPoint(
+                size,
+                latency(size, millis),
+                bandwidth(size, millis) if with_bandwidth else None,
+            )
+        )
+    return points
+
+
+class EffectiveLevel(NamedTuple):
+    """A level of the memory hierarchy, as a plateau of latency of a sweep."""
+
+    size: int
+    """Largest working set of the plateau, in bytes."""
+    next_size: Optional[int]
+    """
+    Smallest larger working set of the sweep, which does not fit in the level
+    anymore, :const:`None` if the plateau ends the sweep.
+    """
+    latency: float
+    """Median latency of the plateau, in nanoseconds."""
+    bandwidth: Optional[int]
+    """Median bandwidth of the plateau in MB/s, :const:`None` if not measured."""
+
+
+def _median_bandwidth(points: list[SweepPoint]) -> Optional[int]:
+    values = [point.bandwidth for point in points if point.bandwidth is not None]
+    return int(statistics.median(values)) if values else None
+
+
+def detect_levels(
+    points: Iterable[SweepPoint], threshold: float = 1.5, min_points: int = 3
+) -> list[EffectiveLevel]:
+    """
+    Detects the plateaus of latency of a sweep. A plateau is a run of at least
+    `min_points` consecutive working sets, each having a latency within
+    `threshold` times the median latency of the previous ones. Working sets
+    between plateaus (partly fitting in a level) are skipped.
+    """
+    points = sorted(points)
+    levels = []
+    run = []
+
+    def close_run(next_index: int):
+        if len(run) >= min_points:
+            levels.append(
+                EffectiveLevel(
+                    run[-1].size,
+                    points[next_index].size if next_index < len(points) else None,
+                    statistics.median(point.latency for point in run),
+                    _median_bandwidth(run),
+                )
+            )
+
+    for index, point in enumerate(points):
+        if (
+            run
+            and point.latency <= statistics.median(p.latency for p in run) * threshold
+        ):
+            run.append(point)
+            continue
+        close_run(index)
+        run = [point]
+    close_run(len(points))
+    return levels
+
+
+class CacheCheck(NamedTuple):
+    """Comparison of the size of a cache reported by libcpuid to the measured one."""
+
+    cache: str
+    """Prefix of the :class:`CPUInfo` properties of the cache, e.g., :const:`'l2'`."""
+    reported: Optional[int]
+    """Size reported by libcpuid, in bytes, :const:`None` if not determined."""
+    effective: Optional[EffectiveLevel]
+    """The matching effective level, :const:`None` if none was detected."""
+
+    @property
+    def agrees(self) -> bool:
+        """
+        Whether the reported size lies between the largest working set
+        fitting in the effective level and the next one of the sweep,
+        within :const:`SIZE_TOLERANCE`.
+        """
+        if self.reported is None or self.effective is None:
+            return False
+        if self.reported * SIZE_TOLERANCE < self.effective.size:
+            return False
+        return self.effective.next_size is None or (
+            self.reported <= self.effective.next_size * SIZE_TOLERANCE
+        )
+
+
+class MemoryReport:
+    """Results of the benchmarks of a single CPU type."""
+
+    def __init__(
+        self,
+        cpu_info: CPUInfo,
+        logical_cpu: Optional[int],
+        points: list[SweepPoint],
+        threshold: float = 1.5,
+    ):
+        self._cpu_info = cpu_info
+        self._logical_cpu = logical_cpu
+        self._points = points
+        self._plateaus = detect_levels(points, threshold)
+
+    def __repr__(self) -> str:
+        levels = ", ".join(f"{level.size}B" for level in self.levels)
+        return f"MemoryReport({self.purpose}, levels=[{levels}])"
+
+    @property
+    def cpu_info(self) -> CPUInfo:
+        """The CPU type which was measured."""
+        return self._cpu_info
+
+    @property
+    def purpose(self) -> Optional[enums.CPUPurpose]:
+        """The purpose of the CPU type."""
+        return self._cpu_info.purpose
+
+    @property
+    def logical_cpu(self) -> Optional[int]:
+        """The logical CPU the benchmarks ran on, :const:`None` if not pinned."""
+        return self._logical_cpu
+
+    @property
+    def points(self) -> list[SweepPoint]:
+        """The measurements of the sweep."""
+        return self._points
+
+    @property
+    def levels(self) -> list[EffectiveLevel]:
+        """The effective cache levels, from the innermost one."""
+        return self._plateaus[:-1]
+
+    @property
+    def memory(self) -> Optional[EffectiveLevel]:
+        """The last plateau of the sweep, assumed to be the main memory."""
+        return self._plateaus[-1] if self._plateaus else None
+
+    @property
+    def checks(self) -> list[CacheCheck]:
+        """
+        Compares the data caches reported by libcpuid to the effective levels,
+        matched in order. Caches neither reported nor detected are omitted.
+        """
+        levels = self.levels
+        checks = []
+        for index, cache in enumerate(DATA_CACHES):
+            size_kb = getattr(self._cpu_info, f"{cache}_cache")
+            reported = size_kb * 1024 if size_kb else None
+            effective = levels[index] if index < len(levels) else None
+            if reported is not None or effective is not None:
+                checks.append(CacheCheck(cache, reported, effective))
+        return checks
+
+    @property
+    def disagreements(self) -> list[CacheCheck]:
+        """The checks in which the reported and the measured values disagree."""
+        return [check for check in self.checks if not check.agrees]
+
+
+def _logical_cpus(cpu_info: Optional[CPUInfo]) -> list[int]:
+    mask = int.from_bytes(cpu_info.affinity_mask, "big") if cpu_info else 0
+    return [cpu for cpu in range(mask.bit_length()) if mask >> cpu & 1]
+
+
+def _pick_cpu(cpu_info: Optional[CPUInfo]) -> Optional[int]:
+    """Returns the first logical CPU of the type the process may run on."""
+    cpus = _logical_cpus(cpu_info)
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    allowed = os.sched_getaffinity(0)
+    if not cpus:
+        return min(allowed)
+    for cpu in cpus:
+        if cpu in allowed:
+            return cpu
+    raise LibcpuidError("No logical CPU of the CPU type is available.")
+
+
+def benchmark(
+    cpu_info: Optional[CPUInfo] = None,
+    sizes: Optional[Iterable[int]] = None,
+    millis: int = 20,
+    with_bandwidth: bool = True,
+    threshold: float = 1.5,
+) -> MemoryReport:
+    """
+    Runs a sweep (see :func:`sweep`) on a logical CPU of the given CPU type,
+    pinning the calling thread to it for the duration of the sweep. Without
+    `cpu_info`, the sweep runs on the first logical CPU the process may run on,
+    which is identified there.
+    """
+    logical_cpu = _pick_cpu(cpu_info)
+
+    def run() -> tuple[CPUInfo, list[SweepPoint]]:
+        pinned_info = cpu_info or CPUInfo.from_current_cpu()
+        return pinned_info, sweep(sizes, millis, with_bandwidth)
+
+    if logical_cpu is None:
+        info, points = run()
+    else:
+        info, points = run_on_cpu(logical_cpu, run)
+    return MemoryReport(info, logical_cpu, points, threshold)
+
+
+def benchmark_system(
+    system_info: SystemInfo,
+    sizes: Optional[Iterable[int]] = None,
+    millis: int = 20,
+    with_bandwidth: bool = True,
+    threshold: float = 1.5,
+) -> dict[Optional[enums.CPUPurpose], MemoryReport]:
+    """
+    Runs :func:`benchmark` once per CPU type of a system, returning
+    the reports by purpose (e.g., performance and efficiency cores).
+    """
+    sizes = None if sizes is None else list(sizes)
+    reports = {}
+    for cpu_info in system_info:
+        if cpu_info.purpose not in reports:
+            reports[cpu_info.purpose] = benchmark(
+                cpu_info, sizes, millis, with_bandwidth, threshold
+            )
+    return reports
@@ -0,0 +1,130 @@
+"""
+Module providing fast checks of single CPU features on the current CPU.
+
+Most x86 features are directly encoded in a single `cpuid` bit
+(see :func:`feature_bit`), so checking them only requires running the leaf
+containing that bit, and the leaf with the maximum leaf number (and the vendor,
+for vendor-specific features), instead of collecting all leaves and identifying
+the CPU. The results of `cpuid` are cached per leaf for the whole process.
+Other features (e.g., ARM ones, or ones adjusted by further logic) fall back
+to a full identification of the current CPU, done once per process.
+
+.. code-block:: python
+
+   import libcpuid
+   from libcpuid.enums import CPUFeature
+
+   if libcpuid.has_feature(CPUFeature.AVX2): ...
+"""
+
+import platform
+from functools import cache
+from typing import Iterable, NamedTuple, Optional
+from libcpuid import enums
+from libcpuid._feature_table import FEATURE_BITS
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    ffi,
+    lib,
+)
+
+_X86_MACHINES = ("x86_64", "amd64", "i386", "i486", "i586", "i686", "x86")
+_VENDOR_STRINGS = {
+    b"GenuineIntel": enums.CPUVendor.INTEL,
+    b"AuthenticAMD": enums.CPUVendor.AMD,
+    b"HygonGenuine": enums.CPUVendor.HYGON,
+}
+_EXT_LEAVES = 0x80000000
+
+_leaf_cache: dict[tuple[int, int], tuple[int, int, int, int]] = {}
+
+
+class FeatureBit(NamedTuple):
+    """Location of a feature directly encoded in a single `cpuid` bit."""
+
+    leaf: int
+    subleaf: int
+    register: int
+    """Index of the output register (0 for EAX, 1 for EBX, 2 for ECX, 3 for EDX)."""
+    bit: int
+    vendors: frozenset[enums.CPUVendor]
+    """The vendors the bit has this meaning for, empty for all x86 vendors."""
+
+
+@cache
+def _feature_bits() -> dict[enums.CPUFeature, FeatureBit]:
+    return {
+        enums.CPUFeature[name]: FeatureBit(
+            leaf,
+            subleaf,
+            register,
+            bit,
+            frozenset(enums.CPUVendor[vendor] for vendor in vendors),
+        )
+        for name, (leaf, subleaf, register, bit, vendors) in FEATURE_BITS.items()
+    }
+
+
+def feature_bit(feature: enums.CPUFeature) -> Optional[FeatureBit]:
+    """
+    Returns the location of the given feature, :const:`None` if it is
+    not directly encoded in a single `cpuid` bit.
+    """
+    return _feature_bits().get(feature)
+
+
+@cache
+def _is_x86() -> bool:
+    return platform.machine().lower() in _X86_MACHINES and bool(lib.cpuid_present())
+
+
+def run_leaf(leaf: int, subleaf: int = 0) -> tuple[int, int, int, int]:
+    """
+    Returns the (EAX, EBX, ECX, EDX) output of `cpuid` for the given leaf
+    and subleaf on the current CPU, running it only on the first call.
+    """
+    key = (leaf, subleaf)
+    if key not in _leaf_cache:
+        regs = ffi.new("uint32_t[4]", [leaf, 0, subleaf, 0])
+        lib.cpu_exec_cpuid_ext(regs)
+        _leaf_cache[key] = tuple(regs)
+    return _leaf_cache[key]
+
+
+def clear_cache():
+    """Clears the cached `cpuid` results (e.g., after a live migration)."""
+    _leaf_cache.clear()
+    _identified_features.cache_clear()
+
+
+def _vendor() -> Optional[enums.CPUVendor]:
+    _, ebx, ecx, edx = run_leaf(0)
+    vendor_str = b"".join(reg.to_bytes(4, "little") for reg in (ebx, edx, ecx))
+    return _VENDOR_STRINGS.get(vendor_str)
+
+
+@cache
+def _identified_features() -> frozenset[enums.CPUFeature]:
+    # Imported here to keep `import libcpuid` light.
+    from libcpuid.info import CPUInfo  # pylint: disable=import-outside-toplevel
+
+    return frozenset(CPUInfo.from_current_cpu().features)
+
+
+def has_feature(feature: enums.CPUFeature) -> bool:
+    """Checks whether the current CPU has the given feature."""
+    feature = enums.CPUFeature(feature)
+    location = feature_bit(feature)
+    if location is None or not _is_x86():
+        return feature in _identified_features()
+    if location.vendors and _vendor() not in location.vendors:
+        return False
+    max_leaf = run_leaf(_EXT_LEAVES if location.leaf >= _EXT_LEAVES else 0)[0]
+    if location.leaf > max_leaf:
+        return False
+    regs = run_leaf(location.leaf, location.subleaf)
+    return bool(regs[location.register] >> location.bit & 1)
+
+
+def has_features(features: Iterable[enums.CPUFeature]) -> bool:
+    """Checks whether the current CPU has all of the given features."""
+    return all(has_feature(feature) for feature in features)
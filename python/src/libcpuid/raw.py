@@ -1,45 +1,366 @@
 """
 Module providing access to raw CPU data.
+
+On x86 Linux, the raw data of a given logical CPU can be collected in two ways,
+chosen by the `method` argument of :meth:`CPURawData.from_cpu_core` and
+:meth:`CPURawDataArray.from_all_cpus`:
+
+- :const:`"affinity"` (the default) migrates the calling thread to the CPU
+  and executes `cpuid` there,
+- :const:`"driver"` reads every leaf from the per-CPU cpuid device
+  (:const:`/dev/cpu/N/cpuid`, provided by the ``cpuid`` kernel module)
+  without moving the calling thread, so that all CPUs can be read concurrently,
+- :const:`"auto"` uses the driver if it is available and falls back
+  to switching the affinity otherwise.
+
+The collection of a single CPU can also be restricted to some families of
+leaves (see :class:`~libcpuid.enums.RawLeaves`), which saves most of the
+`cpuid` instructions (each being a hypervisor exit in virtual machines) when
+only, e.g., the vendor, family/model and features are needed.
+
+Raw data can also be built in memory from the output registers of each leaf
+(see :meth:`CPURawData.from_registers`), and copies with some leaves replaced
+can be derived from existing raw data (e.g., toggling a feature or changing
+the model), so that variants of a CPU can be identified without files.
+
+.. code-block:: python
+
+   from libcpuid.enums import CPUFeature
+   from libcpuid.info import CPUInfo
+   from libcpuid.raw import CPURawData
+
+   raw_data = CPURawData.from_registers(
+       {
+           (0, 0): (0xD, 0x756E6547, 0x6C65746E, 0x49656E69),  # GenuineIntel
+           (1, 0): (0xB0671, 0, 0, 0),
+       }
+   )
+   variant = raw_data.with_brand_string("13th Gen Intel(R) Core(TM) i9-13900K")
+   print(CPUInfo.from_raw(variant).cpu_codename)  # Raptor Lake-S (Core i9)
+   variant = variant.with_signature(6, 191).with_feature(CPUFeature.AVX2, False)
 """
 
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Literal, Mapping, Optional, Sequence, Union
+from libcpuid import enums
+from libcpuid.enums import RawLeaves
 from libcpuid.errors import CLibraryError
+from libcpuid._feature_table import FEATURE_BITS
+from libcpuid._utils import check_collection_method, check_index, raw_data_fields
 from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
     lib,
     ffi,
 )
 
+CollectionMethod = Literal["auto", "affinity", "driver"]
+
+Registers = tuple[int, int, int, int]
+"""The output registers of a `cpuid` leaf, as (EAX, EBX, ECX, EDX)."""
+
+RegisterKey = Union[int, str, tuple[Union[int, str], int]]
+"""
+Key of a mapping of registers: a `cpuid` leaf, or a (leaf, subleaf) pair,
+for x86 CPUs, and the name of a field of :const:`struct cpu_raw_data_t`
+(e.g., :const:`'arm_midr'`), or a (name, index) pair, for ARM CPUs.
+A leaf or name alone stands for subleaf or index 0.
+"""
+
+_RegisterMapping = Mapping[RegisterKey, Union[Sequence[int], int]]
+
+_MAX_DRIVER_WORKERS = 32
+
+_EXT_LEAVES = 0x80000000
+_BRAND_LEAVES = range(0x80000002, 0x80000005)
+_SIGNATURE_MASK = 0x0FFF0FFF
+
+# Leaves with subleaves, as collected by get_raw_data_x86() (cpuid_main.c).
+_SUBLEAF_FIELDS = {
+    0x00000004: "intel_fn4",
+    0x0000000B: "intel_fn11",
+    0x00000012: "intel_fn12h",
+    0x00000014: "intel_fn14h",
+    0x8000001D: "amd_fn8000001dh",
+    0x80000026: "amd_fn80000026h",
+}
+
+
+def _read_with_driver(
+    c_cpu_raw_data, logical_cpu: int, leaves: RawLeaves = RawLeaves.ALL
+):
+    if lib.cpuid_get_raw_data_core_driver_leaves(c_cpu_raw_data, logical_cpu, leaves):
+        raise CLibraryError
+
+
+def _leaf_rows(leaf: int, subleaf: int) -> list[tuple[str, int]]:
+    """
+    Returns the rows of :const:`struct cpu_raw_data_t` holding a leaf, as
+    (field name, row index) pairs. Like when collecting the raw data, subleaf 0
+    is stored with the other leaves, and leaves with subleaves are also stored
+    in their own field.
+    """
+    fields = raw_data_fields()
+    rows = []
+    if subleaf == 0:
+        if 0 <= leaf < fields["basic_cpuid"].num_rows:
+            rows.append(("basic_cpuid", leaf))
+        elif 0 <= leaf - _EXT_LEAVES < fields["ext_cpuid"].num_rows:
+            rows.append(("ext_cpuid", leaf - _EXT_LEAVES))
+    name = _SUBLEAF_FIELDS.get(leaf)
+    if name is not None and 0 <= subleaf < fields[name].num_rows:
+        rows.append((name, subleaf))
+    if not rows:
+        raise ValueError(
+            f"Leaf 0x{leaf:X}, subleaf {subleaf} cannot be stored in the raw data."
+        )
+    return rows
+
+
+def _check_arm_register(name: str, index: int):
+    field = raw_data_fields().get(name)
+    if not name.startswith("arm_") or field is None or not 0 <= index < field.num_rows:
+        raise ValueError(f"Unknown register {name}[{index}].")
+
+
+def _write_registers(c_cpu_raw_data, registers: _RegisterMapping):
+    """Writes a mapping of registers (see :data:`RegisterKey`) into a C structure."""
+    for key, value in registers.items():
+        leaf_or_name, index = key if isinstance(key, tuple) else (key, 0)
+        if isinstance(leaf_or_name, str):
+            _check_arm_register(leaf_or_name, index)
+            if isinstance(getattr(c_cpu_raw_data, leaf_or_name), int):
+                setattr(c_cpu_raw_data, leaf_or_name, value)
+            else:
+                getattr(c_cpu_raw_data, leaf_or_name)[index] = value
+            continue
+        value = tuple(value)
+        if len(value) != 4:
+            raise ValueError(f"Leaf 0x{leaf_or_name:X} needs 4 registers.")
+        for name, row in _leaf_rows(leaf_or_name, index):
+            getattr(c_cpu_raw_data, name)[row][0:4] = value
+
+
+def _new_raw_data_array(num_raw: int, with_affinity: bool) -> tuple:
+    """Allocates a zeroed raw data array, returning it and the array of its items."""
+    c_raw = ffi.new("struct cpu_raw_data_t[]", num_raw)
+    c_cpu_raw_data_array = ffi.new("struct cpu_raw_data_array_t *")
+    c_cpu_raw_data_array.with_affinity = with_affinity
+    c_cpu_raw_data_array.num_raw = num_raw
+    c_cpu_raw_data_array.raw = c_raw
+    return c_cpu_raw_data_array, c_raw
+
 
 class CPURawData:
     """
     Class holding raw data about a single logical CPU.
+
+    Instances obtained by indexing a :class:`CPURawDataArray` are views
+    into the memory of the array, which is kept alive for as long as
+    the view exists. Use :meth:`copy` to get independent data.
     """
 
-    def __init__(self, c_cpu_raw_data):
+    def __init__(
+        self, c_cpu_raw_data, owner=None, is_local=False, leaves=RawLeaves.ALL
+    ):
         self._c_cpu_raw_data = c_cpu_raw_data
+        self._owner = owner
+        self._is_local = is_local
+        self._leaves = RawLeaves(leaves)
 
     @property
     def c_cpu_raw_data(self):
         """Returns the underlying C structure."""
         return self._c_cpu_raw_data
 
+    @property
+    def is_local(self) -> bool:
+        """
+        Whether the data was collected on the current machine,
+        as opposed to, e.g., being loaded from a file.
+        """
+        return self._is_local
+
+    @property
+    def leaves(self) -> RawLeaves:
+        """
+        The families of leaves which were collected. The others are zero
+        and the fields decoded from them are not determined.
+        """
+        return self._leaves
+
+    def copy(self):
+        """Returns a :class:`CPURawData` instance owning a copy of the raw data."""
+        c_cpu_raw_data = ffi.new("struct cpu_raw_data_t *")
+        ffi.memmove(
+            c_cpu_raw_data, self._c_cpu_raw_data, ffi.sizeof("struct cpu_raw_data_t")
+        )
+        return CPURawData(c_cpu_raw_data, is_local=self._is_local, leaves=self._leaves)
+
+    def get_registers(self, leaf: int, subleaf: int = 0) -> Registers:
+        """Returns the output registers of a `cpuid` leaf."""
+        name, row = _leaf_rows(leaf, subleaf)[0]
+        return tuple(getattr(self._c_cpu_raw_data, name)[row])
+
+    def registers(self) -> dict[RegisterKey, Union[Registers, int]]:
+        """
+        Returns the non-zero leaves by (leaf, subleaf) and the non-zero ARM
+        registers by (name, index), as accepted by :meth:`from_registers`.
+        """
+        c_cpu_raw_data = self._c_cpu_raw_data
+        registers = {}
+        for name, first_leaf in (("basic_cpuid", 0), ("ext_cpuid", _EXT_LEAVES)):
+            for row, values in enumerate(getattr(c_cpu_raw_data, name)):
+                if any(values):
+                    registers[(first_leaf + row, 0)] = tuple(values)
+        for leaf, name in _SUBLEAF_FIELDS.items():
+            for subleaf, values in enumerate(getattr(c_cpu_raw_data, name)):
+                if any(values):
+                    registers.setdefault((leaf, subleaf), tuple(values))
+        for name, field in raw_data_fields().items():
+            if not name.startswith("arm_"):
+                continue
+            value = getattr(c_cpu_raw_data, name)
+            values = [value] if isinstance(value, int) else list(value)
+            for index in range(field.num_rows):
+                if values[index]:
+                    registers[(name, index)] = values[index]
+        return registers
+
+    def _with_max_leaf(self, leaf: int) -> dict[RegisterKey, Registers]:
+        """
+        Returns the registers raising the maximum leaf (EAX of leaf 0 or 80000000h)
+        to the given leaf, if needed, so that the library reads it.
+        """
+        first_leaf = _EXT_LEAVES if leaf >= _EXT_LEAVES else 0
+        eax, ebx, ecx, edx = self.get_registers(first_leaf)
+        if eax >= leaf:
+            return {}
+        return {first_leaf: (leaf, ebx, ecx, edx)}
+
+    def with_registers(self, registers: _RegisterMapping):
+        """
+        Returns a copy of the raw data (see :meth:`copy`) in which
+        the given registers (see :meth:`from_registers`) are replaced.
+        """
+        raw_data = self.copy()
+        _write_registers(raw_data.c_cpu_raw_data, registers)
+        return raw_data
+
+    def with_feature(self, feature: enums.CPUFeature, present: bool = True):
+        """
+        Returns a copy of the raw data in which the `cpuid` bit of the given
+        feature is set or cleared, raising the maximum leaf if needed.
+        Raises :class:`ValueError` if the feature is not directly encoded
+        in a single bit (see :func:`libcpuid.probe.feature_bit`).
+        """
+        location = FEATURE_BITS.get(feature.name)
+        if location is None:
+            raise ValueError(f"{feature} is not encoded in a single cpuid bit.")
+        leaf, subleaf, register, bit, _ = location
+        values = list(self.get_registers(leaf, subleaf))
+        if present:
+            values[register] |= 1 << bit
+        else:
+            values[register] &= ~(1 << bit)
+        return self.with_registers(
+            {**self._with_max_leaf(leaf), (leaf, subleaf): values}
+        )
+
+    def with_signature(self, family: int, model: int, stepping: Optional[int] = None):
+        """
+        Returns a copy of the raw data with the given display family and model
+        (see :attr:`CPUInfo.ext_family <libcpuid.info.CPUInfo.ext_family>` and
+        :attr:`CPUInfo.ext_model <libcpuid.info.CPUInfo.ext_model>`), and
+        stepping if given, encoded into the signature (EAX of leaf 1).
+        """
+        eax, ebx, ecx, edx = self.get_registers(1)
+        if stepping is None:
+            stepping = eax & 0xF
+        base_family = min(family, 0xF)
+        if not (0 <= family - base_family <= 0xFF and 0 <= model <= 0xFF):
+            raise ValueError(f"Invalid family {family} or model {model}.")
+        if not 0 <= stepping <= 0xF:
+            raise ValueError(f"Invalid stepping {stepping}.")
+        signature = (
+            stepping
+            | (model & 0xF) << 4
+            | base_family << 8
+            | (model >> 4) << 16
+            | (family - base_family) << 20
+        )
+        eax = eax & ~_SIGNATURE_MASK | signature
+        return self.with_registers({1: (eax, ebx, ecx, edx)})
+
+    def with_brand_string(self, brand_str: str):
+        """
+        Returns a copy of the raw data with the given brand string (at most
+        48 bytes, stored in leaves 80000002h to 80000004h), raising the maximum
+        extended leaf if needed.
+        """
+        encoded = brand_str.encode()
+        if len(encoded) > 16 * len(_BRAND_LEAVES):
+            raise ValueError(f"The brand string {brand_str!r} is too long.")
+        values = struct.unpack(
+            f"<{4 * len(_BRAND_LEAVES)}I",
+            encoded.ljust(16 * len(_BRAND_LEAVES), b"\0"),
+        )
+        registers = self._with_max_leaf(_BRAND_LEAVES[-1])
+        for i, leaf in enumerate(_BRAND_LEAVES):
+            registers[leaf] = values[4 * i : 4 * i + 4]
+        return self.with_registers(registers)
+
     def serialize(self, filename: str):
         """Exports the raw data into a provided file."""
         lib.cpuid_serialize_raw_data(self._c_cpu_raw_data, filename.encode())
 
     @classmethod
-    def from_current_cpu(cls):
-        """Creates a :class:`CPURawData` instance by running `cpuid` on the current CPU."""
+    def from_current_cpu(cls, leaves: RawLeaves = RawLeaves.ALL):
+        """
+        Creates a :class:`CPURawData` instance by running `cpuid` on the current CPU,
+        collecting only the given families of `leaves` (e.g., :const:`RawLeaves.QUICK`).
+        """
         c_cpu_raw_data = ffi.new("struct cpu_raw_data_t *")
-        if lib.cpuid_get_raw_data(c_cpu_raw_data) != 0:
+        current_cpu = ffi.cast("logical_cpu_t", -1)
+        if lib.cpuid_get_raw_data_core_leaves(c_cpu_raw_data, current_cpu, leaves):
             raise CLibraryError
-        return cls(c_cpu_raw_data)
+        return cls(c_cpu_raw_data, is_local=True, leaves=leaves)
 
     @classmethod
-    def from_cpu_core(cls, logical_cpu: int):
-        """Creates a :class:`CPURawData` instance by running `cpuid` on the specified CPU."""
+    def from_cpu_core(
+        cls,
+        logical_cpu: int,
+        method: CollectionMethod = "affinity",
+        leaves: RawLeaves = RawLeaves.ALL,
+    ):
+        """
+        Creates a :class:`CPURawData` instance by running `cpuid` on the specified CPU,
+        using the given collection `method` (see :mod:`libcpuid.raw`) and collecting
+        only the given families of `leaves`.
+        """
+        check_collection_method(method)
         c_cpu_raw_data = ffi.new("struct cpu_raw_data_t *")
-        if lib.cpuid_get_raw_data_core(c_cpu_raw_data, logical_cpu) != 0:
+        if method != "affinity":
+            try:
+                _read_with_driver(c_cpu_raw_data, logical_cpu, leaves)
+                return cls(c_cpu_raw_data, is_local=True, leaves=leaves)
+            except CLibraryError:
+                if method == "driver":
+                    raise
+        if lib.cpuid_get_raw_data_core_leaves(c_cpu_raw_data, logical_cpu, leaves):
             raise CLibraryError
+        return cls(c_cpu_raw_data, is_local=True, leaves=leaves)
+
+    @classmethod
+    def from_registers(cls, registers: _RegisterMapping):
+        """
+        Creates a :class:`CPURawData` instance from a mapping of registers:
+        the output registers (see :data:`Registers`) of the given x86 leaves, or
+        the values of the given ARM registers (see :data:`RegisterKey`). The other
+        leaves and registers are zero, as if they were not reported by the CPU.
+        Raises :class:`ValueError` for leaves which cannot be stored.
+        """
+        c_cpu_raw_data = ffi.new("struct cpu_raw_data_t *")
+        _write_registers(c_cpu_raw_data, registers)
         return cls(c_cpu_raw_data)
 
     @classmethod
@@ -56,42 +377,153 @@ class CPURawDataArray:
     Class holding raw data about multiple CPUs.
     Instances of this class can be indexed like lists. each item
     (of type :class:`CPURawData`) holds data about one **logical** CPU.
+    Items are created lazily and borrow the memory of the array.
     """
 
-    def __init__(self, c_cpu_raw_data_array):
-        self._c_cpu_raw_data_array = c_cpu_raw_data_array
-        self._cpu_raw_data_list = [
-            CPURawData(c_cpu_raw_data)
-            for c_cpu_raw_data in self._c_cpu_raw_data_array.raw[
-                0 : self._c_cpu_raw_data_array.num_raw
-            ]
-        ]
-
-    def __del__(self):
-        lib.cpuid_free_raw_data_array(self._c_cpu_raw_data_array)
+    def __init__(self, c_cpu_raw_data_array, owner=None, is_local=False):
+        if owner is None:
+            self._c_cpu_raw_data_array = ffi.gc(
+                c_cpu_raw_data_array, lib.cpuid_free_raw_data_array
+            )
+        else:
+            # The raw data was not allocated by the C library,
+            # so it must not be freed by it either.
+            self._c_cpu_raw_data_array = c_cpu_raw_data_array
+        self._owner = owner
+        self._is_local = is_local
 
     def __getitem__(self, index: int) -> CPURawData:
-        return self._cpu_raw_data_list[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = check_index(index, len(self))
+        return CPURawData(self._c_cpu_raw_data_array.raw + index, self, self._is_local)
 
     def __len__(self) -> int:
-        return len(self._cpu_raw_data_list)
+        return self._c_cpu_raw_data_array.num_raw
 
     @property
     def c_cpu_raw_data_array(self):
         """Returns the underlying C structure."""
         return self._c_cpu_raw_data_array
 
+    @property
+    def is_local(self) -> bool:
+        """
+        Whether the data was collected on the current machine,
+        as opposed to, e.g., being loaded from a file.
+        """
+        return self._is_local
+
+    def copy(self):
+        """Returns a :class:`CPURawDataArray` instance owning a copy of the raw data."""
+        c_cpu_raw_data_array, c_raw = _new_raw_data_array(
+            len(self), self._c_cpu_raw_data_array.with_affinity
+        )
+        ffi.memmove(
+            c_raw,
+            self._c_cpu_raw_data_array.raw,
+            len(self) * ffi.sizeof("struct cpu_raw_data_t"),
+        )
+        return CPURawDataArray(
+            c_cpu_raw_data_array, owner=c_raw, is_local=self._is_local
+        )
+
+    def with_registers(
+        self,
+        registers: _RegisterMapping,
+        cpus: Optional[Iterable[int]] = None,
+    ):
+        """
+        Returns a copy of the raw data array in which the given registers
+        (see :meth:`CPURawData.from_registers`) are replaced for the given
+        logical CPUs (indices of the array), all of them by default.
+        """
+        raw_data_array = self.copy()
+        c_raw = raw_data_array.c_cpu_raw_data_array.raw
+        for cpu in range(len(self)) if cpus is None else cpus:
+            _write_registers(c_raw + check_index(cpu, len(self)), registers)
+        return raw_data_array
+
     def serialize(self, filename: str):
         """Exports the raw data array into a provided file."""
         lib.cpuid_serialize_all_raw_data(self._c_cpu_raw_data_array, filename.encode())
 
     @classmethod
-    def from_all_cpus(cls):
-        """Creates a :class:`CPURawDataArray` instance by running `cpuid` on all CPUs."""
+    def from_all_cpus(cls, method: CollectionMethod = "affinity"):
+        """
+        Creates a :class:`CPURawDataArray` instance by running `cpuid` on all CPUs,
+        using the given collection `method` (see :mod:`libcpuid.raw`).
+        """
+        check_collection_method(method)
+        if method != "affinity":
+            try:
+                return cls._from_all_cpus_with_driver()
+            except CLibraryError:
+                if method == "driver":
+                    raise
         c_cpu_raw_data_array = ffi.new("struct cpu_raw_data_array_t *")
         if lib.cpuid_get_all_raw_data(c_cpu_raw_data_array) != 0:
             raise CLibraryError
-        return cls(c_cpu_raw_data_array)
+        return cls(c_cpu_raw_data_array, is_local=True)
+
+    @classmethod
+    def _from_all_cpus_with_driver(cls):
+        """
+        Reads the raw data of all CPUs through the cpuid device, concurrently.
+        As when switching the affinity, the array ends before the first CPU
+        which cannot be read (e.g., an offline one), but the first CPU must be.
+        """
+        num_cpus = lib.cpuid_get_total_cpus()
+        c_raw = ffi.new("struct cpu_raw_data_t[]", num_cpus)
+
+        def read(logical_cpu: int) -> bool:
+            try:
+                _read_with_driver(c_raw + logical_cpu, logical_cpu)
+            except CLibraryError:
+                if logical_cpu == 0:
+                    raise
+                return False
+            return True
+
+        with ThreadPoolExecutor(min(num_cpus, _MAX_DRIVER_WORKERS)) as executor:
+            results = list(executor.map(read, range(num_cpus)))
+        num_raw = results.index(False) if False in results else num_cpus
+        c_cpu_raw_data_array = ffi.new("struct cpu_raw_data_array_t *")
+        c_cpu_raw_data_array.with_affinity = True
+        c_cpu_raw_data_array.num_raw = num_raw
+        c_cpu_raw_data_array.raw = c_raw
+        return cls(c_cpu_raw_data_array, owner=c_raw, is_local=True)
+
+    @classmethod
+    def from_raw_data(cls, raw_data: Iterable[CPURawData], with_affinity: bool = False):
+        """
+        Creates a :class:`CPURawDataArray` instance owning copies of the given
+        raw data, one per logical CPU. `with_affinity` tells whether the raw data
+        at index `i` belongs to logical CPU `i` (as when collected on all CPUs).
+        """
+        raw_data = list(raw_data)
+        c_cpu_raw_data_array, c_raw = _new_raw_data_array(len(raw_data), with_affinity)
+        for index, item in enumerate(raw_data):
+            ffi.memmove(
+                c_raw + index, item.c_cpu_raw_data, ffi.sizeof("struct cpu_raw_data_t")
+            )
+        return cls(c_cpu_raw_data_array, owner=c_raw)
+
+    @classmethod
+    def from_registers(
+        cls,
+        registers: Iterable[_RegisterMapping],
+        with_affinity: bool = False,
+    ):
+        """
+        Creates a :class:`CPURawDataArray` instance from one mapping of registers
+        per logical CPU (see :meth:`CPURawData.from_registers`).
+        """
+        registers = list(registers)
+        c_cpu_raw_data_array, c_raw = _new_raw_data_array(len(registers), with_affinity)
+        for index, cpu_registers in enumerate(registers):
+            _write_registers(c_raw + index, cpu_registers)
+        return cls(c_cpu_raw_data_array, owner=c_raw)
 
     @classmethod
     def from_file(cls, filename: str):
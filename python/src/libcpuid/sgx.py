@@ -2,7 +2,10 @@
 Module dealing with SGX-related CPU information.
 """
 
+from typing import Optional
 from libcpuid import enums
+from libcpuid.raw import CPURawData
+from libcpuid._utils import raw_data_fields
 from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
     lib,
     ffi,
@@ -28,14 +31,28 @@ class EPC:
         return self._c_epc.length
 
 
+def _num_stored_epc_sections() -> int:
+    """Returns the number of EPC sections stored in :const:`struct cpu_raw_data_t`."""
+    # The first two subleaves of leaf 12h do not describe EPC sections.
+    return raw_data_fields()["intel_fn12h"].num_rows - 2
+
+
 class SGX:
     """
     Class holding the SGX-related information about a CPU.
+
+    If the raw data the CPU was identified from is given, information about
+    the EPC sections is decoded from it; otherwise, or for the sections not
+    stored in the raw data, `cpuid` is executed on the current CPU. The EPC
+    sections of another machine are only available as far as they are stored
+    in its raw data.
     """
 
-    def __init__(self, c_sgx):
+    def __init__(self, c_sgx, raw_data: Optional[CPURawData] = None):
         self._c_sgx = c_sgx
+        self._raw_data = raw_data
         self._features = None
+        self._epc_sections = {}
 
     @property
     def max_enclave_32bit(self) -> int:
@@ -87,10 +104,40 @@ class SGX:
         """
         return self._c_sgx.secs_xfrm.to_bytes(8)
 
+    @property
+    def num_available_epc_sections(self) -> int:
+        """
+        The number of EPC sections whose information is available. Smaller than
+        :attr:`num_epc_sections` only if the raw data comes from another machine
+        and does not store all sections.
+        """
+        if self._raw_data is None or self._raw_data.is_local:
+            return self.num_epc_sections
+        return min(self.num_epc_sections, _num_stored_epc_sections())
+
     def get_epc(self, index: int) -> EPC:
         """Fetches information about a single EPC area given by `index`."""
         if not 0 <= index < self.num_epc_sections:
             raise IndexError(
                 f"Invalid index {index}, the CPU has {self.num_epc_sections} EPC sections."
             )
-        return EPC(lib.cpuid_get_epc(index, ffi.NULL))
+        if index >= self.num_available_epc_sections:
+            raise IndexError(
+                f"EPC section {index} is not stored in the raw data of another machine."
+            )
+        if index not in self._epc_sections:
+            c_cpu_raw_data = (
+                ffi.NULL if self._raw_data is None else self._raw_data.c_cpu_raw_data
+            )
+            self._epc_sections[index] = EPC(lib.cpuid_get_epc(index, c_cpu_raw_data))
+        return self._epc_sections[index]
+
+    @property
+    def epc_sections(self) -> list[EPC]:
+        """Information about all available EPC sections."""
+        return [self.get_epc(index) for index in range(self.num_available_epc_sections)]
+
+    @property
+    def total_epc_size(self) -> int:
+        """The total length of all available EPC sections."""
+        return sum(epc.length for epc in self.epc_sections)
@@ -0,0 +1,194 @@
+"""
+Module providing a compact in-memory representation of raw CPU data.
+
+A :const:`struct cpu_raw_data_t` reserves space for every leaf family,
+whether it is used or not. The classes in this module only keep the
+populated rows (register quadruples of x86 leaves or single ARM registers)
+and share identical per-CPU blocks, which makes them suitable for keeping
+raw data of many machines in memory. They can be expanded back into
+:class:`CPURawData` and :class:`CPURawDataArray` for identification.
+"""
+
+from typing import Iterator, Optional
+from libcpuid.raw import CPURawData, CPURawDataArray
+from libcpuid._utils import check_index, raw_data_layout
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    ffi,
+)
+
+
+def _encode(c_cpu_raw_data) -> bytes:
+    """
+    Encodes the populated rows of a C raw data structure into a sequence
+    of records, each consisting of the field index, the row index and the row.
+    """
+    buffer = ffi.buffer(c_cpu_raw_data)
+    records = []
+    for field_index, field in enumerate(raw_data_layout()):
+        zero_row = bytes(field.row_size)
+        for row_index in range(field.num_rows):
+            start = field.offset + row_index * field.row_size
+            row = buffer[start : start + field.row_size]
+            if row != zero_row:
+                records.append(bytes((field_index, row_index)) + row)
+    return b"".join(records)
+
+
+def _decode_into(block: bytes, c_cpu_raw_data):
+    """Writes the rows of an encoded block into a zeroed C raw data structure."""
+    layout = raw_data_layout()
+    buffer = ffi.buffer(c_cpu_raw_data)
+    position = 0
+    while position < len(block):
+        field = layout[block[position]]
+        start = field.offset + block[position + 1] * field.row_size
+        position += 2
+        buffer[start : start + field.row_size] = block[
+            position : position + field.row_size
+        ]
+        position += field.row_size
+
+
+def _iter_block(block: bytes) -> Iterator[tuple[str, int, bytes]]:
+    layout = raw_data_layout()
+    position = 0
+    while position < len(block):
+        field = layout[block[position]]
+        row_index = block[position + 1]
+        position += 2
+        yield field.name, row_index, block[position : position + field.row_size]
+        position += field.row_size
+
+
+class SparseRawData:
+    """
+    Compact, immutable counterpart of :class:`CPURawData`
+    holding only the populated rows of the raw data.
+    """
+
+    __slots__ = ("_block",)
+
+    def __init__(self, block: bytes):
+        self._block = block
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SparseRawData) and self._block == other._block
+
+    def __hash__(self) -> int:
+        return hash(self._block)
+
+    @property
+    def block(self) -> bytes:
+        """The encoded populated rows."""
+        return self._block
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the encoded rows in bytes."""
+        return len(self._block)
+
+    def rows(self) -> Iterator[tuple[str, int, bytes]]:
+        """
+        Iterates over the populated rows, yielding the name of the
+        :const:`struct cpu_raw_data_t` field, the row index and the raw
+        (native-endian) content of the row.
+        """
+        return _iter_block(self._block)
+
+    def to_raw(self) -> CPURawData:
+        """Expands the data into a new :class:`CPURawData` instance."""
+        c_cpu_raw_data = ffi.new("struct cpu_raw_data_t *")
+        _decode_into(self._block, c_cpu_raw_data)
+        return CPURawData(c_cpu_raw_data)
+
+    @classmethod
+    def from_raw(cls, raw_data: CPURawData, pool: Optional[dict] = None):
+        """
+        Creates a :class:`SparseRawData` instance from an instance of :class:`CPURawData`.
+        If a `pool` dictionary is given, identical blocks are shared through it.
+        """
+        block = _encode(raw_data.c_cpu_raw_data)
+        if pool is not None:
+            block = pool.setdefault(block, block)
+        return cls(block)
+
+
+class SparseRawDataArray:
+    """
+    Compact, immutable counterpart of :class:`CPURawDataArray`.
+    Instances of this class can be indexed like lists, each item
+    is a :class:`SparseRawData` instance. Logical CPUs with identical
+    raw data share the same block.
+    """
+
+    __slots__ = ("_blocks", "_with_affinity")
+
+    def __init__(self, blocks: tuple[bytes, ...], with_affinity: bool):
+        self._blocks = blocks
+        self._with_affinity = with_affinity
+
+    def __getitem__(self, index: int) -> SparseRawData:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return SparseRawData(self._blocks[check_index(index, len(self))])
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def with_affinity(self) -> bool:
+        """Whether the raw data was collected per logical CPU using CPU affinity."""
+        return self._with_affinity
+
+    def _unique_blocks(self) -> list[bytes]:
+        return list({id(block): block for block in self._blocks}.values())
+
+    @property
+    def num_unique(self) -> int:
+        """The number of distinct per-CPU blocks."""
+        return len(self._unique_blocks())
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the distinct encoded blocks in bytes."""
+        return sum(len(block) for block in self._unique_blocks())
+
+    def to_raw_array(self) -> CPURawDataArray:
+        """Expands the data into a new :class:`CPURawDataArray` instance."""
+        num_raw = len(self._blocks)
+        c_raw = ffi.new("struct cpu_raw_data_t[]", max(num_raw, 1))
+        expanded = {}
+        for index, block in enumerate(self._blocks):
+            if id(block) in expanded:
+                ffi.memmove(
+                    c_raw + index,
+                    c_raw + expanded[id(block)],
+                    ffi.sizeof("struct cpu_raw_data_t"),
+                )
+            else:
+                _decode_into(block, c_raw + index)
+                expanded[id(block)] = index
+        c_cpu_raw_data_array = ffi.new("struct cpu_raw_data_array_t *")
+        c_cpu_raw_data_array.with_affinity = self._with_affinity
+        c_cpu_raw_data_array.num_raw = num_raw
+        c_cpu_raw_data_array.raw = c_raw
+        return CPURawDataArray(c_cpu_raw_data_array, owner=c_raw)
+
+    @classmethod
+    def from_raw_array(
+        cls, raw_data_array: CPURawDataArray, pool: Optional[dict] = None
+    ):
+        """
+        Creates a :class:`SparseRawDataArray` instance from an instance of
+        :class:`CPURawDataArray`. Identical blocks are always shared within the
+        array; passing the same `pool` dictionary to several calls also shares
+        them between arrays.
+        """
+        if pool is None:
+            pool = {}
+        c_cpu_raw_data_array = raw_data_array.c_cpu_raw_data_array
+        blocks = []
+        for index in range(c_cpu_raw_data_array.num_raw):
+            block = _encode(c_cpu_raw_data_array.raw + index)
+            blocks.append(pool.setdefault(block, block))
+        return cls(tuple(blocks), bool(c_cpu_raw_data_array.with_affinity))
@@ -0,0 +1,133 @@
+"""
+Module providing access to the opt-in instrumentation of the libcpuid library,
+which measures the time spent in the phases of raw data collection and
+identification (see :class:`~libcpuid.enums.StatsPhase`) and counts the
+executed `cpuid` instructions. The counters are kept per thread.
+"""
+
+from typing import NamedTuple
+from libcpuid import enums
+from libcpuid.errors import CLibraryError
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    lib,
+    ffi,
+)
+
+
+class PhaseStats(NamedTuple):
+    """Counters of a single phase."""
+
+    count: int
+    """Number of times the phase was entered."""
+    duration_ns: int
+    """Total time spent in the phase, in nanoseconds."""
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean time spent in one entry of the phase, in nanoseconds."""
+        return self.duration_ns / self.count if self.count else 0.0
+
+
+class Stats:
+    """Snapshot of the instrumentation counters."""
+
+    def __init__(self, phases: dict[enums.StatsPhase, PhaseStats], num_cpuid: int):
+        self._phases = phases
+        self._num_cpuid = num_cpuid
+
+    def __getitem__(self, phase: enums.StatsPhase) -> PhaseStats:
+        return self._phases[phase]
+
+    def __sub__(self, other: "Stats") -> "Stats":
+        return Stats(
+            {
+                phase: PhaseStats(
+                    stats.count - other[phase].count,
+                    stats.duration_ns - other[phase].duration_ns,
+                )
+                for phase, stats in self._phases.items()
+            },
+            self._num_cpuid - other.num_cpuid,
+        )
+
+    def __repr__(self) -> str:
+        phases = ", ".join(
+            f"{phase}={stats.count}x/{stats.duration_ns}ns"
+            for phase, stats in self._phases.items()
+        )
+        return f"Stats({phases}, num_cpuid={self._num_cpuid})"
+
+    @property
+    def phases(self) -> dict[enums.StatsPhase, PhaseStats]:
+        """The counters of all phases."""
+        return self._phases
+
+    @property
+    def num_cpuid(self) -> int:
+        """The number of executed `cpuid` instructions."""
+        return self._num_cpuid
+
+    @classmethod
+    def from_c(cls, c_stats):
+        """Creates a :class:`Stats` instance from the corresponding C structure."""
+        return cls(
+            {
+                phase: PhaseStats(
+                    c_stats.phases[phase].count, c_stats.phases[phase].duration_ns
+                )
+                for phase in enums.StatsPhase
+            },
+            c_stats.num_cpuid,
+        )
+
+
+def enable(enabled: bool = True):
+    """Enables (or disables) the instrumentation in the calling thread."""
+    lib.cpuid_enable_stats(int(enabled))
+
+
+def is_enabled() -> bool:
+    """Returns whether the instrumentation is enabled in the calling thread."""
+    return bool(lib.cpuid_stats_enabled())
+
+
+def disable():
+    """Disables the instrumentation in the calling thread, keeping the counters."""
+    lib.cpuid_enable_stats(0)
+
+
+def reset():
+    """Resets the counters of the calling thread to zero."""
+    lib.cpuid_reset_stats()
+
+
+def get() -> Stats:
+    """Returns a snapshot of the counters of the calling thread."""
+    c_stats = ffi.new("struct cpuid_stats_t *")
+    if lib.cpuid_get_stats(c_stats) != 0:
+        raise CLibraryError
+    return Stats.from_c(c_stats)
+
+
+class Collector:
+    """
+    Context manager enabling the instrumentation for the duration of
+    the ``with`` block and restoring its previous state afterwards. The counters
+    collected within the block are then available as :attr:`stats`.
+    """
+
+    def __init__(self):
+        self._start = None
+        self._was_enabled = False
+        self.stats = None
+        """The :class:`Stats` collected within the ``with`` block."""
+
+    def __enter__(self):
+        self._start = get()
+        self._was_enabled = is_enabled()
+        enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        enable(self._was_enabled)
+        self.stats = get() - self._start
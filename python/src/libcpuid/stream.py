@@ -0,0 +1,200 @@
+"""
+Module providing streaming readers of raw CPUID dumps (as written by
+:meth:`CPURawDataArray.serialize` or ``cpuid_tool --save``).
+
+Dumps are read from text streams containing one or more concatenated dumps
+(each starting with a :const:`version=` header), from gzip-compressed streams
+and from tar archives (plain or gzip-compressed). The input is read sequentially
+and each dump is parsed directly into a :class:`CPURawDataArray` as soon as it
+is complete, so memory use is bounded by the size of a single dump and no
+temporary files are created.
+"""
+
+import gzip
+import io
+import os
+import re
+import struct
+import tarfile
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Union
+from libcpuid.raw import CPURawDataArray
+from libcpuid._utils import raw_data_fields
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    ffi,
+)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_TAR_MAGIC_OFFSET = 257
+_TAR_MAGIC = b"ustar"
+_RESULTS_SEPARATOR = "-" * 80
+_LOGICAL_CPU = re.compile(r"_+ Logical CPU #(\d+) _+")
+_REGISTERS = re.compile(
+    r"(?:(?P<array>[a-z0-9_]+)\[(?P<index>\d+)\]|(?P<name>[a-z0-9_]*[a-z_])(?P<suffix>\d*))="
+    r"(?P<values>[0-9a-fA-F]+(?: +[0-9a-fA-F]+)*)"
+)
+_ITEM_FORMATS = {4: "I", 8: "Q"}
+
+
+class RawDump(NamedTuple):
+    """A single raw dump read by :func:`iter_raw_dumps`."""
+
+    source: str
+    """Name of the archive member (or file) containing the dump."""
+    index: int
+    """Index of the dump within its source (for concatenated dumps)."""
+    raw_data_array: CPURawDataArray
+    """The parsed raw data."""
+
+
+class _DumpBuilder:
+    """Accumulates the lines of a single dump into per-CPU buffers."""
+
+    def __init__(self):
+        self._buffers = []
+        self._current = None
+        self._with_affinity = False
+
+    def _select_cpu(self, logical_cpu: int):
+        size = ffi.sizeof("struct cpu_raw_data_t")
+        while len(self._buffers) <= logical_cpu:
+            self._buffers.append(bytearray(size))
+        self._current = self._buffers[logical_cpu]
+
+    def add_line(self, line: str):
+        """Parses a single (non-empty) line of the dump."""
+        match = _LOGICAL_CPU.fullmatch(line)
+        if match is not None:
+            self._with_affinity = True
+            self._select_cpu(int(match[1]))
+            return
+        match = _REGISTERS.fullmatch(line)
+        if match is None:
+            return
+        field = raw_data_fields().get(match["array"] or match["name"])
+        row_index = int(match["index"] or match["suffix"] or 0)
+        if field is None or row_index >= field.num_rows:
+            return
+        values = [int(value, 16) for value in match["values"].split()]
+        item_format = _ITEM_FORMATS.get(field.row_size // len(values))
+        if item_format is None or field.row_size % len(values):
+            return
+        if self._current is None:
+            self._select_cpu(0)
+        start = field.offset + row_index * field.row_size
+        try:
+            struct.pack_into(
+                f"={len(values)}{item_format}", self._current, start, *values
+            )
+        except struct.error:
+            pass
+
+    def __bool__(self) -> bool:
+        return bool(self._buffers)
+
+    def build(self) -> CPURawDataArray:
+        """Creates a :class:`CPURawDataArray` owning a copy of the parsed data."""
+        c_raw = ffi.new("struct cpu_raw_data_t[]", len(self._buffers))
+        for index, buffer in enumerate(self._buffers):
+            ffi.memmove(c_raw + index, buffer, len(buffer))
+        c_cpu_raw_data_array = ffi.new("struct cpu_raw_data_array_t *")
+        c_cpu_raw_data_array.with_affinity = self._with_affinity
+        c_cpu_raw_data_array.num_raw = len(self._buffers)
+        c_cpu_raw_data_array.raw = c_raw
+        return CPURawDataArray(c_cpu_raw_data_array, owner=c_raw)
+
+
+def parse_dumps(lines: Iterable[str]) -> Iterator[CPURawDataArray]:
+    """
+    Parses raw dumps in the libcpuid text format from an iterable of lines,
+    yielding a :class:`CPURawDataArray` for each dump. Dumps are separated
+    by their :const:`version=` headers; test results following a dump
+    (as in the files of the test suite) are skipped.
+    """
+    builder = _DumpBuilder()
+    skipping = False
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("version="):
+            if builder:
+                yield builder.build()
+            builder = _DumpBuilder()
+            skipping = False
+        elif line == _RESULTS_SEPARATOR:
+            skipping = True
+        elif not skipping:
+            builder.add_line(line)
+    if builder:
+        yield builder.build()
+
+
+class _PrefixedStream(io.RawIOBase):
+    """
+    Raw stream returning already consumed bytes before the rest of a stream,
+    used to detect the format of non-seekable streams. Closing it does not
+    close the wrapped stream.
+    """
+
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        super().__init__()
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            data = self._prefix[: len(buffer)]
+            self._prefix = self._prefix[len(data) :]
+        else:
+            data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _read_head(stream: BinaryIO, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _iter_stream(stream: BinaryIO, source: str) -> Iterator[RawDump]:
+    head = _read_head(stream, _TAR_MAGIC_OFFSET + len(_TAR_MAGIC))
+    stream = io.BufferedReader(_PrefixedStream(head, stream))
+    if head.startswith(_GZIP_MAGIC):
+        with gzip.GzipFile(fileobj=stream, mode="rb") as decompressed:
+            yield from _iter_stream(decompressed, source)
+    elif head[_TAR_MAGIC_OFFSET:] == _TAR_MAGIC:
+        with tarfile.open(fileobj=stream, mode="r|") as archive:
+            for member in archive:
+                if member.isfile():
+                    yield from _iter_stream(archive.extractfile(member), member.name)
+    else:
+        text = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+        for index, raw_data_array in enumerate(parse_dumps(text)):
+            yield RawDump(source, index, raw_data_array)
+
+
+def iter_raw_dumps(
+    source: Union[str, os.PathLike, BinaryIO],
+) -> Iterator[RawDump]:
+    """
+    Iterates over the raw dumps in a file, given by its path or as a binary
+    file object. The file may be a text file with one or more concatenated
+    dumps, gzip-compressed, or a tar archive (plain or gzip-compressed) of such
+    files. The format is detected from the content, and non-seekable streams
+    (e.g., pipes or sockets) are supported.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield from _iter_stream(stream, os.fspath(source))
+    else:
+        yield from _iter_stream(source, str(getattr(source, "name", "")))
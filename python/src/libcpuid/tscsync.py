@@ -0,0 +1,288 @@
+"""
+Module checking whether the timestamp counters (TSC) of the logical CPUs are
+synchronized, i.e., whether values returned by :func:`~libcpuid.clock.exec_rdtsc`
+on different CPUs can be compared with each other.
+
+This requires an invariant TSC (ticking at a constant rate in all power states,
+see :attr:`~libcpuid.enums.CPUFeature.CONSTANT_TSC`), and TSCs started in sync
+on all cores and packages. The latter is checked by a ping-pong between
+a reference CPU and each other CPU: the reference reads its TSC, signals the
+other CPU, which reads its own TSC and replies, and the reference reads its TSC
+again. If the TSCs are synchronized, the TSC of the other CPU always lies
+between the two TSCs of the reference, otherwise a message sent between
+the two CPUs can appear to be received before it was sent. The offset between
+the TSCs is bounded by the tightest round trips, and its change between two
+passes over all CPUs gives the drift.
+
+.. code-block:: python
+
+   from libcpuid.tscsync import check_tsc_sync
+
+   report = check_tsc_sync()
+   if not report.safe:
+       print("TSC values of different CPUs are not comparable:", report)
+"""
+
+import os
+import threading
+import time
+from typing import Iterable, NamedTuple, Optional
+from libcpuid import probe
+from libcpuid.enums import CPUFeature
+from libcpuid.errors import CLibraryError, LibcpuidError
+from libcpuid._utils import run_on_cpu
+from libcpuid._libcpuid_cffi import (  # pylint: disable=no-name-in-module, import-error
+    lib,
+    ffi,
+)
+
+_SHARED_SIZE = 16
+
+
+class TSCSample(NamedTuple):
+    """A single round trip of a ping-pong, in TSC cycles."""
+
+    sent: int
+    """TSC of the reference CPU before its request."""
+    remote: int
+    """TSC of the other CPU when it received the request."""
+    received: int
+    """TSC of the reference CPU after the reply."""
+
+
+class OffsetBounds(NamedTuple):
+    """Bounds of the offset of the TSC of a CPU from the reference, in cycles."""
+
+    low: int
+    high: int
+    round_trip: int
+    """The shortest round trip, in cycles."""
+    timestamp: int
+    """TSC of the reference CPU in the middle of the measurement."""
+
+    @property
+    def offset(self) -> float:
+        """The estimated offset, in the middle of the bounds."""
+        return (self.low + self.high) / 2
+
+    @property
+    def consistent(self) -> bool:
+        """
+        Whether a constant offset explains all the rounds,
+        which is not the case if the offset changed during the measurement.
+        """
+        return self.low <= self.high
+
+
+def offset_bounds(samples: Iterable[TSCSample]) -> OffsetBounds:
+    """
+    Bounds the offset (remote TSC minus reference TSC) from the samples of
+    a ping-pong. Each round bounds it by the round trip, and the tightest
+    bounds of all rounds are kept.
+    """
+    samples = list(samples)
+    if not samples:
+        raise ValueError("No samples.")
+    return OffsetBounds(
+        max(sample.remote - sample.received for sample in samples),
+        min(sample.remote - sample.sent for sample in samples),
+        min(sample.received - sample.sent for sample in samples),
+        samples[len(samples) // 2].sent,
+    )
+
+
+def ping_pong(
+    reference: int, logical_cpu: int, rounds: int = 200, timeout: float = 1.0
+) -> list[TSCSample]:
+    """
+    Runs a ping-pong of `rounds` round trips between the `reference`
+    and another logical CPU, pinning the calling thread to the former
+    and a new thread to the latter. Each side waits at most `timeout`
+    seconds for the other one in each round.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        raise LibcpuidError("Pinning threads to CPUs is not supported.")
+    shared = ffi.new("uint64_t[]", _SHARED_SIZE)
+    c_samples = ffi.new("uint64_t[]", 3 * rounds)
+    timeout_ms = max(1, int(timeout * 1000))
+    errors = []
+    pinned = threading.Event()
+
+    def reply():
+        try:
+            os.sched_setaffinity(0, {logical_cpu})
+        except OSError as error:
+            errors.append(error)
+            return
+        finally:
+            pinned.set()
+        if lib.cpu_tsc_ping_pong(shared, 1, rounds, ffi.NULL, timeout_ms):
+            errors.append(CLibraryError())
+
+    def send() -> int:
+        thread = threading.Thread(target=reply, name="libcpuid-tsc-pong")
+        thread.start()
+        try:
+            pinned.wait()
+            if errors:
+                return -1
+            return lib.cpu_tsc_ping_pong(shared, 0, rounds, c_samples, timeout_ms)
+        finally:
+            thread.join()
+
+    if run_on_cpu(reference, send):
+        if errors:
+            raise errors[0]
+        raise CLibraryError
+    return [TSCSample(*c_samples[3 * i : 3 * i + 3]) for i in range(rounds)]
+
+
+class TSCOffset(NamedTuple):
+    """The TSC of a logical CPU compared to the reference one."""
+
+    logical_cpu: int
+    first: OffsetBounds
+    """The offset bounds of the first pass."""
+    second: Optional[OffsetBounds]
+    """The offset bounds of the second pass, :const:`None` if it did not run."""
+    tolerance: int
+    """The offset tolerated, in cycles."""
+
+    @property
+    def offset(self) -> float:
+        """The estimated offset in cycles (of the last pass)."""
+        return (self.second or self.first).offset
+
+    @property
+    def drift(self) -> Optional[float]:
+        """
+        The change of the offset between the passes, in cycles per million
+        cycles of the reference (ppm), :const:`None` without a second pass.
+        """
+        if self.second is None or self.second.timestamp == self.first.timestamp:
+            return None
+        return (
+            (self.second.offset - self.first.offset)
+            / (self.second.timestamp - self.first.timestamp)
+            * 1_000_000
+        )
+
+    @property
+    def drifting(self) -> bool:
+        """Whether the offset changed between the passes more than the bounds allow."""
+        if self.second is None:
+            return False
+        uncertainty = (
+            abs(self.first.high - self.first.low)
+            + abs(self.second.high - self.second.low)
+        ) / 2
+        return abs(self.second.offset - self.first.offset) > (
+            uncertainty + self.tolerance
+        )
+
+    @property
+    def synchronized(self) -> bool:
+        """
+        Whether a zero offset (within the tolerance) is consistent
+        with all the rounds of all the passes, and there is no drift.
+        """
+        return not self.drifting and all(
+            bounds.low - self.tolerance <= 0 <= bounds.high + self.tolerance
+            for bounds in (self.first, self.second)
+            if bounds is not None
+        )
+
+
+class TSCSyncReport(NamedTuple):
+    """The result of :func:`check_tsc_sync`."""
+
+    invariant: bool
+    """Whether the CPU reports an invariant TSC."""
+    reference: int
+    """The reference logical CPU."""
+    offsets: list[TSCOffset]
+    """The comparisons of the checked CPUs to the reference."""
+    unchecked: list[int]
+    """
+    The logical CPUs which were not checked within the time limit,
+    or whose ping-pong failed (e.g., because they went offline).
+    """
+    elapsed: float
+    """The time spent, in seconds."""
+
+    @property
+    def synchronized(self) -> bool:
+        """Whether all the checked CPUs are synchronized with the reference."""
+        return all(offset.synchronized for offset in self.offsets)
+
+    @property
+    def safe(self) -> bool:
+        """
+        Whether TSC values read on different logical CPUs can be compared:
+        the TSC is invariant and all the CPUs were checked and found synchronized.
+        """
+        return self.invariant and not self.unchecked and self.synchronized
+
+
+def _has_invariant_tsc() -> bool:
+    try:
+        return probe.has_feature(CPUFeature.CONSTANT_TSC)
+    except LibcpuidError:
+        return False
+
+
+def check_tsc_sync(  # pylint: disable=too-many-arguments
+    cpus: Optional[Iterable[int]] = None,
+    *,
+    reference: Optional[int] = None,
+    rounds: int = 200,
+    max_time: float = 2.0,
+    tolerance: int = 0,
+    timeout: float = 1.0,
+) -> TSCSyncReport:
+    """
+    Compares the TSC of the given logical CPUs (all the ones the process may run
+    on by default) to the TSC of the `reference` one (the first of them by
+    default), using a ping-pong of `rounds` round trips per CPU (see
+    :func:`ping_pong`). Two passes are made over the CPUs to measure the drift.
+    CPUs are checked until half of `max_time` (in seconds) is spent, and
+    the second pass stops when `max_time` is spent, so that the runtime stays
+    bounded on large machines. Offsets within `tolerance` cycles are accepted.
+    CPUs whose ping-pong fails are reported as unchecked.
+    """
+    start = time.monotonic()
+    invariant = _has_invariant_tsc()
+    if cpus is None:
+        cpus = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else {0}
+    cpus = sorted(set(cpus))
+    if reference is None:
+        reference = cpus[0]
+    others = [cpu for cpu in cpus if cpu != reference]
+    first = {}
+    failed = set()
+    for cpu in others:
+        if time.monotonic() - start > max_time / 2:
+            break
+        try:
+            first[cpu] = offset_bounds(ping_pong(reference, cpu, rounds, timeout))
+        except (CLibraryError, OSError):
+            failed.add(cpu)
+    second = {}
+    for cpu in first:
+        if time.monotonic() - start > max_time:
+            break
+        try:
+            second[cpu] = offset_bounds(ping_pong(reference, cpu, rounds, timeout))
+        except (CLibraryError, OSError):
+            failed.add(cpu)
+    return TSCSyncReport(
+        invariant,
+        reference,
+        [
+            TSCOffset(cpu, bounds, second.get(cpu), tolerance)
+            for cpu, bounds in first.items()
+            if cpu not in failed
+        ],
+        [cpu for cpu in others if cpu not in first or cpu in failed],
+        time.monotonic() - start,
+    )
@@ -1,11 +1,45 @@
 """Sanity tests for the libcpuid package."""
 
+import gzip
+import io
+import json
 import os
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
+import pytest
 import libcpuid
+from libcpuid import ffi
+from libcpuid.enums import (
+    CPUArchitecture,
+    CPUFeature,
+    CPUFeatureLevel,
+    CPUPurpose,
+    CPUVendor,
+    RawLeaves,
+    StatsPhase,
+)
 from libcpuid.info import CPUInfo, SystemInfo
 from libcpuid.raw import CPURawData, CPURawDataArray
-from libcpuid.errors import CLibraryError
+from libcpuid.sparse import SparseRawDataArray
+from libcpuid.diff import diff_raw, diff_info
+from libcpuid.fleet import FleetIndex
+from libcpuid.export import to_dict, write_jsonl, iter_arrow_batches
+from libcpuid.__main__ import main
+from libcpuid.cache import IdentificationCache
+from libcpuid.stats import Collector
+from libcpuid import stats as stats_module
+from libcpuid.stream import iter_raw_dumps
+from libcpuid.dispatch import DispatchRegistry, level_features
+from libcpuid import probe
+from libcpuid.advisor import advise, advise_system
+from libcpuid import membench
+from libcpuid.hotplug import HotplugWatcher, system_info_from_raw_data
+from libcpuid import tscsync
+from libcpuid import clock
+from libcpuid import codenames
+from libcpuid.errors import CLibraryError, DispatchError
+from libcpuid._utils import raw_data_fields
 
 
 def test_cpu_name_in_vendor_list():
@@ -48,3 +82,794 @@ def test_array_serialization():
         info_from_file = SystemInfo.from_raw_array(CPURawDataArray.from_file(info_file))
         assert len(info) == len(info_from_file)
         assert info[0].features == info_from_file[0].features
+
+
+def test_lazy_views():
+    """
+    Checks that items of raw data arrays and system information
+    stay valid after their parent is dropped, and that copies
+    are independent of the original data.
+    """
+    raw = CPURawDataArray.from_all_cpus()[-1]
+    info = SystemInfo.from_raw_array(CPURawDataArray.from_all_cpus())[0]
+    assert CPUInfo.from_raw(raw).vendor == info.vendor
+    raw_copy = raw.copy()
+    assert raw_copy.c_cpu_raw_data != raw.c_cpu_raw_data
+    assert CPUInfo.from_raw(raw_copy).features == CPUInfo.from_raw(raw).features
+    assert info.copy().features == info.features
+
+
+def test_sparse_round_trip():
+    """
+    Checks that the compact raw data representation
+    expands back into equivalent raw data.
+    """
+    raw_array = CPURawDataArray.from_all_cpus()
+    sparse_array = SparseRawDataArray.from_raw_array(raw_array)
+    assert len(sparse_array) == len(raw_array)
+    assert sparse_array.num_unique <= len(sparse_array)
+    expanded = sparse_array.to_raw_array()
+    for raw, raw_expanded in zip(raw_array, expanded):
+        assert bytes(ffi.buffer(raw.c_cpu_raw_data)) == bytes(
+            ffi.buffer(raw_expanded.c_cpu_raw_data)
+        )
+    info = SystemInfo.from_raw_array(expanded)
+    assert info[0].features == SystemInfo.from_raw_array(raw_array)[0].features
+
+
+def test_diff():
+    """
+    Checks that a CPU does not differ from itself and that
+    clearing a feature bit is reported as a removed feature.
+    """
+    raw = CPURawData.from_current_cpu()
+    info = CPUInfo.from_raw(raw)
+    assert not diff_raw(raw, raw.copy())
+    assert not diff_info(info, CPUInfo.from_raw(raw.copy()))
+    if info.architecture != libcpuid.enums.CPUArchitecture.X86:
+        return
+    modified = raw.copy()
+    modified.c_cpu_raw_data.basic_cpuid[1][3] &= ~(1 << 25)  # SSE
+    raw_diff = diff_raw(raw, modified)
+    assert raw_diff.changed_leaves <= {("basic_cpuid", 1)}
+    if raw_diff:
+        assert raw_diff.changes[0].cleared_bits == 1 << 25
+        info_diff = diff_info(info, CPUInfo.from_raw(modified))
+        assert libcpuid.enums.CPUFeature.SSE in info_diff.removed_features
+        assert not info_diff.is_feature_superset
+
+
+def test_fleet_index():
+    """
+    Checks that fleet index queries agree with the indexed
+    CPU information, also after a save/load round trip.
+    """
+    info = CPUInfo.from_current_cpu()
+    quick = CPUInfo.from_current_cpu(RawLeaves.QUICK)
+    index = FleetIndex()
+    index.extend([("a", info), ("b", SystemInfo.from_all_cpus()), ("q", quick)])
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        index_file = os.path.join(tmpdirname, "fleet.idx")
+        index.save(index_file)
+        index = FleetIndex.load(index_file)
+    assert "a" in index.select(index.with_features(*info.features))
+    assert info.features <= index.union()
+    assert index.baseline(index.where("family", "==", getattr(info, "family", -1)))
+    groups = index.group_by("vendor")
+    assert "a" in index.select(groups[info.vendor])
+    assert index.select(index.where_codename(info.cpu_codename))[0] == "a"
+    # Undetermined values are kept apart from all values, including -1.
+    if quick.l2_cache is None:
+        assert index.select(index.null_mask("l2_cache")) == ["q"]
+        assert "q" not in index.select(index.where("l2_cache", "!=", -1))
+        assert index.select(index.group_by("l2_cache")[None]) == ["q"]
+        assert index.select(index.null_mask("cpu_codename")) == ["q"]
+    assert not index.null_mask("vendor")
+    assert index.where("feature_level", "==", -1) == index.group_by(
+        "feature_level"
+    ).get(CPUFeatureLevel.UNKNOWN, 0)
+
+
+def test_export():
+    """
+    Checks that exported rows are JSON-compatible
+    and agree with the exported CPU information.
+    """
+    info = CPUInfo.from_current_cpu()
+    system_info = SystemInfo.from_all_cpus()
+    stream = io.StringIO()
+    assert write_jsonl([("a", info), system_info], stream) == 1 + len(system_info)
+    rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert rows[0]["key"] == "a"
+    assert rows[0] == {"key": "a", **to_dict(info)}
+    assert set(rows[0]["features"]) == {str(feature) for feature in info.features}
+    assert len(to_dict(system_info)["cpu_types"]) == len(system_info)
+
+
+def test_export_arrow():
+    """Checks the Arrow export if the optional pyarrow package is available."""
+    pytest.importorskip("pyarrow")
+    info = CPUInfo.from_current_cpu()
+    batches = list(iter_arrow_batches([info] * 5, batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert batches[0].column("cpu_codename")[0].as_py() == info.cpu_codename
+
+
+def test_cli(capsys):
+    """
+    Checks that the command-line interface prints
+    the selected fields of saved raw dumps.
+    """
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        raw_file = os.path.join(tmpdirname, "raw.txt")
+        CPURawDataArray.from_all_cpus().serialize(raw_file)
+        system_info = SystemInfo.from_all_cpus()
+        assert main(["--jsonl", "--codename", "--cores", "--load", raw_file]) == 0
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert rows[0] == {
+            "key": raw_file,
+            "cpu_codename": system_info[0].cpu_codename,
+            "num_cores": system_info[0].num_cores,
+        }
+        assert main(["--codename", "--cached", tmpdirname]) == 0
+        assert capsys.readouterr().out.splitlines()[-1] == system_info[-1].cpu_codename
+
+
+def test_identification_cache():
+    """
+    Checks that the identification cache is reused while its key
+    matches, refreshed when the key changes, and ignored when it is
+    accessible to other users.
+    """
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        procfs_root = os.path.join(tmpdirname, "proc")
+        os.makedirs(os.path.join(procfs_root, "sys/kernel/random"))
+        boot_id_file = os.path.join(procfs_root, "sys/kernel/random/boot_id")
+        with open(boot_id_file, "w", encoding="ascii") as boot_id:
+            boot_id.write("boot-1\n")
+        cache = IdentificationCache(
+            tmpdirname, procfs_root=procfs_root, sysfs_root=tmpdirname
+        )
+        assert cache.load() is None
+        raw_data_array, system_info = cache.get()
+        loaded = cache.load()
+        assert loaded is not None
+        assert len(loaded.raw_data_array) == len(raw_data_array)
+        assert [info.cpu_codename for info in loaded.system_info] == [
+            info.cpu_codename for info in system_info
+        ]
+        assert loaded.system_info[0].features == system_info[0].features
+        assert loaded.system_info.l2_total_instances == system_info.l2_total_instances
+        assert CPUInfo.from_raw(loaded.raw_data_array[0]).features == (
+            CPUInfo.from_raw(raw_data_array[0]).features
+        )
+        with open(boot_id_file, "w", encoding="ascii") as boot_id:
+            boot_id.write("boot-2\n")
+        assert cache.load() is None
+        cache.get()
+        assert cache.load() is not None
+        # Instances loaded from a replaced file remain valid.
+        assert loaded.system_info[0].cpu_codename == system_info[0].cpu_codename
+        # Files and directories accessible to other users are not trusted.
+        os.chmod(cache.path, 0o644)
+        assert cache.load() is None
+        os.chmod(cache.path, 0o600)
+        assert cache.load() is not None
+        os.chmod(tmpdirname, 0o755)
+        assert cache.load() is None
+        assert not cache.store(raw_data_array, system_info)
+        shared = os.path.join(tmpdirname, "shared")
+        os.symlink(tmpdirname, shared)
+        os.chmod(tmpdirname, 0o700)
+        assert (
+            IdentificationCache(
+                shared, procfs_root=procfs_root, sysfs_root=tmpdirname
+            ).load()
+            is None
+        )
+
+
+def test_purposes():
+    """
+    Checks that CPU types looked up by purpose agree
+    with the CPU types identified by position.
+    """
+    system_info = SystemInfo.from_all_cpus()
+    purposes = system_info.purposes
+    for index, purpose in enumerate(purposes):
+        if purposes.index(purpose) == index:
+            assert system_info.by_purpose(purpose) is system_info[index]
+    cpu_infos = CPUInfo.from_purposes(list(CPUPurpose))
+    assert set(cpu_infos) == set(purposes)
+    for purpose, cpu_info in cpu_infos.items():
+        assert cpu_info.purpose == purpose
+        assert cpu_info.features == system_info.by_purpose(purpose).features
+
+    class TaggedInfo(CPUInfo):
+        """A subclass overriding the creation from the C structure."""
+
+        @classmethod
+        def from_c(cls, c_cpu_id, owner=None, raw_data=None):
+            cpu_info = super().from_c(c_cpu_id, owner, raw_data)
+            cpu_info.tagged = True
+            return cpu_info
+
+    for cpu_info in TaggedInfo.from_purposes(list(CPUPurpose)).values():
+        assert cpu_info.tagged
+
+
+def test_derived_queries():
+    """
+    Checks that derived queries are answered from the raw data
+    the CPU was identified from.
+    """
+    info = CPUInfo.from_current_cpu()
+    assert info.raw_data.is_local
+    assert info.hypervisor == info.hypervisor
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        info_file = os.path.join(tmpdirname, "info.txt")
+        info.raw_data.serialize(info_file)
+        raw_from_file = CPURawData.from_file(info_file)
+    assert not raw_from_file.is_local
+    info_from_file = CPUInfo.from_raw(raw_from_file)
+    assert info_from_file.raw_data is raw_from_file
+    assert (info_from_file.hypervisor is None) == (info.hypervisor is None)
+    sgx = getattr(info, "sgx", None)
+    if sgx is not None:
+        assert info.sgx is sgx
+        assert len(sgx.epc_sections) == sgx.num_epc_sections
+        assert sgx.total_epc_size == sum(epc.length for epc in sgx.epc_sections)
+
+
+def test_stream():
+    """
+    Checks that dumps streamed from concatenated text, gzip
+    and tar archives match the dumps parsed by the C library.
+    """
+    raw_data_array = CPURawDataArray.from_all_cpus()
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        dump_file = os.path.join(tmpdirname, "dump.txt")
+        raw_data_array.serialize(dump_file)
+        expected = CPURawDataArray.from_file(dump_file)
+        with open(dump_file, "rb") as dump:
+            text = dump.read()
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+        for name, content in (("a.txt", text * 2), ("b.txt.gz", gzip.compress(text))):
+            member = tarfile.TarInfo(name)
+            member.size = len(content)
+            tar.addfile(member, io.BytesIO(content))
+    dumps = list(iter_raw_dumps(io.BufferedReader(io.BytesIO(archive.getvalue()))))
+    assert [(dump.source, dump.index) for dump in dumps] == [
+        ("a.txt", 0),
+        ("a.txt", 1),
+        ("b.txt.gz", 0),
+    ]
+    raw_size = len(expected) * ffi.sizeof("struct cpu_raw_data_t")
+    for dump in dumps:
+        assert len(dump.raw_data_array) == len(expected)
+        assert (
+            ffi.buffer(dump.raw_data_array.c_cpu_raw_data_array.raw, raw_size)[:]
+            == ffi.buffer(expected.c_cpu_raw_data_array.raw, raw_size)[:]
+        )
+
+
+def test_threads():
+    """
+    Checks that identification and error reporting work from many threads
+    at once, and that collecting on each CPU restores the affinity mask.
+    """
+    raw_data = CPURawData.from_current_cpu()
+    expected = CPUInfo.from_raw(raw_data)
+    invalid_core = libcpuid.get_total_cpus() + 1000
+    has_affinity = hasattr(os, "sched_getaffinity")
+    cpus = sorted(os.sched_getaffinity(0)) if has_affinity else [0]
+
+    def identify(index):
+        affinity = os.sched_getaffinity(0) if has_affinity else None
+        if index % 2:
+            with pytest.raises(CLibraryError) as error:
+                CPURawData.from_cpu_core(invalid_core)
+            result = str(error.value)
+        else:
+            result = CPUInfo.from_raw(raw_data.copy()).feature_bits
+        CPURawData.from_cpu_core(cpus[index % len(cpus)])
+        if affinity is not None:
+            assert os.sched_getaffinity(0) == affinity
+        return result
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(identify, range(400)))
+    assert set(results[0::2]) == {expected.feature_bits}
+    assert len(set(results[1::2])) == 1
+
+
+def test_driver_collection():
+    """
+    Checks that reading the cpuid kernel driver gives the same identification
+    as switching the affinity, and that "auto" always succeeds.
+    """
+    with pytest.raises(ValueError):
+        CPURawDataArray.from_all_cpus("invalid")
+    by_affinity = CPURawDataArray.from_all_cpus()
+    by_auto = CPURawDataArray.from_all_cpus("auto")
+    assert len(by_auto) == len(by_affinity)
+    try:
+        by_driver = CPURawDataArray.from_all_cpus("driver")
+    except CLibraryError:
+        pytest.skip("the cpuid kernel driver is not available")
+    assert by_driver.is_local and len(by_driver) == len(by_affinity)
+    for expected, actual in zip(
+        SystemInfo.from_raw_array(by_affinity), SystemInfo.from_raw_array(by_driver)
+    ):
+        assert actual.feature_bits == expected.feature_bits
+        assert actual.cpu_codename == expected.cpu_codename
+    core = CPURawData.from_cpu_core(0, method="driver")
+    assert (
+        CPUInfo.from_raw(core).feature_bits
+        == SystemInfo.from_raw_array(by_driver)[0].feature_bits
+    )
+
+
+def test_quick_collection():
+    """
+    Checks that collecting only some leaves runs fewer `cpuid` instructions,
+    keeps the quick fields and marks the others as undetermined.
+    """
+    full = CPUInfo.from_current_cpu()
+    if full.architecture != CPUArchitecture.X86:
+        pytest.skip("leaf families only apply to x86")
+    with Collector() as quick_collector:
+        quick = CPUInfo.from_current_cpu(RawLeaves.QUICK)
+    with Collector() as full_collector:
+        CPURawData.from_current_cpu()
+    assert quick_collector.stats.num_cpuid < full_collector.stats.num_cpuid
+    assert quick.raw_data.copy().leaves == RawLeaves.QUICK
+    for name in ("vendor", "brand_str", "family", "model", "stepping", "feature_bits"):
+        assert getattr(quick, name) == getattr(full, name)
+    assert {"l2_cache", "num_cores", "cpu_codename", "purpose"} <= quick.undetermined
+    assert quick.l2_cache is None and quick.num_cores is None
+    assert quick.cpu_codename is None and quick.purpose is None
+    assert to_dict(quick)["purpose"] is None
+    assert not full.undetermined
+    with_caches = CPUInfo.from_raw(
+        CPURawData.from_cpu_core(
+            0, leaves=RawLeaves.QUICK | RawLeaves.INTEL_FN4 | RawLeaves.AMD_FN8000001DH
+        )
+    )
+    assert with_caches.l2_cache == full.l2_cache
+    assert with_caches.num_cores is None
+
+
+def test_full_collection():
+    """
+    Checks that a full collection runs `cpuid` for every row of the raw data,
+    including the AMD extended topology leaf 0x80000026 (past the rows of
+    ext_cpuid), so that dumps stay complete.
+    """
+    if CPUInfo.from_current_cpu().architecture != CPUArchitecture.X86:
+        pytest.skip("leaf families only apply to x86")
+    fields = raw_data_fields()
+    rows = sum(
+        fields[name].num_rows
+        for name in (
+            "basic_cpuid",
+            "ext_cpuid",
+            "intel_fn4",
+            "intel_fn11",
+            "intel_fn12h",
+            "intel_fn14h",
+            "amd_fn8000001dh",
+            "amd_fn80000026h",
+        )
+    )
+    with Collector() as collector:
+        raw_data = CPURawData.from_current_cpu()
+    assert collector.stats.num_cpuid == rows
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    affinity = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {min(affinity)})
+    try:
+        raw_data = CPURawData.from_current_cpu()
+        expected = [
+            libcpuid.exec_cpuid((0x80000026).to_bytes(4), ecx=subleaf.to_bytes(4))
+            for subleaf in range(fields["amd_fn80000026h"].num_rows)
+        ]
+    finally:
+        os.sched_setaffinity(0, affinity)
+    for subleaf, registers in enumerate(expected):
+        assert raw_data.get_registers(0x80000026, subleaf) == tuple(
+            int.from_bytes(register) for register in registers
+        )
+
+
+def test_probe():
+    """
+    Checks that the single-feature probes agree with the full identification
+    and run only the needed leaves.
+    """
+    features = CPUInfo.from_current_cpu().features
+    probe.clear_cache()
+    with Collector() as collector:
+        libcpuid.has_feature(CPUFeature.AVX2)
+    if CPUInfo.from_current_cpu().architecture == CPUArchitecture.X86:
+        assert 0 < collector.stats.num_cpuid <= 2
+        assert probe.feature_bit(CPUFeature.AVX2) == (7, 0, 1, 5, frozenset())
+    assert probe.feature_bit(CPUFeature.HT) is None
+    for feature in CPUFeature:
+        if feature >= 0:
+            assert libcpuid.has_feature(feature) == (feature in features), feature
+    assert libcpuid.has_features(sorted(features)[:3])
+    assert libcpuid.has_features([])
+
+
+def test_advisor():
+    """Checks that the tuning advice is consistent with the cache geometry."""
+    system_info = SystemInfo.from_all_cpus()
+    assert set(advise_system(system_info)) == set(system_info.purposes)
+    advice = advise(CPUInfo.from_current_cpu())
+    assert advice.false_sharing_padding >= advice.line_size
+    for budget in advice.caches.values():
+        assert 0 < budget.thread_budget <= budget.domain_budget <= budget.size
+    if "l1_data" in advice.caches:
+        edge = advice.tile_edge(8)
+        assert 3 * edge * edge * 8 <= advice.thread_budget("l1_data")
+        chunk = advice.chunk_elements(8, "l1_data")
+        assert chunk * 8 <= advice.thread_budget("l1_data")
+        assert chunk * 8 % advice.line_size == 0
+    with pytest.raises(ValueError):
+        advice.chunk_elements(8, "l5")
+
+
+def test_dispatch(monkeypatch):
+    """
+    Checks that the dispatch registry chooses the most specific
+    supported implementation and honours the environment override.
+    """
+    cpu_info = CPUInfo.from_current_cpu()
+    present = min(cpu_info.features)
+    missing = min(
+        feature
+        for feature in CPUFeature
+        if feature >= 0 and feature not in cpu_info.features
+    )
+
+    def make_registry():
+        registry = DispatchRegistry(cpu_info)
+        registry.register("kernel", variant="generic")(lambda: "generic")
+        registry.register("kernel", features={present}, variant="present")(
+            lambda: "present"
+        )
+        registry.register("kernel", features={missing}, variant="missing")(
+            lambda: "missing"
+        )
+        registry.register("kernel", min_level=CPUFeatureLevel.UNKNOWN)(
+            lambda: "unknown"
+        )
+        return registry
+
+    monkeypatch.delenv("LIBCPUID_DISPATCH", raising=False)
+    registry = make_registry()
+    assert registry.kernel() == "present"
+    assert "kernel" in vars(registry)
+    assert registry.resolve_all() == {"kernel": "present"}
+    monkeypatch.setenv("LIBCPUID_DISPATCH", "generic")
+    assert make_registry().kernel() == "generic"
+    monkeypatch.setenv("LIBCPUID_DISPATCH", "generic,kernel=missing")
+    with pytest.raises(DispatchError):
+        make_registry().resolve("kernel")
+    monkeypatch.delenv("LIBCPUID_DISPATCH")
+    higher = level_features(cpu_info.feature_level) - level_features(
+        CPUFeatureLevel.X86_64_V1
+    )
+    if higher:
+        registry = DispatchRegistry(cpu_info)
+        registry.register("kernel", features={min(higher)}, variant="features")(
+            lambda: "features"
+        )
+        registry.register("kernel", min_level=CPUFeatureLevel.X86_64_V1)(lambda: "v1")
+        assert registry.kernel() == "features"
+
+
+def test_stats():
+    """
+    Checks that the instrumentation counts the phases
+    of collection and identification only while enabled.
+    """
+    with Collector() as collector:
+        system_info = SystemInfo.from_all_cpus()
+    stats = collector.stats
+    assert stats[StatsPhase.GET_ALL_RAW_DATA].count == 1
+    assert stats[StatsPhase.IDENT_INTERNAL].count >= len(system_info)
+    assert stats[StatsPhase.TOPOLOGY].count == system_info[0].total_logical_cpus
+    if libcpuid.cpuid_present():
+        assert stats.num_cpuid > 0
+    assert not stats_module.is_enabled()
+    SystemInfo.from_all_cpus()
+    with Collector() as collector:
+        pass
+    assert collector.stats.num_cpuid == 0
+    with Collector() as outer:
+        with Collector():
+            pass
+        assert stats_module.is_enabled()
+        CPURawData.from_current_cpu()
+    assert not stats_module.is_enabled()
+    if libcpuid.cpuid_present():
+        assert outer.stats.num_cpuid > 0
+
+
+def test_calibration_cache(monkeypatch):
+    """
+    Checks that calibrations are cached until the TTL expires
+    or the cpufreq policy of the measured CPUs changes.
+    """
+    measurements = []
+
+    def measure():
+        measurements.append(None)
+        return 1000 + len(measurements)
+
+    monkeypatch.setitem(clock.CALIBRATION_METHODS, "counting", measure)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cpu_root = os.path.join(tmpdirname, "devices/system/cpu")
+        os.makedirs(os.path.join(cpu_root, "cpufreq/policy0"))
+        governor_file = os.path.join(cpu_root, "cpufreq/policy0/scaling_governor")
+        with open(governor_file, "w", encoding="ascii") as governor:
+            governor.write("performance\n")
+        cache = clock.CalibrationCache(check_interval=0, sysfs_root=tmpdirname)
+        calibration = cache.get("counting")
+        assert calibration.method == "counting"
+        assert calibration.frequency == 1001
+        assert cache.get("counting") is calibration
+        assert calibration.cycles_to_seconds(1001_000_000) == 1.0
+        with open(governor_file, "w", encoding="ascii") as governor:
+            governor.write("powersave\n")
+        assert cache.get("counting").frequency == 1002
+        assert clock.CalibrationCache(ttl=0).get("counting").frequency == 1003
+
+
+def test_frequency_by_os_all():
+    """
+    Checks that OS-reported frequencies are read from a sysfs tree
+    and follow changes of the values and of the online CPUs.
+    """
+
+    def write(path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="ascii") as sysfs_file:
+            sysfs_file.write(content)
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cpu_root = os.path.join(tmpdirname, "devices/system/cpu")
+        write(os.path.join(cpu_root, "online"), "0-1\n")
+        for cpu in range(2):
+            for name, khz in (
+                ("scaling_cur_freq", 2000000 + cpu * 100000),
+                ("scaling_min_freq", 800000),
+                ("scaling_max_freq", 3500000),
+            ):
+                write(os.path.join(cpu_root, f"cpu{cpu}/cpufreq/{name}"), f"{khz}\n")
+        with clock.OSFrequencyReader(tmpdirname) as reader:
+            frequencies = reader.read()
+            assert list(frequencies.cpus) == [0, 1]
+            assert list(frequencies.current) == [2000, 2100]
+            assert list(frequencies.minimum) == [800, 800]
+            assert list(frequencies.maximum) == [3500, 3500]
+            write(os.path.join(cpu_root, "cpu1/cpufreq/scaling_cur_freq"), "1500000\n")
+            assert list(reader.read().current) == [2000, 1500]
+            write(os.path.join(cpu_root, "online"), "0-2\n")
+            frequencies = reader.read()
+            assert list(frequencies.cpus) == [0, 1, 2]
+            assert list(frequencies.current) == [2000, 1500, -1]
+
+
+def test_membench():
+    """
+    Checks the detection of effective cache levels and runs
+    a short sweep pinned to a logical CPU of each purpose.
+    """
+    points = [
+        membench.SweepPoint(size, latency, None)
+        for size, latency in [
+            (4096, 1.0),
+            (8192, 1.1),
+            (16384, 1.0),
+            (32768, 2.5),
+            (65536, 4.0),
+            (131072, 4.2),
+            (262144, 4.1),
+            (524288, 50.0),
+            (1048576, 80.0),
+            (2097152, 85.0),
+            (4194304, 83.0),
+        ]
+    ]
+    levels = membench.detect_levels(points)
+    assert [(level.size, level.next_size) for level in levels] == [
+        (16384, 32768),
+        (262144, 524288),
+        (4194304, None),
+    ]
+    assert membench.CacheCheck("l1_data", 16384, levels[0]).agrees
+    assert not membench.CacheCheck("l2", 8 * 1048576, levels[1]).agrees
+    assert not membench.CacheCheck("l3", None, levels[2]).agrees
+    with pytest.raises(CLibraryError):
+        membench.latency(16)
+    reports = membench.benchmark_system(
+        SystemInfo.from_all_cpus(), sizes=[4096, 8192, 16384], millis=5, threshold=4.0
+    )
+    for report in reports.values():
+        assert [point.size for point in report.points] == [4096, 8192, 16384]
+        assert all(point.latency > 0 and point.bandwidth > 0 for point in report.points)
+        assert report.memory is not None
+
+
+def test_hotplug():
+    """
+    Checks the identification of non-contiguous logical CPUs
+    and the notifications of the hotplug watcher, which must not report
+    changes when no CPU is added or removed.
+    """
+    raw_data = CPURawData.from_current_cpu()
+    system_info = system_info_from_raw_data({0: raw_data, 2: raw_data, 5: raw_data})
+    assert sum(cpu_info.num_logical_cpus for cpu_info in system_info) == 3
+    assert {
+        int.from_bytes(cpu_info.affinity_mask, "big") for cpu_info in system_info
+    } == {0b100101}
+    with tempfile.TemporaryDirectory() as sysfs_root:
+        online = os.path.join(sysfs_root, "devices/system/cpu/online")
+        os.makedirs(os.path.dirname(online))
+        cpu = min(os.sched_getaffinity(0))
+        with open(online, "w", encoding="utf-8") as online_file:
+            online_file.write(f"{cpu}\n")
+        watcher = HotplugWatcher(sysfs_root=sysfs_root)
+        assert watcher.cpus == [cpu] and watcher.check() is None
+        events = []
+        watcher.subscribe(events.append)
+        with open(online, "w", encoding="utf-8") as online_file:
+            online_file.write(f"{cpu + 1}-{cpu + 2}\n")
+        watcher.check()
+        with open(online, "w", encoding="utf-8") as online_file:
+            online_file.write(f"{cpu}\n")
+        watcher.check()
+        assert [(event.added, event.removed) for event in events] == [
+            (frozenset(), {cpu}),
+            ({cpu}, frozenset()),
+        ]
+        assert events[-1].system_info is watcher.system_info
+    affinity = os.sched_getaffinity(0)
+    watcher = HotplugWatcher(method="affinity")
+    assert os.sched_getaffinity(0) == affinity
+    assert watcher.check() is None and watcher.check() is None
+    assert set(watcher.cpus) <= affinity
+
+
+def test_frequency_adaptive(monkeypatch):
+    """
+    Checks that adaptive measurements stop once converged or at the time limit,
+    and that combined estimates cover the disagreement between methods.
+    """
+    readings = iter(range(10**6))
+    monkeypatch.setitem(clock.ADAPTIVE_METHODS, "constant", lambda millis: 2000)
+    monkeypatch.setitem(
+        clock.ADAPTIVE_METHODS,
+        "noisy",
+        lambda millis: 1000 if next(readings) % 2 else 3000,
+    )
+    constant = clock.frequency_adaptive("constant", min_samples=2)
+    assert constant.converged and constant.samples == 4
+    assert constant.low < constant.frequency == 2000 < constant.high
+    noisy = clock.frequency_adaptive("noisy", max_time=0.01)
+    assert not noisy.converged and noisy.elapsed >= 0.01
+    assert noisy.low < 2000 < noisy.high and noisy.relative_error > 0.01
+    combined = clock.combine_estimates([constant, constant._replace(frequency=2010)])
+    assert combined.method == "constant+constant"
+    assert combined.low < 2000 and combined.high > 2010
+    with pytest.raises(ValueError):
+        clock.frequency_adaptive("unknown")
+    estimate = clock.frequency_combined(("tsc", "os", "ic"), max_time=0.2)
+    assert estimate.low <= estimate.frequency <= estimate.high
+    monkeypatch.setitem(clock.ADAPTIVE_METHODS, "os", lambda millis: 2000)
+    reading = clock.frequency_adaptive("os")
+    assert reading.samples == 4 and reading.std_error >= 50
+    reading = reading._replace(frequency=1000, std_error=0.1)
+    assert clock.combine_estimates([constant, reading]).frequency == 1500
+
+
+def test_tsc_sync(monkeypatch):
+    """
+    Checks the offset bounds of TSC ping-pongs and runs
+    a short synchronization check of the current machine.
+    """
+    synced = tscsync.offset_bounds(
+        [tscsync.TSCSample(100, 150, 200), tscsync.TSCSample(300, 320, 400)]
+    )
+    assert (synced.low, synced.high, synced.round_trip) == (-50, 20, 100)
+    behind = tscsync.offset_bounds([tscsync.TSCSample(1000, 900, 1100)])
+    later = tscsync.offset_bounds([tscsync.TSCSample(2000, 1920, 2100)])
+    assert tscsync.TSCOffset(1, synced, synced, 0).synchronized
+    assert not tscsync.TSCOffset(1, behind, None, 0).synchronized
+    assert tscsync.TSCOffset(1, behind, None, 100).synchronized
+    assert tscsync.TSCOffset(1, behind, later, 0).drift == pytest.approx(20_000)
+    cpu = min(os.sched_getaffinity(0))
+    samples = tscsync.ping_pong(cpu, cpu, rounds=3)
+    assert all(sample.sent <= sample.received for sample in samples)
+    report = tscsync.check_tsc_sync(rounds=20, max_time=0.5)
+    assert report.reference == cpu
+    assert (
+        len(report.offsets) + len(report.unchecked) == len(os.sched_getaffinity(0)) - 1
+    )
+
+    def fake_ping_pong(reference, logical_cpu, rounds, timeout):
+        if logical_cpu == 1:
+            raise CLibraryError
+        return [tscsync.TSCSample(100, 150, 200)] * rounds
+
+    monkeypatch.setattr(tscsync, "ping_pong", fake_ping_pong)
+    report = tscsync.check_tsc_sync([0, 1, 2], rounds=3)
+    assert [offset.logical_cpu for offset in report.offsets] == [2]
+    assert report.unchecked == [1] and not report.safe
+
+
+def test_codenames():
+    """
+    Checks that the codename database agrees with the lists of the C library
+    and resolves models from their family and model numbers.
+    """
+    for vendor in (CPUVendor.INTEL, CPUVendor.AMD, CPUVendor.CENTAUR, CPUVendor.ARM):
+        names = [
+            entry.codename if entry.part_name is None else entry.part_name
+            for entry in codenames.entries(vendor)
+            if not entry.generic
+        ]
+        assert list(dict.fromkeys(names)) == libcpuid.get_cpu_list(vendor)
+    assert codenames.lookup(CPUVendor.INTEL, 6, 183).codename.startswith("Raptor Lake")
+    assert codenames.lookup(CPUVendor.AMD, 23, 1).codename == "EPYC (Naples)"
+    gold = codenames.lookup(CPUVendor.INTEL, 6, 143, model_bits=("XEON_", "_GOLD_"))
+    assert gold.codename == "Sapphire Rapids-SP (Xeon Gold)"
+    assert gold.technology == "Intel 7"
+    assert gold in codenames.entries_for(gold.codename)
+    assert codenames.lookup(CPUVendor.INTEL, 99, 99).generic
+    assert codenames.lookup(CPUVendor.CYRIX, 5, 2) is None
+    assert "6x86" in codenames.codenames(CPUVendor.CYRIX)
+    assert codenames.arm_part(CPUVendor.ARM, 0xD0C).part_name == "Neoverse-N1"
+    info = CPUInfo.from_current_cpu()
+    assert codenames.entries_for(info.cpu_codename)
+
+
+def test_raw_data_from_registers():
+    """
+    Checks that raw data built from mappings of registers round-trips
+    and that its modified copies are identified accordingly.
+    """
+    raw_data = CPURawData.from_current_cpu()
+    rebuilt = CPURawData.from_registers(raw_data.registers())
+    assert bytes(ffi.buffer(rebuilt.c_cpu_raw_data)) == bytes(
+        ffi.buffer(raw_data.c_cpu_raw_data)
+    )
+    intel = CPURawData.from_registers(
+        {0: (1, 0x756E6547, 0x6C65746E, 0x49656E69), (1, 0): (0xB0671, 0, 0, 0)}
+    )
+    info = CPUInfo.from_raw(intel)
+    assert (info.ext_family, info.ext_model, info.stepping) == (6, 183, 1)
+    variant = intel.with_brand_string("13th Gen Intel(R) Core(TM) i9-13900K")
+    variant = variant.with_feature(CPUFeature.AVX2)
+    info = CPUInfo.from_raw(variant)
+    assert info.cpu_codename == "Raptor Lake-S (Core i9)"
+    assert CPUFeature.AVX2 in info.features
+    info = CPUInfo.from_raw(variant.with_signature(6, 191))
+    assert (info.ext_model, info.stepping) == (191, 1)
+    assert CPUFeature.AVX2 not in CPUInfo.from_raw(intel).features
+    cleared = variant.with_feature(CPUFeature.AVX2, present=False)
+    assert CPUFeature.AVX2 not in CPUInfo.from_raw(cleared).features
+    with pytest.raises(ValueError):
+        CPURawData.from_registers({(7, 1): (0, 0, 0, 0)})
+    array = CPURawDataArray.from_registers([intel.registers()] * 2)
+    modified = array.with_registers({1: (0xA0671, 0, 0, 0)}, cpus=[1])
+    assert modified[0].get_registers(1) == (0xB0671, 0, 0, 0)
+    assert modified[1].get_registers(1) == (0xA0671, 0, 0, 0)
+    assert array[1].get_registers(1) == (0xB0671, 0, 0, 0)
+    combined = CPURawDataArray.from_raw_data([intel, variant], with_affinity=True)
+    assert len(SystemInfo.from_raw_array(combined)) >= 1
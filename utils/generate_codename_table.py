@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Generates python/src/libcpuid/_codename_table.py, which contains the codename
+recognition tables of the C library: the x86 match tables (struct match_entry_t),
+the ARM part tables (struct arm_id_part) and the fixed lists of codenames
+of the other vendors (cpuid_get_cpu_list).
+
+Usage: utils/generate_codename_table.py (from anywhere in the repository)
+"""
+
+import os
+import re
+import sys
+
+GIT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(GIT_DIR, "libcpuid")
+OUTPUT = os.path.join(GIT_DIR, "python", "src", "libcpuid", "_codename_table.py")
+
+# Source files containing x86 match tables, and the vendors they apply to.
+X86_SOURCES = {
+    "recog_intel.c": ("INTEL",),
+    "recog_amd.c": ("AMD", "HYGON"),
+    "recog_centaur.c": ("CENTAUR",),
+}
+
+TABLE_START = re.compile(r"const struct match_entry_t cpudb_\w+\[\] = \{")
+ENTRY = re.compile(
+    r"\{\s*((?:-?(?:0x[0-9a-fA-F]+|\d+)\s*,\s*){8})(\w+)\s*,\s*([\w|\s]+?)\s*,\s*(\w+)\s*,"
+    r'\s*"([^"]*)"\s*\}'
+)
+COMMENT = re.compile(r"^\s*/\*(.*?)(?:\*/)?\s*$")
+COLUMNS = re.compile(r"^\s*F\s+M\s+S\b")
+TECHNOLOGY = re.compile(r"\b(\d+) ?nm\b|\b(Intel \d+)\b")
+
+ARM_PARTS = re.compile(
+    r"static const struct arm_id_part (\w+)\[\] = \{(.*?)\};", re.DOTALL
+)
+ARM_PART = re.compile(r'\{\s*(-?(?:0x)?[0-9a-fA-F]+),\s*"([^"]*)",\s*"([^"]*)"\s*\}')
+ARM_IMPLEMENTERS = re.compile(
+    r"static const struct arm_hw_impl hw_implementer\[\] = \{(.*?)\};", re.DOTALL
+)
+ARM_IMPLEMENTER = re.compile(
+    r'\{\s*(-?(?:0x)?[0-9a-fA-F]+),\s*VENDOR_(\w+),\s*(\w+),\s*"([^"]*)"\s*\}'
+)
+
+FIXED_LIST = re.compile(
+    r'case VENDOR_(\w+):\s*make_list_from_string\("([^"]*)", list\);'
+)
+
+HEADER = '''"""
+Codename recognition tables of the C library.
+
+X86_ENTRIES are the rows of the x86 match tables, as (vendors, family, model,
+stepping, ext_family, ext_model, num_cores, l2_cache, l3_cache, brand_code,
+model_bits, model_code, technology, codename) tuples, where -1 means any value,
+a brand or model code of None is the "no code" one (NC or 0), and the
+technology node is taken from the comments of the table.
+ARM_PARTS are the known ARM parts, as (vendor, implementer, part_num, part_name,
+codename) tuples. FIXED_CODENAMES are the codenames of the other vendors.
+
+Generated by utils/generate_codename_table.py from the C library, do not edit.
+"""
+
+# pylint: disable=line-too-long
+# fmt: off
+
+'''
+
+
+def read(filename: str) -> str:
+    """Returns the content of a source file of the C library."""
+    with open(os.path.join(SOURCE_DIR, filename), encoding="utf-8") as source:
+        return source.read()
+
+
+def parse_technology(comment: str):
+    """Returns the technology node named in a comment, None if there is none."""
+    match = TECHNOLOGY.search(comment)
+    if match is None:
+        return None
+    return f"{match.group(1)}nm" if match.group(1) else match.group(2)
+
+
+def parse_x86_table(filename: str, vendors: tuple) -> list:
+    """Returns the rows of the match table of a single source file."""
+    lines = read(filename).splitlines()
+    start = next(
+        (index for index, line in enumerate(lines) if TABLE_START.search(line)), None
+    )
+    if start is None:
+        sys.exit(f"{filename}: no match table")
+    rows = []
+    technology = None
+    for line in lines[start + 1 :]:
+        if line.startswith("};"):
+            break
+        comment = COMMENT.match(line)
+        if comment is not None:
+            if not COLUMNS.match(comment.group(1)):
+                technology = parse_technology(comment.group(1))
+            continue
+        entry = ENTRY.search(line)
+        if entry is None:
+            if "{" in line:
+                sys.exit(f"{filename}: cannot parse {line.strip()!r}")
+            continue
+        numbers, brand_code, model_bits, model_code, codename = entry.groups()
+        values = [int(value, 0) for value in numbers.replace(" ", "").split(",")[:8]]
+        bits = tuple(bit.strip() for bit in model_bits.split("|"))
+        rows.append(
+            (
+                vendors,
+                *values,
+                None if brand_code == "NC" else brand_code,
+                () if bits == ("0",) else bits,
+                None if model_code == "0" else model_code,
+                technology,
+                codename,
+            )
+        )
+    return rows
+
+
+def parse_arm_parts() -> list:
+    """Returns the known ARM parts, by implementer."""
+    code = read("recog_arm.c")
+    parts = {name: ARM_PART.findall(body) for name, body in ARM_PARTS.findall(code)}
+    implementers = ARM_IMPLEMENTERS.search(code)
+    if implementers is None:
+        sys.exit("recog_arm.c: no implementer table")
+    rows = []
+    for implementer, vendor, table, _ in ARM_IMPLEMENTER.findall(implementers.group(1)):
+        if vendor == "UNKNOWN":
+            continue
+        for part_num, part_name, codename in parts[table]:
+            if int(part_num, 0) >= 0:
+                rows.append(
+                    (vendor, int(implementer, 0), int(part_num, 0), part_name, codename)
+                )
+    return rows
+
+
+def parse_fixed_lists() -> dict:
+    """Returns the fixed lists of codenames of the vendors without tables."""
+    return {
+        vendor: tuple(names.split(","))
+        for vendor, names in FIXED_LIST.findall(read("cpuid_main.c"))
+    }
+
+
+def quote(value) -> str:
+    """Returns the Python literal of a value, with double quotes."""
+    return repr(value).replace("'", '"')
+
+
+def main():
+    """Writes the generated module."""
+    x86_rows = []
+    for filename, vendors in X86_SOURCES.items():
+        x86_rows += parse_x86_table(filename, vendors)
+    arm_rows = parse_arm_parts()
+    fixed = parse_fixed_lists()
+    with open(OUTPUT, "w", encoding="utf-8") as output:
+        output.write(HEADER)
+        output.write("X86_ENTRIES = (\n")
+        for row in x86_rows:
+            output.write(f"    ({', '.join(quote(value) for value in row)}),\n")
+        output.write(")\n\nARM_PARTS = (\n")
+        for vendor, implementer, part_num, part_name, codename in arm_rows:
+            output.write(
+                f"    ({quote(vendor)}, 0x{implementer:02x}, 0x{part_num:03x}, "
+                f"{quote(part_name)}, {quote(codename)}),\n"
+            )
+        output.write(")\n\nFIXED_CODENAMES = {\n")
+        for vendor, names in fixed.items():
+            output.write(f"    {quote(vendor)}: {quote(names)},\n")
+        output.write("}\n\n# fmt: on\n")
+    print(
+        f"Wrote {len(x86_rows)} x86 entries, {len(arm_rows)} ARM parts and "
+        f"{len(fixed)} fixed lists to {os.path.relpath(OUTPUT, GIT_DIR)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Generates python/src/libcpuid/_feature_table.py, which maps the x86 CPU features
+directly encoded in a single CPUID bit to that bit, from the feature match
+tables of the C library (struct feature_map_t).
+
+Usage: utils/generate_feature_table.py (from anywhere in the repository)
+"""
+
+import os
+import re
+import sys
+
+GIT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT = os.path.join(GIT_DIR, "python", "src", "libcpuid", "_feature_table.py")
+
+# Source files containing match tables, and the vendors they apply to
+# (an empty tuple means all x86 vendors).
+SOURCES = {
+    "cpuid_main.c": (),
+    "recog_intel.c": ("INTEL",),
+    "recog_amd.c": ("AMD", "HYGON"),
+}
+
+# Features set from a match table, but then adjusted by other logic.
+DERIVED = {
+    "HT",  # cleared when a single logical CPU is reported (libcpuid_util.c)
+}
+
+REGISTERS = {"EAX": 0, "EBX": 1, "ECX": 2, "EDX": 3}
+
+TABLE = re.compile(
+    r"const struct feature_map_t (matchtable_\w+)\[\] = \{(.*?)\};", re.DOTALL
+)
+ENTRY = re.compile(r"\{\s*(\d+),\s*CPU_FEATURE_(\w+)\s*\}")
+CALL = re.compile(
+    r"match_features\((matchtable_\w+), COUNT_OF\(\1\), "
+    r"raw->(basic|ext)_cpuid\[(\w+)\]\[(E[A-D]X)\], data\)"
+)
+
+HEADER = '''"""
+Locations of the x86 CPU features directly encoded in a single `cpuid` bit,
+as (leaf, subleaf, register index, bit, vendors) tuples, where an empty tuple
+of vendors means all x86 vendors.
+
+Generated by utils/generate_feature_table.py from the feature match tables
+of the C library, do not edit.
+"""
+
+FEATURE_BITS = {
+'''
+
+
+def parse_source(path: str, vendors: tuple) -> dict:
+    """Returns the features matched in a single source file."""
+    with open(path, encoding="utf-8") as source:
+        code = source.read()
+    tables = {
+        name: [(int(bit), feature) for bit, feature in ENTRY.findall(body)]
+        for name, body in TABLE.findall(code)
+    }
+    features = {}
+    for table, kind, index, register in CALL.findall(code):
+        leaf = int(index, 0) + (0x80000000 if kind == "ext" else 0)
+        for bit, feature in tables[table]:
+            if feature in DERIVED:
+                continue
+            if feature in features:
+                sys.exit(f"{path}: CPU_FEATURE_{feature} is matched twice")
+            features[feature] = (leaf, 0, REGISTERS[register], bit, vendors)
+    return features
+
+
+def main():
+    """Writes the generated module."""
+    features = {}
+    for filename, vendors in SOURCES.items():
+        path = os.path.join(GIT_DIR, "libcpuid", filename)
+        for feature, location in parse_source(path, vendors).items():
+            if feature in features:
+                sys.exit(f"CPU_FEATURE_{feature} is matched in several files")
+            features[feature] = location
+    with open(OUTPUT, "w", encoding="utf-8") as output:
+        output.write(HEADER)
+        for feature, (leaf, subleaf, register, bit, vendors) in sorted(
+            features.items(), key=lambda item: item[1][:4]
+        ):
+            vendors_str = repr(vendors).replace("'", '"')
+            output.write(
+                f'    "{feature}": (0x{leaf:08X}, {subleaf}, {register}, {bit}, {vendors_str}),\n'
+            )
+        output.write("}\n")
+    print(f"Wrote {len(features)} features to {os.path.relpath(OUTPUT, GIT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()